@@ -0,0 +1,15 @@
+"""
+Performance benchmarks for rig-remote.
+
+Run the whole suite and store the results with:
+
+    python -m benchmarks --output results.json
+
+and compare against the results of a previous release with:
+
+    python -m benchmarks --output results.json --baseline previous.json
+
+Scan benchmarks drive create_scanner against a SimulatedRigCtl, so no radio
+is needed; the rig latency profiles model a local, LAN, wifi and remote rig.
+Micro-benchmarks time the hot paths of the models and of the disk io.
+"""
@@ -0,0 +1,61 @@
+"""
+Command line entry point: python -m benchmarks --help
+"""
+
+import argparse
+import logging
+import sys
+
+from benchmarks import micro_benchmarks, scan_benchmarks
+from benchmarks.harness import compare_results, load_results, write_results
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="rig-remote performance benchmarks")
+    parser.add_argument("--output", "-o", default="benchmark_results.json", help="json file to write the results to")
+    parser.add_argument("--baseline", "-b", help="results of a previous run to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.1, help="fraction of slowdown tolerated against the baseline"
+    )
+    parser.add_argument(
+        "--profile",
+        action="append",
+        choices=sorted(scan_benchmarks.LATENCY_PROFILES),
+        help="rig latency profile of the scan benchmarks, may be repeated; defaults to ideal and lan",
+    )
+    parser.add_argument("--steps", type=int, default=500, help="channels per scan benchmark")
+    parser.add_argument("--iterations", type=int, default=10_000, help="timed calls per micro-benchmark")
+    parser.add_argument("--bookmarks", type=int, default=1_000, help="bookmarks in the load/save benchmark file")
+    parser.add_argument("--verbose", "-v", action="store_true", help="log each result")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks and store the results.
+
+    :returns: 1 if the results regress against the baseline, 0 otherwise
+    """
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    baseline = load_results(args.baseline) if args.baseline else None
+
+    results = scan_benchmarks.run(args.profile or ["ideal", "lan"], args.steps)
+    results += micro_benchmarks.run(args.iterations, args.bookmarks)
+    write_results(args.output, results)
+
+    for result in results:
+        print(
+            f"{result.name:32} {result.ops_per_second:12.1f} ops/s"
+            f"  p50 {result.latency_us['p50']:9.1f} us  p99 {result.latency_us['p99']:9.1f} us"
+            f"  {result.allocated_blocks:8.2f} blocks/op"
+        )
+    if baseline is None:
+        return 0
+    regressions = compare_results(baseline, results, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
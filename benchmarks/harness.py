@@ -0,0 +1,192 @@
+"""
+Timing, allocation accounting and json storage of benchmark results.
+"""
+
+import gc
+import json
+import logging
+import math
+import platform
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from importlib import metadata
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+RESULTS_VERSION = 1
+_PERCENTILES = (50, 90, 99)
+
+
+@dataclass
+class BenchmarkResult:
+    """Outcome of one benchmark.
+
+    :param name: benchmark name, unique within a run
+    :param operations: number of timed operations (calls or scan steps)
+    :param total_s: wall time of the timed operations
+    :param ops_per_second: operations / total_s
+    :param latency_us: per-operation latency percentiles in microseconds,
+        keyed "p50", "p90", "p99" and "max"
+    :param allocated_blocks: memory blocks still allocated after one
+        operation, averaged over the allocation pass
+    :param peak_kib: peak traced memory during the allocation pass
+    """
+
+    name: str
+    operations: int
+    total_s: float
+    ops_per_second: float
+    latency_us: dict[str, float]
+    allocated_blocks: float
+    peak_kib: float
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the *pct* percentile of *samples*, nearest-rank method.
+
+    :raises ValueError: if samples is empty
+    """
+    if not samples:
+        raise ValueError("no samples")
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def latency_summary(durations_s: list[float]) -> dict[str, float]:
+    """Return the percentiles and max of *durations_s*, in microseconds."""
+    summary = {f"p{pct}": percentile(durations_s, pct) * 1e6 for pct in _PERCENTILES}
+    summary["max"] = max(durations_s) * 1e6
+    return summary
+
+
+def allocations(operation: Callable[[], object], operations: int) -> tuple[float, float]:
+    """Run *operation* under tracemalloc.
+
+    The allocation pass is separate from the timed one: tracing slows every
+    allocation down and would distort the latencies.  Garbage is collected
+    before each snapshot, so only the blocks kept alive are counted.
+
+    :returns: blocks left allocated per operation and peak KiB
+    """
+    tracemalloc.start()
+    try:
+        gc.collect()
+        before = tracemalloc.take_snapshot()
+        for _ in range(operations):
+            operation()
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return blocks / operations, peak / 1024
+
+
+def measure(name: str, operation: Callable[[], object], iterations: int, warmup: int = 10) -> BenchmarkResult:
+    """Time *iterations* calls of *operation* and account its allocations.
+
+    :param name: benchmark name
+    :param operation: the callable under test, called without arguments
+    :param iterations: number of timed calls
+    :param warmup: untimed calls made first
+    :raises ValueError: if iterations is lower than 1
+    """
+    if iterations < 1:
+        raise ValueError(f"iterations must be >= 1, got {iterations}")
+    for _ in range(warmup):
+        operation()
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        operation()
+        durations.append(time.perf_counter() - start)
+    blocks, peak_kib = allocations(operation, min(iterations, 100))
+    return result_from_durations(name, durations, blocks, peak_kib)
+
+
+def result_from_durations(
+    name: str, durations_s: list[float], allocated_blocks: float, peak_kib: float
+) -> BenchmarkResult:
+    """Build a BenchmarkResult from per-operation durations."""
+    total = sum(durations_s)
+    result = BenchmarkResult(
+        name=name,
+        operations=len(durations_s),
+        total_s=total,
+        ops_per_second=len(durations_s) / total if total else math.inf,
+        latency_us=latency_summary(durations_s),
+        allocated_blocks=allocated_blocks,
+        peak_kib=peak_kib,
+    )
+    logger.info(
+        "%s: %.1f ops/s, p50 %.1f us, p99 %.1f us",
+        name,
+        result.ops_per_second,
+        result.latency_us["p50"],
+        result.latency_us["p99"],
+    )
+    return result
+
+
+def _package_version() -> str:
+    try:
+        return metadata.version("rig-remote")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def write_results(path: str, results: list[BenchmarkResult]) -> None:
+    """Store *results* as json in *path*, with the environment they ran in."""
+    data = {
+        "version": RESULTS_VERSION,
+        "rig_remote": _package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "results": [asdict(result) for result in results],
+    }
+    with open(path, "w", encoding="utf-8") as results_file:
+        json.dump(data, results_file, indent=2)
+    logger.info("Saved %i benchmark results to %s", len(results), path)
+
+
+def load_results(path: str) -> dict[str, BenchmarkResult]:
+    """Load the results stored by write_results, keyed by name.
+
+    :raises OSError: if the file can't be read
+    :raises ValueError: if the file isn't a results file of this version
+    """
+    with open(path, encoding="utf-8") as results_file:
+        data: dict[str, Any] = json.load(results_file)
+    if data.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path} is not a version {RESULTS_VERSION} benchmark results file")
+    return {entry["name"]: BenchmarkResult(**entry) for entry in data["results"]}
+
+
+def compare_results(
+    baseline: dict[str, BenchmarkResult], current: list[BenchmarkResult], tolerance: float = 0.1
+) -> list[str]:
+    """Return the regressions of *current* against *baseline*.
+
+    A benchmark regresses when its throughput drops, or its p99 latency
+    grows, by more than *tolerance* (a fraction).  Benchmarks missing from
+    the baseline are not compared.
+    """
+    regressions = []
+    for result in current:
+        reference = baseline.get(result.name)
+        if reference is None:
+            continue
+        if result.ops_per_second < reference.ops_per_second * (1 - tolerance):
+            regressions.append(f"{result.name}: {result.ops_per_second:.1f} ops/s, was {reference.ops_per_second:.1f}")
+        if result.latency_us["p99"] > reference.latency_us["p99"] * (1 + tolerance):
+            regressions.append(
+                f"{result.name}: p99 {result.latency_us['p99']:.1f} us, was {reference.latency_us['p99']:.1f}"
+            )
+    return regressions
@@ -0,0 +1,58 @@
+"""
+Micro-benchmarks of the model and disk io hot paths.
+
+Channel construction runs on every tune of a scan, LogFile.write on every
+logged signal; BookmarksManager load and save run on a bookmark file of
+``bookmarks`` entries, the size of a large gqrx import.
+"""
+
+import os
+import tempfile
+
+from benchmarks.harness import BenchmarkResult, measure
+from rig_remote.bookmarksmanager import BookmarksManager, bookmark_factory
+from rig_remote.constants import LOG_RECORD_FREQUENCY
+from rig_remote.disk_io import LogFile
+from rig_remote.models.channel import Channel
+
+
+def bench_channel(iterations: int) -> BenchmarkResult:
+    return measure("channel_construction", lambda: Channel(input_frequency=145_500_000, modulation="FM"), iterations)
+
+
+def bench_bookmarks(directory: str, bookmarks: int, iterations: int) -> list[BenchmarkResult]:
+    """Benchmark BookmarksManager.save and load on a file of *bookmarks* entries."""
+    path = os.path.join(directory, "bookmarks.csv")
+    manager = BookmarksManager()
+    manager.bookmarks = [
+        bookmark_factory(100_000_000 + i * 12_500, "FM", f"bookmark {i}", "", "") for i in range(bookmarks)
+    ]
+    manager.save(path)
+
+    def load() -> None:
+        BookmarksManager().load(path)
+
+    return [
+        measure(f"bookmarks_save_{bookmarks}", lambda: manager.save(path), iterations, warmup=2),
+        measure(f"bookmarks_load_{bookmarks}", load, iterations, warmup=2),
+    ]
+
+
+def bench_log_write(directory: str, iterations: int) -> BenchmarkResult:
+    log = LogFile()
+    log.open(os.path.join(directory, "scan.log"))
+    record = bookmark_factory(145_500_000, "FM", "log benchmark", "", "")
+    try:
+        return measure("logfile_write", lambda: log.write(LOG_RECORD_FREQUENCY, record, [-35.0]), iterations)
+    finally:
+        log.close()
+
+
+def run(iterations: int, bookmarks: int) -> list[BenchmarkResult]:
+    """Run every micro-benchmark, *iterations* timed calls each."""
+    with tempfile.TemporaryDirectory() as directory:
+        return [
+            bench_channel(iterations),
+            *bench_bookmarks(directory, bookmarks, max(1, iterations // 100)),
+            bench_log_write(directory, iterations),
+        ]
@@ -0,0 +1,118 @@
+"""
+Scan throughput benchmarks.
+
+Both scan strategies are built with create_scanner and run against a
+SimulatedRigCtl.  The scanner's own waits (tune settle, signal sampling)
+are disabled through sleep_fn, so a step costs the scan engine work plus
+the round trips to the rig, whose latency comes from LATENCY_PROFILES.
+
+A step is the interval between two consecutive set_frequency calls.
+"""
+
+import time
+from typing import Any
+from unittest.mock import Mock
+
+from benchmarks.harness import BenchmarkResult, allocations, result_from_durations
+from rig_remote.bookmarksmanager import bookmark_factory
+from rig_remote.disk_io import LogFile
+from rig_remote.models.bookmark import Bookmark
+from rig_remote.models.scanning_task import ScanningTask
+from rig_remote.queue_comms import QueueComms
+from rig_remote.rig_backends.simulated_rigctl import (
+    Carrier,
+    SimulatedRigCtl,
+    SimulatedSpectrum,
+    SimulationProfile,
+)
+from rig_remote.scanning import ScanningConfig, create_scanner
+from rig_remote.stmessenger import STMessenger
+
+# Rig round-trip latency models, in seconds: an in-process rig, gqrx on the
+# local network, a rig reached over wifi and one across the internet.
+LATENCY_PROFILES = {
+    "ideal": SimulationProfile(),
+    "lan": SimulationProfile(latency=0.0005, jitter=0.0003, seed=1),
+    "wifi": SimulationProfile(latency=0.003, jitter=0.004, seed=1),
+    "remote": SimulationProfile(latency=0.025, jitter=0.015, seed=1),
+}
+
+_RANGE_MIN = 100_000_000
+_INTERVAL = 12_500
+_SGN_LEVEL = -40
+
+
+class _TimedRig(SimulatedRigCtl):
+    """SimulatedRigCtl recording when each tune starts."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.tune_times: list[float] = []
+
+    def set_frequency(self, frequency: int) -> None:
+        self.tune_times.append(time.perf_counter())
+        super().set_frequency(frequency)
+
+
+def _spectrum(frequencies: list[int]) -> SimulatedSpectrum:
+    """One carrier above the detection level every 20 channels."""
+    return SimulatedSpectrum(
+        carriers=[Carrier(frequency=freq, level=-20.0, bandwidth=_INTERVAL) for freq in frequencies[::20]]
+    )
+
+
+def _task(scan_mode: str, steps: int, bookmarks: list[Bookmark]) -> ScanningTask:
+    return ScanningTask(
+        frequency_modulation="FM",
+        scan_mode=scan_mode,
+        new_bookmarks_list=[],
+        range_min=_RANGE_MIN,
+        range_max=_RANGE_MIN + steps * _INTERVAL,
+        interval=_INTERVAL,
+        delay=0,
+        passes=1,
+        sgn_level=_SGN_LEVEL,
+        wait=False,
+        record=False,
+        auto_bookmark=False,
+        log=False,
+        bookmarks=bookmarks,
+    )
+
+
+def _run_scan(scan_mode: str, steps: int, profile: SimulationProfile) -> _TimedRig:
+    frequencies = [_RANGE_MIN + step * _INTERVAL for step in range(steps)]
+    bookmarks = []
+    if scan_mode == "bookmarks":
+        bookmarks = [bookmark_factory(freq, "FM", f"channel {i}", "", "") for i, freq in enumerate(frequencies)]
+    rig = _TimedRig(spectrum=_spectrum(frequencies), profile=profile)
+    scanner = create_scanner(
+        scan_mode=scan_mode,
+        scan_queue=STMessenger(QueueComms()),
+        log_filename="",
+        rigctl=rig,
+        config=ScanningConfig(signal_checks=2),
+        log=Mock(spec=LogFile),
+        sleep_fn=lambda _: None,
+    )
+    scanner.scan(_task(scan_mode, steps, bookmarks))
+    rig.tune_times.append(time.perf_counter())
+    return rig
+
+
+def bench_scan(scan_mode: str, profile_name: str, steps: int) -> BenchmarkResult:
+    """Benchmark one scan of *steps* channels.
+
+    :param scan_mode: "frequency" or "bookmarks"
+    :param profile_name: key of LATENCY_PROFILES
+    :param steps: channels to scan
+    """
+    rig = _run_scan(scan_mode, steps, LATENCY_PROFILES[profile_name])
+    durations = [end - start for start, end in zip(rig.tune_times, rig.tune_times[1:], strict=False)]
+    blocks, peak_kib = allocations(lambda: _run_scan(scan_mode, steps, LATENCY_PROFILES["ideal"]), 1)
+    return result_from_durations(f"scan_{scan_mode}_{profile_name}", durations, blocks / steps, peak_kib)
+
+
+def run(profiles: list[str], steps: int) -> list[BenchmarkResult]:
+    """Run the scan benchmarks of both strategies for each of *profiles*."""
+    return [bench_scan(scan_mode, profile, steps) for profile in profiles for scan_mode in ("frequency", "bookmarks")]
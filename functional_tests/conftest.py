@@ -0,0 +1,36 @@
+"""
+Optional gqrx stand-in for the functional tests.
+
+With RIG_REMOTE_GQRX_SIMULATOR=1 in the environment, and no gqrx already
+listening, a GQRXSimulator is started on the gqrx endpoint before the test
+modules are collected, so the gqrx functional tests run on any machine.
+Under pytest-xdist the simulator runs in the controller process only and
+the workers share its single rig state, as they would share a real gqrx:
+run the gqrx tests without -n for reliable results.
+"""
+
+import os
+
+import pytest
+
+from functional_tests.gqrx_config import _GQRX_HOST, _GQRX_PORT, _gqrx_reachable
+from rig_remote.rig_backends.gqrx_simulator import GQRXSimulator
+
+_SIMULATOR_ENV = "RIG_REMOTE_GQRX_SIMULATOR"
+_simulator_key = pytest.StashKey[GQRXSimulator]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if os.environ.get(_SIMULATOR_ENV) != "1" or hasattr(config, "workerinput"):
+        return
+    if _gqrx_reachable():
+        return
+    simulator = GQRXSimulator(host=_GQRX_HOST, port=_GQRX_PORT)
+    simulator.start()
+    config.stash[_simulator_key] = simulator
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    simulator = config.stash.get(_simulator_key, None)
+    if simulator is not None:
+        simulator.stop()
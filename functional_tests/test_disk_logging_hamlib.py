@@ -2,18 +2,18 @@
 Functional tests for disk-logging behaviour (task.log=True).
 
 Exercises the full scan pipeline with task.log=True against a real LogFile
-Mock so that every log.write() call can be inspected.  The scanner strategies
+Mock so that every log.write() and log.write_entry() call can be inspected.  The scanner strategies
 are real instances; only the RigCtl hardware interface and the LogFile are
 mocked.
 
 Behaviours under test:
 
 Frequency scanner (record_type="F"):
-  - log.write() called once per signal detection, never when no signal
+  - log.write_entry() called once per signal detection, never when no signal
   - record_type argument is always "F"
-  - The Bookmark passed to write() carries the correct signal frequency
+  - write_entry() is given the signal frequency and the scanned modulation
   - signal argument is always an empty list
-  - log.write() never called when task.log=False, even when signal is present
+  - log.write_entry() never called when task.log=False, even when signal is present
   - log.open() and log.close() called exactly once when task.log=True
 
 Bookmark scanner (record_type="B"):
@@ -156,11 +156,11 @@ def _scanner(scan_mode: str, rig: Mock, log_mock: Mock):
 
 
 # ===========================================================================
-# Frequency scanner — log.write behaviour
+# Frequency scanner — log.write_entry behaviour
 # ===========================================================================
 
 def test_freq_scan_log_write_called_once_per_signal_detection():
-    """One signal detection → log.write() called exactly once."""
+    """One signal detection → log.write_entry() called exactly once."""
     level_map = {88_000_000: _NOISE, 89_000_000: _SIGNAL, 90_000_000: _NOISE}
     rig = _make_freq_tracking_rig(level_map)
     log = _make_log_mock()
@@ -168,14 +168,14 @@ def test_freq_scan_log_write_called_once_per_signal_detection():
     task = _freq_log_task(range_min=88_000_000, range_max=91_000_000, interval=1_000_000)
     _scanner("frequency", rig, log).scan(task)
 
-    assert log.write.call_count == 1, (
-        f"Expected 1 write call for 1 signal detection, got {log.write.call_count}"
+    assert log.write_entry.call_count == 1, (
+        f"Expected 1 write call for 1 signal detection, got {log.write_entry.call_count}"
     )
 
 
 @pytest.mark.parametrize("signal_count", [1, 2, 3])
 def test_freq_scan_log_write_count_matches_signal_detections(signal_count):
-    """log.write() call count equals the number of steps where signal is detected."""
+    """log.write_entry() call count equals the number of steps where signal is detected."""
     # Range: 88M to (88M + signal_count+1 MHz) in 1 MHz steps
     # Signal at 89M, 90M, 91M … up to signal_count steps
     base = 88_000_000
@@ -192,13 +192,13 @@ def test_freq_scan_log_write_count_matches_signal_detections(signal_count):
     task = _freq_log_task(range_min=base, range_max=range_max, interval=interval)
     _scanner("frequency", rig, log).scan(task)
 
-    assert log.write.call_count == signal_count, (
-        f"Expected {signal_count} write calls, got {log.write.call_count}"
+    assert log.write_entry.call_count == signal_count, (
+        f"Expected {signal_count} write calls, got {log.write_entry.call_count}"
     )
 
 
 def test_freq_scan_log_write_record_type_is_F():
-    """Every log.write() call for the frequency scanner uses record_type='F'."""
+    """Every log.write_entry() call for the frequency scanner uses record_type='F'."""
     level_map = {88_000_000: _NOISE, 89_000_000: _SIGNAL, 90_000_000: _NOISE}
     rig = _make_freq_tracking_rig(level_map)
     log = _make_log_mock()
@@ -206,7 +206,7 @@ def test_freq_scan_log_write_record_type_is_F():
     task = _freq_log_task(range_min=88_000_000, range_max=91_000_000, interval=1_000_000)
     _scanner("frequency", rig, log).scan(task)
 
-    for c in log.write.call_args_list:
+    for c in log.write_entry.call_args_list:
         assert c.kwargs.get("record_type") == "F" or c.args[0] == "F", (
             f"Expected record_type='F', got call: {c}"
         )
@@ -221,14 +221,14 @@ def test_freq_scan_log_write_signal_arg_is_empty_list():
     task = _freq_log_task(range_min=88_000_000, range_max=90_000_000, interval=1_000_000)
     _scanner("frequency", rig, log).scan(task)
 
-    assert log.write.call_count == 1
-    c = log.write.call_args
-    signal_arg = c.kwargs.get("signal") if c.kwargs.get("signal") is not None else c.args[2]
+    assert log.write_entry.call_count == 1
+    c = log.write_entry.call_args
+    signal_arg = c.kwargs.get("signal") if c.kwargs.get("signal") is not None else c.args[3]
     assert signal_arg == [], f"Expected signal=[], got {signal_arg!r}"
 
 
-def test_freq_scan_log_write_bookmark_frequency_matches_detection():
-    """The Bookmark record passed to log.write() carries the signal frequency."""
+def test_freq_scan_log_write_frequency_matches_detection():
+    """log.write_entry() is given the signal frequency and the scanned mode."""
     SIGNAL_FREQ = 89_000_000
     level_map = {88_000_000: _NOISE, SIGNAL_FREQ: _SIGNAL, 90_000_000: _NOISE}
     rig = _make_freq_tracking_rig(level_map)
@@ -237,27 +237,28 @@ def test_freq_scan_log_write_bookmark_frequency_matches_detection():
     task = _freq_log_task(range_min=88_000_000, range_max=91_000_000, interval=1_000_000)
     _scanner("frequency", rig, log).scan(task)
 
-    assert log.write.call_count == 1
-    c = log.write.call_args
-    record = c.kwargs.get("record") if "record" in (c.kwargs or {}) else c.args[1]
-    assert record.channel.frequency == SIGNAL_FREQ, (
-        f"Expected bookmark frequency {SIGNAL_FREQ}, got {record.channel.frequency}"
+    assert log.write_entry.call_count == 1
+    c = log.write_entry.call_args
+    assert c.kwargs["frequency"] == SIGNAL_FREQ, (
+        f"Expected frequency {SIGNAL_FREQ}, got {c.kwargs['frequency']}"
     )
+    assert c.kwargs["modulation"] == task.frequency_modulation
+    rig.get_mode.assert_not_called()
 
 
 def test_freq_scan_log_not_called_when_no_signal():
-    """No signal detected → log.write() is never called."""
+    """No signal detected → log.write_entry() is never called."""
     rig = _make_freq_tracking_rig({88_000_000: _NOISE, 89_000_000: _NOISE})
     log = _make_log_mock()
 
     task = _freq_log_task(range_min=88_000_000, range_max=90_000_000, interval=1_000_000)
     _scanner("frequency", rig, log).scan(task)
 
-    log.write.assert_not_called()
+    log.write_entry.assert_not_called()
 
 
 def test_freq_scan_log_not_called_when_log_flag_false():
-    """task.log=False → log.write() never called even when signal is present."""
+    """task.log=False → log.write_entry() never called even when signal is present."""
     level_map = {88_000_000: _SIGNAL, 89_000_000: _NOISE}
     rig = _make_freq_tracking_rig(level_map)
     log = _make_log_mock()
@@ -267,7 +268,7 @@ def test_freq_scan_log_not_called_when_log_flag_false():
     )
     _scanner("frequency", rig, log).scan(task)
 
-    log.write.assert_not_called()
+    log.write_entry.assert_not_called()
 
 
 def test_freq_scan_log_open_and_close_called_when_log_true():
@@ -349,13 +349,13 @@ def test_inner_scan_two_triggers_produce_two_independent_bookmarks():
 
 
 # ---------------------------------------------------------------------------
-# Test: bookmark modulation comes from get_mode(), not task modulation
+# Test: bookmark modulation comes from the task, not from get_mode()
 # ---------------------------------------------------------------------------
 
-@pytest.mark.parametrize("rig_mode", ["FM", "AM", "USB", "LSB", "CW"])
-def test_inner_scan_bookmark_modulation_comes_from_get_mode(rig_mode):
-    """The bookmark created by the inner scan queries get_mode() for
-    modulation; task.frequency_modulation does not bleed into the bookmark."""
+@pytest.mark.parametrize("task_modulation", ["FM", "AM", "USB", "LSB", "CW"])
+def test_inner_scan_bookmark_modulation_comes_from_task(task_modulation):
+    """The bookmark created by the inner scan carries the modulation the
+    scan tuned; the rig is not queried for its mode."""
     TRIGGER_FREQ = 88_000_000
     PEAK_FREQ    = 88_250_000
 
@@ -364,9 +364,9 @@ def test_inner_scan_bookmark_modulation_comes_from_get_mode(rig_mode):
         PEAK_FREQ:    _THRESHOLD + 150,
         89_000_000:   _NOISE,
     }
+    rig_mode = "FM" if task_modulation != "FM" else "AM"
     rig = _make_frequency_tracking_rig(level_map, mode=rig_mode)
 
-    task_modulation = "FM" if rig_mode != "FM" else "AM"
     task = _inner_task(
         range_min=88_000_000,
         range_max=90_000_000,
@@ -378,7 +378,8 @@ def test_inner_scan_bookmark_modulation_comes_from_get_mode(rig_mode):
     _scanner_with_rig(rig).scan(task)
 
     assert len(task.new_bookmarks_list) == 1
-    assert task.new_bookmarks_list[0].channel.modulation == rig_mode, (
-        f"Expected modulation {rig_mode!r} from get_mode(), "
+    assert task.new_bookmarks_list[0].channel.modulation == task_modulation, (
+        f"Expected modulation {task_modulation!r} from the task, "
         f"got {task.new_bookmarks_list[0].channel.modulation!r}"
     )
+    rig.get_mode.assert_not_called()
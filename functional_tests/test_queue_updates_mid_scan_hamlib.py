@@ -225,7 +225,7 @@ def test_sgn_level_update_does_not_affect_steps_already_passed():
         range_min=RANGE_MIN, range_max=RANGE_MAX, interval=INTERVAL,
         sgn_level=_SGN_LEVEL, auto_bookmark=False,
     )
-    task.log = True  # enable logging so log.write() acts as signal indicator
+    task.log = True  # enable logging so log.write_entry() acts as signal indicator
 
     log_mock = Mock(spec=LogFile)
     scanner = create_scanner(
@@ -239,7 +239,7 @@ def test_sgn_level_update_does_not_affect_steps_already_passed():
     )
     scanner.scan(task)
 
-    log_mock.write.assert_called_once()
+    log_mock.write_entry.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
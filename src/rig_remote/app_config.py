@@ -38,7 +38,7 @@ from rig_remote.constants import (
     SELECTED_RIG_KEYS,
 )
 from rig_remote.disk_io import IO
-from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.models.rig_endpoint import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT, RigEndpoint
 from rig_remote.rig_backends.protocol import BackendType
 
 logger = logging.getLogger(__name__)
@@ -47,7 +47,7 @@ _ENDPOINT_SECTION_PREFIX = "rigendpoint."
 _SELECTED_RIGS_SECTION = "selected rigs"
 
 # Fields persisted per endpoint section, in save order.
-_GQRX_ENDPOINT_FIELDS = ("uuid", "backend", "name", "hostname", "port")
+_GQRX_ENDPOINT_FIELDS = ("uuid", "backend", "name", "hostname", "port", "connect_timeout", "read_timeout")
 _HAMLIB_ENDPOINT_FIELDS = (
     "uuid",
     "backend",
@@ -72,6 +72,8 @@ def _endpoint_to_section(endpoint: RigEndpoint) -> dict[str, str]:
     if endpoint.backend == BackendType.GQRX:
         base["hostname"] = endpoint.hostname
         base["port"] = str(endpoint.port)
+        base["connect_timeout"] = str(endpoint.connect_timeout)
+        base["read_timeout"] = str(endpoint.read_timeout)
     else:
         base["rig_model"] = str(endpoint.rig_model)
         base["serial_port"] = endpoint.serial_port
@@ -101,6 +103,8 @@ def _section_to_endpoint(items: dict[str, str]) -> RigEndpoint | None:
                 name=name,
                 hostname=items.get("hostname", ""),
                 port=int(items.get("port", "0")),
+                connect_timeout=float(items.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT)),
+                read_timeout=float(items.get("read_timeout", DEFAULT_READ_TIMEOUT)),
             )
         else:
             endpoint = RigEndpoint(
@@ -145,6 +149,7 @@ class AppConfig:
         "passes": "0",
         "inner_band": "0",
         "inner_interval": "0",
+        "priority_interval": "0",
         "sgn_level": "-30",
         "range_min": "24,000",
         "range_max": "1800,000",
@@ -155,6 +160,7 @@ class AppConfig:
         "save_exit": "false",
         "aggr_scan": "false",
         "auto_bookmark": "false",
+        "adaptive_scan": "false",
         "log_filename": None,
         "bookmark_filename": None,
     }
@@ -372,6 +378,7 @@ class AppConfig:
         self.config["passes"] = window.params["txt_passes"].text()
         self.config["inner_band"] = window.params["txt_inner_band"].text()
         self.config["inner_interval"] = window.params["txt_inner_interval"].text()
+        self.config["priority_interval"] = window.params["txt_priority_interval"].text()
         self.config["sgn_level"] = window.params["txt_sgn_level"].text()
         self.config["range_min"] = window.params["txt_range_min"].text()
         self.config["range_max"] = window.params["txt_range_max"].text()
@@ -381,5 +388,6 @@ class AppConfig:
         self.config["always_on_top"] = window.ckb_top.isChecked()
         self.config["save_exit"] = window.ckb_save_exit.isChecked()
         self.config["auto_bookmark"] = window.params["ckb_auto_bookmark"].isChecked()
+        self.config["adaptive_scan"] = window.params["ckb_adaptive_scan"].isChecked()
         self.config["bookmark_filename"] = window.bookmarks_file
         self.config["log_filename"] = window.log_file
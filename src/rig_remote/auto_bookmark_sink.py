@@ -0,0 +1,165 @@
+"""
+AutoBookmarkSink: auto-bookmarks of a frequency scan, merged and batched.
+
+Each hit of the scan — a frequency, its modulation and the level read there —
+either joins a cluster of hits or opens a new one.  A hit at most
+``merge_bandwidth`` Hz away from a cluster of the same modulation joins it:
+the cluster widens to cover the hit, and its peak moves to the hit when the
+hit is the stronger.  A hit bridging two clusters merges them, so the steps
+of one wide signal end up in a single cluster however they are found.
+
+The clusters of a modulation are kept sorted by their lowest frequency, so
+the cluster a hit falls in is found by bisection instead of comparing the
+hit with every bookmark.  Opening or merging a cluster inserts into or
+deletes from these lists, which is O(n) in the number of clusters.  That
+move is a single memmove of pointers, cheaper than the tune and signal
+check behind each hit up to far more clusters than a scan finds, so no
+balanced tree is kept instead.
+
+The bookmarks already in the task seed the clusters: hits around them are
+not bookmarked again.  flush() turns each cluster opened since the previous
+flush into one bookmark, at its peak, and appends them to the task.
+"""
+
+import logging
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from itertools import chain
+
+from rig_remote.bookmarksmanager import bookmark_factory
+from rig_remote.models.bookmark import Bookmark
+from rig_remote.models.scanning_task import ScanningTask
+
+logger = logging.getLogger(__name__)
+
+AUTO_BOOKMARK_DESCRIPTION = "auto added by scan"
+
+# Level of the hits whose level is not known, weaker than any level read.
+NO_LEVEL = float("-inf")
+
+
+@dataclass(slots=True)
+class _Cluster:
+    """Hits of one modulation within merge_bandwidth of each other."""
+
+    modulation: str
+    low: int
+    high: int
+    peak: int
+    level: float
+    # Bookmarked already, in the task or by a previous flush.
+    known: bool = False
+    # Absorbed by the cluster below it.
+    merged: bool = False
+
+
+class _Clusters:
+    """Clusters of one modulation, sorted by lowest frequency."""
+
+    def __init__(self) -> None:
+        self._lows: list[int] = []
+        self._clusters: list[_Cluster] = []
+
+    def add(self, modulation: str, frequency: int, level: float, bandwidth: int, known: bool) -> _Cluster | None:
+        """Merge a hit into the clusters, in O(log n) plus an O(n) list
+        insert when it opens a cluster or delete when it merges two.
+
+        :returns: the cluster opened by the hit, None when it joined one.
+        """
+        index = bisect_right(self._lows, frequency)
+        joined = [
+            i
+            for i in (index - 1, index)
+            if 0 <= i < len(self._clusters)
+            and self._clusters[i].low - bandwidth <= frequency <= self._clusters[i].high + bandwidth
+        ]
+        if not joined:
+            cluster = _Cluster(modulation, frequency, frequency, frequency, level, known)
+            self._lows.insert(index, frequency)
+            self._clusters.insert(index, cluster)
+            return cluster
+
+        position = joined[0]
+        cluster = self._clusters[position]
+        if len(joined) == 2:
+            self._absorb(cluster, self._clusters[position + 1])
+            del self._lows[position + 1]
+            del self._clusters[position + 1]
+        if frequency < cluster.low:
+            cluster.low = self._lows[position] = frequency
+        cluster.high = max(cluster.high, frequency)
+        if not cluster.known and level > cluster.level:
+            cluster.peak = frequency
+            cluster.level = level
+        cluster.known = cluster.known or known
+        return None
+
+    @staticmethod
+    def _absorb(cluster: _Cluster, upper: _Cluster) -> None:
+        """Merge *upper*, the next cluster up, into *cluster*."""
+        upper.merged = True
+        cluster.high = upper.high
+        if not cluster.known and (upper.known or upper.level > cluster.level):
+            cluster.peak, cluster.level = upper.peak, upper.level
+        cluster.known = cluster.known or upper.known
+
+
+class AutoBookmarkSink:
+    """Auto-bookmarks of a scan, merged by proximity and added to the task
+    in batches.
+    """
+
+    def __init__(self, task: ScanningTask, merge_bandwidth: int = 0) -> None:
+        """Initialise a sink for *task*, seeded with its bookmarks.
+
+        :param task: ScanningTask receiving the bookmarks on flush().
+        :param merge_bandwidth: Hz within which hits are merged, 0 merges
+            the hits on the same frequency only.
+        """
+        self.task = task
+        self.merge_bandwidth = merge_bandwidth
+        self._clusters: defaultdict[str, _Clusters] = defaultdict(_Clusters)
+        self._pending: list[_Cluster] = []
+        for bm in chain(task.bookmarks, task.new_bookmarks_list):
+            self._add(bm.channel.frequency, bm.channel.modulation, NO_LEVEL, known=True)
+
+    def __len__(self) -> int:
+        """Return the number of bookmarks the next flush() will add."""
+        return sum(1 for cluster in self._pending if not (cluster.known or cluster.merged))
+
+    def _add(self, frequency: int, modulation: str, level: float, known: bool) -> _Cluster | None:
+        return self._clusters[modulation].add(modulation, frequency, level, self.merge_bandwidth, known)
+
+    def add(self, frequency: int, modulation: str, level: float = NO_LEVEL) -> bool:
+        """Merge a hit of the scan.
+
+        :param level: signal level read at *frequency*, NO_LEVEL if unknown
+        :returns: True when the hit opens a new cluster, False when it was
+            merged into a known or pending one.
+        """
+        cluster = self._add(frequency, modulation, level, known=False)
+        if cluster is None:
+            logger.debug("Hit at %d Hz %s merged", frequency, modulation)
+            return False
+        self._pending.append(cluster)
+        return True
+
+    def flush(self) -> list[Bookmark]:
+        """Append one bookmark per new cluster to the task and return them."""
+        pending, self._pending = self._pending, []
+        flushed = []
+        for cluster in pending:
+            if cluster.known or cluster.merged:
+                continue
+            cluster.known = True
+            flushed.append(
+                bookmark_factory(
+                    input_frequency=cluster.peak,
+                    modulation=cluster.modulation,
+                    description=AUTO_BOOKMARK_DESCRIPTION,
+                    lockout="",
+                )
+            )
+        self.task.new_bookmarks_list.extend(flushed)
+        return flushed
@@ -0,0 +1,58 @@
+"""
+Band plan files for segmented frequency scans.
+
+A band plan is a csv file with one segment per row:
+
+    range_min,range_max,interval,modulation[,description]
+
+Frequencies and interval are in Hz; range_min is inclusive and range_max
+exclusive, as in the scan loop.  Empty rows and rows whose first field
+starts with "#" are ignored, invalid rows are logged and skipped.
+"""
+
+import logging
+
+from rig_remote.disk_io import IO
+from rig_remote.models.scan_segment import ScanSegment, merge_segments
+
+logger = logging.getLogger(__name__)
+
+_MIN_FIELDS = 4
+_MAX_FIELDS = 5
+
+
+def load_band_plan(band_plan_file: str, delimiter: str = ",") -> list[ScanSegment]:
+    """Load the segments of a band plan file, sorted and merged.
+
+    :param band_plan_file: path of the csv file to read
+    :param delimiter: csv delimiter, defaults to ","
+    :raises InvalidPathError: if the file does not exist
+    :raises csv.Error: if the file isn't valid csv
+    :returns: the segments of the band plan, ready for ScanningTask
+    """
+    io = IO()
+    io.csv_load(band_plan_file, delimiter)
+    segments = []
+    skipped_count = 0
+    for row in io.csv_rows:
+        if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+            continue
+        if not _MIN_FIELDS <= len(row) <= _MAX_FIELDS:
+            logger.info("skipping band plan line %s, expecting %i or %i fields", row, _MIN_FIELDS, _MAX_FIELDS)
+            skipped_count += 1
+            continue
+        try:
+            segments.append(
+                ScanSegment(
+                    range_min=int(row[0]),
+                    range_max=int(row[1]),
+                    interval=int(row[2]),
+                    modulation=row[3].strip(),
+                    description=row[4].strip() if len(row) == _MAX_FIELDS else "",
+                )
+            )
+        except ValueError:
+            logger.info("skipping band plan line %s as invalid", row)
+            skipped_count += 1
+    logger.info("Loaded %i band plan segments, skipped %i entries", len(segments), skipped_count)
+    return merge_segments(segments)
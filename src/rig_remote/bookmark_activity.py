@@ -0,0 +1,131 @@
+"""
+Activity tracking for adaptive bookmark scans.
+
+BookmarkActivity keeps an exponentially decaying hit score per bookmark and
+turns it into a visiting order for each scan pass:
+
+  - busy bookmarks (high score) are visited first;
+  - bookmarks whose score decayed below ``cold_threshold`` are visited only
+    once every ``cold_revisit_passes`` passes, so long-silent channels stop
+    costing a tune and a signal check on every pass;
+  - bookmarks never visited before are always due;
+  - a pass is never empty: when every bookmark is silent and not yet due,
+    the most overdue one is visited.
+
+Scores live in the instance, so keeping one BookmarkActivity around and
+passing it to successive ScanningTasks carries the history across scans.
+"""
+
+import logging
+
+from rig_remote.models.bookmark import Bookmark
+
+logger = logging.getLogger(__name__)
+
+
+def activity_key(bookmark: Bookmark) -> str:
+    """Return the key used to track *bookmark*.
+
+    Bookmarks built through ``bookmark_factory`` without an explicit id carry
+    an empty id, so frequency and modulation are used as a fallback key.
+
+    :param bookmark: bookmark to build the key for
+    :returns: the bookmark id, or "<frequency>:<modulation>" when it is empty
+    """
+    if bookmark.id:
+        return bookmark.id
+    return f"{bookmark.channel.frequency}:{bookmark.channel.modulation}"
+
+
+class BookmarkActivity:
+    """Decaying per-bookmark hit scores and the pass schedule derived from them."""
+
+    def __init__(
+        self,
+        decay: float = 0.5,
+        cold_threshold: float = 0.05,
+        cold_revisit_passes: int = 4,
+    ) -> None:
+        """Initialise an empty activity history.
+
+        :param decay: factor applied to the previous score on every visit,
+            must be in [0, 1).  Lower values forget old activity faster.
+        :param cold_threshold: score below which a visited bookmark is
+            considered silent.
+        :param cold_revisit_passes: a silent bookmark is visited once every
+            this many passes; 1 disables skipping.
+        :raises ValueError: if any parameter is out of range
+        """
+        if not 0.0 <= decay < 1.0:
+            raise ValueError(f"decay must be in [0, 1), got {decay}")
+        if cold_threshold < 0:
+            raise ValueError(f"cold_threshold must be >= 0, got {cold_threshold}")
+        if cold_revisit_passes < 1:
+            raise ValueError(f"cold_revisit_passes must be >= 1, got {cold_revisit_passes}")
+        self._decay = decay
+        self._cold_threshold = cold_threshold
+        self._cold_revisit_passes = cold_revisit_passes
+        self._scores: dict[str, float] = {}
+        self._skipped_passes: dict[str, int] = {}
+
+    def score(self, bookmark: Bookmark) -> float:
+        """Return the current activity score of *bookmark* (0.0 when unknown)."""
+        return self._scores.get(activity_key(bookmark), 0.0)
+
+    def record(self, bookmark: Bookmark, hit: bool) -> None:
+        """Fold the outcome of one visit into the score of *bookmark*.
+
+        :param bookmark: the bookmark just checked
+        :param hit: True if a signal was found on it
+        """
+        key = activity_key(bookmark)
+        self._scores[key] = self._scores.get(key, 0.0) * self._decay + (1.0 if hit else 0.0)
+        self._skipped_passes[key] = 0
+
+    def reset(self) -> None:
+        """Forget all recorded activity."""
+        self._scores.clear()
+        self._skipped_passes.clear()
+
+    def schedule(self, bookmarks: list[Bookmark]) -> list[Bookmark]:
+        """Return the bookmarks to visit in the next pass, busiest first.
+
+        Silent bookmarks that are not due yet are left out, unless all of them
+        are, in which case the most overdue one is kept; ties keep the original
+        list order.
+
+        :param bookmarks: full bookmark list of the scan task
+        :returns: the bookmarks due this pass, ordered by descending score
+        """
+        return [bookmarks[position] for position in self.schedule_positions(bookmarks)]
+
+    def schedule_positions(self, bookmarks: list[Bookmark]) -> list[int]:
+        """Same as ``schedule`` but return positions in *bookmarks*.
+
+        Used by scans walking a precompiled ScanPlan, whose arrays are
+        parallel to the bookmark list.
+
+        :param bookmarks: full bookmark list of the scan task
+        :returns: the positions of the bookmarks due this pass, ordered by
+            descending score
+        """
+        due: list[tuple[float, int]] = []
+        # (passes skipped, -position) of the most overdue silent bookmark
+        overdue: tuple[int, int] | None = None
+        for position, bookmark in enumerate(bookmarks):
+            key = activity_key(bookmark)
+            score = self._scores.get(key)
+            if score is not None and score < self._cold_threshold:
+                skipped = self._skipped_passes.get(key, 0) + 1
+                if skipped < self._cold_revisit_passes:
+                    self._skipped_passes[key] = skipped
+                    if overdue is None or (skipped, -position) > overdue:
+                        overdue = (skipped, -position)
+                    continue
+            due.append((-(score or 0.0), position))
+        if not due and overdue is not None:
+            # a pass that tunes nothing would still count towards the scan passes
+            due.append((0.0, -overdue[1]))
+        due.sort()
+        logger.debug("Adaptive schedule: %i of %i bookmarks due", len(due), len(bookmarks))
+        return [position for _, position in due]
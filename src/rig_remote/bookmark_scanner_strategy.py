@@ -1,14 +1,17 @@
 """
 Bookmark scan strategy.
 
-Iterates over a pre-built list of Bookmark objects, tuning the rig to each
-non-locked entry and performing optional recording, logging and wait loops.
+Compiles the bookmark list into a ScanPlan (locked entries removed) and walks
+it, tuning the rig to each entry and performing optional recording, logging
+and wait loops.  When the task carries a BookmarkActivity the visiting order
+of every pass is taken from its adaptive schedule instead of the list order.
 """
 
 import logging
 
 from rig_remote.disk_io import LogFile
 from rig_remote.models.scanning_task import ScanningTask
+from rig_remote.scan_plan import compile_bookmark_plan
 from rig_remote.scanner_core import ScannerCore
 
 logger = logging.getLogger(__name__)
@@ -31,11 +34,18 @@ class BookmarkScannerStrategy:
     def scan(self, task: ScanningTask, log: LogFile) -> ScanningTask:
         """Iterate over ``task.bookmarks``, tuning and checking each in turn.
 
-        Locked bookmarks (``lockout == "L"``) are skipped.  A tune failure
+        The bookmarks are compiled once into a ScanPlan, which leaves out
+        locked bookmarks (``lockout == "L"``), and recompiled at the start of
+        a pass if a queue event marked it stale.  A tune failure
         aborts the current pass but does not stop the outer loop unless
         ``terminate()`` was called.  Recording, logging, and the wait-for-
         signal loop are all governed by the corresponding flags in *task*.
 
+        When ``task.bookmark_activity`` is set, each pass visits the
+        positions returned by its ``schedule_positions()`` and every signal check is
+        fed back through ``record()``.  Priority bookmarks are interleaved
+        through ``ScannerCore.priority_check`` before each bookmark is tuned.
+
         :param task: ScanningTask containing the bookmark list and all scan
             options (record, log, wait, passes, sgn_level, delay).
         :param log: Open LogFile to write bookmark activity records into
@@ -46,32 +56,45 @@ class BookmarkScannerStrategy:
         pass_count = task.passes
         logger.info("Starting bookmark scan")
 
+        plan = compile_bookmark_plan(task.bookmarks)
+        self._core.plan_stale = False
+
         while not self._core.should_stop():
-            for bookmark in task.bookmarks:
+            if self._core.plan_stale:
+                plan = compile_bookmark_plan(task.bookmarks)
+                self._core.plan_stale = False
+            activity = task.bookmark_activity
+            order = activity.schedule_positions(plan.bookmarks) if activity is not None else range(len(plan))
+            for index in order:
+                bookmark = plan.bookmarks[index]
                 logger.info("Processing bookmark %s", bookmark.id)
+                self._core.count_step()
 
                 if self._core.process_queue(task):
                     pass_count = task.passes
 
-                if bookmark.lockout == "L":
-                    logger.info("Bookmark %s locked — skipping.", bookmark.id)
-                    continue
-
                 try:
-                    self._core.channel_tune(bookmark.channel)
+                    self._core.priority_check(task, log)
+                    self._core.tune(plan.frequencies[index], plan.mode(index))
                 except (OSError, TimeoutError):
                     logger.error("Tune failed for bookmark %s — aborting pass.", bookmark.id)
+                    self._core.counters.tune_errors += 1
                     break
 
                 if task.record:
-                    self._core.rigctl.start_recording()
+                    with self._core.timed("recording"):
+                        self._core.rigctl.start_recording()
                     logger.info("Recording started.")
 
-                if self._core.signal_check(sgn_level=task.sgn_level):
+                signal_found = self._core.signal_check(sgn_level=task.sgn_level)
+                if signal_found:
                     logger.info("Signal found on bookmarked frequency %s.", bookmark.id)
+                if activity is not None:
+                    activity.record(bookmark, signal_found)
 
                 if task.log:
-                    log.write(record_type="B", record=bookmark, signal=[])
+                    with self._core.timed("logging"):
+                        log.write(record_type="B", record=bookmark, signal=[])
 
                 while task.wait:
                     if self._core.signal_check(sgn_level=task.sgn_level) and not self._core.should_stop():
@@ -83,7 +106,8 @@ class BookmarkScannerStrategy:
                     self._core.queue_sleep(task)
 
                 if task.record:
-                    self._core.rigctl.stop_recording()
+                    with self._core.timed("recording"):
+                        self._core.rigctl.stop_recording()
                     logger.info("Recording stopped.")
 
                 if self._core.should_stop():
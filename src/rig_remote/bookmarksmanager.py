@@ -126,7 +126,7 @@ class BookmarksManager:
             logger.info("No bookmarks file found, skipping.")
             return []
         skipped_count = 0
-        id_list = []
+        id_list: set[str] = set()
         for entry in self._io.csv_rows:
             if len(entry) != self._BOOKMARK_ENTRY_FIELDS:
                 logger.info(
@@ -138,7 +138,7 @@ class BookmarksManager:
                 logger.info("skipping line %s as duplicate", entry)
                 skipped_count += 1
                 continue
-            id_list.append(entry[4])
+            id_list.add(entry[4])
 
             bookmark = self._factory(entry[0], entry[1], entry[2], entry[3], entry[4])
             self.bookmarks.append(bookmark)
@@ -23,6 +23,13 @@ LEN_BM = 4
 # Upper bound for valid rig frequencies (500 MHz)
 MAX_FREQUENCY_HZ = 500_000_000
 
+# Default working directory and file names, shared by the UI and the daemon
+DEFAULT_PREFIX = "~/.rig-remote"
+DEFAULT_CONFIG_FILENAME = "rig-remote.conf"
+DEFAULT_LOG_FILENAME = "rig-remote-log.txt"
+DEFAULT_BOOKMARK_FILENAME = "rig-remote-bookmarks.csv"
+DEFAULT_HAMLIB_MODELS_FILENAME = "hamlib-models.json"
+
 # Log record type identifiers used in activity log files
 LOG_RECORD_BOOKMARK = "B"
 LOG_RECORD_FREQUENCY = "F"
@@ -47,6 +54,8 @@ SCANNING_CONFIG = [
     "passes",
     "inner_band",
     "inner_interval",
+    "adaptive_scan",
+    "priority_interval",
 ]
 MAIN_CONFIG = ["always_on_top", "save_exit", "bookmark_filename", "log", "log_filename"]
 MONITOR_CONFIG = ["monitor_mode_loops"]
@@ -0,0 +1,668 @@
+"""
+Local JSON-RPC control API.
+
+ControlServer exposes a ScanController over JSON-RPC 2.0, on a localhost TCP
+port or a Unix socket, so that any number of clients can drive and monitor
+the scans, syncs and bookmarks of one process concurrently.  Requests and
+responses are JSON documents, one per line; batches are supported.
+
+Methods, with their named parameters:
+
+  status                          scan, sync and bookmark state, counters,
+                                  frequency and level of the running scan
+  scan.start  mode, rig, modulation, adaptive and ScanningTask values
+              (range_min, range_max, interval, sgn_level, delay, passes,
+              wait, record, log, auto_bookmark, inner_band, inner_interval,
+              priority_interval)
+  scan.stop
+  scan.update parameter, value    change a value of the running scan
+  sync.start / sync.stop          keep rig 1 tuned to rig 2
+  bookmarks.list
+  bookmarks.add  frequency, modulation, description, lockout
+  bookmarks.update  id, description, modulation, lockout
+  bookmarks.delete  id
+  bookmarks.save                  write the bookmark file
+
+    $ echo '{"jsonrpc": "2.0", "method": "status", "id": 1}' | nc 127.0.0.1 9478
+
+There is no authentication: the TCP server only binds to the loopback
+interface by default and the Unix socket is only accessible to its owner.
+The headless daemon serves this API with ``rig_remote_daemon --mode serve``.
+"""
+
+import json
+import logging
+import os
+import socketserver
+import threading
+from collections.abc import Callable
+from dataclasses import asdict
+from inspect import signature
+from queue import Full
+from typing import Any, cast
+from uuid import uuid4
+
+from rig_remote.app_config import AppConfig
+from rig_remote.bookmark_activity import BookmarkActivity
+from rig_remote.bookmarksmanager import BookmarksManager, bookmark_factory
+from rig_remote.constants import RIG_COUNT
+from rig_remote.daemon import (
+    SCAN_MODES,
+    TASK_FLAG_PARAMETERS,
+    TASK_INT_PARAMETERS,
+    add_new_bookmarks,
+    build_backends,
+    build_scanning_task,
+    connect_backends,
+    disconnect_backends,
+)
+from rig_remote.metrics import MetricsCollector
+from rig_remote.models.bookmark import Bookmark
+from rig_remote.models.run_counters import ScanCounters, SyncCounters
+from rig_remote.models.scan_segment import ScanSegment
+from rig_remote.models.scanning_task import ScanningTask
+from rig_remote.models.sync_task import SyncTask
+from rig_remote.queue_comms import QueueComms
+from rig_remote.rig_backends.instrumented_rigctl import InstrumentedRigCtl
+from rig_remote.rig_backends.protocol import RigBackend
+from rig_remote.rig_backends.resilient_rigctl import ResilientRigCtl
+from rig_remote.scan_telemetry import ScanTelemetry
+from rig_remote.scanning import Scanning2, create_scanner
+from rig_remote.scanning_config import ScanningConfig
+from rig_remote.stmessenger import STMessenger
+from rig_remote.syncing import Syncing
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTROL_PORT = 9478
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+SERVER_ERROR = -32000
+
+
+def _bookmark_to_dict(bookmark: Bookmark) -> dict[str, Any]:
+    return {
+        "id": bookmark.id,
+        "frequency": bookmark.channel.frequency,
+        "modulation": bookmark.channel.modulation,
+        "description": bookmark.description,
+        "lockout": bookmark.lockout,
+    }
+
+
+def _task_to_dict(task: ScanningTask) -> dict[str, Any]:
+    return {key: getattr(task, key) for key in (*TASK_INT_PARAMETERS, *TASK_FLAG_PARAMETERS)}
+
+
+class ScanController:
+    """Thread-safe start, stop and update of scans and syncs, and bookmark
+    management, for concurrent clients.
+
+    Scans and syncs run in background threads; as in the UI, only one of
+    them runs at a time.  Bookmark changes apply from the next bookmark
+    scan.  Hamlib backends must be connected by the caller.
+    """
+
+    def __init__(
+        self,
+        app_config: AppConfig,
+        backends: list[RigBackend],
+        config: ScanningConfig | None = None,
+        sleep_fn: Callable[[float], None] | None = None,
+        segments: list[ScanSegment] | None = None,
+        adaptive: bool = False,
+    ) -> None:
+        """Initialise the controller and load the bookmark file.
+
+        :param app_config: configuration with the bookmark_filename,
+            log_filename and default scan values
+        :param backends: one backend per rig
+        :param config: ScanningConfig of the scans, the default one when
+            not provided
+        :param sleep_fn: sleep used by the scans, for tests
+        :param segments: band plan swept by the frequency scans, instead of
+            the range of the scan values
+        :param adaptive: schedule the bookmark scans by bookmark activity
+            when scan.start does not say, as does the adaptive_scan value of
+            app_config
+        """
+        self.app_config = app_config
+        self.backends = backends
+        self.scan_counters = ScanCounters()
+        self.scan_telemetry = ScanTelemetry()
+        self.sync_counters = SyncCounters()
+        self.scan_queue = STMessenger(queue_comms=QueueComms())
+        self.sync_queue = STMessenger(queue_comms=QueueComms())
+        self._config = config or ScanningConfig()
+        self._sleep_fn = sleep_fn
+        self._segments = segments
+        self._adaptive = adaptive or str(app_config.config.get("adaptive_scan") or "false").lower() == "true"
+        # kept across scans, so adaptive bookmark scans build on the history
+        self.bookmark_activity = BookmarkActivity()
+        self._lock = threading.RLock()
+        self._bookmarks_file = str(app_config.config["bookmark_filename"])
+        self._bookmarks = BookmarksManager()
+        self._bookmarks.load(self._bookmarks_file)
+        self._scanning: Scanning2 | None = None
+        self._scan_thread: threading.Thread | None = None
+        self._scan_task: ScanningTask | None = None
+        self._scan_rig = 0
+        self._scan_error = ""
+        self._syncing: Syncing | None = None
+        self._sync_thread: threading.Thread | None = None
+        self._sync_error = ""
+
+    def metrics_collector(self) -> MetricsCollector:
+        """Return a collector of the counters, queues and backends."""
+        return MetricsCollector(
+            scan_counters=self.scan_counters,
+            sync_counters=self.sync_counters,
+            queues={"scan": self.scan_queue, "sync": self.sync_queue},
+            backends={f"rig{number}": backend for number, backend in enumerate(self.backends, start=1)},
+        )
+
+    @property
+    def scanning(self) -> bool:
+        return self._scan_thread is not None and self._scan_thread.is_alive()
+
+    @property
+    def syncing(self) -> bool:
+        return self._sync_thread is not None and self._sync_thread.is_alive()
+
+    def status(self) -> dict[str, Any]:
+        """Return the state of the scan, the sync and the bookmarks."""
+        with self._lock:
+            task = self._scan_task
+            return {
+                "scan": {
+                    "running": self.scanning,
+                    "mode": task.scan_mode if task is not None else None,
+                    "rig": self._scan_rig or None,
+                    "task": _task_to_dict(task) if task is not None else None,
+                    "new_bookmarks": len(task.new_bookmarks_list) if task is not None else 0,
+                    "frequency": self.scan_telemetry.frequency,
+                    "level": self.scan_telemetry.level,
+                    "error": self._scan_error,
+                    "counters": asdict(self.scan_counters),
+                },
+                "sync": {
+                    "running": self.syncing,
+                    "error": self._sync_error,
+                    "counters": asdict(self.sync_counters),
+                },
+                "bookmarks": len(self._bookmarks.bookmarks),
+            }
+
+    def start_scan(
+        self,
+        mode: str = "frequency",
+        rig: int = 1,
+        modulation: str = "FM",
+        adaptive: bool | None = None,
+        **parameters: int | bool | None,
+    ) -> dict[str, Any]:
+        """Start a scan with the configuration values, replaced by *parameters*.
+
+        :param adaptive: schedule a bookmark scan by bookmark activity; the
+            default of the controller when None
+        :returns: the scan part of status()
+        :raises ValueError: if a parameter is invalid
+        :raises RuntimeError: if a scan or sync is running
+        """
+        with self._lock:
+            if self.scanning or self.syncing:
+                raise RuntimeError("A scan or sync is already running")
+            if mode not in SCAN_MODES:
+                raise ValueError(f"mode must be one of {SCAN_MODES}, got {mode!r}")
+            if rig not in range(1, RIG_COUNT + 1):
+                raise ValueError(f"rig must be between 1 and {RIG_COUNT}, got {rig!r}")
+            bookmarks = list(self._bookmarks.bookmarks)
+            if mode == "bookmarks" and not bookmarks:
+                raise ValueError("No bookmarks to scan")
+            if adaptive is None:
+                adaptive = self._adaptive
+            elif not isinstance(adaptive, bool):
+                raise ValueError(f"adaptive must be a boolean, got {adaptive!r}")
+            task = build_scanning_task(
+                self.app_config,
+                scan_mode=mode,
+                frequency_modulation=modulation,
+                bookmarks=bookmarks,
+                new_bookmarks_list=[],
+                segments=self._segments,
+                overrides=parameters,
+                bookmark_activity=self.bookmark_activity if adaptive else None,
+            )
+            self._scanning = create_scanner(
+                scan_mode=mode,
+                scan_queue=self.scan_queue,
+                log_filename=str(self.app_config.config["log_filename"]),
+                rigctl=ResilientRigCtl(self.backends[rig - 1]),
+                config=self._config,
+                sleep_fn=self._sleep_fn,
+                counters=self.scan_counters,
+                telemetry=self.scan_telemetry,
+            )
+            self._scan_task = task
+            self._scan_rig = rig
+            self._scan_error = ""
+            self._scan_thread = threading.Thread(
+                target=self._run_scan, args=(self._scanning, task), name="control-scan", daemon=True
+            )
+            self._scan_thread.start()
+            logger.info("%s scan started on rig %i", mode, rig)
+            scan_status: dict[str, Any] = self.status()["scan"]
+            return scan_status
+
+    def _run_scan(self, scanning: Scanning2, task: ScanningTask) -> None:
+        try:
+            scanning.scan(task)
+        except Exception as exc:
+            logger.exception("Scan failed")
+            self._scan_error = str(exc) or type(exc).__name__
+        finally:
+            self.scan_queue.check_end_of_scan()
+            with self._lock:
+                if task.new_bookmarks_list:
+                    add_new_bookmarks(self._bookmarks, task.new_bookmarks_list)
+
+    def stop_scan(self) -> bool:
+        """Stop the running scan and wait for its thread.
+
+        :returns: False if no scan was running
+        """
+        with self._lock:
+            thread, scanning = self._scan_thread, self._scanning
+        if thread is None or scanning is None or not thread.is_alive():
+            return False
+        scanning.terminate()
+        thread.join()
+        return True
+
+    def update_scan(self, parameter: str, value: Any) -> None:
+        """Change *parameter* of the running scan, e.g. sgn_level.
+
+        The scan applies it at its next step.
+
+        :raises ValueError: if the parameter can't be updated during a scan
+        :raises RuntimeError: if no scan is running or the queue is full
+        """
+        names = {name.split("_", 1)[1]: name for name in self._config.valid_scan_update_event_names}
+        if parameter not in names:
+            raise ValueError(f"parameter must be one of {sorted(names)}, got {parameter!r}")
+        if not self.scanning:
+            raise RuntimeError("No scan is running")
+        try:
+            self.scan_queue.send_event_update((names[parameter], value))
+        except Full:
+            raise RuntimeError("The scan queue is full, retry later") from None
+
+    def start_sync(self) -> None:
+        """Start copying the frequency and mode of rig 2 to rig 1.
+
+        :raises RuntimeError: if a scan or sync is running
+        """
+        with self._lock:
+            if self.scanning or self.syncing:
+                raise RuntimeError("A scan or sync is already running")
+            self._syncing = Syncing(counters=self.sync_counters)
+            self._sync_error = ""
+            # as in the UI, rig 2 is the source and rig 1 the destination
+            task = SyncTask(self.sync_queue, ResilientRigCtl(self.backends[1]), ResilientRigCtl(self.backends[0]))
+            self._sync_thread = threading.Thread(
+                target=self._run_sync, args=(self._syncing, task), name="control-sync", daemon=True
+            )
+            self._sync_thread.start()
+            logger.info("Sync started")
+
+    def _run_sync(self, syncing: Syncing, task: SyncTask) -> None:
+        try:
+            syncing.sync(task)
+        except Exception as exc:
+            logger.exception("Sync failed")
+            self._sync_error = str(exc) or type(exc).__name__
+        finally:
+            self.sync_queue.check_end_of_scan()
+
+    def stop_sync(self) -> bool:
+        """Stop the running sync and wait for its thread.
+
+        :returns: False if no sync was running
+        """
+        with self._lock:
+            thread, syncing = self._sync_thread, self._syncing
+        if thread is None or syncing is None or not thread.is_alive():
+            return False
+        syncing.terminate()
+        thread.join()
+        return True
+
+    def shutdown(self) -> None:
+        """Stop the scan and sync, if running."""
+        self.stop_scan()
+        self.stop_sync()
+
+    def list_bookmarks(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [_bookmark_to_dict(bookmark) for bookmark in self._bookmarks.bookmarks]
+
+    def add_bookmark(self, frequency: int, modulation: str, description: str, lockout: str = "") -> dict[str, Any]:
+        """Add a bookmark, not saved until save_bookmarks().
+
+        :returns: the bookmark added
+        :raises ValueError: if a value is invalid or the bookmark exists
+        """
+        bookmark = bookmark_factory(
+            input_frequency=frequency, modulation=modulation, description=description, lockout=lockout
+        )
+        bookmark.id = str(uuid4())
+        with self._lock:
+            if not self._bookmarks.add_bookmark(bookmark):
+                raise ValueError("The bookmark already exists")
+        return _bookmark_to_dict(bookmark)
+
+    def update_bookmark(
+        self,
+        id: str,
+        description: str | None = None,
+        modulation: str | None = None,
+        lockout: str | None = None,
+    ) -> dict[str, Any]:
+        """Change the fields given of the bookmark with *id*, not saved until
+        save_bookmarks().
+
+        :returns: the bookmark updated
+        :raises ValueError: if there is no such bookmark, a value is invalid
+            or the change duplicates another bookmark
+        """
+        with self._lock:
+            bookmarks = self._bookmarks.bookmarks
+            index = next((i for i, bookmark in enumerate(bookmarks) if bookmark.id == id), None)
+            if index is None:
+                raise ValueError(f"No bookmark with id {id!r}")
+            current = bookmarks[index]
+            updated = bookmark_factory(
+                input_frequency=current.channel.frequency,
+                modulation=modulation if modulation is not None else current.channel.modulation,
+                description=description if description is not None else current.description,
+                lockout=lockout if lockout is not None else current.lockout,
+                bookmark_id=current.id,
+            )
+            if any(bookmark == updated for i, bookmark in enumerate(bookmarks) if i != index):
+                raise ValueError("The bookmark already exists")
+            bookmarks[index] = updated
+        return _bookmark_to_dict(updated)
+
+    def delete_bookmark(self, id: str) -> bool:
+        """Delete the bookmark with *id*, not saved until save_bookmarks().
+
+        :returns: False if there is no such bookmark
+        """
+        with self._lock:
+            for bookmark in self._bookmarks.bookmarks:
+                if bookmark.id == id:
+                    return self._bookmarks.delete_bookmark(bookmark)
+        return False
+
+    def save_bookmarks(self) -> None:
+        """Write the bookmarks to the bookmark file."""
+        with self._lock:
+            self._bookmarks.save(self._bookmarks_file)
+
+
+class _Dispatcher:
+    """Maps JSON-RPC requests to ScanController methods."""
+
+    def __init__(self, controller: ScanController) -> None:
+        self.methods: dict[str, Callable[..., Any]] = {
+            "status": controller.status,
+            "scan.start": controller.start_scan,
+            "scan.stop": controller.stop_scan,
+            "scan.update": controller.update_scan,
+            "sync.start": controller.start_sync,
+            "sync.stop": controller.stop_sync,
+            "bookmarks.list": controller.list_bookmarks,
+            "bookmarks.add": controller.add_bookmark,
+            "bookmarks.update": controller.update_bookmark,
+            "bookmarks.delete": controller.delete_bookmark,
+            "bookmarks.save": controller.save_bookmarks,
+        }
+
+    @staticmethod
+    def _error(request_id: Any, code: int, message: str) -> dict[str, Any]:
+        return {"jsonrpc": "2.0", "error": {"code": code, "message": message}, "id": request_id}
+
+    def handle(self, line: bytes) -> bytes | None:
+        """Answer one line of the protocol.
+
+        :returns: the response, None when the request is a notification
+        """
+        try:
+            request = json.loads(line)
+        except ValueError:
+            response: Any = self._error(None, PARSE_ERROR, "Parse error")
+        else:
+            if isinstance(request, list) and request:
+                response = [answer for item in request if (answer := self.call(item)) is not None] or None
+            else:
+                response = self.call(request)
+        if response is None:
+            return None
+        return json.dumps(response).encode()
+
+    def call(self, request: Any) -> dict[str, Any] | None:
+        """Run one request object; None for notifications."""
+        if (
+            not isinstance(request, dict)
+            or request.get("jsonrpc") != "2.0"
+            or not isinstance(request.get("method"), str)
+        ):
+            return self._error(None, INVALID_REQUEST, "Invalid Request")
+        request_id = request.get("id")
+        notification = "id" not in request
+        method = self.methods.get(request["method"])
+        params = request.get("params", {})
+        if method is None:
+            response = self._error(request_id, METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+        elif not isinstance(params, dict | list):
+            response = self._error(request_id, INVALID_PARAMS, "params must be an object or an array")
+        else:
+            args, kwargs = (params, {}) if isinstance(params, list) else ([], params)
+            try:
+                signature(method).bind(*args, **kwargs)
+                result = method(*args, **kwargs)
+            except (TypeError, ValueError) as exc:
+                response = self._error(request_id, INVALID_PARAMS, str(exc))
+            except (RuntimeError, OSError) as exc:
+                response = self._error(request_id, SERVER_ERROR, str(exc))
+            except Exception:
+                logger.exception("Control request %s failed", request["method"])
+                response = self._error(request_id, INTERNAL_ERROR, "Internal error")
+            else:
+                response = {"jsonrpc": "2.0", "result": result, "id": request_id}
+        return None if notification else response
+
+
+class _ControlRequestHandler(socketserver.StreamRequestHandler):
+    server: "_TCPControlServer | _UnixControlServer"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.dispatcher.handle(line)
+            if response is not None:
+                self.wfile.write(response + b"\n")
+
+
+class _TCPControlServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], dispatcher: _Dispatcher) -> None:
+        self.dispatcher = dispatcher
+        super().__init__(address, _ControlRequestHandler)
+
+
+# Unix sockets are not available on every platform
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class _UnixControlServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+        def __init__(self, path: str, dispatcher: _Dispatcher) -> None:
+            self.dispatcher = dispatcher
+            super().__init__(path, _ControlRequestHandler)
+
+
+class ControlServer:
+    """Background server of the JSON-RPC control API."""
+
+    def __init__(
+        self,
+        controller: ScanController,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_CONTROL_PORT,
+        socket_path: str | None = None,
+    ) -> None:
+        """Initialise the server, nothing is bound until start().
+
+        :param controller: controller the requests are run against
+        :param host: address to bind, ignored with socket_path
+        :param port: port to bind, 0 picks a free one; ignored with
+            socket_path
+        :param socket_path: path of a Unix socket to serve on instead of TCP
+        """
+        self.controller = controller
+        self._dispatcher = _Dispatcher(controller)
+        self._host = host
+        self._port = port
+        self._socket_path = socket_path
+        self._server: _TCPControlServer | _UnixControlServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int] | str:
+        """Host and port, or the socket path, the server listens on.
+
+        :raises RuntimeError: if the server is not running
+        """
+        if self._server is None:
+            raise RuntimeError("ControlServer is not running")
+        if self._socket_path is not None:
+            return self._socket_path
+        host, port = cast(tuple[str, int], self._server.server_address)
+        return str(host), int(port)
+
+    def start(self) -> None:
+        """Bind and serve in a daemon thread.
+
+        :raises OSError: if the port or socket can't be bound, or Unix
+            sockets are not supported
+        """
+        if self._server is not None:
+            return
+        if self._socket_path is not None:
+            if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+                raise OSError("Unix sockets are not supported on this platform")
+            if os.path.exists(self._socket_path):
+                os.unlink(self._socket_path)
+            # the socket is created owner-only, never reachable by other users
+            umask = os.umask(0o177)
+            try:
+                self._server = _UnixControlServer(self._socket_path, self._dispatcher)
+            finally:
+                os.umask(umask)
+        else:
+            self._server = _TCPControlServer((self._host, self._port), self._dispatcher)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="control-server", daemon=True)
+        self._thread.start()
+        logger.info("Control API listening on %s", self.address)
+
+    def stop(self) -> None:
+        """Stop serving and release the port or socket."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        if self._socket_path is not None and os.path.exists(self._socket_path):
+            os.unlink(self._socket_path)
+        self._server = None
+        self._thread = None
+        logger.info("Control API stopped")
+
+    def __enter__(self) -> "ControlServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+class ControlDaemon:
+    """Serves the control API until stop() is called, for the headless daemon."""
+
+    def __init__(
+        self,
+        app_config: AppConfig,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_CONTROL_PORT,
+        socket_path: str | None = None,
+        backends: list[RigBackend] | None = None,
+        instrument: bool = False,
+        config: ScanningConfig | None = None,
+        segments: list[ScanSegment] | None = None,
+        adaptive: bool = False,
+    ) -> None:
+        """Initialise the daemon, nothing is connected until run().
+
+        :param backends: one backend per rig; built from the endpoints of
+            app_config when not provided
+        :param instrument: wrap the backends in InstrumentedRigCtl, so the
+            metrics export the command latencies
+        :param config: ScanningConfig of the scans, the default one when
+            not provided
+        :param segments: band plan swept by the frequency scans
+        :param adaptive: default of the adaptive parameter of scan.start
+        """
+        self._raw_backends = backends if backends is not None else build_backends(app_config)
+        wrapped: list[RigBackend] = (
+            [InstrumentedRigCtl(backend) for backend in self._raw_backends] if instrument else list(self._raw_backends)
+        )
+        self.controller = ScanController(app_config, wrapped, config=config, segments=segments, adaptive=adaptive)
+        self.server = ControlServer(self.controller, host=host, port=port, socket_path=socket_path)
+        self._stop = threading.Event()
+
+    def metrics_collector(self) -> MetricsCollector:
+        return self.controller.metrics_collector()
+
+    def stop(self) -> None:
+        """Make run() return, safe from signal handlers."""
+        self._stop.set()
+
+    def run(self) -> int:
+        """Connect the rigs and serve until stop() is called.
+
+        :returns: exit status, 0 on success
+        """
+        connected = []
+        try:
+            connected = connect_backends(self._raw_backends)
+            self.server.start()
+            while not self._stop.wait(0.5):
+                pass
+        except OSError:
+            logger.exception("Could not start the control API")
+            return 1
+        finally:
+            self.server.stop()
+            self.controller.shutdown()
+            disconnect_backends(connected)
+        return 0
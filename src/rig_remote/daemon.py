@@ -0,0 +1,571 @@
+"""
+Headless scanning daemon.
+
+Runs the scans and syncs of rig-remote without the Qt user interface, for
+receivers left unattended on machines without a display:
+
+    rig_remote_daemon --mode frequency
+    rig_remote_daemon --mode bookmarks --passes 10 --metrics-port 9477
+    rig_remote_daemon --mode sync
+
+The rig endpoints, scan parameters, bookmark and activity log files are read
+from the same configuration file the UI writes; the command line overrides
+a few of them.  Nothing in this module imports PySide6.
+
+SIGINT and SIGTERM stop the scan or sync at its next step.  The bookmarks
+found by a frequency scan with auto_bookmark set are then added to the
+bookmark file.
+"""
+
+import argparse
+import csv
+import logging
+import os
+import signal
+import sys
+import textwrap
+from collections.abc import Callable, Mapping
+from types import FrameType
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from rig_remote.app_config import AppConfig
+from rig_remote.band_plan import load_band_plan
+from rig_remote.bookmark_activity import BookmarkActivity
+from rig_remote.bookmarksmanager import BookmarksManager
+from rig_remote.constants import (
+    DEFAULT_BOOKMARK_FILENAME,
+    DEFAULT_CONFIG_FILENAME,
+    DEFAULT_LOG_FILENAME,
+    DEFAULT_PREFIX,
+    RIG_COUNT,
+)
+from rig_remote.exceptions import InvalidPathError
+from rig_remote.metrics import MetricsCollector, MetricsHTTPServer, TextfileExporter
+from rig_remote.models.bookmark import Bookmark
+from rig_remote.models.modulation_modes import ModulationModes
+from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.models.run_counters import ScanCounters, SyncCounters
+from rig_remote.models.scan_segment import ScanSegment
+from rig_remote.models.scanning_task import ScanningTask
+from rig_remote.models.sync_task import SyncTask
+from rig_remote.queue_comms import QueueComms
+from rig_remote.rig_backends.gqrx_rigctl import GQRXRigCtl
+from rig_remote.rig_backends.hamlib_rigctl import HamlibRigCtl
+from rig_remote.rig_backends.instrumented_rigctl import InstrumentedRigCtl
+from rig_remote.rig_backends.mode_translator import ModeTranslator
+from rig_remote.rig_backends.protocol import BackendType, RigBackend
+from rig_remote.rig_backends.resilient_rigctl import ResilientRigCtl
+from rig_remote.scan_profiler import ScanProfiler
+from rig_remote.scanning import Scanning2, create_scanner
+from rig_remote.scanning_config import DETECTOR_LEVEL, DETECTORS, ScanningConfig
+from rig_remote.stmessenger import STMessenger
+from rig_remote.syncing import Syncing
+from rig_remote.utility import log_configuration, process_path
+
+if TYPE_CHECKING:  # pragma: no cover
+    from rig_remote.control_server import ControlDaemon  # pragma: no cover
+
+logger = logging.getLogger(__name__)
+
+SCAN_MODES = ("frequency", "bookmarks")
+DAEMON_MODES = (*SCAN_MODES, "sync")
+
+
+def input_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """Argument parser.
+
+    :param argv: arguments to parse, sys.argv[1:] by default
+    """
+    parser = argparse.ArgumentParser(
+        prog="rig_remote_daemon",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        description=textwrap.fill(
+            "Runs rig-remote scans or syncs without user interface, using the parameters of the config file."
+        ),
+        epilog="Please refer to: https://github.com/Marzona/rig-remote/wiki",
+    )
+    parser.add_argument(
+        "--mode",
+        "-m",
+        choices=(*DAEMON_MODES, "serve"),
+        default="frequency",
+        help="Frequency scan, bookmark scan, sync of rig 1 from rig 2, "
+        + "or serve the control API until stopped. Default: frequency.",
+    )
+    parser.add_argument(
+        "--rig",
+        "-r",
+        type=int,
+        choices=range(1, RIG_COUNT + 1),
+        default=1,
+        help="Rig used for scanning. Default: 1.",
+    )
+    parser.add_argument(
+        "--modulation",
+        choices=[mode.value for mode in ModulationModes],
+        default="FM",
+        help="Modulation of the frequency scan. Default: FM.",
+    )
+    parser.add_argument("--passes", type=int, help="Number of scan passes.")
+    parser.add_argument(
+        "--detector",
+        choices=DETECTORS,
+        default=DETECTOR_LEVEL,
+        help="Detect activity by signal level, or by the squelch state of the rig "
+        + "when it reports one. Default: level.",
+    )
+    parser.add_argument(
+        "--merge-bandwidth",
+        dest="merge_bandwidth",
+        type=int,
+        default=0,
+        help="Merge the auto-bookmarks found within this many Hz of each other into one. Default: 0.",
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Visit the busiest bookmarks first and the long silent ones less often. "
+        + "Default: the adaptive_scan value of the configuration file.",
+    )
+    parser.add_argument("--band-plan", dest="band_plan", help="Band plan file swept by the frequency scan.")
+    parser.add_argument("--checkpoint", help="Checkpoint file of the frequency scan.")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume the frequency scan from the checkpoint file.",
+    )
+    parser.add_argument("--profile", action="store_true", help="Log the scan step timing profile at the end.")
+    parser.add_argument("--control-host", dest="control_host", default="127.0.0.1", help="Address of --control-port.")
+    parser.add_argument(
+        "--control-port",
+        dest="control_port",
+        type=int,
+        default=9478,
+        help="Port of the control API in serve mode. Default: 9478.",
+    )
+    parser.add_argument(
+        "--control-socket",
+        dest="control_socket",
+        help="Serve the control API on this Unix socket instead of --control-port.",
+    )
+    parser.add_argument("--metrics-host", dest="metrics_host", default="127.0.0.1", help="Address of --metrics-port.")
+    parser.add_argument("--metrics-port", dest="metrics_port", type=int, help="Serve Prometheus metrics on this port.")
+    parser.add_argument(
+        "--metrics-textfile",
+        dest="metrics_textfile",
+        help="Write Prometheus metrics to this file, for the node_exporter textfile collector.",
+    )
+    parser.add_argument(
+        "--bookmarks",
+        "-b",
+        dest="alternate_bookmark_file",
+        help="Sets the full path for the bookmark file.",
+    )
+    parser.add_argument("--config", "-c", dest="alternate_config_file", help="Sets the full path for the config file.")
+    parser.add_argument("--log", "-l", dest="alternate_log_file", help="Sets the full path for the activity log file.")
+    parser.add_argument(
+        "--prefix",
+        "-p",
+        dest="alternate_prefix",
+        help="Sets the directory prefix for default working files. "
+        + "NOTE: Individual path options override this prefix.",
+    )
+    parser.add_argument("--verbose", "-v", dest="verbose", action="store_true", help="Increase log verbosity.")
+    args = parser.parse_args(argv)
+    if args.mode == "serve" and (args.checkpoint or args.resume):
+        parser.error("--checkpoint and --resume apply to a single scan, not to --mode serve")
+    return args
+
+
+def load_app_config(args: argparse.Namespace) -> AppConfig:
+    """Read the configuration file and set the bookmark and log filenames,
+    as the UI does.
+    """
+    dir_prefix = os.path.expanduser(args.alternate_prefix or DEFAULT_PREFIX)
+    if args.alternate_config_file:
+        config_file = process_path(args.alternate_config_file)
+    else:
+        config_file = os.path.join(dir_prefix, DEFAULT_CONFIG_FILENAME)
+
+    app_config = AppConfig(config_file=config_file)
+    app_config.read_conf()
+    # read_conf may hand out DEFAULT_CONFIG itself, don't modify it
+    app_config.config = dict(app_config.config)
+    if args.alternate_bookmark_file is not None:
+        app_config.config["bookmark_filename"] = process_path(args.alternate_bookmark_file)
+    elif app_config.config.get("bookmark_filename") is None:
+        app_config.config["bookmark_filename"] = os.path.join(dir_prefix, DEFAULT_BOOKMARK_FILENAME)
+    if args.alternate_log_file is not None:
+        app_config.config["log_filename"] = process_path(args.alternate_log_file)
+    else:
+        app_config.config["log_filename"] = os.path.join(dir_prefix, DEFAULT_LOG_FILENAME)
+    return app_config
+
+
+def create_backend(endpoint: RigEndpoint) -> RigBackend:
+    """Return the backend for *endpoint*, not connected."""
+    if endpoint.backend == BackendType.HAMLIB:
+        return HamlibRigCtl(endpoint=endpoint, mode_translator=ModeTranslator(BackendType.HAMLIB))
+    return GQRXRigCtl(endpoint=endpoint, mode_translator=ModeTranslator(BackendType.GQRX))
+
+
+def rig_endpoint(app_config: AppConfig, rig_number: int) -> RigEndpoint:
+    """Return the endpoint of rig *rig_number*: the selected one, else the
+    one configured for that rig number, else the most recent one.
+
+    :raises IndexError: if no endpoint is configured
+    """
+    uuid = app_config.selected_rig_uuids[rig_number - 1]
+    endpoint = app_config.endpoint_by_uuid(uuid) if uuid else None
+    if endpoint is None:
+        endpoint = next((ep for ep in app_config.rig_endpoints if ep.number == rig_number), None)
+    return endpoint or app_config.rig_endpoints[-1]
+
+
+def build_backends(app_config: AppConfig) -> list[RigBackend]:
+    """Return one backend per rig, for the endpoints of *app_config*."""
+    return [create_backend(rig_endpoint(app_config, number)) for number in range(1, RIG_COUNT + 1)]
+
+
+def add_new_bookmarks(manager: BookmarksManager, bookmarks: list[Bookmark]) -> int:
+    """Add the bookmarks found by a scan to *manager*.
+
+    :returns: the number of bookmarks added, duplicates are skipped
+    """
+    logger.info("adding %i collected bookmarks...", len(bookmarks))
+    added = 0
+    for bookmark in bookmarks:
+        # auto added bookmarks have no id, load() would keep only one
+        if not bookmark.id:
+            bookmark.id = str(uuid4())
+        added += manager.add_bookmark(bookmark)
+    return added
+
+
+def _config_int(app_config: AppConfig, key: str) -> int:
+    value = app_config.config.get(key) or AppConfig.DEFAULT_CONFIG[key]
+    return int(str(value).replace(",", ""))
+
+
+def _config_flag(app_config: AppConfig, key: str) -> bool:
+    return str(app_config.config.get(key) or "false").lower() == "true"
+
+
+# ScanningTask parameters read from the configuration file
+TASK_INT_PARAMETERS = (
+    "range_min",
+    "range_max",
+    "interval",
+    "sgn_level",
+    "delay",
+    "passes",
+    "inner_band",
+    "inner_interval",
+    "priority_interval",
+)
+TASK_FLAG_PARAMETERS = ("wait", "record", "log", "auto_bookmark")
+
+
+def build_scanning_task(
+    app_config: AppConfig,
+    scan_mode: str,
+    frequency_modulation: str,
+    bookmarks: list[Bookmark],
+    new_bookmarks_list: list[Bookmark],
+    segments: list[ScanSegment] | None = None,
+    overrides: Mapping[str, int | bool | None] | None = None,
+    bookmark_activity: BookmarkActivity | None = None,
+) -> ScanningTask:
+    """Build the ScanningTask the UI would start with the values of the
+    configuration file.
+
+    :param overrides: values replacing those of the configuration file, by
+        ScanningTask parameter name; None values are ignored
+    :param bookmark_activity: activity history making a bookmark scan
+        adaptive, None for a plain one
+
+    The bookmarks with lockout "P" are the priority channels of the scan.
+    :raises ValueError: if a numeric value of the configuration is invalid,
+        or an override is not in TASK_INT_PARAMETERS or TASK_FLAG_PARAMETERS
+    """
+    overrides = overrides or {}
+    unknown = set(overrides) - set(TASK_INT_PARAMETERS) - set(TASK_FLAG_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unsupported scan parameters: {sorted(unknown)}")
+    parameters: dict[str, int | bool] = {key: _config_int(app_config, key) for key in TASK_INT_PARAMETERS}
+    parameters.update({key: _config_flag(app_config, key) for key in TASK_FLAG_PARAMETERS})
+    parameters.update({key: value for key, value in overrides.items() if value is not None})
+    return ScanningTask(
+        frequency_modulation=frequency_modulation,
+        scan_mode=scan_mode,
+        new_bookmarks_list=new_bookmarks_list,
+        bookmarks=bookmarks,
+        segments=segments if scan_mode == "frequency" else None,
+        bookmark_activity=bookmark_activity,
+        priority_bookmarks=[bookmark for bookmark in bookmarks if bookmark.lockout == "P"],
+        **parameters,  # type: ignore[arg-type]
+    )
+
+
+def connect_backends(backends: list[RigBackend]) -> list[HamlibRigCtl]:
+    """Connect the Hamlib backends among *backends*, GQRX needs no connection.
+
+    :returns: the backends connected, to disconnect once done
+    :raises OSError: if a connection fails; the backends connected so far
+        are disconnected
+    """
+    connected: list[HamlibRigCtl] = []
+    try:
+        for backend in backends:
+            if isinstance(backend, HamlibRigCtl):
+                backend.connect()
+                connected.append(backend)
+    except OSError:
+        disconnect_backends(connected)
+        raise
+    return connected
+
+
+def disconnect_backends(backends: list[HamlibRigCtl]) -> None:
+    for backend in backends:
+        backend.disconnect()
+
+
+class ScanDaemon:
+    """Runs one scan or sync with the rigs of an AppConfig.
+
+    The counters, queues and backends are public so that a MetricsCollector
+    can export them while the daemon runs.
+    """
+
+    def __init__(
+        self,
+        app_config: AppConfig,
+        mode: str = "frequency",
+        rig_number: int = 1,
+        frequency_modulation: str = "FM",
+        passes: int | None = None,
+        segments: list[ScanSegment] | None = None,
+        checkpoint_file: str | None = None,
+        resume: bool = False,
+        profiler: ScanProfiler | None = None,
+        backends: list[RigBackend] | None = None,
+        instrument: bool = False,
+        sleep_fn: Callable[[float], None] | None = None,
+        detector: str = DETECTOR_LEVEL,
+        merge_bandwidth: int = 0,
+        adaptive: bool = False,
+    ) -> None:
+        """Initialise the daemon, nothing is connected until run().
+
+        :param app_config: configuration read with read_conf()
+        :param mode: one of DAEMON_MODES
+        :param rig_number: rig used for scanning, 1-based
+        :param backends: one backend per rig; built from the selected
+            endpoints of app_config when not provided
+        :param instrument: wrap the backends in InstrumentedRigCtl, so the
+            metrics export the command latencies
+        :param sleep_fn: sleep used by the scan, for tests
+        :param detector: activity detector of the scan, one of DETECTORS
+        :param merge_bandwidth: Hz within which auto-bookmarks are merged
+        :param adaptive: schedule the bookmark scan by bookmark activity, as
+            does the adaptive_scan value of app_config
+        :raises ValueError: if mode, rig_number, detector or merge_bandwidth
+            is not supported
+        """
+        if mode not in DAEMON_MODES:
+            raise ValueError(f"mode must be one of {DAEMON_MODES}, got {mode!r}")
+        if not 1 <= rig_number <= RIG_COUNT:
+            raise ValueError(f"rig_number must be between 1 and {RIG_COUNT}, got {rig_number}")
+        self.app_config = app_config
+        self.mode = mode
+        self.rig_number = rig_number
+        self.frequency_modulation = frequency_modulation
+        self.passes = passes
+        self.segments = segments
+        self.checkpoint_file = checkpoint_file
+        self.resume = resume
+        self.profiler = profiler
+        self.sleep_fn = sleep_fn
+        self.config = ScanningConfig(detector=detector, merge_bandwidth=merge_bandwidth)
+        self.bookmark_activity = BookmarkActivity() if adaptive or _config_flag(app_config, "adaptive_scan") else None
+        if backends is None:
+            backends = build_backends(app_config)
+        self._raw_backends = backends
+        self.backends: list[RigBackend] = (
+            [InstrumentedRigCtl(backend) for backend in backends] if instrument else list(backends)
+        )
+        self.scan_counters = ScanCounters()
+        self.sync_counters = SyncCounters()
+        self.scan_queue = STMessenger(queue_comms=QueueComms())
+        self.sync_queue = STMessenger(queue_comms=QueueComms())
+        self.new_bookmarks: list[Bookmark] = []
+        self._scanning: Scanning2 | None = None
+        self._syncing: Syncing | None = None
+        self._stopped = False
+
+    def metrics_collector(self) -> MetricsCollector:
+        """Return a collector of the counters, queues and backends."""
+        return MetricsCollector(
+            scan_counters=self.scan_counters,
+            sync_counters=self.sync_counters,
+            queues={"scan": self.scan_queue, "sync": self.sync_queue},
+            backends={f"rig{number}": backend for number, backend in enumerate(self.backends, start=1)},
+        )
+
+    def stop(self) -> None:
+        """Stop the scan or sync at its next step, safe from signal handlers."""
+        logger.info("Stopping the %s daemon", self.mode)
+        self._stopped = True
+        if self._scanning is not None:
+            self._scanning.terminate()
+        if self._syncing is not None:
+            self._syncing.terminate()
+
+    def run(self) -> int:
+        """Run the scan or sync until it completes or stop() is called.
+
+        :returns: exit status, 0 on success
+        """
+        rigs = [self.rig_number] if self.mode in SCAN_MODES else [1, 2]
+        connected: list[HamlibRigCtl] = []
+        try:
+            connected = connect_backends([self._raw_backends[number - 1] for number in rigs])
+            if self.mode == "sync":
+                return self._sync()
+            return self._scan()
+        except OSError:
+            logger.exception("Rig communication failed")
+            return 1
+        finally:
+            disconnect_backends(connected)
+
+    def _scan(self) -> int:
+        bookmarks_file = str(self.app_config.config["bookmark_filename"])
+        manager = BookmarksManager()
+        bookmarks = manager.load(bookmarks_file)
+        if self.mode == "bookmarks" and not bookmarks:
+            logger.error("No bookmarks to scan in %s", bookmarks_file)
+            return 1
+        try:
+            task = build_scanning_task(
+                self.app_config,
+                scan_mode=self.mode,
+                frequency_modulation=self.frequency_modulation,
+                bookmarks=bookmarks,
+                new_bookmarks_list=self.new_bookmarks,
+                overrides={"passes": self.passes},
+                segments=self.segments,
+                bookmark_activity=self.bookmark_activity,
+            )
+        except ValueError:
+            logger.exception("Invalid scan parameters in %s", self.app_config.config_file)
+            return 1
+        self._scanning = create_scanner(
+            scan_mode=self.mode,
+            scan_queue=self.scan_queue,
+            log_filename=str(self.app_config.config["log_filename"]),
+            rigctl=ResilientRigCtl(self.backends[self.rig_number - 1]),
+            config=self.config,
+            sleep_fn=self.sleep_fn,
+            checkpoint_file=self.checkpoint_file,
+            resume=self.resume,
+            profiler=self.profiler,
+            counters=self.scan_counters,
+        )
+        if self._stopped:
+            self._scanning.terminate()
+        self._scanning.scan(task)
+        if self.new_bookmarks:
+            add_new_bookmarks(manager, self.new_bookmarks)
+            manager.save(bookmarks_file)
+        return 0
+
+    def _sync(self) -> int:
+        self._syncing = Syncing(counters=self.sync_counters)
+        if self._stopped:
+            self._syncing.terminate()
+        # as in the UI, rig 2 is the source and rig 1 the destination
+        task = SyncTask(self.sync_queue, ResilientRigCtl(self.backends[1]), ResilientRigCtl(self.backends[0]))
+        self._syncing.sync(task)
+        return 0
+
+
+# entry point
+def cli(argv: list[str] | None = None) -> None:
+    args = input_arguments(argv)
+    log_configuration(args.verbose)
+    app_config = load_app_config(args)
+
+    segments = None
+    if args.band_plan:
+        try:
+            segments = load_band_plan(process_path(args.band_plan))
+        except (InvalidPathError, csv.Error):
+            logger.exception("Could not load band plan %s", args.band_plan)
+            sys.exit(1)
+
+    metrics = args.metrics_port is not None or args.metrics_textfile is not None
+    daemon: ScanDaemon | ControlDaemon
+    if args.mode == "serve":
+        # imported here as the control server builds on this module
+        from rig_remote import control_server
+
+        daemon = control_server.ControlDaemon(
+            app_config,
+            host=args.control_host,
+            port=args.control_port,
+            socket_path=process_path(args.control_socket) if args.control_socket else None,
+            instrument=metrics,
+            config=ScanningConfig(detector=args.detector, merge_bandwidth=args.merge_bandwidth),
+            segments=segments,
+            adaptive=args.adaptive,
+        )
+    else:
+        daemon = ScanDaemon(
+            app_config,
+            mode=args.mode,
+            rig_number=args.rig,
+            frequency_modulation=args.modulation,
+            passes=args.passes,
+            segments=segments,
+            checkpoint_file=process_path(args.checkpoint) if args.checkpoint else None,
+            resume=args.resume,
+            profiler=ScanProfiler() if args.profile else None,
+            instrument=metrics,
+            detector=args.detector,
+            merge_bandwidth=args.merge_bandwidth,
+            adaptive=args.adaptive,
+        )
+
+    def _on_signal(signum: int, _frame: FrameType | None) -> None:
+        logger.warning("Received signal %i", signum)
+        daemon.stop()
+
+    signal.signal(signal.SIGINT, _on_signal)
+    signal.signal(signal.SIGTERM, _on_signal)
+
+    collector = daemon.metrics_collector()
+    http_server = (
+        MetricsHTTPServer(collector, host=args.metrics_host, port=args.metrics_port)
+        if args.metrics_port is not None
+        else None
+    )
+    textfile = TextfileExporter(collector, process_path(args.metrics_textfile)) if args.metrics_textfile else None
+    try:
+        if http_server is not None:
+            http_server.start()
+        if textfile is not None:
+            textfile.start()
+        status = daemon.run()
+    finally:
+        if textfile is not None:
+            textfile.stop()
+        if http_server is not None:
+            http_server.stop()
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    cli()
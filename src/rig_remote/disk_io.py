@@ -125,6 +125,19 @@ class LogFile:
         :param signal: signal level
         :raises IOError or OSError for any issue that happens while writing.
         """
+        self.write_entry(record_type, record.channel.frequency, record.channel.modulation, signal)
+
+    def write_entry(self, record_type: str, frequency: int, modulation: str, signal: list[float]) -> None:
+        """Writes a message about *frequency* to the log file.
+
+        Same record as write(), for callers that have no Bookmark at hand.
+
+        :param record_type: type of the record to write
+        :param frequency: frequency in Hz
+        :param modulation: modulation in use on *frequency*
+        :param signal: signal level
+        :raises IOError or OSError for any issue that happens while writing.
+        """
 
         if record_type not in [LOG_RECORD_BOOKMARK, LOG_RECORD_FREQUENCY]:
             logger.error("Record type not supported, must be 'B' or 'F', got %s", record_type)
@@ -135,9 +148,9 @@ class LogFile:
             + " "
             + str(datetime.datetime.today().strftime("%a %Y-%b-%d %H:%M:%S"))
             + " "
-            + str(record.channel.frequency)
+            + str(frequency)
             + " "
-            + record.channel.modulation
+            + modulation
             + " "
             + str(signal)
             + "\n"
@@ -152,9 +165,11 @@ class LogFile:
             raise
         except (TypeError, IndexError):
             logger.exception(
-                "At least one of the parameter isn't of the expected type: record_type %s, record %s, signal %s",
+                "At least one of the parameter isn't of the expected type: "
+                "record_type %s, frequency %s, modulation %s, signal %s",
                 type(record_type),
-                type(record),
+                type(frequency),
+                type(modulation),
                 type(signal),
             )
             raise
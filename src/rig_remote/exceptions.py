@@ -38,3 +38,7 @@ class RetriableError(Exception):
 
 class BookmarkFormatError(RetriableError):
     pass
+
+
+class RigUnavailableError(ConnectionError):
+    pass
@@ -3,15 +3,25 @@ Frequency scan strategy.
 
 Sweeps a frequency range from range_min to range_max in steps of interval,
 optionally auto-bookmarking active frequencies and recording/logging activity.
+The range is compiled into a ScanPlan up front and recompiled only when a
+queue event changes range_min, range_max or interval.  When the ScannerCore
+carries a ScanCheckpointStore the scan position is saved as the sweep goes
+and can be resumed after a restart.
+
+Auto-bookmark hits carry the modulation of the step being scanned, the rig
+is not asked for its mode.  They go to an AutoBookmarkSink, which merges the
+hits within ``ScanningConfig.merge_bandwidth`` of each other or of a known
+bookmark and hands the new bookmarks to the task once per pass.
 """
 
 import logging
 
-from rig_remote.bookmarksmanager import bookmark_factory
+from rig_remote.auto_bookmark_sink import NO_LEVEL, AutoBookmarkSink
+from rig_remote.constants import LOG_RECORD_FREQUENCY
 from rig_remote.disk_io import LogFile
-from rig_remote.models.bookmark import Bookmark
 from rig_remote.models.channel import Channel
 from rig_remote.models.scanning_task import ScanningTask
+from rig_remote.scan_plan import ScanPlan, compile_frequency_plan
 from rig_remote.scanner_core import ScannerCore
 
 logger = logging.getLogger(__name__)
@@ -28,7 +38,11 @@ class FrequencyScannerStrategy:
         self._core = core
         self._prev_level: float = 0.0
         self._prev_freq: int = 0
+        self._prev_mode: str = ""
+        # Level read at _prev_freq, for the AutoBookmarkSink.
+        self._prev_strength: float = NO_LEVEL
         self._hold_bookmark: bool = False
+        self._sink: AutoBookmarkSink | None = None
 
     def terminate(self) -> None:
         """Delegate termination to the underlying ScannerCore."""
@@ -38,32 +52,49 @@ class FrequencyScannerStrategy:
     # Auto-bookmark helpers (owned here because they track per-scan state)
     # ------------------------------------------------------------------
 
-    def _create_new_bookmark(self, freq: int) -> Bookmark:
-        """Create and return a new auto-generated Bookmark at *freq*.
+    def _sink_for(self, task: ScanningTask) -> AutoBookmarkSink:
+        """Return the AutoBookmarkSink of *task*, created on first use."""
+        if self._sink is None or self._sink.task is not task:
+            self._sink = AutoBookmarkSink(task, self._core.config.merge_bandwidth)
+        return self._sink
 
-        Queries the rig for the current mode so the bookmark reflects the
-        modulation in use at the time of creation.
+    def _add_hit(self, freq: int, modulation: str, task: ScanningTask, level: float = NO_LEVEL) -> bool:
+        """Hand an auto-bookmark hit at *freq* to the sink of *task*.
+
+        The bookmark reaches ``task.new_bookmarks_list`` when the sink is
+        flushed, see _flush_bookmarks().
 
         :param freq: Frequency in Hz at which to create the bookmark.
-        :returns: A new Bookmark instance with description "auto added by scan".
+        :param modulation: Modulation scanned at *freq*.
+        :param task: Active ScanningTask.
+        :param level: Signal level read at *freq*, NO_LEVEL if unknown.
+        :returns: True if the hit opens a new bookmark, False if it was
+            merged into a known or pending one.
         """
-        bm = bookmark_factory(
-            input_frequency=freq,
-            modulation=self._core.rigctl.get_mode(),
-            description="auto added by scan",
-            lockout="",
-        )
-        logger.info("New bookmark created: %s", bm)
-        return bm
+        with self._core.timed("bookmark"):
+            added = self._sink_for(task).add(freq, modulation, level)
+        if added:
+            logger.info("New auto-bookmark at %d Hz %s", freq, modulation)
+        return added
+
+    def _flush_bookmarks(self) -> None:
+        """Hand the queued auto-bookmarks to the task and the ScannerCore."""
+        if self._sink is None:
+            return
+        for bm in self._sink.flush():
+            logger.info("New bookmark created: %s", bm)
+            self._core.bookmark_created(bm)
 
-    def _store_prev_bookmark(self, level: float, freq: int) -> None:
+    def _store_prev_bookmark(self, level: float, freq: int, modulation: str = "") -> None:
         """Record a candidate peak frequency for potential auto-bookmarking.
 
         :param level: Signal level recorded at *freq*.
         :param freq: Frequency in Hz of the candidate peak.
+        :param modulation: Modulation scanned at *freq*.
         """
         self._prev_level = level
         self._prev_freq = freq
+        self._prev_mode = modulation
         self._hold_bookmark = True
         logger.info("Stored candidate peak at %d Hz (level %s)", freq, level)
 
@@ -71,9 +102,11 @@ class FrequencyScannerStrategy:
         """Clear the stored candidate peak, resetting auto-bookmark state."""
         self._prev_level = 0.0
         self._prev_freq = 0
+        self._prev_mode = ""
+        self._prev_strength = NO_LEVEL
         self._hold_bookmark = False
 
-    def _autobookmark(self, level: int, freq: int, task: ScanningTask) -> None:
+    def _autobookmark(self, level: int, freq: int, task: ScanningTask, modulation: str | None = None) -> None:
         """Update auto-bookmark state and emit a bookmark when the peak has passed.
 
         On the first call (no previous level stored) the current position is
@@ -83,25 +116,29 @@ class FrequencyScannerStrategy:
 
         :param level: Signal level at *freq* (in the same units as ``sgn_level``).
         :param freq: Current frequency in Hz being evaluated.
-        :param task: Active ScanningTask; new bookmarks are appended to
+        :param task: Active ScanningTask; new bookmarks are queued for
             ``task.new_bookmarks_list``.
+        :param modulation: Modulation scanned at *freq*, defaults to
+            ``task.frequency_modulation``.
         """
+        modulation = modulation or task.frequency_modulation
         if not self._prev_level:
-            self._store_prev_bookmark(level=level, freq=freq)
+            self._store_prev_bookmark(level=level, freq=freq, modulation=modulation)
+            self._prev_strength = self._core.last_level
             return
         if level <= self._prev_level:
-            new_bm = self._create_new_bookmark(self._prev_freq)
             logger.info("Auto-bookmarking previous frequency.")
-            task.new_bookmarks_list.append(new_bm)
+            self._add_hit(self._prev_freq, self._prev_mode or modulation, task, self._prev_strength)
             self._erase_prev_bookmark()
         else:
-            self._store_prev_bookmark(level=level, freq=freq)
+            self._store_prev_bookmark(level=level, freq=freq, modulation=modulation)
+            self._prev_strength = self._core.last_level
 
     # ------------------------------------------------------------------
     # Inner refinement scan
     # ------------------------------------------------------------------
 
-    def _inner_scan(self, freq_start: int, task: ScanningTask) -> tuple[int, float]:
+    def _inner_scan(self, freq_start: int, task: ScanningTask, modulation: str | None = None) -> tuple[int, float]:
         """Sweep [freq_start, freq_start + task.inner_band) at task.inner_interval
         steps and return the frequency with the highest signal level.
 
@@ -117,12 +154,16 @@ class FrequencyScannerStrategy:
             signal above the threshold — the lower bound of the inner sweep.
         :param task: Active ScanningTask supplying inner_band, inner_interval,
             and frequency_modulation.
+        :param modulation: Modulation of the sweep, defaults to
+            ``task.frequency_modulation``.  Segmented scans pass the mode of
+            the segment the signal was found in.
         :returns: ``(peak_freq, peak_level)`` — the frequency inside the inner
             band that produced the strongest signal.
         """
         peak_freq: int = freq_start
         peak_level: float = float("-inf")
         freq: int = freq_start
+        modulation = modulation or task.frequency_modulation
         inner_end: int = freq_start + task.inner_band
 
         logger.info(
@@ -134,13 +175,14 @@ class FrequencyScannerStrategy:
 
         while freq < inner_end:
             try:
-                self._core.channel_tune(Channel(modulation=task.frequency_modulation, input_frequency=freq))
+                self._core.channel_tune(Channel(modulation=modulation, input_frequency=freq))
             except (OSError, TimeoutError, ValueError):
                 logger.warning("Inner scan tune error at %d Hz — skipping step.", freq)
                 freq += task.inner_interval
                 continue
 
-            level = self._core.rigctl.get_level()
+            with self._core.timed("sample_io"):
+                level = self._core.rigctl.get_level()
             logger.info("Inner scan: freq=%d Hz  level=%f", freq, level)
 
             if level > peak_level:
@@ -156,6 +198,22 @@ class FrequencyScannerStrategy:
     # Main scan loop
     # ------------------------------------------------------------------
 
+    def _compile_plan(self, task: ScanningTask) -> ScanPlan:
+        """Compile *task* into a ScanPlan and clear the core plan-stale flag.
+
+        An unsupported modulation yields an empty plan, so every pass is
+        skipped, as when each step failed to tune.
+
+        :param task: Active ScanningTask to compile.
+        :returns: The compiled plan.
+        """
+        self._core.plan_stale = False
+        try:
+            return compile_frequency_plan(task)
+        except ValueError:
+            logger.error("Unable to compile scan plan — no step will be tuned.")
+            return ScanPlan()
+
     def scan(self, task: ScanningTask, log: LogFile) -> ScanningTask:
         """Sweep from ``task.range_min`` to ``task.range_max`` in steps of
         ``task.interval``, performing a signal check at each frequency.
@@ -165,7 +223,22 @@ class FrequencyScannerStrategy:
         After each signal hit the scan pauses for ``task.delay`` seconds
         (via ``queue_sleep``) before continuing.  If no signal is found but
         a previous peak was held (``_hold_bookmark``), that frequency is
-        auto-bookmarked.
+        auto-bookmarked.  Auto-bookmarks are added to
+        ``task.new_bookmarks_list`` at the end of each pass, and before the
+        scan returns.  Priority bookmarks are interleaved through
+        ``ScannerCore.priority_check`` before each step is tuned.
+
+        The steps come from a ScanPlan, which sweeps all the task segments
+        in one pass when the task has any.  When a queue event changes the range
+        or the interval mid-pass the plan is recompiled and the pass resumes
+        at the first new step at or above the current frequency.
+
+        With a checkpoint store on the core, the position is saved every
+        ``save_every`` steps, at each pass boundary, when a tune error aborts
+        the pass and when the scan is terminated; the file is removed once
+        all passes complete.  If the store was created with ``resume`` the
+        scan starts from the stored frequency, pass count and collected
+        bookmarks.
 
         :param task: ScanningTask describing the frequency range, step size,
             modulation, and all scan options (record, log, auto_bookmark,
@@ -179,60 +252,102 @@ class FrequencyScannerStrategy:
         pass_count = task.passes
         logger.info("Starting frequency scan")
 
+        plan = self._compile_plan(task)
+        checkpoint = self._core.checkpoint
+        start_index = 0
+        if checkpoint is not None and checkpoint.resume:
+            state = checkpoint.load(task)
+            if state is not None:
+                pass_count = state.pass_count
+                task.new_bookmarks_list.extend(bm for bm in state.new_bookmarks if bm not in task.new_bookmarks_list)
+                start_index = plan.resume_index(state.frequency)
+        self._sink = AutoBookmarkSink(task, self._core.config.merge_bandwidth)
+
+        aborted = False
         while not self._core.should_stop():
-            freq = task.range_min
             logger.info("Scan pass %d, interval %d Hz", pass_count, task.interval)
 
-            if freq > task.range_max:
+            if task.range_min > task.range_max:
                 logger.error("range_min > range_max — stopping scan.")
                 self._core.terminate()
 
-            while freq < task.range_max:
+            if self._core.plan_stale:
+                plan = self._compile_plan(task)
+
+            index, start_index = start_index, 0
+            aborted = False
+            while index < len(plan):
                 if self._core.should_stop():
+                    self._flush_bookmarks()
+                    if checkpoint is not None:
+                        checkpoint.save(task, plan.frequencies[index], pass_count)
                     return task
 
                 if self._core.process_queue(task):
                     pass_count = task.passes
-
+                    if self._core.plan_stale:
+                        freq = plan.frequencies[index]
+                        plan = self._compile_plan(task)
+                        index = plan.resume_index(freq)
+                        if index >= len(plan):
+                            break
+
+                freq = plan.frequencies[index]
+                self._core.count_step()
+                if checkpoint is not None:
+                    checkpoint.step(task, freq, pass_count)
                 try:
-                    self._core.channel_tune(Channel(modulation=task.frequency_modulation, input_frequency=freq))
+                    self._core.priority_check(task, log)
+                    self._core.tune(freq, plan.mode(index))
                 except (OSError, TimeoutError, ValueError):
                     logger.error("Tune error at %d Hz — aborting pass.", freq)
+                    self._core.counters.tune_errors += 1
+                    self._flush_bookmarks()
+                    if checkpoint is not None:
+                        checkpoint.save(task, freq, pass_count)
+                    aborted = True
                     break
 
                 if self._core.signal_check(sgn_level=task.sgn_level):
                     if task.record:
-                        self._core.rigctl.start_recording()
+                        with self._core.timed("recording"):
+                            self._core.rigctl.start_recording()
                         logger.info("Recording started.")
 
                     if task.auto_bookmark:
                         if task.inner_band > 0 and task.inner_interval > 0:
-                            peak_freq, _ = self._inner_scan(freq, task)
-                            new_bm = self._create_new_bookmark(peak_freq)
-                            task.new_bookmarks_list.append(new_bm)
+                            peak_freq, peak_level = self._inner_scan(freq, task, plan.mode(index))
+                            self._add_hit(peak_freq, plan.mode(index), task, peak_level)
                             logger.info("Inner scan bookmark at %d Hz", peak_freq)
                         else:
-                            self._autobookmark(level=task.sgn_level, freq=freq, task=task)
+                            self._autobookmark(level=task.sgn_level, freq=freq, task=task, modulation=plan.mode(index))
 
                     if task.log:
-                        new_bm = self._create_new_bookmark(freq)
-                        log.write(record_type="F", record=new_bm, signal=[])
+                        with self._core.timed("logging"):
+                            log.write_entry(
+                                record_type=LOG_RECORD_FREQUENCY, frequency=freq, modulation=plan.mode(index), signal=[]
+                            )
 
                     if not self._core.should_stop():
                         self._core.queue_sleep(task)
 
                     if task.record:
-                        self._core.rigctl.stop_recording()
+                        with self._core.timed("recording"):
+                            self._core.rigctl.stop_recording()
                         logger.info("Recording stopped.")
 
                 elif self._hold_bookmark:
-                    new_bm = self._create_new_bookmark(self._prev_freq)
-                    task.new_bookmarks_list.append(new_bm)
-                    self._store_prev_bookmark(level=task.sgn_level, freq=self._prev_freq)
+                    self._add_hit(self._prev_freq, self._prev_mode or plan.mode(index), task, self._prev_strength)
+                    self._store_prev_bookmark(level=task.sgn_level, freq=self._prev_freq, modulation=self._prev_mode)
 
-                freq += task.interval
+                index += 1
 
+            self._flush_bookmarks()
             pass_count = self._core.pass_count_update(pass_count)
+            if checkpoint is not None and not aborted and pass_count > 0:
+                checkpoint.save(task, task.range_min, pass_count)
 
+        if checkpoint is not None and not aborted and pass_count == 0:
+            checkpoint.clear()
         self._core.scan_queue.notify_end_of_scan()
         return task
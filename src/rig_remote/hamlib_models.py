@@ -0,0 +1,169 @@
+"""
+Catalogue of the rig models supported by Hamlib.
+
+The models are listed by ``rigctl --list``, which takes a noticeable time to
+run, so load_hamlib_models() keeps the parsed list in a small json file keyed
+by the path, modification time and size of the rigctl binary: the list is
+only queried again when rigctl changes, and checking the cache runs nothing.  HamlibModelLoader runs it on a
+background thread so building the UI never waits for rigctl.
+
+Each entry has the format "<num> (<Mfg> <Model>)" so that
+int(entry.split()[0]) always yields the model number.
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from rig_remote.constants import DEFAULT_HAMLIB_MODELS_FILENAME, DEFAULT_PREFIX
+
+logger = logging.getLogger(__name__)
+
+HAMLIB_MODEL_FALLBACK: list[str] = [
+    "1 (Hamlib Dummy)",
+    "122 (Yaesu FT-857)",
+    "209 (Kenwood TS-2000)",
+    "361 (Icom IC-7300)",
+]
+
+DEFAULT_CACHE_PATH = os.path.join(DEFAULT_PREFIX, DEFAULT_HAMLIB_MODELS_FILENAME)
+
+RIGCTL_TIMEOUT = 5
+
+_CACHE_VERSION = 2
+
+
+def parse_rigctl_list(output: str) -> list[str]:
+    """Return the models of a ``rigctl --list`` output sorted by number."""
+    entries: list[tuple[int, str]] = []
+    for line in output.splitlines():
+        parts = re.split(r"\s{2,}", line.strip())
+        if len(parts) >= 3 and parts[0].isdigit():
+            num = int(parts[0])
+            entries.append((num, f"{num} ({parts[1]} {parts[2]})"))
+    return [label for _, label in sorted(entries)]
+
+
+def rigctl_fingerprint(rigctl: str = "rigctl") -> dict[str, Any] | None:
+    """Identify the installed rigctl binary, None when it is not on PATH.
+
+    Only the file is looked at, rigctl is not run.
+
+    :raises OSError: when rigctl cannot be accessed
+    """
+    path = shutil.which(rigctl)
+    if path is None:
+        return None
+    stat = os.stat(path)
+    return {"path": path, "mtime": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _read_cache(cache_path: str, fingerprint: dict[str, Any]) -> list[str] | None:
+    try:
+        with open(cache_path, encoding="utf-8") as cache_file:
+            data = json.load(cache_file)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable Hamlib model cache %s", cache_path)
+        return None
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION or data.get("rigctl") != fingerprint:
+        return None
+    models = data.get("models")
+    if not isinstance(models, list) or not models or not all(isinstance(model, str) for model in models):
+        return None
+    return models
+
+
+def _write_cache(cache_path: str, fingerprint: dict[str, Any], rigctl_version: str, models: list[str]) -> None:
+    data = {"version": _CACHE_VERSION, "rigctl": fingerprint, "rigctl_version": rigctl_version, "models": models}
+    temp_path = f"{cache_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as cache_file:
+            json.dump(data, cache_file)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        logger.warning("Unable to write Hamlib model cache %s: %s", cache_path, e)
+
+
+def load_hamlib_models(cache_path: str = DEFAULT_CACHE_PATH, rigctl: str = "rigctl") -> list[str]:
+    """Return all Hamlib rig models as combo-box strings.
+
+    The cached list is returned while rigctl is unchanged, otherwise rigctl
+    is queried and the cache rewritten.  Falls back to a short hardcoded
+    list when rigctl is not on PATH or lists no model.
+
+    :param cache_path: json file of the cached list, ``~`` is expanded
+    :param rigctl: name or path of the rigctl binary
+    """
+    cache_path = os.path.expanduser(cache_path)
+    try:
+        fingerprint = rigctl_fingerprint(rigctl)
+        if fingerprint is None:
+            logger.warning("rigctl not found on PATH; using fallback Hamlib model list")
+            return list(HAMLIB_MODEL_FALLBACK)
+        models = _read_cache(cache_path, fingerprint)
+        if models is not None:
+            return models
+        rigctl_version = subprocess.check_output(
+            [fingerprint["path"], "--version"], text=True, timeout=RIGCTL_TIMEOUT
+        ).strip()
+        logger.info("Listing the Hamlib models of %s", rigctl_version)
+        output = subprocess.check_output([fingerprint["path"], "--list"], text=True, timeout=RIGCTL_TIMEOUT)
+    except (OSError, ValueError, subprocess.SubprocessError) as e:
+        logger.warning("rigctl failed (%s); using fallback Hamlib model list", e)
+        return list(HAMLIB_MODEL_FALLBACK)
+
+    models = parse_rigctl_list(output)
+    if not models:
+        logger.warning("rigctl returned no parseable models; using fallback list")
+        return list(HAMLIB_MODEL_FALLBACK)
+    _write_cache(cache_path, fingerprint, rigctl_version, models)
+    return models
+
+
+class HamlibModelLoader:
+    """Loads the Hamlib model catalogue on a background thread."""
+
+    def __init__(
+        self,
+        callback: Callable[[list[str]], None],
+        cache_path: str = DEFAULT_CACHE_PATH,
+        rigctl: str = "rigctl",
+    ) -> None:
+        """Initialise a loader that is not started yet.
+
+        :param callback: called on the loader thread with the list of models
+        :param cache_path: json file of the cached list
+        :param rigctl: name or path of the rigctl binary
+        """
+        self._callback = callback
+        self._cache_path = cache_path
+        self._rigctl = rigctl
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start loading the models."""
+        if self._thread is not None:
+            raise RuntimeError("Hamlib model loader already started")
+        self._thread = threading.Thread(target=self._run, name="hamlib-models", daemon=True)
+        self._thread.start()
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait for the models to be delivered."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        models = load_hamlib_models(self._cache_path, self._rigctl)
+        try:
+            self._callback(models)
+        except Exception:
+            logger.exception("Hamlib model callback failed")
@@ -0,0 +1,124 @@
+"""
+Cached, background resolution of rig hostnames.
+
+Looking up a hostname can block for seconds when the DNS server is slow or
+unreachable, and rig endpoints used to be resolved synchronously each time
+one was created, which happens for every persisted endpoint at startup and
+on every hostname or port edit in the UI.
+
+HostnameResolver resolves each hostname once on a daemon thread and keeps
+the address, or the lookup error, for a time to live.  prefetch() starts a
+lookup without waiting for it; resolve() waits for the pending lookup or
+returns the cached answer, so callers asking for the same hostname share a
+single lookup.  IP address literals are returned as they are, without a
+thread.
+"""
+
+import ipaddress
+import logging
+import socket
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 300.0
+DEFAULT_NEGATIVE_TTL = 30.0
+
+
+def is_ip_address(hostname: str) -> bool:
+    """Return True if *hostname* is an IPv4 or IPv6 address literal."""
+    try:
+        ipaddress.ip_address(hostname)
+    except ValueError:
+        return False
+    return True
+
+
+class HostnameResolver:
+    """Hostname to IP address cache filled by background lookups."""
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        lookup: Callable[[str], str] = socket.gethostbyname,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise an empty cache.
+
+        :param ttl: seconds an address is reused before it is looked up again
+        :param negative_ttl: seconds a failed lookup is reused
+        :param lookup: blocking lookup, socket.gethostbyname by default
+        :param clock: monotonic clock in seconds
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lookup = lookup
+        self._clock = clock
+        self._lock = threading.Lock()
+        # hostname -> (expiry, address or the error raised by the lookup)
+        self._entries: dict[str, tuple[float, str | OSError]] = {}
+        self._pending: dict[str, Future[str]] = {}
+
+    def prefetch(self, hostname: str) -> Future[str]:
+        """Start resolving *hostname* in the background unless already known.
+
+        :returns: a future of the address, done when it is cached
+        """
+        future: Future[str] = Future()
+        if is_ip_address(hostname):
+            future.set_result(hostname)
+            return future
+        with self._lock:
+            entry = self._entries.get(hostname)
+            if entry is not None and entry[0] > self._clock():
+                if isinstance(entry[1], OSError):
+                    future.set_exception(entry[1])
+                else:
+                    future.set_result(entry[1])
+                return future
+            pending = self._pending.get(hostname)
+            if pending is not None:
+                return pending
+            self._pending[hostname] = future
+        threading.Thread(
+            target=self._resolve_into, args=(hostname, future), name="resolve-hostname", daemon=True
+        ).start()
+        return future
+
+    def resolve(self, hostname: str, timeout: float | None = None) -> str:
+        """Return the address of *hostname*, waiting for its lookup if needed.
+
+        :raises OSError: socket.gaierror when the hostname does not resolve,
+            TimeoutError when the lookup takes more than *timeout* seconds
+        """
+        return self.prefetch(hostname).result(timeout)
+
+    def invalidate(self, hostname: str) -> None:
+        """Forget the address of *hostname*, e.g. after a connection to it failed."""
+        with self._lock:
+            self._entries.pop(hostname, None)
+
+    def _resolve_into(self, hostname: str, future: Future[str]) -> None:
+        try:
+            address = self._lookup(hostname)
+        except (OSError, ValueError) as e:
+            # gethostbyname raises UnicodeError for labels it cannot encode
+            error = e if isinstance(e, OSError) else socket.gaierror(str(e))
+            logger.warning("Unable to resolve %s: %s", hostname, error)
+            with self._lock:
+                self._entries[hostname] = (self._clock() + self.negative_ttl, error)
+                del self._pending[hostname]
+            future.set_exception(error)
+            return
+        logger.debug("Resolved %s to %s", hostname, address)
+        with self._lock:
+            self._entries[hostname] = (self._clock() + self.ttl, address)
+            del self._pending[hostname]
+        future.set_result(address)
+
+
+default_resolver = HostnameResolver()
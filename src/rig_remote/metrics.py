@@ -0,0 +1,341 @@
+"""
+Prometheus-format metrics for unattended scanners.
+
+MetricsCollector renders, in the Prometheus text exposition format, the
+state of whatever sources it is given:
+
+  - ScanCounters: steps scanned, hits, bookmarks created, tune errors,
+    scans started, whether a scan is running and when the last step ran;
+  - SyncCounters: copies done, errors, lag of the last copy;
+  - STMessenger queues: depth of the parent and child queues;
+  - rig backends: command latency histograms and errors when wrapped in
+    InstrumentedRigCtl, connect/send/recv phase histograms for GQRXRigCtl,
+    and connections opened by backends counting them (HamlibRigCtl).
+
+Two exporters publish the rendering:
+
+  - MetricsHTTPServer serves it on http://host:port/metrics for scraping;
+  - TextfileExporter rewrites a file periodically, for the node_exporter
+    textfile collector.
+
+A scan that is stuck shows rig_remote_scan_active 1 with an old
+rig_remote_scan_last_step_timestamp_seconds; one that is crawling shows a
+low rate of rig_remote_scan_steps_total.
+"""
+
+import http.server
+import logging
+import os
+import threading
+from typing import Any
+
+from rig_remote.models.run_counters import ScanCounters, SyncCounters
+from rig_remote.rig_backends.instrumented_rigctl import BUCKET_BOUNDS, InstrumentedRigCtl
+from rig_remote.rig_backends.protocol import RigBackend
+from rig_remote.stmessenger import STMessenger
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_Sample = tuple[dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_sample(name: str, labels: dict[str, str], value: float) -> str:
+    if labels:
+        label_text = ",".join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+        name = f"{name}{{{label_text}}}"
+    if value == float("inf"):
+        return f"{name} +Inf"
+    return f"{name} {value!r}" if isinstance(value, float) else f"{name} {value}"
+
+
+class _Rendering:
+    """Accumulates metric families in exposition format."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def family(self, name: str, metric_type: str, help_text: str, samples: list[_Sample]) -> None:
+        if not samples:
+            return
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {metric_type}")
+        self.lines.extend(_format_sample(name, labels, value) for labels, value in samples)
+
+    def histogram(self, name: str, help_text: str, series: list[tuple[dict[str, str], dict[str, Any]]]) -> None:
+        """Add a histogram family from LatencyHistogram snapshots."""
+        if not series:
+            return
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} histogram")
+        for labels, snapshot in series:
+            cumulative = 0
+            for bound in BUCKET_BOUNDS:
+                cumulative += snapshot["buckets"].get(f"{bound:g}", 0)
+                self.lines.append(_format_sample(f"{name}_bucket", {**labels, "le": f"{bound:g}"}, cumulative))
+            self.lines.append(_format_sample(f"{name}_bucket", {**labels, "le": "+Inf"}, snapshot["count"]))
+            self.lines.append(_format_sample(f"{name}_sum", labels, float(snapshot["total_s"])))
+            self.lines.append(_format_sample(f"{name}_count", labels, snapshot["count"]))
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+class MetricsCollector:
+    """Renders the metrics of the sources it is given.
+
+    Sources can be changed at any time through the public attributes, e.g.
+    when a new scan queue or backend is configured.
+    """
+
+    def __init__(
+        self,
+        scan_counters: ScanCounters | None = None,
+        sync_counters: SyncCounters | None = None,
+        queues: dict[str, STMessenger] | None = None,
+        backends: dict[str, RigBackend] | None = None,
+    ) -> None:
+        """Initialise the collector.
+
+        :param scan_counters: counters shared with the scans, see create_scanner
+        :param sync_counters: counters shared with Syncing
+        :param queues: messengers whose queue depth is exported, by name
+        :param backends: rig backends, by name; wrap them in InstrumentedRigCtl
+            to export command latencies
+        """
+        self.scan_counters = scan_counters
+        self.sync_counters = sync_counters
+        self.queues = queues or {}
+        self.backends = backends or {}
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        rendering = _Rendering()
+        rendering.family("rig_remote_up", "gauge", "Always 1 while rig-remote is running.", [({}, 1)])
+        if self.scan_counters is not None:
+            self._render_scan(rendering, self.scan_counters)
+        if self.sync_counters is not None:
+            self._render_sync(rendering, self.sync_counters)
+        self._render_queues(rendering)
+        self._render_backends(rendering)
+        return rendering.text()
+
+    @staticmethod
+    def _render_scan(rendering: _Rendering, counters: ScanCounters) -> None:
+        for name, help_text, value in (
+            ("rig_remote_scan_steps_total", "Channels tuned by the scan loops.", counters.steps),
+            ("rig_remote_scan_hits_total", "Signal checks that found activity.", counters.hits),
+            ("rig_remote_scan_bookmarks_created_total", "Bookmarks created by scans.", counters.bookmarks_created),
+            ("rig_remote_scan_tune_errors_total", "Scan steps that failed to tune.", counters.tune_errors),
+            ("rig_remote_scans_total", "Scans started.", counters.scans),
+        ):
+            rendering.family(name, "counter", help_text, [({}, value)])
+        rendering.family("rig_remote_scan_active", "gauge", "1 while a scan is running.", [({}, int(counters.active))])
+        rendering.family(
+            "rig_remote_scan_last_step_timestamp_seconds",
+            "gauge",
+            "Unix time of the last scan step.",
+            [({}, counters.last_step_time)],
+        )
+
+    @staticmethod
+    def _render_sync(rendering: _Rendering, counters: SyncCounters) -> None:
+        rendering.family("rig_remote_syncs_total", "counter", "Copies from the source rig.", [({}, counters.syncs)])
+        rendering.family("rig_remote_sync_errors_total", "counter", "Failed sync copies.", [({}, counters.errors)])
+        rendering.family(
+            "rig_remote_sync_lag_seconds", "gauge", "Duration of the last sync copy.", [({}, counters.last_lag)]
+        )
+        rendering.family(
+            "rig_remote_sync_last_timestamp_seconds",
+            "gauge",
+            "Unix time of the last sync copy.",
+            [({}, counters.last_sync_time)],
+        )
+
+    def _render_queues(self, rendering: _Rendering) -> None:
+        samples: list[_Sample] = []
+        for name, messenger in self.queues.items():
+            comms = messenger.queue_comms
+            samples.append(({"queue": name, "direction": "parent"}, comms.parent_queue.qsize()))
+            samples.append(({"queue": name, "direction": "child"}, comms.child_queue.qsize()))
+        rendering.family("rig_remote_queue_depth", "gauge", "Events waiting on the inter-thread queues.", samples)
+
+    def _render_backends(self, rendering: _Rendering) -> None:
+        commands: list[tuple[dict[str, str], dict[str, Any]]] = []
+        phases: list[tuple[dict[str, str], dict[str, Any]]] = []
+        errors: list[_Sample] = []
+        connects: list[_Sample] = []
+        for name, backend in self.backends.items():
+            inner = backend
+            if isinstance(backend, InstrumentedRigCtl):
+                inner = backend.backend
+                snapshot = backend.snapshot()
+                for command, histogram in snapshot["commands"].items():
+                    labels = {"backend": name, "command": command}
+                    commands.append((labels, histogram))
+                    errors.append((labels, histogram["errors"]))
+                for phase, histogram in snapshot["phases"].items():
+                    phases.append(({"backend": name, "phase": phase}, histogram))
+            connect_count = getattr(inner, "connect_count", None)
+            if isinstance(connect_count, int):
+                connects.append(({"backend": name}, connect_count))
+        rendering.histogram("rig_remote_backend_command_seconds", "Latency of the rig backend commands.", commands)
+        rendering.family(
+            "rig_remote_backend_command_errors_total", "counter", "Rig backend commands that raised.", errors
+        )
+        rendering.histogram("rig_remote_backend_phase_seconds", "Time spent connecting, sending and receiving.", phases)
+        rendering.family(
+            "rig_remote_backend_connects_total",
+            "counter",
+            "Connections opened by the backend; more than one means reconnects.",
+            connects,
+        )
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+    server: "_MetricsServer"
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.collector.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("metrics request: " + format, *args)
+
+
+class _MetricsServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], collector: MetricsCollector) -> None:
+        self.collector = collector
+        super().__init__(address, _MetricsHandler)
+
+
+class MetricsHTTPServer:
+    """Serves the collector rendering on /metrics from a background thread."""
+
+    def __init__(self, collector: MetricsCollector, host: str = "127.0.0.1", port: int = 9477) -> None:
+        """Initialise the server, nothing is bound until start().
+
+        :param collector: the metrics to serve
+        :param host: address to bind, loopback by default
+        :param port: port to bind, 0 picks a free one
+        """
+        self.collector = collector
+        self._host = host
+        self._port = port
+        self._server: _MetricsServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Host and port the server listens on.
+
+        :raises RuntimeError: if the server is not running
+        """
+        if self._server is None:
+            raise RuntimeError("MetricsHTTPServer is not running")
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    def start(self) -> None:
+        """Bind the port and serve in a daemon thread.
+
+        :raises OSError: if the port can't be bound
+        """
+        if self._server is not None:
+            return
+        self._server = _MetricsServer((self._host, self._port), self.collector)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True)
+        self._thread.start()
+        logger.info("Serving metrics on http://%s:%i/metrics", *self.address)
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> "MetricsHTTPServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+class TextfileExporter:
+    """Writes the collector rendering to a file every *interval* seconds."""
+
+    def __init__(self, collector: MetricsCollector, path: str, interval: float = 15.0) -> None:
+        """Initialise the exporter, nothing is written until start().
+
+        :param collector: the metrics to write
+        :param path: file to write, named *.prom for the node_exporter
+            textfile collector
+        :param interval: seconds between two writes
+        :raises ValueError: if interval isn't positive
+        """
+        if interval <= 0:
+            raise ValueError(f"interval must be > 0, got {interval}")
+        self.collector = collector
+        self.path = path
+        self._interval = interval
+        self._stop: threading.Event | None = None
+        self._thread: threading.Thread | None = None
+
+    def write(self) -> None:
+        """Write the metrics once, atomically.
+
+        Write errors are logged and otherwise ignored.
+        """
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as metrics_file:
+                metrics_file.write(self.collector.render())
+            os.replace(temp_path, self.path)
+        except OSError:
+            logger.exception("Could not write metrics to %s", self.path)
+
+    def start(self) -> None:
+        """Write the metrics now and then every interval from a daemon thread."""
+        if self._thread is not None:
+            return
+        stop = threading.Event()
+
+        def _run() -> None:
+            self.write()
+            while not stop.wait(self._interval):
+                self.write()
+            self.write()
+
+        self._stop = stop
+        self._thread = threading.Thread(target=_run, name="metrics-textfile", daemon=True)
+        self._thread.start()
+        logger.info("Writing metrics to %s every %.1f s", self.path, self._interval)
+
+    def stop(self) -> None:
+        """Stop the periodic writes, writing the metrics one last time."""
+        if self._stop is None or self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._stop = None
+        self._thread = None
@@ -27,7 +27,8 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class Bookmark:
-    _LOCKOUTS = ["", "L", "O", "0"]
+    # "L" locks the bookmark out of the scans, "P" makes it a priority channel
+    _LOCKOUTS = ["", "L", "O", "0", "P"]
     channel: Channel
     description: str
     lockout: str = ""
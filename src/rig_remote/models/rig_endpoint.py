@@ -5,19 +5,31 @@ Supports two backends:
   - GQRX  — TCP/IP; requires hostname + port.
   - HAMLIB — USB/serial; requires rig_model + serial_port + serial parameters.
 
-Port > 1024 and DNS hostname validation apply to GQRX only.
+Port > 1024, hostname and timeout validation apply to GQRX only.
 Hamlib-specific fields are ignored when backend == GQRX.
+
+Creating a GQRX endpoint only checks the hostname syntax and starts its
+lookup in the background (hostname_resolver.default_resolver); the address is
+waited for by resolve(), when the rig is first contacted, and kept in address
+until the hostname changes or invalidate_address() is called after a
+connection error.
 """
 
 import logging
+import re
 from dataclasses import dataclass, field
-from socket import gaierror, gethostbyname
 from uuid import uuid4
 
+from rig_remote import hostname_resolver
 from rig_remote.rig_backends.protocol import BackendType
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 5.0
+
+_HOSTNAME_LABEL = re.compile(r"(?!-)[A-Za-z0-9-]{1,63}(?<!-)")
+
 
 @dataclass
 class RigEndpoint:
@@ -30,6 +42,8 @@ class RigEndpoint:
     # GQRX-specific
     hostname: str = ""
     port: int = 0
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT  # seconds
+    read_timeout: float = DEFAULT_READ_TIMEOUT  # seconds
 
     # Hamlib-specific
     rig_model: int = 0
@@ -39,6 +53,10 @@ class RigEndpoint:
     stop_bits: int = 1
     parity: str = "N"
 
+    # Address resolve() returned for hostname, "" until it is looked up.
+    address: str = field(default="", init=False, compare=False, repr=False)
+    _resolved_hostname: str = field(default="", init=False, compare=False, repr=False)
+
     def __post_init__(self) -> None:
         self._is_valid_number()
         if self.backend == BackendType.GQRX:
@@ -46,6 +64,8 @@ class RigEndpoint:
                 self._is_valid_port(self.port)
             if self.hostname:
                 self._is_valid_hostname(self.hostname)
+            self._is_valid_timeout(self.connect_timeout)
+            self._is_valid_timeout(self.read_timeout)
         if not self.name:
             self.name = self._default_name()
 
@@ -67,13 +87,47 @@ class RigEndpoint:
             logger.error(message)
             raise ValueError(message)
 
+    @staticmethod
+    def _is_valid_timeout(timeout: float) -> None:
+        if not timeout > 0:
+            message = f"Timeout must be a positive number of seconds, got {timeout}"
+            logger.error(message)
+            raise ValueError(message)
+
     @staticmethod
     def _is_valid_hostname(hostname: str) -> None:
-        try:
-            _ = gethostbyname(hostname)
-        except gaierror as e:
-            logger.error("Hostname error: %s", e)
-            raise ValueError(str(e)) from e
+        """Check the syntax of *hostname* and start resolving it."""
+        if not hostname_resolver.is_ip_address(hostname):
+            labels = hostname.removesuffix(".").split(".")
+            if (
+                len(hostname) > 253
+                or not all(_HOSTNAME_LABEL.fullmatch(label) for label in labels)
+                # dotted numbers that are not an IPv4 address, e.g. 10.0.0.300
+                or labels[-1].isdigit()
+            ):
+                message = f"Invalid hostname: {hostname}"
+                logger.error(message)
+                raise ValueError(message)
+        hostname_resolver.default_resolver.prefetch(hostname)
+
+    def resolve(self, timeout: float | None = None) -> str:
+        """Return the IP address of the hostname.
+
+        Returns the stored address when the hostname was already resolved,
+        otherwise waits for the background lookup if it is still running.
+
+        :raises OSError: when the hostname does not resolve in *timeout* seconds
+        """
+        if self.address and self._resolved_hostname == self.hostname:
+            return self.address
+        self.address = hostname_resolver.default_resolver.resolve(self.hostname, timeout)
+        self._resolved_hostname = self.hostname
+        return self.address
+
+    def invalidate_address(self) -> None:
+        """Forget the address, so that the next resolve() looks the hostname up again."""
+        self.address = ""
+        hostname_resolver.default_resolver.invalidate(self.hostname)
 
     def set_port(self, port: int) -> None:
         self._is_valid_port(port=port)
@@ -0,0 +1,28 @@
+"""
+Snapshot of the state of a rig, read by RigBackend.get_status().
+
+Backends read the values in as few transactions as they can: HamlibRigCtl
+in a single serial burst.  Values a rig or backend cannot report are None.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class RigStatus:
+    """Frequency, mode and levels of a rig at one point in time.
+
+    :param frequency: frequency in Hz
+    :param mode: modulation, as returned by get_mode()
+    :param strength: signal strength in the units of get_level(), dB × 10
+    :param raw_strength: uncalibrated S-meter reading
+    :param squelch_open: True while the squelch is open
+    :param rf_power: transmit power setting, 0.0 to 1.0
+    """
+
+    frequency: int
+    mode: str
+    strength: int
+    raw_strength: int | None = None
+    squelch_open: bool | None = None
+    rf_power: float | None = None
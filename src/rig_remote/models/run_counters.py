@@ -0,0 +1,50 @@
+"""
+Cumulative activity counters of scans and syncs.
+
+ScannerCore and Syncing update these as they run; the metrics exporters
+(metrics.py) read them from another thread.  One instance can be shared by
+successive scans or syncs, so the counters keep growing across runs as
+monitoring systems expect.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ScanCounters:
+    """Activity of the scans run with these counters.
+
+    :param steps: channels tuned by the scan loops
+    :param hits: signal checks that found activity
+    :param bookmarks_created: bookmarks added to the new bookmarks list
+    :param tune_errors: steps that failed to tune
+    :param scans: scans started
+    :param active: whether a scan is running
+    :param last_step_time: unix time of the last step, 0.0 before the first
+    """
+
+    steps: int = 0
+    hits: int = 0
+    bookmarks_created: int = 0
+    tune_errors: int = 0
+    scans: int = 0
+    active: bool = False
+    last_step_time: float = 0.0
+
+
+@dataclass
+class SyncCounters:
+    """Activity of the syncs run with these counters.
+
+    :param syncs: frequency and mode copies from the source to the
+        destination rig
+    :param errors: copies that failed
+    :param last_lag: seconds the last copy took, from reading the source to
+        setting the destination
+    :param last_sync_time: unix time of the last copy, 0.0 before the first
+    """
+
+    syncs: int = 0
+    errors: int = 0
+    last_lag: float = 0.0
+    last_sync_time: float = 0.0
@@ -0,0 +1,81 @@
+"""
+ScanSegment: one frequency range of a segmented frequency scan.
+
+A segmented scan sweeps several ranges in a single pass, each with its own
+step and modulation.  merge_segments() sorts a segment list and removes the
+overlaps so that no frequency is swept twice in a pass.
+"""
+
+import logging
+from dataclasses import dataclass, replace
+
+from rig_remote.constants import MAX_FREQUENCY_HZ
+from rig_remote.models.modulation_modes import ModulationModes
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScanSegment:
+    """One frequency range of a segmented scan, with its own step and mode.
+
+    The range follows the scan convention: range_min inclusive, range_max
+    exclusive.
+    """
+
+    _MODULATIONS = [modulation.value for modulation in ModulationModes]
+
+    range_min: int
+    range_max: int
+    interval: int
+    modulation: str
+    description: str = ""
+
+    def __post_init__(self) -> None:
+        if self.modulation.upper() not in self._MODULATIONS:
+            message = (
+                f"Provided modulation {self.modulation!r} is not supported, "
+                f"supported modulations are {self._MODULATIONS}"
+            )
+            logger.error(message)
+            raise ValueError(message)
+        self.modulation = self.modulation.upper()
+
+        if self.range_min < 1 or self.range_max > MAX_FREQUENCY_HZ + 1 or self.range_min >= self.range_max:
+            message = f"invalid segment range [{self.range_min}, {self.range_max})"
+            logger.error(message)
+            raise ValueError(message)
+
+        if self.interval < 1:
+            message = f"invalid segment interval {self.interval}"
+            logger.error(message)
+            raise ValueError(message)
+
+
+def merge_segments(segments: list[ScanSegment]) -> list[ScanSegment]:
+    """Sort *segments* by frequency and remove overlaps.
+
+    Overlapping or adjacent segments sharing interval and modulation are
+    joined into one.  When overlapping segments differ, the one starting
+    first keeps the overlap: the other is moved to start where the first
+    ends, or dropped if it lies entirely inside it.
+
+    :param segments: segments in any order, possibly overlapping
+    :returns: new list of sorted, non-overlapping segments
+    """
+    merged: list[ScanSegment] = []
+    for segment in sorted(segments, key=lambda s: (s.range_min, s.range_max)):
+        if not merged or segment.range_min > merged[-1].range_max:
+            merged.append(segment)
+            continue
+        last = merged[-1]
+        if segment.interval == last.interval and segment.modulation == last.modulation:
+            merged[-1] = replace(last, range_max=max(last.range_max, segment.range_max))
+        elif segment.range_max <= last.range_max:
+            logger.warning("Segment %s is covered by %s, dropping it", segment, last)
+        elif segment.range_min == last.range_max:
+            merged.append(segment)
+        else:
+            logger.warning("Segment %s overlaps %s, starting it at %i", segment, last, last.range_max)
+            merged.append(replace(segment, range_min=last.range_max))
+    return merged
@@ -17,9 +17,15 @@ Copyright (c) 2016 Tim Sweeney
 """
 
 import logging
+from dataclasses import replace
+from typing import TYPE_CHECKING
 
 from rig_remote.constants import MAX_FREQUENCY_HZ
 from rig_remote.models.bookmark import Bookmark
+from rig_remote.models.scan_segment import ScanSegment, merge_segments
+
+if TYPE_CHECKING:  # pragma: no cover
+    from rig_remote.bookmark_activity import BookmarkActivity
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +40,8 @@ class ScanningTask:
     _SUPPORTED_SCANNING_MODES = ("bookmarks", "frequency")
     # minimum interval in hertz
     _MIN_INTERVAL: int = 1000
+    # upper bound on priority channels, keeps the per-step overhead bounded
+    _MAX_PRIORITY_CHANNELS: int = 10
 
     def __init__(
         self,
@@ -53,6 +61,10 @@ class ScanningTask:
         bookmarks: list[Bookmark],
         inner_band: int = 0,
         inner_interval: int = 0,
+        bookmark_activity: "BookmarkActivity | None" = None,
+        priority_bookmarks: list[Bookmark] | None = None,
+        priority_interval: int = 0,
+        segments: list[ScanSegment] | None = None,
     ):
         """We do some checks to see if we are good to go with the scan.
 
@@ -65,6 +77,22 @@ class ScanningTask:
         :param inner_interval: Step size in Hz for the inner refinement scan.
             Must be >= ``_MIN_INTERVAL`` when enabled.  Set to 0 (default) to
             disable inner scanning.
+        :param bookmark_activity: Optional activity tracker.  When provided,
+            bookmark scans visit busy bookmarks first and revisit long-silent
+            ones less often.  Reuse the same instance across tasks to keep
+            the hit history between scans.  None (default) scans the
+            bookmarks in list order.
+        :param priority_bookmarks: Bookmarks re-checked every
+            ``priority_interval`` steps of the scan, whatever the scan mode.
+            Locked bookmarks are skipped.  At most
+            ``_MAX_PRIORITY_CHANNELS`` entries are kept.
+        :param priority_interval: Number of scan steps between two priority
+            checks.  Set to 0 (default) to disable priority channels.
+        :param segments: Frequency ranges swept in a single pass of a
+            frequency scan, each with its own step and modulation.  They are
+            sorted and merged, and range_min/range_max are set to the span
+            they cover.  When set, range and interval queue events have no
+            effect.  None (default) sweeps range_min to range_max.
         :raises: InvalidScanModeError if action or mode are not allowed
         :raises: ValueError if the pass_params dictionary contains invalid data
 
@@ -86,14 +114,20 @@ class ScanningTask:
         self.scan_mode = scan_mode
         self.inner_band = inner_band
         self.inner_interval = inner_interval
+        self.bookmark_activity = bookmark_activity
+        self.priority_bookmarks = priority_bookmarks if priority_bookmarks is not None else []
+        self.priority_interval = priority_interval
+        self.segments = segments if segments is not None else []
         self._post_init()
 
     def _post_init(self) -> None:
         self._check_passes()
+        self._check_segments()
         self._check_scan_mode()
         self._check_range_min()
         self._check_range_max()
         self._check_inner_scan_params()
+        self._check_priority_params()
 
     def _check_range_min(self) -> None:
         """Checks for a sane range_min. We don't want to search for signals
@@ -117,6 +151,29 @@ class ScanningTask:
             )
             self.range_max = MAX_FREQUENCY_HZ
 
+    def _check_segments(self) -> None:
+        """Normalise the segments of a segmented scan.
+
+        Segment intervals below _MIN_INTERVAL are clamped up, the segments
+        are sorted and merged, and range_min/range_max are set to the span
+        they cover so the range checks keep applying.
+        """
+        if not self.segments:
+            return
+        segments = []
+        for segment in self.segments:
+            if segment.interval < self._MIN_INTERVAL:
+                logger.error(
+                    "Low segment interval provided %i, overriding with %i",
+                    segment.interval,
+                    self._MIN_INTERVAL,
+                )
+                segment = replace(segment, interval=self._MIN_INTERVAL)
+            segments.append(segment)
+        self.segments = merge_segments(segments)
+        self.range_min = self.segments[0].range_min
+        self.range_max = self.segments[-1].range_max
+
     def _check_scan_mode(self) -> None:
         if self.scan_mode.lower() not in self._SUPPORTED_SCANNING_MODES:
             message = (
@@ -203,3 +260,24 @@ class ScanningTask:
                 self.inner_band,
                 self.inner_interval,
             )
+
+    def _check_priority_params(self) -> None:
+        """Validate and normalise priority_bookmarks / priority_interval.
+
+        A negative interval is clamped to 0 (disabled) and the priority list
+        is truncated to ``_MAX_PRIORITY_CHANNELS`` entries.
+        """
+        if self.priority_interval < 0:
+            logger.error(
+                "Negative priority_interval %i provided, overriding with 0",
+                self.priority_interval,
+            )
+            self.priority_interval = 0
+
+        if len(self.priority_bookmarks) > self._MAX_PRIORITY_CHANNELS:
+            logger.error(
+                "%i priority bookmarks provided, keeping the first %i",
+                len(self.priority_bookmarks),
+                self._MAX_PRIORITY_CHANNELS,
+            )
+            self.priority_bookmarks = self.priority_bookmarks[: self._MAX_PRIORITY_CHANNELS]
@@ -4,7 +4,9 @@ GQRXRigCtl: GQRX/rigctl TCP backend.
 Opens a new TCP socket per command (connect → send → read → close).
 This is intentional: gqrx is single-request-per-connection, and the
 per-call model protects against flaky network conditions without any
-reconnect logic.
+reconnect logic.  Replies are read line by line into a receive buffer kept
+by the instance, until the number of lines the command answers has arrived.
+Connect and read timeouts come from the RigEndpoint.
 
 Fixes applied relative to the original RigCtl class:
   - set_frequency / get_frequency use int Hz (not float).
@@ -15,15 +17,30 @@ Fixes applied relative to the original RigCtl class:
 
 import logging
 import socket
+import threading
+import time
+from collections.abc import Callable
 from logging import Logger
 
 from rig_remote.models.modulation_modes import ModulationModes
 from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.models.rig_status import RigStatus
 from rig_remote.rig_backends.mode_translator import ModeTranslator
 from rig_remote.rig_backends.protocol import BackendType
 
 logger: Logger = logging.getLogger(__name__)
 
+_BUFFER_SIZE = 1024
+_MAX_REPLY_SIZE = 64 * 1024
+
+# Lines of the replies longer than one line: "m" answers mode and passband.
+_REPLY_LINES = {"m": 2}
+
+# gqrx squelch level with the squelch off, in dBFS.
+_SQUELCH_OFF = -150.0
+# Seconds the squelch level read by get_dcd is reused.
+_SQUELCH_TTL = 5.0
+
 
 class GQRXRigCtl:
     SUPPORTED_MODULATION_MODES = ModulationModes
@@ -117,43 +134,103 @@ class GQRXRigCtl:
     ) -> None:
         self.endpoint = endpoint
         self._translator = mode_translator or ModeTranslator(BackendType.GQRX)
+        # Called with ("connect" | "send" | "recv", seconds) after every
+        # successful exchange; None disables the timing entirely.
+        self.phase_observer: Callable[[str, float], None] | None = None
+        # Receive buffer reused by every command, serialised by _io_lock.
+        self._io_lock = threading.Lock()
+        self._buffer = bytearray(_BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        # (squelch level, monotonic time it was read) cached by get_dcd.
+        self._squelch: tuple[float, float] | None = None
 
     def _send_message(self, request: str) -> str:
-        rig_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        rig_socket.settimeout(5.0)
-        logger.info(
+        logger.debug(
             "sending: %s to endpoint %s:%i",
             request,
             self.endpoint.hostname,
             self.endpoint.port,
         )
-        request = f"{request}\n"
-        try:
-            rig_socket.connect((self.endpoint.hostname, self.endpoint.port))
-            rig_socket.sendall(bytearray(request.encode()))
-            response = rig_socket.recv(1024)
-            rig_socket.close()
-        except TimeoutError:
-            logger.error(
-                "Timeout connecting to %s:%s",
-                self.endpoint.hostname,
-                self.endpoint.port,
-            )
-            raise
-        except OSError:
-            logger.exception(
-                "Connection error on %s:%s",
-                self.endpoint.hostname,
-                self.endpoint.port,
-            )
-            raise
-        logger.info(
+        lines = _REPLY_LINES.get(request.split(" ", 1)[0], 1)
+        observer = self.phase_observer
+        with self._io_lock:
+            rig_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            address = ""
+            try:
+                # stored by the endpoint, no DNS lookup per command
+                address = self.endpoint.resolve(timeout=self.endpoint.connect_timeout)
+                rig_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                rig_socket.settimeout(self.endpoint.connect_timeout)
+                started = time.perf_counter() if observer else 0.0
+                rig_socket.connect((address, self.endpoint.port))
+                connected = time.perf_counter() if observer else 0.0
+                rig_socket.settimeout(self.endpoint.read_timeout)
+                rig_socket.sendall(f"{request}\n".encode())
+                sent = time.perf_counter() if observer else 0.0
+                response = self._read_reply(rig_socket, lines)
+                if observer:
+                    received = time.perf_counter()
+                    observer("connect", connected - started)
+                    observer("send", sent - connected)
+                    observer("recv", received - sent)
+            except TimeoutError:
+                logger.error(
+                    "Timeout connecting to %s:%s",
+                    self.endpoint.hostname,
+                    self.endpoint.port,
+                )
+                if address:
+                    # the rig may have moved, look its hostname up again
+                    self.endpoint.invalidate_address()
+                raise
+            except OSError:
+                logger.exception(
+                    "Connection error on %s:%s",
+                    self.endpoint.hostname,
+                    self.endpoint.port,
+                )
+                if address:
+                    self.endpoint.invalidate_address()
+                raise
+            finally:
+                rig_socket.close()
+        logger.debug(
             "received %s from %s:%s",
             response,
             self.endpoint.hostname,
             self.endpoint.port,
         )
-        return str(response.decode())
+        return response
+
+    def _read_reply(self, rig_socket: socket.socket, lines: int) -> str:
+        """Read the reply to a command from *rig_socket*.
+
+        The reply ends after *lines* newlines, after an "RPRT" error line or
+        when gqrx closes the connection, so a complete reply is returned as
+        soon as it arrives, however it is split in segments.
+        """
+        size = 0
+        newlines = 0
+        while newlines < lines:
+            if size == len(self._buffer):
+                if size >= _MAX_REPLY_SIZE:
+                    raise OSError(f"Reply longer than {_MAX_REPLY_SIZE} bytes")
+                self._grow_buffer()
+            with self._view[size:] as free:
+                received = rig_socket.recv_into(free)
+            if not received:
+                break
+            newlines += self._buffer.count(b"\n", size, size + received)
+            size += received
+            if newlines and self._buffer.startswith(b"RPRT"):
+                break
+        return self._buffer[:size].decode()
+
+    def _grow_buffer(self) -> None:
+        # a bytearray cannot be resized while a memoryview exports it
+        self._view.release()
+        self._buffer.extend(bytes(len(self._buffer)))
+        self._view = memoryview(self._buffer)
 
     def set_frequency(self, frequency: int) -> None:
         try:
@@ -192,6 +269,37 @@ class GQRXRigCtl:
             raise ValueError(f"Expected string response, got {type(output)}")
         return int(float(output.strip()))
 
+    def get_status(self) -> RigStatus:
+        """Return frequency, mode and signal strength.
+
+        gqrx answers one command per connection, so this costs the three
+        round trips of get_frequency, get_mode and get_level; gqrx reports
+        no other level.
+        """
+        return RigStatus(
+            frequency=self.get_frequency(),
+            mode=self.get_mode(),
+            strength=self.get_level(),
+        )
+
+    def get_dcd(self) -> bool:
+        """Return True while the gqrx squelch is open.
+
+        gqrx has no DCD command: the squelch is open when the signal
+        strength reaches the squelch level.  The level, read with "l SQL",
+        is reused for _SQUELCH_TTL seconds, so most calls cost a single
+        strength read.
+
+        :raises NotImplementedError: when the gqrx squelch is off
+        """
+        now = time.monotonic()
+        if self._squelch is None or now - self._squelch[1] >= _SQUELCH_TTL:
+            self._squelch = (float(self._send_message("l SQL").strip()), now)
+        squelch = self._squelch[0]
+        if squelch <= _SQUELCH_OFF:
+            raise NotImplementedError("The gqrx squelch is off")
+        return float(self._send_message("l").strip()) >= squelch
+
     def set_vfo(self, vfo: str) -> str:
         if vfo not in self._ALLOWED_VFO_COMMANDS:
             logger.error(
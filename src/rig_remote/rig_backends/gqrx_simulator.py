@@ -0,0 +1,177 @@
+"""
+GQRXSimulator: local TCP stand-in for gqrx remote control.
+
+Serves the rigctl subset used by GQRXRigCtl on a local port and answers from
+a SimulatedRigCtl, so everything talking to gqrx (the UI, GQRXRigCtl, the
+functional tests) can run without a radio:
+
+    with GQRXSimulator(port=7356) as simulator:
+        ...  # connect to simulator.address
+
+Each connection may carry several newline-terminated commands, as gqrx
+allows.  Set commands answer "RPRT 0", or "RPRT 1" when rejected; get
+commands answer their value.  A failure injected by the SimulationProfile
+closes the connection without an answer, as a crashing gqrx would:
+GQRXRigCtl gets an empty response.  Latency and jitter of the profile apply to every command.
+"""
+
+import logging
+import socketserver
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from rig_remote.rig_backends.simulated_rigctl import SimulatedRigCtl
+
+logger = logging.getLogger(__name__)
+
+# Passband reported after the mode by "m", as gqrx does.
+_PASSBAND_HZ = 10_000
+# "*" carries the numeric reset value, the backend API takes its name.
+_RESET_NAMES = {"0": "NONE", "1": "SOFTWARE_RESET", "2": "VFO_RESET", "4": "MEMORY_CLEAR_RESET", "8": "MASTER_RESET"}
+
+
+def _answer(rig: SimulatedRigCtl, line: str) -> str | None:
+    """Run one gqrx command against *rig*.
+
+    :returns: the answer without trailing newline, None to close the
+        connection
+    :raises OSError: when the simulated rig injects a failure
+    """
+    parts = line.split()
+    if not parts:
+        return "RPRT 1"
+    command, args = parts[0], parts[1:]
+    if command in ("q", "c"):
+        return None
+
+    getters: dict[str, Callable[[], Any]] = {
+        "f": rig.get_frequency,
+        "v": rig.get_vfo,
+        "j": rig.get_rit,
+        "z": rig.get_xit,
+        "i": rig.get_split_freq,
+        "x": rig.get_split_mode,
+        "u": rig.get_func,
+        "p": rig.get_parm,
+        "y": rig.get_antenna,
+    }
+    setters: dict[str, Callable[[str], Any]] = {
+        "F": lambda value: rig.set_frequency(int(float(value))),
+        "M": rig.set_mode,
+        "V": rig.set_vfo,
+        "J": lambda value: rig.set_rit(int(value)),
+        "Z": lambda value: rig.set_xit(int(value)),
+        "I": lambda value: rig.set_split_freq(int(value)),
+        "X": rig.set_split_mode,
+        "U": rig.set_func,
+        "P": rig.set_parm,
+        "Y": lambda value: rig.set_antenna(int(value)),
+        "*": lambda value: rig.rig_reset(_RESET_NAMES.get(value, value)),
+    }
+
+    if command == "m":
+        return f"{rig.get_mode()}\n{_PASSBAND_HZ}"
+    if command == "l":
+        return f"{rig.sample_level():.1f}"
+    if command == "AOS":
+        rig.start_recording()
+        return "RPRT 0"
+    if command == "LOS":
+        rig.stop_recording()
+        return "RPRT 0"
+    if command in getters and not args:
+        return str(getters[command]())
+    if command in setters and args:
+        try:
+            setters[command](args[0])
+        except ValueError:
+            return "RPRT 1"
+        return "RPRT 0"
+    logger.info("Unsupported command %r", line)
+    return "RPRT 1"
+
+
+class _GQRXRequestHandler(socketserver.StreamRequestHandler):
+    server: "_GQRXServer"
+
+    def handle(self) -> None:
+        for raw_line in self.rfile:
+            line = raw_line.decode(errors="replace").strip()
+            try:
+                answer = _answer(self.server.rig, line)
+            except OSError:
+                logger.info("Dropping connection after simulated failure on %r", line)
+                return
+            if answer is None:
+                return
+            self.wfile.write(f"{answer}\n".encode())
+
+
+class _GQRXServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], rig: SimulatedRigCtl) -> None:
+        self.rig = rig
+        super().__init__(address, _GQRXRequestHandler)
+
+
+class GQRXSimulator:
+    """Background TCP server speaking the gqrx remote control protocol."""
+
+    def __init__(self, rig: SimulatedRigCtl | None = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Initialise the simulator, nothing is bound until start().
+
+        :param rig: simulated rig answering the commands, a default
+            SimulatedRigCtl when not provided
+        :param host: address to bind
+        :param port: port to bind, 0 picks a free one
+        """
+        self.rig = rig or SimulatedRigCtl()
+        self._host = host
+        self._port = port
+        self._server: _GQRXServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Host and port the simulator listens on.
+
+        :raises RuntimeError: if the simulator is not running
+        """
+        if self._server is None:
+            raise RuntimeError("GQRXSimulator is not running")
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    def start(self) -> None:
+        """Bind the port and serve in a daemon thread.
+
+        :raises OSError: if the port can't be bound
+        """
+        if self._server is not None:
+            return
+        self._server = _GQRXServer((self._host, self._port), self.rig)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="gqrx-simulator", daemon=True)
+        self._thread.start()
+        logger.info("gqrx simulator listening on %s:%i", *self.address)
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
+        logger.info("gqrx simulator stopped")
+
+    def __enter__(self) -> "GQRXSimulator":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
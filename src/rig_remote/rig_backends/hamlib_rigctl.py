@@ -11,9 +11,19 @@ Connection lifecycle:
     opens a new socket per command).
 
 Thread safety:
-  - Hamlib.Rig is a stateful serial object.  Every call is wrapped in a
-    threading.RLock so concurrent access from the main thread and the
-    scan thread cannot corrupt the rig state.
+  - Hamlib.Rig is a stateful serial object.  Only the SerialWorker thread
+    of the backend touches it: every command, connect() and disconnect()
+    included, is queued to the worker, which runs them one at a time.
+    Commands of the scan and sync loops, issued inside
+    serial_worker.background_priority(), queue behind those of the UI, and
+    concurrent identical reads share a single transaction.
+
+Hamlib constants:
+  - The Hamlib module and the constants the commands pass are resolved
+    once, at connect(), into a _HamlibConstants table; VFO and function
+    names are looked up on first use and memoised.  Commands then pay no
+    import or module attribute lookup, and the worker only runs the rig
+    call itself.
 
 Level contract:
   - get_level() multiplies Hamlib.RIG_LEVEL_STRENGTH by 10 to match
@@ -21,15 +31,20 @@ Level contract:
 """
 
 import logging
-import threading
 import types
-from typing import Any
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
 
 from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.models.rig_status import RigStatus
 from rig_remote.rig_backends.mode_translator import ModeTranslator
+from rig_remote.rig_backends.serial_worker import SerialWorker
 
 logger = logging.getLogger(__name__)
 
+_N = TypeVar("_N", int, float)
+
 
 # Lazy Hamlib import: allows sys.modules mocking in tests without Hamlib installed.
 def _hamlib() -> types.ModuleType:
@@ -44,14 +59,81 @@ def _hamlib() -> types.ModuleType:
         ) from exc
 
 
+_RESET_CONSTANTS = {
+    "NONE": "RIG_RESET_NONE",
+    "SOFTWARE_RESET": "RIG_RESET_SOFT",
+    "VFO_RESET": "RIG_RESET_VFO",
+    "MEMORY_CLEAR_RESET": "RIG_RESET_MCALL",
+    "MASTER_RESET": "RIG_RESET_MASTER",
+}
+
+
+@dataclass(frozen=True)
+class _HamlibConstants:
+    """Hamlib module handle and the constants used by HamlibRigCtl."""
+
+    module: types.ModuleType
+    vfo_curr: Any
+    level_strength: Any
+    passband_nochange: Any
+    # optional levels of get_status(), None when Hamlib does not define them
+    level_rawstr: Any
+    level_sqlstat: Any
+    level_rfpower: Any
+    # error codes, as positive numbers, of a rig without the requested feature
+    unavailable_errors: frozenset[int]
+    resets: dict[str, Any]
+    _vfos: dict[str, Any] = field(default_factory=dict)
+    _funcs: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, hl: types.ModuleType) -> "_HamlibConstants":
+        return cls(
+            module=hl,
+            vfo_curr=hl.RIG_VFO_CURR,
+            level_strength=hl.RIG_LEVEL_STRENGTH,
+            passband_nochange=hl.RIG_PASSBAND_NOCHANGE,
+            level_rawstr=getattr(hl, "RIG_LEVEL_RAWSTR", None),
+            level_sqlstat=getattr(hl, "RIG_LEVEL_SQLSTAT", None),
+            level_rfpower=getattr(hl, "RIG_LEVEL_RFPOWER", None),
+            unavailable_errors=frozenset(
+                code
+                for code in (getattr(hl, "RIG_ENIMPL", None), getattr(hl, "RIG_ENAVAIL", None))
+                if isinstance(code, int)
+            ),
+            resets={name: getattr(hl, constant) for name, constant in _RESET_CONSTANTS.items()},
+        )
+
+    def vfo(self, vfo: str) -> Any:
+        """Return the RIG_VFO_* constant of *vfo*, None if Hamlib has none."""
+        try:
+            return self._vfos[vfo]
+        except KeyError:
+            constant = self._vfos[vfo] = getattr(self.module, f"RIG_VFO_{vfo}", None)
+            return constant
+
+    def func(self, func: str) -> Any:
+        """Return the RIG_FUNC_* constant of *func*, 0 if Hamlib has none."""
+        try:
+            return self._funcs[func]
+        except KeyError:
+            constant = self._funcs[func] = getattr(self.module, f"RIG_FUNC_{func}", 0)
+            return constant
+
+
 class HamlibRigCtl:
     """Hamlib-based rig backend.  One instance per configured Hamlib endpoint."""
 
     def __init__(self, endpoint: RigEndpoint, mode_translator: ModeTranslator) -> None:
         self._endpoint = endpoint
         self._translator = mode_translator
-        self._lock = threading.RLock()
+        self._worker = SerialWorker(f"hamlib-{endpoint.rig_model}")
         self._rig: Any = None
+        self._hl: _HamlibConstants | None = None
+        # Optional levels the connected rig failed to read, skipped from then on.
+        self._unsupported_levels: set[Any] = set()
+        # Successful connect() calls; reconnects show up as increases > 1.
+        self.connect_count = 0
 
     @property
     def endpoint(self) -> RigEndpoint:
@@ -67,44 +149,57 @@ class HamlibRigCtl:
 
     def connect(self) -> None:
         """Close any existing connection then open the configured endpoint."""
-        hl = _hamlib()
-        with self._lock:
-            if self._rig is not None:
-                try:
-                    self._rig.close()
-                except Exception:
-                    logger.warning("Error closing previous Hamlib connection — ignored")
-                self._rig = None
+        self._worker.run(self._open, _HamlibConstants.load(_hamlib()))
 
-            rig = hl.Rig(self._endpoint.rig_model)
-            rig.set_conf("rig_pathname", self._endpoint.serial_port)
-            rig.set_conf("serial_speed", str(self._endpoint.baud_rate))
-            rig.set_conf("data_bits", str(self._endpoint.data_bits))
-            rig.set_conf("stop_bits", str(self._endpoint.stop_bits))
-            rig.set_conf("serial_parity", self._endpoint.parity)
+    def _open(self, hl: _HamlibConstants) -> None:
+        self._hl = hl
+        self._unsupported_levels.clear()
+        if self._rig is not None:
             try:
-                rig.open()
-            except Exception as exc:
-                logger.error("Failed to open Hamlib connection: %s", exc)
-                raise OSError(str(exc)) from exc
-            self._rig = rig
-            logger.info(
-                "Hamlib connected: model=%d port=%s baud=%d",
-                self._endpoint.rig_model,
-                self._endpoint.serial_port,
-                self._endpoint.baud_rate,
-            )
+                self._rig.close()
+            except Exception:
+                logger.warning("Error closing previous Hamlib connection — ignored")
+            self._rig = None
+
+        rig = hl.module.Rig(self._endpoint.rig_model)
+        rig.set_conf("rig_pathname", self._endpoint.serial_port)
+        rig.set_conf("serial_speed", str(self._endpoint.baud_rate))
+        rig.set_conf("data_bits", str(self._endpoint.data_bits))
+        rig.set_conf("stop_bits", str(self._endpoint.stop_bits))
+        rig.set_conf("serial_parity", self._endpoint.parity)
+        try:
+            rig.open()
+        except Exception as exc:
+            logger.error("Failed to open Hamlib connection: %s", exc)
+            raise OSError(str(exc)) from exc
+        self._rig = rig
+        self.connect_count += 1
+        logger.info(
+            "Hamlib connected: model=%d port=%s baud=%d",
+            self._endpoint.rig_model,
+            self._endpoint.serial_port,
+            self._endpoint.baud_rate,
+        )
 
     def disconnect(self) -> None:
         """Close the current Hamlib connection."""
-        with self._lock:
-            if self._rig is not None:
-                try:
-                    self._rig.close()
-                except Exception:
-                    logger.error("Error closing Hamlib connection")
-                finally:
-                    self._rig = None
+        self._worker.run(self._close)
+
+    def _close(self) -> None:
+        if self._rig is not None:
+            try:
+                self._rig.close()
+            except Exception:
+                logger.error("Error closing Hamlib connection")
+            finally:
+                self._rig = None
+
+    def _constants(self) -> _HamlibConstants:
+        """Return the constants resolved at connect(), resolving them if needed."""
+        hl = self._hl
+        if hl is None:
+            hl = self._hl = _HamlibConstants.load(_hamlib())
+        return hl
 
     def _require_rig(self) -> Any:
         """Return the connected Rig object or raise OSError if not connected."""
@@ -112,50 +207,53 @@ class HamlibRigCtl:
             raise OSError("Hamlib rig is not connected — press Connect first")
         return self._rig
 
+    def _transaction(self, name: str, *args: Any) -> Any:
+        """Call the Rig method *name*; runs on the worker thread."""
+        return getattr(self._require_rig(), name)(*args)
+
+    def _write(self, name: str, *args: Any) -> Any:
+        return self._worker.run(self._transaction, name, *args)
+
+    def _read(self, name: str, *args: Any) -> Any:
+        """Like _write, but merged with an identical read already queued."""
+        return self._worker.run(self._transaction, name, *args, key=(name, *args))
+
     # ------------------------------------------------------------------
     # RigBackend protocol implementation
     # ------------------------------------------------------------------
 
     def set_frequency(self, frequency: int) -> None:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                rig.set_freq(hl.RIG_VFO_CURR, frequency)
-            except Exception as exc:
-                logger.error("Hamlib error setting frequency to %d: %s", frequency, exc)
-                raise
+        hl = self._constants()
+        try:
+            self._write("set_freq", hl.vfo_curr, frequency)
+        except Exception as exc:
+            logger.error("Hamlib error setting frequency to %d: %s", frequency, exc)
+            raise
 
     def get_frequency(self) -> int:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                return int(rig.get_freq(hl.RIG_VFO_CURR))
-            except Exception as exc:
-                logger.error("Hamlib error getting frequency: %s", exc)
-                raise
+        hl = self._constants()
+        try:
+            return int(self._read("get_freq", hl.vfo_curr))
+        except Exception as exc:
+            logger.error("Hamlib error getting frequency: %s", exc)
+            raise
 
     def set_mode(self, mode: str) -> None:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            hamlib_mode = self._translator.to_backend(mode)  # raises ValueError if unmapped
-            try:
-                rig.set_mode(hl.RIG_VFO_CURR, hamlib_mode, hl.RIG_PASSBAND_NOCHANGE)
-            except Exception as exc:
-                logger.error("Hamlib error setting mode %r: %s", mode, exc)
-                raise
+        hl = self._constants()
+        hamlib_mode = self._translator.to_backend(mode)  # raises ValueError if unmapped
+        try:
+            self._write("set_mode", hl.vfo_curr, hamlib_mode, hl.passband_nochange)
+        except Exception as exc:
+            logger.error("Hamlib error setting mode %r: %s", mode, exc)
+            raise
 
     def get_mode(self) -> str:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                mode_const, _width = rig.get_mode(hl.RIG_VFO_CURR)
-            except Exception as exc:
-                logger.error("Hamlib error getting mode: %s", exc)
-                raise
+        hl = self._constants()
+        try:
+            mode_const, _width = self._read("get_mode", hl.vfo_curr)
+        except Exception as exc:
+            logger.error("Hamlib error getting mode: %s", exc)
+            raise
         # from_backend raises ValueError for unmapped constants → retriable in scan loop
         return self._translator.from_backend(mode_const)
 
@@ -166,14 +264,84 @@ class HamlibRigCtl:
         shared with GQRXRigCtl.  Absolute reference levels differ between
         backends; users switching must re-calibrate sgn_level.
         """
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                return int(rig.get_level_i(hl.RIG_LEVEL_STRENGTH)) * 10
-            except Exception as exc:
-                logger.error("Hamlib error getting signal level: %s", exc)
-                raise
+        hl = self._constants()
+        try:
+            return int(self._read("get_level_i", hl.level_strength)) * 10
+        except Exception as exc:
+            logger.error("Hamlib error getting signal level: %s", exc)
+            raise
+
+    def get_status(self) -> RigStatus:
+        """Return frequency, mode and levels read in one serial burst.
+
+        The worker runs all the reads as a single transaction, so no other
+        command is interleaved and concurrent calls share it.  RAWSTR,
+        SQLSTAT and RFPOWER are optional: a rig failing to read one reports
+        None for it until the next connect().
+        """
+        hl = self._constants()
+        try:
+            frequency, mode_const, strength, raw_strength, squelch, rf_power = self._worker.run(
+                self._read_status, hl, key="status"
+            )
+        except Exception as exc:
+            logger.error("Hamlib error getting status: %s", exc)
+            raise
+        return RigStatus(
+            frequency=frequency,
+            mode=self._translator.from_backend(mode_const),
+            strength=strength,
+            raw_strength=raw_strength,
+            squelch_open=None if squelch is None else bool(squelch),
+            rf_power=rf_power,
+        )
+
+    def _read_status(self, hl: _HamlibConstants) -> tuple[Any, ...]:
+        """Read the values of get_status(); runs on the worker thread."""
+        rig = self._require_rig()
+        mode_const, _width = rig.get_mode(hl.vfo_curr)
+        return (
+            int(rig.get_freq(hl.vfo_curr)),
+            mode_const,
+            int(rig.get_level_i(hl.level_strength)) * 10,
+            self._optional_level(rig.get_level_i, hl.level_rawstr, int),
+            self._optional_level(rig.get_level_i, hl.level_sqlstat, int),
+            self._optional_level(rig.get_level_f, hl.level_rfpower, float),
+        )
+
+    def _optional_level(self, read: Callable[[Any], Any], level: Any, convert: Callable[[Any], _N]) -> _N | None:
+        if level is None or level in self._unsupported_levels:
+            return None
+        try:
+            return convert(read(level))
+        except Exception as exc:
+            logger.info("Hamlib level %s not readable, skipped from now on: %s", level, exc)
+            self._unsupported_levels.add(level)
+            return None
+
+    def get_dcd(self) -> bool:
+        """Return True while the squelch of the rig is open.
+
+        :raises NotImplementedError: when the rig does not report it
+        """
+        hl = self._constants()
+        try:
+            return bool(self._worker.run(self._read_dcd, hl, key="dcd"))
+        except NotImplementedError:
+            raise
+        except Exception as exc:
+            logger.error("Hamlib error getting squelch state: %s", exc)
+            raise
+
+    def _read_dcd(self, hl: _HamlibConstants) -> Any:
+        """Read the squelch state; runs on the worker thread."""
+        rig = self._require_rig()
+        dcd = rig.get_dcd(hl.vfo_curr)
+        # the bindings report errors in error_status rather than raising
+        status = getattr(rig, "error_status", 0)
+        if isinstance(status, int) and -status in hl.unavailable_errors:
+            raise NotImplementedError("The rig does not report its squelch state")
+        return dcd
 
     def start_recording(self) -> str:
         raise NotImplementedError("Recording is not supported by the Hamlib backend")
@@ -182,100 +350,82 @@ class HamlibRigCtl:
         raise NotImplementedError("Recording is not supported by the Hamlib backend")
 
     def set_rit(self, rit: int) -> str:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                rig.set_rit(hl.RIG_VFO_CURR, rit)
-            except Exception as exc:
-                logger.error("Hamlib error setting RIT: %s", exc)
-                raise
+        hl = self._constants()
+        try:
+            self._write("set_rit", hl.vfo_curr, rit)
+        except Exception as exc:
+            logger.error("Hamlib error setting RIT: %s", exc)
+            raise
         return ""
 
     def get_rit(self) -> str:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                return str(rig.get_rit(hl.RIG_VFO_CURR))
-            except Exception as exc:
-                logger.error("Hamlib error getting RIT: %s", exc)
-                raise
+        hl = self._constants()
+        try:
+            return str(self._read("get_rit", hl.vfo_curr))
+        except Exception as exc:
+            logger.error("Hamlib error getting RIT: %s", exc)
+            raise
 
     def set_xit(self, xit: int) -> str:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                rig.set_xit(hl.RIG_VFO_CURR, xit)
-            except Exception as exc:
-                logger.error("Hamlib error setting XIT: %s", exc)
-                raise
+        hl = self._constants()
+        try:
+            self._write("set_xit", hl.vfo_curr, xit)
+        except Exception as exc:
+            logger.error("Hamlib error setting XIT: %s", exc)
+            raise
         return ""
 
     def get_xit(self) -> str:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                return str(rig.get_xit(hl.RIG_VFO_CURR))
-            except Exception as exc:
-                logger.error("Hamlib error getting XIT: %s", exc)
-                raise
+        hl = self._constants()
+        try:
+            return str(self._read("get_xit", hl.vfo_curr))
+        except Exception as exc:
+            logger.error("Hamlib error getting XIT: %s", exc)
+            raise
 
     def set_split_freq(self, split_freq: int) -> str:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                rig.set_split_freq(hl.RIG_VFO_CURR, split_freq)
-            except Exception as exc:
-                logger.error("Hamlib error setting split freq: %s", exc)
-                raise
+        hl = self._constants()
+        try:
+            self._write("set_split_freq", hl.vfo_curr, split_freq)
+        except Exception as exc:
+            logger.error("Hamlib error setting split freq: %s", exc)
+            raise
         return ""
 
     def get_split_freq(self) -> int:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                return int(rig.get_split_freq(hl.RIG_VFO_CURR))
-            except Exception as exc:
-                logger.error("Hamlib error getting split freq: %s", exc)
-                raise
+        hl = self._constants()
+        try:
+            return int(self._read("get_split_freq", hl.vfo_curr))
+        except Exception as exc:
+            logger.error("Hamlib error getting split freq: %s", exc)
+            raise
 
     def set_split_mode(self, split_mode: str) -> str:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            hamlib_mode = self._translator.to_backend(split_mode)
-            try:
-                rig.set_split_mode(hl.RIG_VFO_CURR, hamlib_mode, hl.RIG_PASSBAND_NOCHANGE)
-            except Exception as exc:
-                logger.error("Hamlib error setting split mode: %s", exc)
-                raise
+        hl = self._constants()
+        hamlib_mode = self._translator.to_backend(split_mode)
+        try:
+            self._write("set_split_mode", hl.vfo_curr, hamlib_mode, hl.passband_nochange)
+        except Exception as exc:
+            logger.error("Hamlib error setting split mode: %s", exc)
+            raise
         return ""
 
     def get_split_mode(self) -> str:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                mode_const, _width = rig.get_split_mode(hl.RIG_VFO_CURR)
-            except Exception as exc:
-                logger.error("Hamlib error getting split mode: %s", exc)
-                raise
+        hl = self._constants()
+        try:
+            mode_const, _width = self._read("get_split_mode", hl.vfo_curr)
+        except Exception as exc:
+            logger.error("Hamlib error getting split mode: %s", exc)
+            raise
         return self._translator.from_backend(mode_const)
 
     def set_func(self, func: str) -> str:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                rig.set_func(hl.RIG_VFO_CURR, getattr(hl, f"RIG_FUNC_{func}", 0), 1)
-            except Exception as exc:
-                logger.error("Hamlib error setting func %r: %s", func, exc)
-                raise
+        hl = self._constants()
+        try:
+            self._write("set_func", hl.vfo_curr, hl.func(func), 1)
+        except Exception as exc:
+            logger.error("Hamlib error setting func %r: %s", func, exc)
+            raise
         return ""
 
     def get_func(self) -> str:
@@ -288,66 +438,49 @@ class HamlibRigCtl:
         return ""
 
     def set_vfo(self, vfo: str) -> str:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            vfo_const = getattr(hl, f"RIG_VFO_{vfo.upper()}", None)
-            if vfo_const is None:
-                raise ValueError(f"Unknown VFO: {vfo!r}")
-            try:
-                rig.set_vfo(vfo_const)
-            except Exception as exc:
-                logger.error("Hamlib error setting VFO %r: %s", vfo, exc)
-                raise
+        hl = self._constants()
+        vfo_const = hl.vfo(vfo.upper())
+        if vfo_const is None:
+            raise ValueError(f"Unknown VFO: {vfo!r}")
+        try:
+            self._write("set_vfo", vfo_const)
+        except Exception as exc:
+            logger.error("Hamlib error setting VFO %r: %s", vfo, exc)
+            raise
         return ""
 
     def get_vfo(self) -> str:
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                return str(rig.get_vfo())
-            except Exception as exc:
-                logger.error("Hamlib error getting VFO: %s", exc)
-                raise
+        try:
+            return str(self._read("get_vfo"))
+        except Exception as exc:
+            logger.error("Hamlib error getting VFO: %s", exc)
+            raise
 
     def set_antenna(self, antenna: int) -> str:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                rig.set_ant(hl.RIG_VFO_CURR, antenna)
-            except Exception as exc:
-                logger.error("Hamlib error setting antenna: %s", exc)
-                raise
+        hl = self._constants()
+        try:
+            self._write("set_ant", hl.vfo_curr, antenna)
+        except Exception as exc:
+            logger.error("Hamlib error setting antenna: %s", exc)
+            raise
         return ""
 
     def get_antenna(self) -> int:
-        hl = _hamlib()
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                return int(rig.get_ant(hl.RIG_VFO_CURR))
-            except Exception as exc:
-                logger.error("Hamlib error getting antenna: %s", exc)
-                raise
+        hl = self._constants()
+        try:
+            return int(self._read("get_ant", hl.vfo_curr))
+        except Exception as exc:
+            logger.error("Hamlib error getting antenna: %s", exc)
+            raise
 
     def rig_reset(self, reset_signal: str) -> str:
-        hl = _hamlib()
-        _reset_map = {
-            "NONE": hl.RIG_RESET_NONE,
-            "SOFTWARE_RESET": hl.RIG_RESET_SOFT,
-            "VFO_RESET": hl.RIG_RESET_VFO,
-            "MEMORY_CLEAR_RESET": hl.RIG_RESET_MCALL,
-            "MASTER_RESET": hl.RIG_RESET_MASTER,
-        }
-        if reset_signal not in _reset_map:
-            logger.error("reset_signal must be one of %s", list(_reset_map))
+        resets = self._constants().resets
+        if reset_signal not in resets:
+            logger.error("reset_signal must be one of %s", list(resets))
             raise ValueError(f"Unknown reset signal: {reset_signal!r}")
-        with self._lock:
-            rig = self._require_rig()
-            try:
-                rig.reset(_reset_map[reset_signal])
-            except Exception as exc:
-                logger.error("Hamlib error resetting rig: %s", exc)
-                raise
+        try:
+            self._write("reset", resets[reset_signal])
+        except Exception as exc:
+            logger.error("Hamlib error resetting rig: %s", exc)
+            raise
         return ""
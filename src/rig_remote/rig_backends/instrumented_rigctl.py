@@ -0,0 +1,305 @@
+"""
+InstrumentedRigCtl: RigBackend wrapper recording per-command latency.
+
+Every call through the wrapper is timed and added to a LatencyHistogram of
+its command; calls raising an exception are also counted as errors.  The
+wrapped backend is otherwise untouched and its exceptions propagate.
+
+For backends exposing a ``phase_observer`` hook (GQRXRigCtl) the time spent
+in connect, send and recv is recorded as well, in the "phases" section of
+the snapshot.
+
+Collection can be switched off at any time with ``enabled = False``: each
+call then costs a single attribute check on top of the wrapped one.
+
+snapshot() returns the statistics as plain dicts; start_dump() writes them
+periodically to a json file from a background thread.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.models.rig_status import RigStatus
+from rig_remote.rig_backends.protocol import RigBackend
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Bucket upper bounds in seconds: 10 µs doubling up to ~10.5 s, plus an
+# overflow bucket for anything slower.
+BUCKET_BOUNDS = tuple(10e-6 * 2**i for i in range(21))
+_PERCENTILES = (50, 90, 99)
+
+
+class LatencyHistogram:
+    """Log-scale histogram of durations, in seconds.
+
+    Percentiles are estimated from the bucket bounds, so they are accurate
+    within a factor of two; min, max and mean are exact.
+    """
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.buckets[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, pct: float) -> float:
+        """Return the estimated *pct* percentile, 0.0 when empty."""
+        if not self.count:
+            return 0.0
+        rank = pct / 100 * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.buckets):
+            cumulative += bucket_count
+            if bucket_count and cumulative >= rank:
+                bound = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max
+                return min(max(bound, self.min), self.max)
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the histogram as a json-compatible dict."""
+        summary: dict[str, Any] = {
+            "count": self.count,
+            "errors": self.errors,
+            "total_s": self.total,
+            "min_s": self.min if self.count else 0.0,
+            "max_s": self.max,
+            "mean_s": self.total / self.count if self.count else 0.0,
+        }
+        for pct in _PERCENTILES:
+            summary[f"p{pct}_s"] = self.percentile(pct)
+        summary["buckets"] = {
+            f"{bound:g}": bucket_count
+            for bound, bucket_count in zip((*BUCKET_BOUNDS, float("inf")), self.buckets, strict=True)
+            if bucket_count
+        }
+        return summary
+
+
+class InstrumentedRigCtl:
+    """RigBackend recording latency and errors of a wrapped backend."""
+
+    def __init__(
+        self,
+        backend: RigBackend,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Wrap *backend*.
+
+        :param backend: the backend every call is forwarded to
+        :param enabled: whether collection starts enabled
+        :param clock: monotonic clock in seconds, time.perf_counter by default
+        """
+        self._backend = backend
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._commands: dict[str, LatencyHistogram] = {}
+        self._phases: dict[str, LatencyHistogram] = {}
+        self._dump_stop: threading.Event | None = None
+        self._dump_thread: threading.Thread | None = None
+        self._enabled = False
+        self.enabled = enabled
+
+    @property
+    def backend(self) -> RigBackend:
+        return self._backend
+
+    @property
+    def endpoint(self) -> RigEndpoint:
+        return self._backend.endpoint
+
+    @endpoint.setter
+    def endpoint(self, value: RigEndpoint) -> None:
+        self._backend.endpoint = value
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        if hasattr(self._backend, "phase_observer"):
+            self._backend.phase_observer = self._record_phase if value else None
+
+    def _record(self, table: dict[str, LatencyHistogram], name: str, seconds: float, failed: bool) -> None:
+        with self._lock:
+            histogram = table.get(name)
+            if histogram is None:
+                histogram = table[name] = LatencyHistogram()
+            histogram.record(seconds)
+            if failed:
+                histogram.errors += 1
+
+    def _record_phase(self, phase: str, seconds: float) -> None:
+        self._record(self._phases, phase, seconds, False)
+
+    def _call(self, name: str, command: Callable[..., _T], *args: Any) -> _T:
+        if not self._enabled:
+            return command(*args)
+        started = self._clock()
+        try:
+            result = command(*args)
+        except Exception:
+            self._record(self._commands, name, self._clock() - started, True)
+            raise
+        self._record(self._commands, name, self._clock() - started, False)
+        return result
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the statistics collected so far.
+
+        :returns: {"commands": {name: histogram}, "phases": {phase: histogram}}
+            with each histogram as returned by LatencyHistogram.snapshot()
+        """
+        with self._lock:
+            return {
+                "commands": {name: histogram.snapshot() for name, histogram in self._commands.items()},
+                "phases": {name: histogram.snapshot() for name, histogram in self._phases.items()},
+            }
+
+    def reset(self) -> None:
+        """Discard the statistics collected so far."""
+        with self._lock:
+            self._commands.clear()
+            self._phases.clear()
+
+    def dump(self, path: str) -> None:
+        """Write snapshot() to *path* as json, atomically.
+
+        Write errors are logged and otherwise ignored.
+        """
+        data = {"timestamp": time.time(), **self.snapshot()}
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as dump_file:
+                json.dump(data, dump_file, indent=2)
+            os.replace(temp_path, path)
+        except OSError:
+            logger.exception("Could not write rig statistics to %s", path)
+
+    def start_dump(self, path: str, interval: float = 60.0) -> None:
+        """Dump the statistics to *path* every *interval* seconds.
+
+        :raises ValueError: if interval isn't positive
+        """
+        if interval <= 0:
+            raise ValueError(f"interval must be > 0, got {interval}")
+        self.stop_dump()
+        stop = threading.Event()
+
+        def _run() -> None:
+            while not stop.wait(interval):
+                self.dump(path)
+            self.dump(path)
+
+        self._dump_stop = stop
+        self._dump_thread = threading.Thread(target=_run, name="rig-stats-dump", daemon=True)
+        self._dump_thread.start()
+        logger.info("Dumping rig statistics to %s every %.1f s", path, interval)
+
+    def stop_dump(self) -> None:
+        """Stop the periodic dump, writing the statistics one last time."""
+        if self._dump_stop is None or self._dump_thread is None:
+            return
+        self._dump_stop.set()
+        self._dump_thread.join()
+        self._dump_stop = None
+        self._dump_thread = None
+
+    def set_frequency(self, frequency: int) -> None:
+        self._call("set_frequency", self._backend.set_frequency, frequency)
+
+    def get_frequency(self) -> int:
+        return self._call("get_frequency", self._backend.get_frequency)
+
+    def set_mode(self, mode: str) -> None:
+        self._call("set_mode", self._backend.set_mode, mode)
+
+    def get_mode(self) -> str:
+        return self._call("get_mode", self._backend.get_mode)
+
+    def get_level(self) -> int:
+        return self._call("get_level", self._backend.get_level)
+
+    def get_status(self) -> RigStatus:
+        return self._call("get_status", self._backend.get_status)
+
+    def get_dcd(self) -> bool:
+        return self._call("get_dcd", self._backend.get_dcd)
+
+    def set_vfo(self, vfo: str) -> str:
+        return self._call("set_vfo", self._backend.set_vfo, vfo)
+
+    def get_vfo(self) -> str:
+        return self._call("get_vfo", self._backend.get_vfo)
+
+    def start_recording(self) -> str:
+        return self._call("start_recording", self._backend.start_recording)
+
+    def stop_recording(self) -> str:
+        return self._call("stop_recording", self._backend.stop_recording)
+
+    def set_rit(self, rit: int) -> str:
+        return self._call("set_rit", self._backend.set_rit, rit)
+
+    def get_rit(self) -> str:
+        return self._call("get_rit", self._backend.get_rit)
+
+    def set_xit(self, xit: int) -> str:
+        return self._call("set_xit", self._backend.set_xit, xit)
+
+    def get_xit(self) -> str:
+        return self._call("get_xit", self._backend.get_xit)
+
+    def set_split_freq(self, split_freq: int) -> str:
+        return self._call("set_split_freq", self._backend.set_split_freq, split_freq)
+
+    def get_split_freq(self) -> int:
+        return self._call("get_split_freq", self._backend.get_split_freq)
+
+    def set_split_mode(self, split_mode: str) -> str:
+        return self._call("set_split_mode", self._backend.set_split_mode, split_mode)
+
+    def get_split_mode(self) -> str:
+        return self._call("get_split_mode", self._backend.get_split_mode)
+
+    def set_func(self, func: str) -> str:
+        return self._call("set_func", self._backend.set_func, func)
+
+    def get_func(self) -> str:
+        return self._call("get_func", self._backend.get_func)
+
+    def set_parm(self, parm: str) -> str:
+        return self._call("set_parm", self._backend.set_parm, parm)
+
+    def get_parm(self) -> str:
+        return self._call("get_parm", self._backend.get_parm)
+
+    def set_antenna(self, antenna: int) -> str:
+        return self._call("set_antenna", self._backend.set_antenna, antenna)
+
+    def get_antenna(self) -> int:
+        return self._call("get_antenna", self._backend.get_antenna)
+
+    def rig_reset(self, reset_signal: str) -> str:
+        return self._call("rig_reset", self._backend.rig_reset, reset_signal)
@@ -7,6 +7,10 @@ by both RigEndpoint and ModeTranslator.
 
 Frequency contract: all get_frequency / set_frequency values are int Hz.
 Level contract:     get_level() returns int in units of dB × 10.
+Status contract:    get_status() returns frequency, mode and levels together,
+                    read in as few rig transactions as the backend allows.
+Squelch contract:   get_dcd() returns True while the squelch is open and
+                    raises NotImplementedError if the rig cannot tell.
 """
 
 from enum import Enum
@@ -14,6 +18,7 @@ from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from rig_remote.models.rig_endpoint import RigEndpoint
+    from rig_remote.models.rig_status import RigStatus
 
 
 class BackendType(str, Enum):
@@ -36,6 +41,8 @@ class RigBackend(Protocol):
     def set_mode(self, mode: str) -> None: ...
     def get_mode(self) -> str: ...
     def get_level(self) -> int: ...
+    def get_status(self) -> "RigStatus": ...
+    def get_dcd(self) -> bool: ...
     def set_vfo(self, vfo: str) -> str: ...
     def get_vfo(self) -> str: ...
     def start_recording(self) -> str: ...
@@ -0,0 +1,295 @@
+"""
+ResilientRigCtl: RigBackend wrapper failing fast while a rig is unreachable.
+
+Every call goes through the CircuitBreaker of the rig endpoint.  After
+``failure_threshold`` consecutive communication errors (OSError, which
+includes timeouts, or Hamlib.error) the circuit opens: calls raise
+RigUnavailableError at once instead of waiting for the socket timeouts of a
+rig that is gone.  Once the backoff delay has elapsed a single trial call is
+let through (half-open); it closes the circuit if it succeeds and reopens it
+for a longer delay if it fails.  The delay doubles with each failed trial, up
+to ``max_delay``, and is shortened by a random jitter so that several
+clients of the same rig do not retry in step.
+
+Breakers are shared per endpoint (breaker_for()), so the scan, the sync and
+the UI commands sent to a rig all see the same state.  Callers use
+``retry_in()`` to pause until the next trial instead of hammering the rig:
+ScannerCore and Syncing do so when they are given a ResilientRigCtl.
+
+Other exceptions, ValueError in particular, are not communication errors:
+they propagate without affecting the circuit.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable
+from enum import StrEnum
+from typing import Any, TypeVar
+
+from rig_remote.exceptions import RigUnavailableError
+from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.models.rig_status import RigStatus
+from rig_remote.rig_backends.protocol import RigBackend
+
+logger = logging.getLogger(__name__)
+
+# Hamlib.error is an optional runtime dependency, see scanner_core.
+try:
+    from Hamlib import error as _HAMLIB_ERROR
+except ImportError:
+    _HAMLIB_ERROR = type("_NoHamlibError", (Exception,), {})
+
+_T = TypeVar("_T")
+
+COMMUNICATION_ERRORS: tuple[type[BaseException], ...] = (OSError, _HAMLIB_ERROR)
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 60.0
+DEFAULT_JITTER = 0.5
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Failure counter and backoff schedule of one rig."""
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        jitter: float = DEFAULT_JITTER,
+        clock: Callable[[], float] = time.monotonic,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        """Initialise a closed circuit.
+
+        :param failure_threshold: consecutive failures opening the circuit
+        :param base_delay: seconds before the first trial call
+        :param max_delay: upper bound of the delay between trial calls
+        :param jitter: fraction of the delay randomly removed, 0 to 1
+        :param clock: monotonic clock in seconds
+        :param rand: random number generator in [0, 1)
+        :raises ValueError: on a threshold below 1 or a negative delay
+        """
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be >= 1, got {failure_threshold}")
+        if base_delay < 0 or max_delay < base_delay:
+            raise ValueError(f"Invalid backoff delays {base_delay}, {max_delay}")
+        if not 0 <= jitter <= 1:
+            raise ValueError(f"jitter must be between 0 and 1, got {jitter}")
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._clock = clock
+        self._rand = rand
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened = 0  # consecutive openings, sets the backoff delay
+        self._retry_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._state
+
+    def retry_in(self) -> float:
+        """Return the seconds left before a call is let through, 0 if now."""
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return 0.0
+            if self._state is CircuitState.HALF_OPEN:
+                # wait for the trial call in progress
+                return self.base_delay
+            return max(0.0, self._retry_at - self._clock())
+
+    def before_call(self) -> None:
+        """Let a call through or refuse it.
+
+        :raises RigUnavailableError: while the circuit is open, or half-open
+            with a trial call in progress
+        """
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return
+            if self._state is CircuitState.OPEN:
+                remaining = self._retry_at - self._clock()
+                if remaining <= 0:
+                    self._state = CircuitState.HALF_OPEN
+                    return
+                raise RigUnavailableError(f"Rig unavailable, next attempt in {remaining:.1f} s")
+            raise RigUnavailableError("Rig unavailable, reconnection attempt in progress")
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state is not CircuitState.CLOSED:
+                logger.info("Rig reachable again, circuit closed")
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._opened = 0
+
+    def end_trial(self) -> None:
+        """Release the trial call of a half-open circuit that failed for a
+        reason other than communication, e.g. an invalid argument: the next
+        call is let through as a new trial.
+        """
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._state = CircuitState.OPEN
+                self._retry_at = self._clock()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state is CircuitState.CLOSED and self._failures < self.failure_threshold:
+                return
+            delay = min(self.max_delay, self.base_delay * 2**self._opened)
+            delay *= 1 - self.jitter * self._rand()
+            self._opened += 1
+            self._state = CircuitState.OPEN
+            self._retry_at = self._clock() + delay
+            logger.warning("Rig unreachable after %d failures, next attempt in %.1f s", self._failures, delay)
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(endpoint: RigEndpoint) -> CircuitBreaker:
+    """Return the CircuitBreaker shared by all the clients of *endpoint*."""
+    with _breakers_lock:
+        breaker = _breakers.get(endpoint.id)
+        if breaker is None:
+            breaker = _breakers[endpoint.id] = CircuitBreaker()
+        return breaker
+
+
+class ResilientRigCtl:
+    """RigBackend guarding a wrapped backend with a CircuitBreaker."""
+
+    def __init__(self, backend: RigBackend, breaker: CircuitBreaker | None = None) -> None:
+        """Wrap *backend*.
+
+        :param backend: the backend every call is forwarded to
+        :param breaker: the breaker to use, by default the one shared by the
+            endpoint of the backend
+        """
+        self._backend = backend
+        self.breaker = breaker or breaker_for(backend.endpoint)
+
+    @property
+    def backend(self) -> RigBackend:
+        return self._backend
+
+    @property
+    def endpoint(self) -> RigEndpoint:
+        return self._backend.endpoint
+
+    @endpoint.setter
+    def endpoint(self, value: RigEndpoint) -> None:
+        self._backend.endpoint = value
+        self.breaker = breaker_for(value)
+
+    def retry_in(self) -> float:
+        """Return the seconds left before the rig is contacted again."""
+        return self.breaker.retry_in()
+
+    def _call(self, command: Callable[..., _T], *args: Any) -> _T:
+        self.breaker.before_call()
+        try:
+            result = command(*args)
+        except COMMUNICATION_ERRORS:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.end_trial()
+            raise
+        self.breaker.record_success()
+        return result
+
+    def set_frequency(self, frequency: int) -> None:
+        self._call(self._backend.set_frequency, frequency)
+
+    def get_frequency(self) -> int:
+        return self._call(self._backend.get_frequency)
+
+    def set_mode(self, mode: str) -> None:
+        self._call(self._backend.set_mode, mode)
+
+    def get_mode(self) -> str:
+        return self._call(self._backend.get_mode)
+
+    def get_level(self) -> int:
+        return self._call(self._backend.get_level)
+
+    def get_status(self) -> RigStatus:
+        return self._call(self._backend.get_status)
+
+    def get_dcd(self) -> bool:
+        return self._call(self._backend.get_dcd)
+
+    def set_vfo(self, vfo: str) -> str:
+        return self._call(self._backend.set_vfo, vfo)
+
+    def get_vfo(self) -> str:
+        return self._call(self._backend.get_vfo)
+
+    def start_recording(self) -> str:
+        return self._call(self._backend.start_recording)
+
+    def stop_recording(self) -> str:
+        return self._call(self._backend.stop_recording)
+
+    def set_rit(self, rit: int) -> str:
+        return self._call(self._backend.set_rit, rit)
+
+    def get_rit(self) -> str:
+        return self._call(self._backend.get_rit)
+
+    def set_xit(self, xit: int) -> str:
+        return self._call(self._backend.set_xit, xit)
+
+    def get_xit(self) -> str:
+        return self._call(self._backend.get_xit)
+
+    def set_split_freq(self, split_freq: int) -> str:
+        return self._call(self._backend.set_split_freq, split_freq)
+
+    def get_split_freq(self) -> int:
+        return self._call(self._backend.get_split_freq)
+
+    def set_split_mode(self, split_mode: str) -> str:
+        return self._call(self._backend.set_split_mode, split_mode)
+
+    def get_split_mode(self) -> str:
+        return self._call(self._backend.get_split_mode)
+
+    def set_func(self, func: str) -> str:
+        return self._call(self._backend.set_func, func)
+
+    def get_func(self) -> str:
+        return self._call(self._backend.get_func)
+
+    def set_parm(self, parm: str) -> str:
+        return self._call(self._backend.set_parm, parm)
+
+    def get_parm(self) -> str:
+        return self._call(self._backend.get_parm)
+
+    def set_antenna(self, antenna: int) -> str:
+        return self._call(self._backend.set_antenna, antenna)
+
+    def get_antenna(self) -> int:
+        return self._call(self._backend.get_antenna)
+
+    def rig_reset(self, reset_signal: str) -> str:
+        return self._call(self._backend.rig_reset, reset_signal)
@@ -0,0 +1,140 @@
+"""
+SerialWorker: single thread owning the I/O of one serial rig.
+
+Callers hand their rig transactions to the worker and wait for the result,
+instead of taking turns on a lock: the worker runs them one at a time from
+a priority queue.  Commands issued inside ``background_priority()`` — the
+scan and sync loops — queue behind the others, so a command from the UI
+waits at most for the transaction in progress, however many samples the
+scan has queued.
+
+Reads can be given a key: a read queued while another one with the same key
+is still waiting is not queued again, both callers get the result of the
+single transaction.  A foreground read joining a background one moves it
+ahead in the queue.
+
+The thread is started by the first command and ends after ``idle_timeout``
+seconds without any, so an idle or disconnected rig costs no thread.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_FOREGROUND = 0
+PRIORITY_BACKGROUND = 1
+
+DEFAULT_IDLE_TIMEOUT = 10.0
+
+_priority: ContextVar[int] = ContextVar("rig_command_priority", default=PRIORITY_FOREGROUND)
+
+
+@contextmanager
+def background_priority() -> Iterator[None]:
+    """Queue the rig commands of the current thread behind the foreground ones."""
+    token = _priority.set(PRIORITY_BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class _Request:
+    __slots__ = ("command", "args", "key", "future", "started")
+
+    def __init__(self, command: Callable[..., Any], args: tuple[Any, ...], key: Hashable | None) -> None:
+        self.command = command
+        self.args = args
+        self.key = key
+        self.future: Future[Any] = Future()
+        self.started = False
+
+
+class SerialWorker:
+    """Priority queue of rig transactions run by a single thread."""
+
+    def __init__(self, name: str, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+        """Initialise a worker, its thread is started by the first command.
+
+        :param name: name of the thread, for the logs
+        :param idle_timeout: seconds without commands before the thread ends
+        """
+        self.name = name
+        self.idle_timeout = idle_timeout
+        self._ready = threading.Condition()
+        # (priority, sequence, request); a merged read may appear twice
+        self._queue: list[tuple[int, int, _Request]] = []
+        self._pending_reads: dict[Hashable, _Request] = {}
+        self._sequence = itertools.count()
+        self._thread: threading.Thread | None = None
+        # Reads served by a transaction already queued.
+        self.merged = 0
+
+    def run(self, command: Callable[..., Any], *args: Any, key: Hashable | None = None) -> Any:
+        """Run *command* on the worker thread and return its result.
+
+        :param key: identifies a read, see the module docstring; None for
+            commands that must run every time
+        :raises: whatever *command* raises
+        """
+        if threading.current_thread() is self._thread:
+            # nested call from a transaction
+            return command(*args)
+        return self.submit(command, *args, key=key).result()
+
+    def submit(self, command: Callable[..., Any], *args: Any, key: Hashable | None = None) -> Future[Any]:
+        """Queue *command* and return the Future of its result."""
+        priority = _priority.get()
+        with self._ready:
+            request = self._pending_reads.get(key) if key is not None else None
+            if request is not None:
+                self.merged += 1
+            else:
+                request = _Request(command, args, key)
+                if key is not None:
+                    self._pending_reads[key] = request
+            heapq.heappush(self._queue, (priority, next(self._sequence), request))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+                self._thread.start()
+            self._ready.notify()
+        return request.future
+
+    def _next_request(self) -> _Request | None:
+        """Pop the next request to run, None once idle for idle_timeout."""
+        with self._ready:
+            while True:
+                if not self._queue and not self._ready.wait(self.idle_timeout) and not self._queue:
+                    self._thread = None
+                    return None
+                if not self._queue:
+                    continue
+                _priority, _sequence, request = heapq.heappop(self._queue)
+                if request.started:
+                    # merged read already run from its other queue entry
+                    continue
+                request.started = True
+                if request.key is not None:
+                    del self._pending_reads[request.key]
+                return request
+
+    def _loop(self) -> None:
+        logger.debug("Serial worker %s started", self.name)
+        while (request := self._next_request()) is not None:
+            if not request.future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = request.command(*request.args)
+            except BaseException as exc:
+                request.future.set_exception(exc)
+            else:
+                request.future.set_result(result)
+        logger.debug("Serial worker %s idle, stopped", self.name)
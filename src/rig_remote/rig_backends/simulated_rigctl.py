@@ -0,0 +1,345 @@
+"""
+SimulatedRigCtl: in-process RigBackend driven by a synthetic spectrum.
+
+No radio or network is involved: the backend keeps the rig state in memory
+and answers get_level() from a SimulatedSpectrum of carriers above a noise
+floor.  A SimulationProfile adds the behaviour of a real rig:
+
+  - per-command latency and random jitter;
+  - settle time: levels read too soon after a tune report the noise floor;
+  - failure injection: commands raise OSError with a given probability,
+    optionally restricted to some commands;
+  - level noise added to every level read.
+
+Levels are expressed in the units get_level() returns, so thresholds behave
+the same as against the backend being modelled.  The default profile and
+spectrum (no carriers, -100 noise floor, no latency or failures) match an
+idle gqrx and are fully deterministic.
+
+The same instance can be served over TCP with the gqrx protocol through
+GQRXSimulator (rig_backends/gqrx_simulator.py).
+"""
+
+import logging
+import random
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from rig_remote.models.modulation_modes import ModulationModes
+from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.models.rig_status import RigStatus
+from rig_remote.rig_backends.gqrx_rigctl import GQRXRigCtl
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Carrier:
+    """A signal of the synthetic spectrum.
+
+    The level decreases linearly from *level* at *frequency* down to the
+    noise floor at ``frequency ± bandwidth / 2``.
+    """
+
+    frequency: int
+    level: float
+    bandwidth: int = 10_000
+
+    def __post_init__(self) -> None:
+        if self.bandwidth < 1:
+            raise ValueError(f"carrier bandwidth must be >= 1, got {self.bandwidth}")
+
+
+@dataclass
+class SimulatedSpectrum:
+    """Carriers over a flat noise floor."""
+
+    carriers: list[Carrier] = field(default_factory=list)
+    noise_floor: float = -100.0
+
+    def __post_init__(self) -> None:
+        self.carriers = sorted(self.carriers, key=lambda c: c.frequency)
+        self._frequencies = [carrier.frequency for carrier in self.carriers]
+        self._max_half_width = max((carrier.bandwidth / 2 for carrier in self.carriers), default=0.0)
+
+    def level_at(self, frequency: int) -> float:
+        """Return the noise-free level at *frequency*."""
+        level = self.noise_floor
+        first = bisect_left(self._frequencies, frequency - self._max_half_width)
+        for carrier in self.carriers[first:]:
+            if carrier.frequency > frequency + self._max_half_width:
+                break
+            half_width = carrier.bandwidth / 2
+            offset = abs(frequency - carrier.frequency)
+            if offset <= half_width:
+                level = max(level, carrier.level - (carrier.level - self.noise_floor) * offset / half_width)
+        return level
+
+
+@dataclass
+class SimulationProfile:
+    """Timing and failure behaviour of a simulated rig.
+
+    :param latency: seconds spent on every command
+    :param jitter: upper bound of a uniform random delay added to latency
+    :param settle_time: seconds after set_frequency during which get_level
+        reports the noise floor
+    :param failure_rate: probability, in [0, 1], that a command raises OSError
+    :param fail_commands: method names failure_rate applies to; empty means
+        every command
+    :param level_noise: upper bound of a uniform random offset, positive or
+        negative, added to every level read
+    :param seed: random seed, for reproducible jitter, noise and failures
+    :param squelch: level from which get_dcd reports the squelch open;
+        None simulates a rig without squelch state
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    settle_time: float = 0.0
+    failure_rate: float = 0.0
+    fail_commands: frozenset[str] = frozenset()
+    level_noise: float = 0.0
+    seed: int | None = None
+    squelch: float | None = None
+
+    def __post_init__(self) -> None:
+        for name in ("latency", "jitter", "settle_time", "level_noise"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must be >= 0, got {getattr(self, name)}")
+        if not 0.0 <= self.failure_rate <= 1.0:
+            raise ValueError(f"failure_rate must be in [0, 1], got {self.failure_rate}")
+
+
+class SimulatedRigCtl:
+    """RigBackend answering from memory and a synthetic spectrum.
+
+    Thread safe, so a single instance can back a multi-threaded
+    GQRXSimulator.  ``commands`` counts the calls per method name.
+    """
+
+    _MODULATIONS = [modulation.value for modulation in ModulationModes]
+
+    def __init__(
+        self,
+        endpoint: RigEndpoint | None = None,
+        spectrum: SimulatedSpectrum | None = None,
+        profile: SimulationProfile | None = None,
+        sleep_fn: Callable[[float], None] | None = None,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        """Initialise the simulated rig.
+
+        :param endpoint: endpoint reported by the ``endpoint`` property, a
+            placeholder named "simulated" by default
+        :param spectrum: spectrum sampled by get_level, empty by default
+        :param profile: timing and failure behaviour, none by default
+        :param sleep_fn: sleep used for latency, time.sleep by default
+        :param clock: monotonic clock used for settle time, time.monotonic
+            by default
+        """
+        self.endpoint = endpoint or RigEndpoint(name="simulated")
+        self.spectrum = spectrum or SimulatedSpectrum()
+        self.profile = profile or SimulationProfile()
+        self.commands: Counter[str] = Counter()
+        self._sleep = sleep_fn or time.sleep
+        self._clock = clock or time.monotonic
+        self._rng = random.Random(self.profile.seed)
+        self._lock = threading.Lock()
+        self._tuned_at = float("-inf")
+        self.frequency = 100_000_000
+        self.mode = "FM"
+        self.recording = False
+        self._vfo = "VFOA"
+        self._rit = 0
+        self._xit = 0
+        self._split_freq = 0
+        self._split_mode = "FM"
+        self._func = ""
+        self._parm = ""
+        self._antenna = 1
+
+    def _command(self, name: str) -> None:
+        """Account for one command: count it, wait, and maybe fail it."""
+        with self._lock:
+            self.commands[name] += 1
+            delay = self.profile.latency
+            if self.profile.jitter:
+                delay += self._rng.uniform(0.0, self.profile.jitter)
+            fails = (
+                self.profile.failure_rate > 0
+                and (not self.profile.fail_commands or name in self.profile.fail_commands)
+                and self._rng.random() < self.profile.failure_rate
+            )
+        if delay > 0:
+            self._sleep(delay)
+        if fails:
+            logger.info("Simulated failure on %s", name)
+            raise OSError(f"simulated failure on {name}")
+
+    def set_frequency(self, frequency: int) -> None:
+        try:
+            freq = int(frequency)
+        except (TypeError, ValueError):
+            logger.error("Bad frequency parameter: %r", frequency)
+            raise ValueError(f"Invalid frequency: {frequency!r}") from None
+        self._command("set_frequency")
+        with self._lock:
+            self.frequency = freq
+            self._tuned_at = self._clock()
+
+    def get_frequency(self) -> int:
+        self._command("get_frequency")
+        return self.frequency
+
+    def set_mode(self, mode: str) -> None:
+        if mode not in self._MODULATIONS:
+            logger.error("Mode %r is not supported", mode)
+            raise ValueError(f"Mode {mode!r} is not supported")
+        self._command("set_mode")
+        self.mode = mode
+
+    def get_mode(self) -> str:
+        self._command("get_mode")
+        return self.mode
+
+    def get_level(self) -> int:
+        return int(self.sample_level())
+
+    def get_status(self) -> RigStatus:
+        """Return frequency, mode and level, counted as a single command."""
+        self._command("get_status")
+        return RigStatus(frequency=self.frequency, mode=self.mode, strength=int(self._level()))
+
+    def get_dcd(self) -> bool:
+        """Return True while the level reaches ``profile.squelch``.
+
+        :raises NotImplementedError: when the profile has no squelch
+        """
+        self._command("get_dcd")
+        if self.profile.squelch is None:
+            raise NotImplementedError("The simulated rig has no squelch")
+        return self._level() >= self.profile.squelch
+
+    def sample_level(self) -> float:
+        """Run a get_level command and return the level with its decimals.
+
+        Used by GQRXSimulator, which reports levels as gqrx does.
+        """
+        self._command("get_level")
+        return self._level()
+
+    def _level(self) -> float:
+        with self._lock:
+            if self._clock() - self._tuned_at < self.profile.settle_time:
+                level = self.spectrum.noise_floor
+            else:
+                level = self.spectrum.level_at(self.frequency)
+            if self.profile.level_noise:
+                level += self._rng.uniform(-self.profile.level_noise, self.profile.level_noise)
+        return level
+
+    def start_recording(self) -> str:
+        self._command("start_recording")
+        self.recording = True
+        return "RPRT 0"
+
+    def stop_recording(self) -> str:
+        self._command("stop_recording")
+        self.recording = False
+        return "RPRT 0"
+
+    def set_vfo(self, vfo: str) -> str:
+        if vfo not in GQRXRigCtl._ALLOWED_VFO_COMMANDS:
+            logger.error("VFO value must be in %s, got %s", GQRXRigCtl._ALLOWED_VFO_COMMANDS, vfo)
+            raise ValueError
+        self._command("set_vfo")
+        self._vfo = vfo
+        return "RPRT 0"
+
+    def get_vfo(self) -> str:
+        self._command("get_vfo")
+        return self._vfo
+
+    def set_rit(self, rit: int) -> str:
+        self._command("set_rit")
+        self._rit = int(rit)
+        return "RPRT 0"
+
+    def get_rit(self) -> str:
+        self._command("get_rit")
+        return str(self._rit)
+
+    def set_xit(self, xit: int) -> str:
+        self._command("set_xit")
+        self._xit = int(xit)
+        return "RPRT 0"
+
+    def get_xit(self) -> str:
+        self._command("get_xit")
+        return str(self._xit)
+
+    def set_split_freq(self, split_freq: int) -> str:
+        self._command("set_split_freq")
+        self._split_freq = int(split_freq)
+        return "RPRT 0"
+
+    def get_split_freq(self) -> int:
+        self._command("get_split_freq")
+        return self._split_freq
+
+    def set_split_mode(self, split_mode: str) -> str:
+        if split_mode not in GQRXRigCtl._ALLOWED_SPLIT_MODES:
+            logger.error("split_mode must be in %s, got %s", GQRXRigCtl._ALLOWED_SPLIT_MODES, split_mode)
+            raise ValueError
+        self._command("set_split_mode")
+        self._split_mode = split_mode
+        return "RPRT 0"
+
+    def get_split_mode(self) -> str:
+        self._command("get_split_mode")
+        return self._split_mode
+
+    def set_func(self, func: str) -> str:
+        if func not in GQRXRigCtl._ALLOWED_FUNC_COMMANDS:
+            logger.error("func must be in %s, got %s", GQRXRigCtl._ALLOWED_FUNC_COMMANDS, func)
+            raise ValueError
+        self._command("set_func")
+        self._func = func
+        return "RPRT 0"
+
+    def get_func(self) -> str:
+        self._command("get_func")
+        return self._func
+
+    def set_parm(self, parm: str) -> str:
+        if parm not in GQRXRigCtl._ALLOWED_PARM_COMMANDS:
+            logger.error("parm must be in %s, got %s", GQRXRigCtl._ALLOWED_PARM_COMMANDS, parm)
+            raise ValueError
+        self._command("set_parm")
+        self._parm = parm
+        return "RPRT 0"
+
+    def get_parm(self) -> str:
+        self._command("get_parm")
+        return self._parm
+
+    def set_antenna(self, antenna: int) -> str:
+        self._command("set_antenna")
+        self._antenna = int(antenna)
+        return "RPRT 0"
+
+    def get_antenna(self) -> int:
+        self._command("get_antenna")
+        return self._antenna
+
+    def rig_reset(self, reset_signal: str) -> str:
+        if reset_signal not in GQRXRigCtl._RESET_CMD_DICT:
+            logger.error("reset_signal must be one of %s", GQRXRigCtl._RESET_CMD_DICT.keys())
+            raise ValueError
+        self._command("rig_reset")
+        return "RPRT 0"
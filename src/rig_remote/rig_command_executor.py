@@ -0,0 +1,53 @@
+"""
+Per-rig worker threads for the commands sent from the user interface.
+
+Reading or tuning a rig blocks for as long as the rig takes to answer: up to
+the socket timeout for an unreachable gqrx, longer for a Hamlib connect
+opening a serial port.  RigCommandExecutor runs these calls on one worker
+thread per rig instead of the caller's thread.  The commands sent to a rig
+run one at a time in the order they were submitted, so a tune is never
+interleaved with a read of the same rig, while a slow rig does not delay the
+commands sent to the others.
+
+submit() returns a concurrent.futures.Future; the Qt UI hands its result
+back to the GUI thread with a signal (ui_handlers.RigCommandRelay).
+"""
+
+import logging
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class RigCommandExecutor:
+    """Serialises the commands sent to each rig on a worker thread per rig."""
+
+    def __init__(self) -> None:
+        self._workers: dict[int, ThreadPoolExecutor] = {}
+        self._closed = False
+
+    def submit(self, rig_number: int, command: Callable[..., Any], *args: Any, **kwargs: Any) -> "Future[Any]":
+        """Run ``command(*args, **kwargs)`` on the worker thread of the rig.
+
+        :param rig_number: rig the command is sent to, starting from 1
+        :raises RuntimeError: after shutdown()
+        """
+        if self._closed:
+            raise RuntimeError("Rig command executor is shut down")
+        worker = self._workers.get(rig_number)
+        if worker is None:
+            worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"rig-{rig_number}")
+            self._workers[rig_number] = worker
+        return worker.submit(command, *args, **kwargs)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Cancel the queued commands and stop the worker threads.
+
+        :param wait: wait for the running commands to return
+        """
+        self._closed = True
+        for worker in self._workers.values():
+            worker.shutdown(wait=wait, cancel_futures=True)
+        self._workers.clear()
@@ -22,12 +22,20 @@ import argparse
 import os
 import sys
 import textwrap
-from logging import Logger
 
 from PySide6 import QtWidgets
 
 from rig_remote.app_config import AppConfig
+from rig_remote.constants import (
+    DEFAULT_BOOKMARK_FILENAME,
+    DEFAULT_CONFIG_FILENAME,
+    DEFAULT_LOG_FILENAME,
+    DEFAULT_PREFIX,
+)
 from rig_remote.ui_qt import RigRemote
+from rig_remote.utility import log_configuration, process_path
+
+__all__ = ["cli", "input_arguments", "log_configuration", "process_path"]
 
 
 # helper functions
@@ -99,68 +107,15 @@ def input_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def log_configuration(verbose: bool) -> Logger:
-    """
-    Configure logging and return the root logger with an explicit level set.
-    Ensures time.tzset is called if available and that handlers use the same level.
-    """
-    import logging
-    import time
-
-    level = logging.INFO if verbose else logging.WARNING
-    logger = logging.getLogger()  # root logger
-    logger.setLevel(level)
-
-    # Call tzset if available (harmless)
-    try:
-        if hasattr(time, "tzset"):
-            time.tzset()
-    except OSError:
-        pass
-
-    # Ensure at least one handler exists and synchronize handler levels
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        handler.setLevel(level)
-        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-    else:
-        for h in logger.handlers:
-            try:
-                h.setLevel(level)
-            except (AttributeError, ValueError):
-                pass
-
-    return logger
-
-
-def process_path(path: str) -> str:
-    """Handle tilde expansion in a path.
-
-    :param path: path to expand
-    """
-
-    working_path, working_name = os.path.split(path)
-    if working_path:
-        working_path = os.path.expanduser(working_path)
-    return os.path.join(working_path, working_name)
-
-
 # entry point
 def cli() -> None:
-    DEFAULT_PREFIX = os.path.expanduser("~/.rig-remote")
-    DEFAULT_CONFIG_FILENAME = "rig-remote.conf"
-    DEFAULT_LOG_FILENAME = "rig-remote-log.txt"
-    DEFAULT_BOOKMARK_FILENAME = "rig-remote-bookmarks.csv"
-
     args = input_arguments()
     log_configuration(args.verbose)
     if args.alternate_prefix:
         prefix = args.alternate_prefix
         dir_prefix = os.path.expanduser(prefix)
     else:
-        dir_prefix = DEFAULT_PREFIX
+        dir_prefix = os.path.expanduser(DEFAULT_PREFIX)
     if args.alternate_config_file:
         conf = args.alternate_config_file
         config_file = process_path(conf)
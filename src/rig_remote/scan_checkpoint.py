@@ -0,0 +1,152 @@
+"""
+On-disk checkpoints for resumable frequency scans.
+
+ScanCheckpointStore keeps a small json file holding the position of a running
+frequency scan: the next frequency to tune, the remaining passes and the
+bookmarks collected so far.  The file is rewritten every ``save_every`` steps
+and whenever a pass is aborted or terminated, always through a temporary file
+and ``os.replace`` so a crash never leaves a truncated checkpoint behind.
+
+A checkpoint records the range, interval, modulation and segments of the
+scan it belongs to and is only resumed by a task with the same parameters.
+The file is removed once the scan completes all its passes.
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any
+
+from rig_remote.bookmarksmanager import bookmark_factory
+from rig_remote.models.bookmark import Bookmark
+from rig_remote.models.scanning_task import ScanningTask
+
+logger = logging.getLogger(__name__)
+
+_CHECKPOINT_VERSION = 1
+
+
+def _task_signature(task: ScanningTask) -> list[Any]:
+    """Return the json-compatible parameters identifying the sweep of *task*."""
+    return [
+        task.range_min,
+        task.range_max,
+        task.interval,
+        task.frequency_modulation.upper(),
+        [[s.range_min, s.range_max, s.interval, s.modulation] for s in task.segments],
+    ]
+
+
+@dataclass
+class ScanCheckpoint:
+    """Scan position restored from a checkpoint file."""
+
+    frequency: int
+    pass_count: int
+    new_bookmarks: list[Bookmark] = field(default_factory=list)
+
+
+class ScanCheckpointStore:
+    """Reads and writes the checkpoint file of a frequency scan."""
+
+    def __init__(self, path: str, save_every: int = 50, resume: bool = False) -> None:
+        """Initialise the store.
+
+        :param path: checkpoint file path
+        :param save_every: number of scan steps between two periodic saves
+        :param resume: if True the scan starts from the checkpoint found in
+            *path*, if any, instead of range_min
+        :raises ValueError: if save_every is lower than 1
+        """
+        if save_every < 1:
+            raise ValueError(f"save_every must be >= 1, got {save_every}")
+        self.path = path
+        self.resume = resume
+        self._save_every = save_every
+        self._steps = 0
+
+    def load(self, task: ScanningTask) -> ScanCheckpoint | None:
+        """Return the checkpoint stored for *task*.
+
+        :param task: the task about to be scanned
+        :returns: the stored checkpoint, or None when there is no file, the
+            file can't be parsed or it belongs to a scan with other parameters
+        """
+        try:
+            with open(self.path, encoding="utf-8") as checkpoint_file:
+                data = json.load(checkpoint_file)
+        except FileNotFoundError:
+            logger.info("No scan checkpoint found in %s", self.path)
+            return None
+        except (OSError, ValueError):
+            logger.exception("Unreadable scan checkpoint %s, ignoring it", self.path)
+            return None
+
+        try:
+            if data["version"] != _CHECKPOINT_VERSION or data["task"] != _task_signature(task):
+                logger.warning("Scan checkpoint %s belongs to a different scan, ignoring it", self.path)
+                return None
+            checkpoint = ScanCheckpoint(
+                frequency=int(data["frequency"]),
+                pass_count=int(data["pass_count"]),
+                new_bookmarks=[bookmark_factory(*entry) for entry in data["new_bookmarks"]],
+            )
+        except (KeyError, TypeError, ValueError):
+            logger.exception("Invalid scan checkpoint %s, ignoring it", self.path)
+            return None
+        logger.info("Resuming scan at %i Hz, %i passes left", checkpoint.frequency, checkpoint.pass_count)
+        return checkpoint
+
+    def save(self, task: ScanningTask, frequency: int, pass_count: int) -> None:
+        """Write the scan position to the checkpoint file.
+
+        Write errors are logged and otherwise ignored: losing a checkpoint
+        must not stop the scan.
+
+        :param task: the running task, its collected bookmarks are saved too
+        :param frequency: next frequency to tune
+        :param pass_count: passes left, as counted by the strategy
+        """
+        self._steps = 0
+        data = {
+            "version": _CHECKPOINT_VERSION,
+            "task": _task_signature(task),
+            "frequency": frequency,
+            "pass_count": pass_count,
+            "new_bookmarks": [
+                [bm.channel.frequency, bm.channel.modulation, bm.description, bm.lockout, bm.id]
+                for bm in task.new_bookmarks_list
+            ],
+        }
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as checkpoint_file:
+                json.dump(data, checkpoint_file)
+            os.replace(temp_path, self.path)
+        except OSError:
+            logger.exception("Could not write scan checkpoint %s", self.path)
+            return
+        logger.debug("Scan checkpoint saved at %i Hz", frequency)
+
+    def step(self, task: ScanningTask, frequency: int, pass_count: int) -> None:
+        """Count one scan step and save the checkpoint every ``save_every`` steps.
+
+        :param task: the running task
+        :param frequency: frequency about to be tuned
+        :param pass_count: passes left, as counted by the strategy
+        """
+        self._steps += 1
+        if self._steps >= self._save_every:
+            self.save(task, frequency, pass_count)
+
+    def clear(self) -> None:
+        """Remove the checkpoint file, if any."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            return
+        except OSError:
+            logger.exception("Could not remove scan checkpoint %s", self.path)
+            return
+        logger.info("Scan checkpoint %s removed", self.path)
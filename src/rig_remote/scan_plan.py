@@ -0,0 +1,135 @@
+"""
+Precompiled scan plans.
+
+A ScanPlan is the flat list of tuning steps of a scan: two parallel arrays
+holding the frequency in Hz and a one-byte mode code for every step.
+Compiling a ScanningTask into a plan does all the per-step work once:
+
+  - frequency scans expand ``range_min``/``range_max``/``interval``, or each
+    of the task segments, into the step frequencies and validate each
+    modulation a single time;
+  - bookmark scans drop locked bookmarks and resolve each channel to its
+    frequency and mode code.
+
+Strategies then walk the arrays by index and only recompile when a queue
+event changes the parameters the plan was built from.
+"""
+
+import logging
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+from rig_remote.constants import MAX_FREQUENCY_HZ
+from rig_remote.models.bookmark import Bookmark
+from rig_remote.models.modulation_modes import ModulationModes
+from rig_remote.models.scanning_task import ScanningTask
+
+logger = logging.getLogger(__name__)
+
+MODE_CODES: tuple[str, ...] = tuple(modulation.value for modulation in ModulationModes)
+_MODE_INDEX: dict[str, int] = {mode: code for code, mode in enumerate(MODE_CODES)}
+
+
+def mode_code(modulation: str) -> int:
+    """Return the code used in a ScanPlan for *modulation*.
+
+    :param modulation: modulation name, case insensitive
+    :returns: index of the modulation in MODE_CODES
+    :raises ValueError: if the modulation is not supported
+    """
+    try:
+        return _MODE_INDEX[modulation.upper()]
+    except KeyError:
+        message = f"Provided modulation {modulation!r} is not supported, supported modulations are {list(MODE_CODES)}"
+        logger.error(message)
+        raise ValueError(message) from None
+
+
+@dataclass
+class ScanPlan:
+    """Array-backed list of (frequency, mode code) tuning steps.
+
+    ``bookmarks`` is only filled for bookmark plans and is parallel to the
+    two arrays, so the strategy can log and record against the source entry.
+    """
+
+    frequencies: array[int] = field(default_factory=lambda: array("q"))
+    mode_codes: array[int] = field(default_factory=lambda: array("B"))
+    bookmarks: list[Bookmark] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.frequencies)
+
+    def mode(self, index: int) -> str:
+        """Return the modulation name of step *index*."""
+        return MODE_CODES[self.mode_codes[index]]
+
+    def resume_index(self, frequency: int) -> int:
+        """Return the index of the first step at or above *frequency*.
+
+        Only meaningful for frequency plans, whose steps are sorted.
+        """
+        return bisect_left(self.frequencies, frequency)
+
+
+def compile_frequency_plan(task: ScanningTask) -> ScanPlan:
+    """Expand the frequency range of *task* into a ScanPlan.
+
+    Steps go from ``range_min`` (inclusive) to ``range_max`` (exclusive) in
+    increments of ``interval``, the same convention as the scan loop.  A step
+    with an invalid frequency aborts the pass, so the plan stops before
+    the first step above MAX_FREQUENCY_HZ and is empty when the first step is
+    below 1 Hz.  The interval is clamped to the ScanningTask minimum because
+    queue events may set it below it.
+
+    When the task has segments, each segment is expanded with its own
+    interval and modulation instead and the steps are concatenated.  The
+    segments are sorted and do not overlap, so the plan stays sorted.
+
+    :param task: frequency ScanningTask to compile
+    :returns: the compiled plan, empty if the range holds no valid step
+    :raises ValueError: if the task modulation is not supported
+    """
+    if task.segments:
+        plan = ScanPlan()
+        for segment in task.segments:
+            steps = range(segment.range_min, segment.range_max, segment.interval)
+            plan.frequencies.extend(steps)
+            plan.mode_codes.extend(array("B", [mode_code(segment.modulation)]) * len(steps))
+        logger.info("Compiled segmented frequency plan: %i steps in %i segments", len(plan), len(task.segments))
+        return plan
+
+    code = mode_code(task.frequency_modulation)
+    step = max(task.interval, ScanningTask._MIN_INTERVAL)
+    steps = range(task.range_min, min(task.range_max, MAX_FREQUENCY_HZ + 1), step)
+    if steps and steps[0] < 1:
+        logger.error("Invalid first scan step %i Hz, the scan plan is empty.", steps[0])
+        steps = range(0)
+    plan = ScanPlan(frequencies=array("q", steps), mode_codes=array("B", [code]) * len(steps))
+    logger.info(
+        "Compiled frequency plan: %i steps [%i, %i) Hz step %i Hz",
+        len(plan),
+        task.range_min,
+        task.range_max,
+        step,
+    )
+    return plan
+
+
+def compile_bookmark_plan(bookmarks: list[Bookmark]) -> ScanPlan:
+    """Compile the non-locked entries of *bookmarks* into a ScanPlan.
+
+    :param bookmarks: bookmark list of a bookmark ScanningTask
+    :returns: the compiled plan, in list order
+    :raises ValueError: if a bookmark carries an unsupported modulation
+    """
+    plan = ScanPlan()
+    for bookmark in bookmarks:
+        if bookmark.lockout == "L":
+            continue
+        plan.frequencies.append(bookmark.channel.frequency)
+        plan.mode_codes.append(mode_code(bookmark.channel.modulation))
+        plan.bookmarks.append(bookmark)
+    logger.info("Compiled bookmark plan: %i of %i bookmarks", len(plan), len(bookmarks))
+    return plan
@@ -0,0 +1,125 @@
+"""
+Scan-step timing profile.
+
+ScanProfiler attributes the wall time of a scan to the phases of a step:
+
+  tune_io       set_frequency / set_mode round trips
+  settle_sleep  time_wait_for_tune waits after each tune command
+  sample_io     get_level round trips
+  sample_sleep  no_signal_delay waits between level samples
+  queue         processing of queued parameter updates
+  hold          task.delay waits after a signal was found
+  recording     start_recording / stop_recording round trips
+  logging       activity log writes
+  bookmark      creation of new bookmarks, including the get_mode query
+
+Whatever is not covered by a phase is reported as "other", the scan engine
+overhead.  The report shows which of the ScanningConfig waits or the network
+round trips dominate a step on a given deployment.
+
+A ScannerCore without profiler skips all of this: the timed sections cost a
+shared no-op context manager.
+"""
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PHASES = (
+    "tune_io",
+    "settle_sleep",
+    "sample_io",
+    "sample_sleep",
+    "queue",
+    "hold",
+    "recording",
+    "logging",
+    "bookmark",
+)
+
+
+class ScanProfiler:
+    """Accumulates the time spent in each phase of a scan."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        """Initialise an empty profile.
+
+        :param clock: monotonic clock in seconds, time.perf_counter by default
+        """
+        self._clock = clock
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        self.totals: dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.counts: dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.steps = 0
+        self._started: float | None = None
+        self._stopped: float | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the body of the with statement as phase *name*.
+
+        :raises KeyError: if name is not one of PHASES
+        """
+        self.counts[name] += 1
+        started = self._clock()
+        if self._started is None:
+            self._started = started
+        try:
+            yield
+        finally:
+            self.totals[name] += self._clock() - started
+
+    def step(self) -> None:
+        """Count one scan step; the profile starts at the first one."""
+        self.steps += 1
+        if self._started is None:
+            self._started = self._clock()
+
+    def stop(self) -> None:
+        """Mark the end of the scan."""
+        self._stopped = self._clock()
+
+    def summary(self) -> dict[str, Any]:
+        """Return the profile as a json-compatible dict.
+
+        :returns: steps, wall_s and, per phase plus "other", the count,
+            total_s, the share of the wall time and the mean ms per step
+        """
+        end = self._stopped if self._stopped is not None else self._clock()
+        wall = end - self._started if self._started is not None else 0.0
+        phases = {name: (self.counts[name], self.totals[name]) for name in PHASES}
+        phases["other"] = (self.steps, max(0.0, wall - sum(self.totals.values())))
+        return {
+            "steps": self.steps,
+            "wall_s": wall,
+            "phases": {
+                name: {
+                    "count": count,
+                    "total_s": total,
+                    "share": total / wall if wall else 0.0,
+                    "ms_per_step": total * 1000 / self.steps if self.steps else 0.0,
+                }
+                for name, (count, total) in phases.items()
+            },
+        }
+
+    def report(self) -> str:
+        """Return the summary as a text table, slowest phase first."""
+        summary = self.summary()
+        lines = [f"Scan profile: {summary['steps']} steps in {summary['wall_s']:.3f} s"]
+        ordered = sorted(summary["phases"].items(), key=lambda item: item[1]["total_s"], reverse=True)
+        for name, phase in ordered:
+            if not phase["total_s"]:
+                continue
+            lines.append(
+                f"  {name:<13}{phase['total_s']:10.3f} s {phase['share']:7.1%}"
+                f" {phase['ms_per_step']:10.3f} ms/step {phase['count']:8d} calls"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,217 @@
+"""
+Live telemetry of a running scan.
+
+ScanTelemetry is fed by the ScannerCore on the scan thread: the frequency
+tuned, the level of each signal check, the steps, the hits and the bookmarks
+created.  At most once per ``interval`` seconds it publishes a TelemetrySample
+of these to its subscribers, plus a final sample when the scan ends, so
+consumers follow the scan as it runs instead of polling for its end.
+
+Subscribers are plain callables run on the scan thread, so they must return
+immediately: the Qt UI re-emits the samples as a signal
+(ui_scan_handlers.ScanTelemetryRelay), headless clients iterate over a
+TelemetryStream, which buffers them for another thread.
+
+Between two samples the scan loop only stores a few attributes and reads the
+clock once per signal check, so feeding the telemetry does not slow the scan.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from rig_remote.models.bookmark import Bookmark
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 0.25
+DEFAULT_STREAM_SIZE = 64
+
+Subscriber = Callable[["TelemetrySample"], None]
+
+
+@dataclass(frozen=True)
+class TelemetrySample:
+    """State of a scan when the sample was published.
+
+    :param frequency: last frequency tuned in Hz, 0 before the first tune
+    :param level: last signal level read, 0 before the first signal check
+    :param steps: channels tuned since the scan started
+    :param hits: signal checks that found activity since the scan started
+    :param new_bookmarks: bookmarks created since the previous sample
+    :param timestamp: unix time of the sample
+    :param done: True on the last sample of the scan
+    """
+
+    frequency: int
+    level: int
+    steps: int
+    hits: int
+    new_bookmarks: tuple[Bookmark, ...] = ()
+    timestamp: float = 0.0
+    done: bool = False
+
+
+class ScanTelemetry:
+    """Rate-limited publisher of TelemetrySamples."""
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise a telemetry without subscribers.
+
+        :param interval: minimum seconds between two samples, 0 publishes
+            one sample per signal check
+        :param clock: monotonic clock in seconds, time.monotonic by default
+        """
+        self.interval = interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Replaced, never mutated, so the scan thread reads it without lock.
+        self._subscribers: tuple[Subscriber, ...] = ()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the previous scan; called when a scan starts."""
+        self.frequency = 0
+        self.level = 0
+        self.steps = 0
+        self.hits = 0
+        self._new_bookmarks: list[Bookmark] = []
+        self._next_publish = 0.0
+        self.last_sample: TelemetrySample | None = None
+
+    # ------------------------------------------------------------------
+    # Consumers
+    # ------------------------------------------------------------------
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """Call *callback* with each sample published from now on.
+
+        The callback runs on the scan thread and must not block.  Exceptions
+        it raises are logged and do not stop the scan.
+
+        :returns: a function that unsubscribes *callback*
+        """
+        with self._lock:
+            self._subscribers = (*self._subscribers, callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                self._subscribers = tuple(s for s in self._subscribers if s is not callback)
+
+        return unsubscribe
+
+    def stream(self, maxsize: int = DEFAULT_STREAM_SIZE) -> "TelemetryStream":
+        """Return an iterator over the samples published from now on."""
+        return TelemetryStream(self, maxsize)
+
+    # ------------------------------------------------------------------
+    # Producer, called on the scan thread
+    # ------------------------------------------------------------------
+
+    def step(self) -> None:
+        """Count one channel tuned by the scan loop."""
+        self.steps += 1
+
+    def tuned(self, frequency: int) -> None:
+        """Record the frequency the rig was tuned to."""
+        self.frequency = frequency
+
+    def sampled(self, level: int, hit: bool) -> None:
+        """Record the result of a signal check and publish if due."""
+        self.level = level
+        if hit:
+            self.hits += 1
+        now = self._clock()
+        if now >= self._next_publish:
+            self._next_publish = now + self.interval
+            self._publish(done=False)
+
+    def bookmark_created(self, bookmark: Bookmark) -> None:
+        """Queue *bookmark* for the next sample."""
+        self._new_bookmarks.append(bookmark)
+
+    def finish(self) -> None:
+        """Publish the last sample of the scan, with the pending bookmarks."""
+        self._publish(done=True)
+
+    def _publish(self, done: bool) -> None:
+        new_bookmarks = tuple(self._new_bookmarks)
+        self._new_bookmarks.clear()
+        sample = TelemetrySample(
+            frequency=self.frequency,
+            level=self.level,
+            steps=self.steps,
+            hits=self.hits,
+            new_bookmarks=new_bookmarks,
+            timestamp=time.time(),
+            done=done,
+        )
+        self.last_sample = sample
+        for subscriber in self._subscribers:
+            try:
+                subscriber(sample)
+            except Exception:
+                logger.exception("Telemetry subscriber %r failed", subscriber)
+
+
+class TelemetryStream:
+    """Blocking iterator over the samples of a ScanTelemetry.
+
+    Samples are buffered up to *maxsize*; when the consumer falls behind the
+    oldest ones are dropped, so the scan thread never waits for it.  The
+    iteration ends after the last sample of the scan, or when close() is
+    called.
+    """
+
+    def __init__(self, telemetry: ScanTelemetry, maxsize: int = DEFAULT_STREAM_SIZE) -> None:
+        self._samples: deque[TelemetrySample] = deque(maxlen=maxsize)
+        self._ready = threading.Condition()
+        self._closed = False
+        self._unsubscribe = telemetry.subscribe(self._put)
+
+    def _put(self, sample: TelemetrySample) -> None:
+        with self._ready:
+            if self._closed:
+                return
+            self._samples.append(sample)
+            if sample.done:
+                self._close()
+            self._ready.notify_all()
+
+    def _close(self) -> None:
+        self._closed = True
+        self._unsubscribe()
+
+    def close(self) -> None:
+        """Stop receiving samples and end the iteration once drained."""
+        with self._ready:
+            self._close()
+            self._ready.notify_all()
+
+    def get(self, timeout: float | None = None) -> TelemetrySample | None:
+        """Return the next sample, or None on timeout or end of stream."""
+        with self._ready:
+            self._ready.wait_for(lambda: self._samples or self._closed, timeout)
+            return self._samples.popleft() if self._samples else None
+
+    def __iter__(self) -> "TelemetryStream":
+        return self
+
+    def __next__(self) -> TelemetrySample:
+        sample = self.get()
+        if sample is None:
+            raise StopIteration
+        return sample
+
+    def __enter__(self) -> "TelemetryStream":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -4,22 +4,58 @@ Shared primitive layer for all scanner strategies.
 ScannerCore owns the RigBackend reference, the STMessenger queue, the
 ScanningConfig, the liveness flag, and the sleep indirection.  All
 scanner strategies are composed with a ScannerCore instance.
+
+Priority channels are interleaved here too: strategies call
+``priority_check`` once per step and the core decides when the priority
+bookmarks are due.
+
+Strategies walk a precompiled ScanPlan; ``plan_stale`` is raised by
+``process_queue`` whenever an event changes a parameter the plan was
+compiled from.
+
+The optional ScanCheckpointStore is carried here as well, so frequency scans
+can save their position and resume it after a restart.
+
+So is the optional ScanProfiler: ``timed(phase)`` wraps each phase of a
+step and is a no-op without a profiler.  ``count_step()`` counts each step
+on the ScanCounters, and on the profiler if any.
+
+The optional ScanTelemetry is fed with the frequency tuned, the result of
+each signal check and the bookmarks created; strategies report their new
+bookmarks through ``bookmark_created``.
+
+``signal_check`` detects activity by signal level, or with the squelch
+detector of the ScanningConfig by a single read of the rig squelch state.
+
+With a ResilientRigCtl a communication error pauses the scan instead of
+ending it: the core waits until the circuit breaker of the rig lets a new
+attempt through, then retries the command.
 """
 
 import logging
 import time
 from collections.abc import Callable
-from typing import Any
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, TypeVar
 
+from rig_remote.disk_io import LogFile
+from rig_remote.models.bookmark import Bookmark
 from rig_remote.models.channel import Channel
+from rig_remote.models.run_counters import ScanCounters
 from rig_remote.models.scanning_task import ScanningTask
 from rig_remote.rig_backends.protocol import RigBackend
-from rig_remote.scanning_config import ScanningConfig
+from rig_remote.rig_backends.resilient_rigctl import ResilientRigCtl
+from rig_remote.scan_checkpoint import ScanCheckpointStore
+from rig_remote.scan_profiler import ScanProfiler
+from rig_remote.scan_telemetry import ScanTelemetry
+from rig_remote.scanning_config import DETECTOR_SQUELCH, ScanningConfig
 from rig_remote.stmessenger import STMessenger
 from rig_remote.utility import khertz_to_hertz
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 # Hamlib.error is an optional runtime dependency.  Import it lazily so the
 # module loads correctly in environments where Hamlib is not installed.
 # When Hamlib is absent, _HAMLIB_ERROR is a never-raised sentinel type.
@@ -28,6 +64,13 @@ try:
 except ImportError:
     _HAMLIB_ERROR = type("_NoHamlibError", (Exception,), {})
 
+# Longest single sleep while waiting for an unavailable rig, so that
+# terminate() is honoured promptly.
+_RIG_WAIT_SLICE = 0.5
+
+# Shared by every timed() call when no profiler is set.
+_NOT_PROFILED: AbstractContextManager[None] = nullcontext()
+
 
 class ScannerCore:
     """Low-level scanning primitives shared by all scanner strategies.
@@ -38,6 +81,12 @@ class ScannerCore:
       - the ScanningConfig
       - the liveness flag (_scan_active)
       - the sleep indirection (injectable for tests)
+      - the priority-channel step counter
+      - the plan-stale flag raised by queue events that invalidate a ScanPlan
+      - the optional ScanCheckpointStore (frequency scans only)
+      - the optional ScanProfiler
+      - the ScanCounters read by the metrics exporters
+      - the optional ScanTelemetry
     """
 
     _QUEUE_EVENT_CONVERTERS: dict[str, Callable[[Any], Any]] = {
@@ -49,18 +98,35 @@ class ScannerCore:
         "delay": int,
     }
 
+    # Queue event keys that invalidate a compiled ScanPlan.
+    _PLAN_EVENT_KEYS: frozenset[str] = frozenset({"range_min", "range_max", "interval"})
+
     def __init__(
         self,
         scan_queue: STMessenger,
         rigctl: RigBackend,
         config: ScanningConfig,
         sleep_fn: Callable[[float], None] | None = None,
+        checkpoint: ScanCheckpointStore | None = None,
+        profiler: ScanProfiler | None = None,
+        counters: ScanCounters | None = None,
+        telemetry: ScanTelemetry | None = None,
     ) -> None:
         self.scan_queue = scan_queue
         self.rigctl = rigctl
         self.config = config
         self._scan_active: bool = True
         self._sleep: Callable[[float], None] = sleep_fn or time.sleep
+        self._steps_since_priority: int = 0
+        self.plan_stale: bool = False
+        self.checkpoint = checkpoint
+        self.profiler = profiler
+        self.counters = counters or ScanCounters()
+        self.telemetry = telemetry
+        # Cleared when the rig turns out not to report its squelch state.
+        self._squelch_supported: bool = True
+        # Last level read by signal_check, 0 before the first one.
+        self.last_level: int = 0
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -74,6 +140,31 @@ class ScannerCore:
     def should_stop(self) -> bool:
         return not self._scan_active
 
+    # ------------------------------------------------------------------
+    # Profiling
+    # ------------------------------------------------------------------
+
+    def timed(self, phase: str) -> AbstractContextManager[None]:
+        """Return a context manager timing *phase* on the profiler, if any."""
+        if self.profiler is None:
+            return _NOT_PROFILED
+        return self.profiler.phase(phase)
+
+    def count_step(self) -> None:
+        """Count one scan step on the counters and the profiler, if any."""
+        self.counters.steps += 1
+        self.counters.last_step_time = time.time()
+        if self.profiler is not None:
+            self.profiler.step()
+        if self.telemetry is not None:
+            self.telemetry.step()
+
+    def bookmark_created(self, bookmark: Bookmark) -> None:
+        """Count a bookmark added to the new bookmarks list by a strategy."""
+        self.counters.bookmarks_created += 1
+        if self.telemetry is not None:
+            self.telemetry.bookmark_created(bookmark)
+
     # ------------------------------------------------------------------
     # Queue management
     # ------------------------------------------------------------------
@@ -84,12 +175,17 @@ class ScannerCore:
             if self.scan_queue.update_queued():
                 self.process_queue(task)
             if remaining > 0:
-                self._sleep(1)
+                with self.timed("hold"):
+                    self._sleep(1)
                 remaining -= 1
             else:
                 break
 
     def process_queue(self, task: ScanningTask) -> bool:
+        with self.timed("queue"):
+            return self._apply_queue_events(task)
+
+    def _apply_queue_events(self, task: ScanningTask) -> bool:
         processed = False
         while self.scan_queue.update_queued():
             event = self.scan_queue.get_event_update()
@@ -132,6 +228,8 @@ class ScannerCore:
                 break
 
             processed = True
+            if key in self._PLAN_EVENT_KEYS:
+                self.plan_stale = True
             logger.info("Queue event applied: %s = %s", param_name, param_value)
 
         return processed
@@ -141,15 +239,25 @@ class ScannerCore:
     # ------------------------------------------------------------------
 
     def channel_tune(self, channel: Channel) -> None:
-        """Tune the rig to *channel* and wait for it to settle.
+        """Tune the rig to *channel* and wait for it to settle, see ``tune``."""
+        self.tune(channel.frequency, channel.modulation)
 
-        Catches OSError, TimeoutError, and Hamlib.error (all treated as
-        retriable communications errors).  ValueError from ModeTranslator
+    def tune(self, frequency: int, modulation: str) -> None:
+        """Tune the rig to *frequency* in *modulation* and wait for it to settle.
+
+        Takes the raw values of a ScanPlan step, so no Channel is built per
+        step.  Catches OSError, TimeoutError, and Hamlib.error (all treated
+        as retriable communications errors).  ValueError from ModeTranslator
         (unmapped mode) is also retriable — the scan skips the channel.
+        With a ResilientRigCtl communications errors are only raised once
+        the scan is terminated, see ``_rig_io``.
         """
-        logger.info("Tuning to %i", channel.frequency)
+        logger.info("Tuning to %i", frequency)
+        if self.telemetry is not None:
+            self.telemetry.tuned(frequency)
         try:
-            self.rigctl.set_frequency(channel.frequency)
+            with self.timed("tune_io"):
+                self._rig_io(self.rigctl.set_frequency, frequency)
         except ValueError:
             logger.error("Bad frequency parameter.")
             raise
@@ -157,10 +265,12 @@ class ScannerCore:
             logger.error("Communications error while setting frequency.")
             self._scan_active = False
             raise
-        self._sleep(self.config.time_wait_for_tune)
+        with self.timed("settle_sleep"):
+            self._sleep(self.config.time_wait_for_tune)
 
         try:
-            self.rigctl.set_mode(channel.modulation)
+            with self.timed("tune_io"):
+                self._rig_io(self.rigctl.set_mode, modulation)
         except ValueError:
             logger.error("Bad modulation parameter.")
             raise
@@ -168,10 +278,47 @@ class ScannerCore:
             logger.error("Communications error while setting mode.")
             self._scan_active = False
             raise
-        self._sleep(self.config.time_wait_for_tune)
+        with self.timed("settle_sleep"):
+            self._sleep(self.config.time_wait_for_tune)
+
+    def _rig_io(self, command: Callable[..., _T], *args: Any) -> _T:
+        """Run a rig command, retrying it while a resilient rig is unavailable.
+
+        Communication errors propagate unchanged unless the rig is a
+        ResilientRigCtl: the scan then pauses until its circuit breaker lets
+        a new attempt through and retries, until the scan is terminated.
+        """
+        while True:
+            try:
+                return command(*args)
+            except (OSError, TimeoutError, _HAMLIB_ERROR):
+                if not isinstance(self.rigctl, ResilientRigCtl) or not self._scan_active:
+                    raise
+                logger.warning("Rig unavailable, scan paused.")
+                self._wait_for_rig(self.rigctl)
+                if not self._scan_active:
+                    raise
+                logger.info("Retrying rig command.")
+
+    def _wait_for_rig(self, rigctl: ResilientRigCtl) -> None:
+        """Sleep until *rigctl* accepts calls again or the scan is terminated."""
+        while self._scan_active:
+            delay = rigctl.retry_in()
+            if delay <= 0:
+                return
+            self._sleep(min(delay, _RIG_WAIT_SLICE))
 
     def signal_check(self, sgn_level: int) -> bool:
-        """Sample the signal level ``config.signal_checks`` times."""
+        """Sample the signal level ``config.signal_checks`` times.
+
+        With the squelch detector the squelch state of the rig is read once
+        instead, and *sgn_level* is ignored; rigs that do not report it fall
+        back to level sampling for the rest of the scan.
+        """
+        if self.config.detector == DETECTOR_SQUELCH and self._squelch_supported:
+            squelch_open = self._squelch_check()
+            if squelch_open is not None:
+                return squelch_open
         threshold = int(sgn_level) * 10
         signal_found = 0
         level: int = 0
@@ -183,13 +330,19 @@ class ScannerCore:
                 self.config.signal_checks,
                 threshold,
             )
-            level = self.rigctl.get_level()
+            with self.timed("sample_io"):
+                level = self._rig_io(self.rigctl.get_level)
             logger.debug("Signal check result: level=%d threshold=%d", level, threshold)
+            self.last_level = level
             if level >= threshold:
                 signal_found += 1
-            self._sleep(self.config.no_signal_delay)
+            with self.timed("sample_sleep"):
+                self._sleep(self.config.no_signal_delay)
 
+        if self.telemetry is not None:
+            self.telemetry.sampled(level, signal_found > 0)
         if signal_found > 0:
+            self.counters.hits += 1
             logger.info(
                 "Activity found — level: %d  hits: %d/%d",
                 level,
@@ -199,6 +352,84 @@ class ScannerCore:
             return True
         return False
 
+    def _squelch_check(self) -> bool | None:
+        """Read the squelch state once, None if the rig does not report it.
+
+        When the squelch is open the signal level is read once as well and
+        kept in ``last_level``, so hits carry the level they were found at.
+        """
+        try:
+            with self.timed("sample_io"):
+                squelch_open = self._rig_io(self.rigctl.get_dcd)
+        except NotImplementedError:
+            logger.warning("The rig does not report its squelch state, detecting by signal level.")
+            self._squelch_supported = False
+            return None
+        if squelch_open:
+            with self.timed("sample_io"):
+                self.last_level = self._rig_io(self.rigctl.get_level)
+        with self.timed("sample_sleep"):
+            self._sleep(self.config.no_signal_delay)
+        if self.telemetry is not None:
+            self.telemetry.sampled(self.last_level if squelch_open else self.telemetry.level, squelch_open)
+        if squelch_open:
+            self.counters.hits += 1
+            logger.info("Activity found — squelch open")
+        return squelch_open
+
+    # ------------------------------------------------------------------
+    # Priority channels
+    # ------------------------------------------------------------------
+
+    def priority_check(self, task: ScanningTask, log: LogFile) -> bool:
+        """Count one scan step and visit the priority bookmarks when due.
+
+        Every ``task.priority_interval`` steps each non-locked bookmark in
+        ``task.priority_bookmarks`` is tuned and checked.  A hit is logged
+        (when ``task.log`` is set) and held for ``task.delay`` seconds, or
+        for as long as the signal lasts when ``task.wait`` is set, before
+        the next priority channel is checked.  The extra cost is therefore
+        bounded to ``len(priority_bookmarks)`` tunes every
+        ``priority_interval`` steps, plus the time spent on active channels.
+
+        A ValueError on a priority channel skips it; communications errors
+        propagate to the calling strategy exactly like a failed step tune.
+
+        :param task: Active ScanningTask holding the priority settings.
+        :param log: Open LogFile used for priority hits when ``task.log``
+            is True.
+        :returns: True if the priority channels were visited on this step,
+            in which case the rig is no longer tuned to the caller's channel.
+        """
+        if task.priority_interval <= 0 or not task.priority_bookmarks:
+            return False
+        self._steps_since_priority += 1
+        if self._steps_since_priority < task.priority_interval:
+            return False
+        self._steps_since_priority = 0
+
+        for bookmark in task.priority_bookmarks:
+            if self.should_stop():
+                break
+            if bookmark.lockout == "L":
+                continue
+            try:
+                self.channel_tune(bookmark.channel)
+            except ValueError:
+                logger.warning("Priority bookmark %s could not be tuned — skipping.", bookmark.id)
+                continue
+            if not self.signal_check(sgn_level=task.sgn_level):
+                continue
+            logger.info("Signal found on priority bookmark %s.", bookmark.id)
+            if task.log:
+                with self.timed("logging"):
+                    log.write(record_type="B", record=bookmark, signal=[])
+            while task.wait and not self.should_stop() and self.signal_check(sgn_level=task.sgn_level):
+                self.process_queue(task)
+            if not self.should_stop():
+                self.queue_sleep(task)
+        return True
+
     # ------------------------------------------------------------------
     # Pass-count helper
     # ------------------------------------------------------------------
@@ -17,6 +17,15 @@ Design:
     create_scanner()         — factory: accepts scan_mode + dependencies,
                                builds ScannerCore, wraps it in the right strategy,
                                returns a ready Scanning2 instance.
+    ScanCheckpointStore      — optional on-disk scan position, lets frequency
+                               scans resume after a restart.
+                               Defined in scan_checkpoint.py.
+    ScanProfiler             — optional per-phase timing of the scan steps,
+                               reported when the scan ends.
+                               Defined in scan_profiler.py.
+    ScanTelemetry            — optional rate-limited stream of the scan
+                               progress, consumed while the scan runs.
+                               Defined in scan_telemetry.py.
 """
 
 import logging
@@ -26,8 +35,13 @@ from typing import Protocol, runtime_checkable
 from rig_remote.bookmark_scanner_strategy import BookmarkScannerStrategy
 from rig_remote.disk_io import LogFile
 from rig_remote.frequency_scanner_strategy import FrequencyScannerStrategy
+from rig_remote.models.run_counters import ScanCounters
 from rig_remote.models.scanning_task import ScanningTask
 from rig_remote.rig_backends.protocol import RigBackend
+from rig_remote.rig_backends.serial_worker import background_priority
+from rig_remote.scan_checkpoint import ScanCheckpointStore
+from rig_remote.scan_profiler import ScanProfiler
+from rig_remote.scan_telemetry import ScanTelemetry
 from rig_remote.scanner_core import ScannerCore
 from rig_remote.scanning_config import ScanningConfig
 from rig_remote.stmessenger import STMessenger
@@ -42,6 +56,9 @@ __all__ = [
     "BookmarkScannerStrategy",
     "FrequencyScannerStrategy",
     "Scanning2",
+    "ScanCheckpointStore",
+    "ScanProfiler",
+    "ScanTelemetry",
     "create_scanner",
 ]
 
@@ -86,6 +103,9 @@ class Scanning2:
         scanner: ScannerStrategy,
         log: LogFile,
         log_filename: str,
+        profiler: ScanProfiler | None = None,
+        counters: ScanCounters | None = None,
+        telemetry: ScanTelemetry | None = None,
     ) -> None:
         """Initialise the facade with its strategy and log configuration.
 
@@ -94,10 +114,19 @@ class Scanning2:
         :param log: LogFile instance whose lifecycle this facade manages.
         :param log_filename: Path to the activity log file; passed to
             ``log.open()`` when ``task.log`` is True.
+        :param profiler: Optional ScanProfiler shared with the ScannerCore;
+            its report is logged when each scan ends.
+        :param counters: Optional ScanCounters shared with the ScannerCore;
+            the facade counts the scans and flags the running one.
+        :param telemetry: Optional ScanTelemetry shared with the ScannerCore;
+            reset when each scan starts and finished when it ends.
         """
         self._scanner = scanner
         self._log = log
         self._log_filename = log_filename
+        self._profiler = profiler
+        self._counters = counters or ScanCounters()
+        self._telemetry = telemetry
 
     def terminate(self) -> None:
         """Delegate termination to the underlying scanner strategy."""
@@ -120,7 +149,23 @@ class Scanning2:
                 raise
 
         logger.info("Starting scan, mode: %s", task.scan_mode)
-        self._scanner.scan(task, self._log)
+        if self._profiler is not None:
+            self._profiler.reset()
+        if self._telemetry is not None:
+            self._telemetry.reset()
+        self._counters.scans += 1
+        self._counters.active = True
+        try:
+            # queue behind the UI commands on serial rigs
+            with background_priority():
+                self._scanner.scan(task, self._log)
+        finally:
+            self._counters.active = False
+            if self._profiler is not None:
+                self._profiler.stop()
+                logger.info("%s", self._profiler.report())
+            if self._telemetry is not None:
+                self._telemetry.finish()
 
         if task.log:
             self._log.close()
@@ -145,6 +190,11 @@ def create_scanner(
     config: ScanningConfig | None = None,
     log: LogFile | None = None,
     sleep_fn: Callable[[float], None] | None = None,
+    checkpoint_file: str | None = None,
+    resume: bool = False,
+    profiler: ScanProfiler | None = None,
+    counters: ScanCounters | None = None,
+    telemetry: ScanTelemetry | None = None,
 ) -> Scanning2:
     """Factory — returns a fully composed Scanning2 for *scan_mode*.
 
@@ -165,21 +215,43 @@ def create_scanner(
         provided.
     :param sleep_fn: Optional sleep callable injected into ScannerCore;
         pass a no-op lambda in tests to eliminate wall-time delays.
+    :param checkpoint_file: Optional path of a checkpoint file.  Frequency
+        scans periodically save their position there; ignored by bookmark
+        scans.
+    :param resume: When True and *checkpoint_file* holds a checkpoint for
+        the same scan parameters, the frequency scan continues from it
+        instead of starting at range_min.
+    :param profiler: Optional ScanProfiler; when given, the time of every
+        scan step is attributed to its phases and the report is logged at
+        the end of each scan.
+    :param counters: Optional ScanCounters updated by the scan, typically
+        shared by successive scans and read by a metrics exporter; a fresh
+        one is used when not provided.
+    :param telemetry: Optional ScanTelemetry publishing the progress of the
+        scan to its subscribers while it runs.
     :returns: A fully composed Scanning2 instance ready to call ``scan()``.
     :raises ValueError: If *scan_mode* is not a recognised mode.
     """
     strategy_cls = _SCANNER_REGISTRY.get(scan_mode.lower())
     if strategy_cls is None:
-        raise ValueError(f"Unsupported scan_mode {scan_mode!r}. " f"Supported modes: {list(_SCANNER_REGISTRY)}")
+        raise ValueError(f"Unsupported scan_mode {scan_mode!r}. Supported modes: {list(_SCANNER_REGISTRY)}")
 
     resolved_config = config or ScanningConfig()
     resolved_log = log or LogFile()
 
+    checkpoint = None
+    if checkpoint_file is not None and scan_mode.lower() == "frequency":
+        checkpoint = ScanCheckpointStore(checkpoint_file, resume=resume)
+
     core = ScannerCore(
         scan_queue=scan_queue,
         rigctl=rigctl,
         config=resolved_config,
         sleep_fn=sleep_fn,
+        checkpoint=checkpoint,
+        profiler=profiler,
+        counters=counters,
+        telemetry=telemetry,
     )
     strategy = strategy_cls(core)
 
@@ -187,4 +259,7 @@ def create_scanner(
         scanner=strategy,
         log=resolved_log,
         log_filename=log_filename,
+        profiler=profiler,
+        counters=core.counters,
+        telemetry=telemetry,
     )
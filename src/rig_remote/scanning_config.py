@@ -4,6 +4,11 @@ ScanningConfig dataclass — all tunable constants for a scanning session.
 
 from dataclasses import dataclass, field
 
+# Activity detectors of ScannerCore.signal_check.
+DETECTOR_LEVEL = "level"
+DETECTOR_SQUELCH = "squelch"
+DETECTORS = (DETECTOR_LEVEL, DETECTOR_SQUELCH)
+
 
 @dataclass
 class ScanningConfig:
@@ -20,6 +25,16 @@ class ScanningConfig:
         samples.
     :param valid_scan_update_event_names: Queue event names that are permitted
         to mutate the running ScanningTask during a scan.
+    :param detector: DETECTOR_LEVEL compares ``signal_checks`` level samples
+        with the signal level threshold; DETECTOR_SQUELCH reads the squelch
+        state of the rig once, falling back to level sampling on rigs that
+        do not report it.
+    :param merge_bandwidth: Hz; auto-bookmark hits at most this far from a
+        hit or a bookmark of the same modulation are merged into a single
+        bookmark at the strongest of them.  0 only merges hits on the same
+        frequency.
+    :raises ValueError: if *detector* is not one of DETECTORS, or
+        *merge_bandwidth* is negative.
     """
 
     # Seconds to wait after issuing a tune command before reading the signal.
@@ -45,6 +60,18 @@ class ScanningConfig:
         ]
     )
 
+    # How activity is detected, one of DETECTORS.
+    detector: str = DETECTOR_LEVEL
+
+    # Hz within which auto-bookmark hits are merged into one bookmark.
+    merge_bandwidth: int = 0
+
+    def __post_init__(self) -> None:
+        if self.detector not in DETECTORS:
+            raise ValueError(f"detector must be one of {DETECTORS}, got {self.detector!r}")
+        if self.merge_bandwidth < 0:
+            raise ValueError(f"merge_bandwidth must not be negative, got {self.merge_bandwidth}")
+
     def __eq__(self, other: object) -> bool:
         """Two ScanningConfigs are equal when all fields match.
 
@@ -59,4 +86,6 @@ class ScanningConfig:
             and self.signal_checks == other.signal_checks
             and self.no_signal_delay == other.no_signal_delay
             and self.valid_scan_update_event_names == other.valid_scan_update_event_names
+            and self.detector == other.detector
+            and self.merge_bandwidth == other.merge_bandwidth
         )
@@ -16,7 +16,10 @@ Copyright (c) 2015 Simone Marzona
 import logging
 import time
 
+from rig_remote.models.run_counters import SyncCounters
 from rig_remote.models.sync_task import SyncTask
+from rig_remote.rig_backends.resilient_rigctl import COMMUNICATION_ERRORS, ResilientRigCtl
+from rig_remote.rig_backends.serial_worker import background_priority
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +31,17 @@ class Syncing:
     """
 
     _SYNC_INTERVAL = 0.1
+    # Longest single sleep while a rig is unavailable, so that terminate()
+    # is honoured promptly.
+    _RIG_WAIT_SLICE = 0.5
 
-    def __init__(self) -> None:
+    def __init__(self, counters: SyncCounters | None = None) -> None:
+        """
+        :param counters: SyncCounters updated at every copy, typically shared
+            by successive syncs and read by a metrics exporter
+        """
         self.sync_active = True
+        self.counters = counters or SyncCounters()
 
     def terminate(self) -> None:
         logger.info("Terminating sync task")
@@ -43,16 +54,63 @@ class Syncing:
         :param task: object that represent a scanning task
         :param once: if True, the sync will stop after the first frequency change
         :returns: updates the scanning task object with the new activity found
+
+        Errors end the sync, except communication errors of a rig that is a
+        ResilientRigCtl: the sync then waits until the rigs accept calls
+        again and carries on.
         """
 
         logger.info("Starting sync from rig 1 to rig 2, task id %s", task.id)
-
-        while self.sync_active:
-            task.dst_rig.set_frequency(task.src_rig.get_frequency())
-            task.dst_rig.set_mode(task.src_rig.get_mode())
-            time.sleep(self._SYNC_INTERVAL)
-            if once:
-                self.terminate()
+        with background_priority():
+            while self.sync_active:
+                started = time.perf_counter()
+                # the rig of the call in progress, to tell which one failed
+                rig = task.src_rig
+                try:
+                    frequency = rig.get_frequency()
+                    rig = task.dst_rig
+                    rig.set_frequency(frequency)
+                    rig = task.src_rig
+                    mode = rig.get_mode()
+                    rig = task.dst_rig
+                    rig.set_mode(mode)
+                except COMMUNICATION_ERRORS:
+                    self.counters.errors += 1
+                    if not isinstance(rig, ResilientRigCtl):
+                        raise
+                    logger.warning("Rig unavailable, sync paused.")
+                    self._wait_for_rigs(task)
+                    continue
+                except Exception:
+                    self.counters.errors += 1
+                    raise
+                self.counters.last_lag = time.perf_counter() - started
+                self.counters.last_sync_time = time.time()
+                self.counters.syncs += 1
+                time.sleep(self._SYNC_INTERVAL)
+                if once:
+                    self.terminate()
         task.syncq.notify_end_of_scan()
         self.terminate()
         return task
+
+    @staticmethod
+    def _resilient_rigs(task: SyncTask) -> list[ResilientRigCtl]:
+        return [rig for rig in (task.src_rig, task.dst_rig) if isinstance(rig, ResilientRigCtl)]
+
+    def _wait_for_rigs(self, task: SyncTask) -> None:
+        """Sleep until the resilient rigs of *task* accept calls again, at
+        least _SYNC_INTERVAL: a breaker still closed after a failure lets the
+        next call through at once.
+        """
+        rigs = self._resilient_rigs(task)
+        waited = 0.0
+        while self.sync_active:
+            delay = max(rig.retry_in() for rig in rigs)
+            if delay <= 0:
+                if waited < self._SYNC_INTERVAL:
+                    time.sleep(self._SYNC_INTERVAL - waited)
+                return
+            pause = min(delay, self._RIG_WAIT_SLICE)
+            time.sleep(pause)
+            waited += pause
@@ -0,0 +1,184 @@
+"""
+Table model of the bookmark panel.
+
+BookmarksTableModel hands the Bookmark objects of the BookmarksManager to the
+bookmark view as they are: no widget item is created per bookmark and the
+view only asks for the cells of the rows on screen, so loading, sorting or
+scrolling 100k bookmarks costs a few list operations.
+
+The model sorts its own rows with a key per column, numeric for the
+frequency.  QSortFilterProxyModel would call back into Python for each
+comparison, which takes seconds on 100k rows.
+"""
+
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtGui import QBrush, QColor
+
+from rig_remote.models.bookmark import Bookmark
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("Frequency", "Mode", "Description")
+
+_LOCKED_BRUSH = QBrush(QColor("red"))
+_PRIORITY_BRUSH = QBrush(QColor("yellow"))
+
+_SORT_KEYS: tuple[Callable[[Bookmark], Any], ...] = (
+    lambda bookmark: int(bookmark.channel.frequency),
+    lambda bookmark: bookmark.channel.modulation.lower(),
+    lambda bookmark: bookmark.description.lower(),
+)
+
+_Index = QModelIndex | QPersistentModelIndex
+
+# Parent of the rows of a table.
+_ROOT = QModelIndex()
+
+
+class BookmarksTableModel(QAbstractTableModel):
+    """Frequency, mode and description of a list of bookmarks.
+
+    Locked out bookmarks are shown on a red background, priority ones on a
+    yellow background.  Rows keep the sort
+    order last requested by the view when bookmarks are added.
+    """
+
+    def __init__(self, parent: Any = None) -> None:
+        super().__init__(parent)
+        self._rows: list[Bookmark] = []
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    # ------------------------------------------------------------------
+    # QAbstractTableModel interface
+    # ------------------------------------------------------------------
+
+    def rowCount(self, parent: _Index = _ROOT) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: _Index = _ROOT) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index: _Index, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        bookmark = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            column = index.column()
+            if column == 0:
+                return str(bookmark.channel.frequency)
+            if column == 1:
+                return bookmark.channel.modulation
+            return bookmark.description
+        if role == Qt.ItemDataRole.BackgroundRole and bookmark.lockout == "L":
+            return _LOCKED_BRUSH
+        if role == Qt.ItemDataRole.BackgroundRole and bookmark.lockout == "P":
+            return _PRIORITY_BRUSH
+        return None
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """Sort the rows on *column*; -1 keeps the current order."""
+        if (column, order) == (self._sort_column, self._sort_order):
+            # rows are kept in this order as they are added
+            return
+        self._sort_column = column
+        self._sort_order = order
+        self._sort()
+
+    def _sort(self) -> None:
+        column, order = self._sort_column, self._sort_order
+        if column not in range(len(COLUMNS)):
+            return
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        tracked = [self._rows[index.row()] for index in persistent]
+        self._rows.sort(key=_SORT_KEYS[column], reverse=order == Qt.SortOrder.DescendingOrder)
+        if persistent:
+            rows = {id(bookmark): row for row, bookmark in enumerate(self._rows)}
+            moved = [
+                self.index(rows[id(bookmark)], index.column())
+                for bookmark, index in zip(tracked, persistent, strict=True)
+            ]
+            self.changePersistentIndexList(persistent, moved)
+        self.layoutChanged.emit()
+
+    # ------------------------------------------------------------------
+    # Bookmarks
+    # ------------------------------------------------------------------
+
+    def bookmark(self, row: int) -> Bookmark:
+        """Return the bookmark shown on *row*."""
+        return self._rows[row]
+
+    def bookmarks(self) -> list[Bookmark]:
+        """Return the bookmarks in display order."""
+        return list(self._rows)
+
+    def row_of(self, bookmark: Bookmark) -> int:
+        """Return the row of *bookmark*, or -1 if it is not shown."""
+        try:
+            return self._rows.index(bookmark)
+        except ValueError:
+            return -1
+
+    def append_bookmarks(self, bookmarks: Iterable[Bookmark]) -> None:
+        """Add *bookmarks*, then restore the sort order."""
+        new_rows = list(bookmarks)
+        if not new_rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(_ROOT, first, first + len(new_rows) - 1)
+        self._rows.extend(new_rows)
+        self.endInsertRows()
+        self._sort()
+
+    def insert_bookmark(self, bookmark: Bookmark) -> int:
+        """Add *bookmark* at its sorted position and return its row."""
+        row = self._insert_position(bookmark)
+        self.beginInsertRows(_ROOT, row, row)
+        self._rows.insert(row, bookmark)
+        self.endInsertRows()
+        return row
+
+    def _insert_position(self, bookmark: Bookmark) -> int:
+        if self._sort_column not in range(len(COLUMNS)):
+            return len(self._rows)
+        key = _SORT_KEYS[self._sort_column]
+        value = key(bookmark)
+        descending = self._sort_order == Qt.SortOrder.DescendingOrder
+        low, high = 0, len(self._rows)
+        while low < high:
+            middle = (low + high) // 2
+            current = key(self._rows[middle])
+            if (current >= value) if descending else (current <= value):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def remove_row(self, row: int) -> Bookmark:
+        """Remove the bookmark on *row* and return it."""
+        self.beginRemoveRows(_ROOT, row, row)
+        bookmark = self._rows.pop(row)
+        self.endRemoveRows()
+        return bookmark
+
+    def set_lockout(self, row: int, lockout: str) -> None:
+        """Change the lockout of the bookmark on *row*."""
+        self._rows[row].lockout = lockout
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(COLUMNS) - 1))
+
+    def clear(self) -> None:
+        """Remove all the bookmarks."""
+        self.beginResetModel()
+        self._rows = []
+        self.endResetModel()
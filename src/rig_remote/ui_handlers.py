@@ -1,10 +1,14 @@
 """
 UI event-handler mixin for Rig Remote.
 
-Contains bookmark import/export, rig-control, backend-selection, and
+Contains bookmark import/export, band plan loading, rig-control, backend-selection, and
 window-close callbacks for the RigRemote window.  Scan, sync, form-entry,
 and checkbox handlers live in RigRemoteScanHandlersMixin (ui_scan_handlers.py).
 
+The rig-control callbacks never talk to a rig on the GUI thread: they submit
+their commands to the RigCommandExecutor of the window and update the form
+when RigCommandRelay reports the result back on the GUI thread.
+
 This module is a mixin (RigRemoteHandlersMixin).  Concrete instance
 attributes it references are declared as class-level annotations so mypy
 can verify types; the actual values are set by RigRemote.__init__.
@@ -17,36 +21,68 @@ QWidget via a single contained cast.
 
 from __future__ import annotations
 
+import csv
 import logging
 import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from functools import partial
 from pathlib import Path
 from typing import Any, cast
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QObject, Qt, Signal
 from PySide6.QtWidgets import (
     QCheckBox,
     QFileDialog,
     QMessageBox,
     QPushButton,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTableView,
     QWidget,
 )
 
 from rig_remote.app_config import AppConfig
+from rig_remote.band_plan import load_band_plan
 from rig_remote.bookmarksmanager import BookmarksManager, bookmark_factory
+from rig_remote.exceptions import InvalidPathError
 from rig_remote.models.bookmark import Bookmark
 from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.models.scan_segment import ScanSegment
 from rig_remote.rig_backends.hamlib_rigctl import HamlibRigCtl
 from rig_remote.rig_backends.mode_translator import ModeTranslator
 from rig_remote.rig_backends.protocol import BackendType, RigBackend
+from rig_remote.rig_command_executor import RigCommandExecutor
 from rig_remote.scanning import Scanning2
 from rig_remote.stmessenger import STMessenger
 from rig_remote.syncing import Syncing
+from rig_remote.ui_bookmarks_model import BookmarksTableModel
 
 logger = logging.getLogger(__name__)
 
 
+class RigCommandRelay(QObject):
+    """Calls back on the GUI thread when a rig command completes."""
+
+    completed = Signal(object, object)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.completed.connect(self._call)
+
+    def watch(self, future: Future[Any], callback: Callable[[Future[Any]], None]) -> None:
+        """Call ``callback(future)`` on the GUI thread once *future* is done."""
+        future.add_done_callback(partial(self._done, callback))
+
+    def _done(self, callback: Callable[[Future[Any]], None], future: Future[Any]) -> None:
+        try:
+            self.completed.emit(callback, future)
+        except RuntimeError:
+            # the window was closed while the command was running
+            logger.debug("Rig command completed after the window was closed")
+
+    def _call(self, callback: Callable[[Future[Any]], None], future: Future[Any]) -> None:
+        callback(future)
+
+
 class RigRemoteHandlersMixin:
     """Mixin providing bookmark, rig-control, backend, and window-close handlers for RigRemote.
 
@@ -79,8 +115,12 @@ class RigRemoteHandlersMixin:
     scanning: Scanning2 | None
     syncing: Syncing | None
     new_bookmarks_list: list[Bookmark]
+    band_plan: list[ScanSegment]
     rigctl: list[RigBackend]
-    tree: QTreeWidget
+    rig_executor: RigCommandExecutor
+    rig_command_relay: RigCommandRelay
+    tree: QTableView
+    bookmark_model: BookmarksTableModel
     book_scan_toggle: QPushButton
     freq_scan_toggle: QPushButton
     sync_button: QPushButton
@@ -102,8 +142,7 @@ class RigRemoteHandlersMixin:
 
     def _insert_bookmarks(self, bookmarks: list[Bookmark], silent: bool = False) -> None: ...
 
-    @staticmethod
-    def _get_bookmark_from_item(item: QTreeWidgetItem) -> Bookmark: ...  # type: ignore[empty-body]
+    def _selected_row(self) -> int: ...  # type: ignore[empty-body]
 
     # ------------------------------------------------------------------
     # Qt window method stubs — provided by QMainWindow at runtime
@@ -196,6 +235,43 @@ class RigRemoteHandlersMixin:
         except OSError as err:
             QMessageBox.critical(self._parent(), "Export error", f"Could not export bookmarks:\n{err}")
 
+    # ------------------------------------------------------------------
+    # Band plan
+    # ------------------------------------------------------------------
+
+    def _load_band_plan_dialog(self) -> None:
+        """Prompt the user to select a band plan file for frequency scans."""
+        filename, _ = QFileDialog.getOpenFileName(
+            self._parent(),
+            "Load band plan",
+            "",
+            "CSV files (*.csv);;All files (*)",
+        )
+        if not filename:
+            return
+
+        self._load_band_plan(Path(filename))
+
+    def _load_band_plan(self, band_plan_path: Path) -> None:
+        """Load the band plan segments swept by the next frequency scans."""
+        try:
+            segments = load_band_plan(str(band_plan_path))
+        except (InvalidPathError, csv.Error) as err:
+            QMessageBox.critical(
+                self._parent(), "Band plan error", f"Could not load band plan {band_plan_path}:\n{err}"
+            )
+            return
+        if not segments:
+            QMessageBox.critical(self._parent(), "Band plan error", "No valid segment found in the band plan.")
+            return
+        self.band_plan = segments
+        logger.info("Band plan loaded, %i segments", len(segments))
+
+    def _clear_band_plan(self) -> None:
+        """Go back to scanning the form frequency range."""
+        self.band_plan = []
+        logger.info("Band plan cleared")
+
     # ------------------------------------------------------------------
     # Rig control
     # ------------------------------------------------------------------
@@ -214,20 +290,35 @@ class RigRemoteHandlersMixin:
         self.params[description].clear()
         self.params[mode].setCurrentIndex(-1)
 
+    def _run_rig_command(
+        self,
+        rig_number: int,
+        command: Callable[[], Any],
+        on_done: Callable[[Future[Any]], None],
+    ) -> None:
+        """Send *command* to the worker thread of the rig, call *on_done* on the GUI thread."""
+        self.rig_command_relay.watch(self.rig_executor.submit(rig_number, command), on_done)
+
     def cb_get_frequency(self, rig_endpoint: RigEndpoint, silent: bool = False) -> None:
         """Get current rig frequency and mode"""
         self._clear_form(rig_endpoint.number)
-        try:
-            frequency = self.rigctl[rig_endpoint.number - 1].get_frequency()
-            mode = self.rigctl[rig_endpoint.number - 1].get_mode()
-            txt_frequency = f"txt_frequency{rig_endpoint.number}"
-            self.params[txt_frequency].setText(str(frequency))
-            cbb_mode = f"cbb_mode{rig_endpoint.number}"
-            self.params[cbb_mode].setCurrentText(mode)
+        rig = self.rigctl[rig_endpoint.number - 1]
+
+        def read() -> tuple[Any, str]:
+            return rig.get_frequency(), rig.get_mode()
+
+        def done(future: Future[tuple[Any, str]]) -> None:
+            try:
+                frequency, mode = future.result()
+            except (OSError, TimeoutError, ValueError) as err:
+                if not silent:
+                    QMessageBox.critical(self._parent(), "Error", f"Could not connect to rig.\n{err}")
+                return
+            self.params[f"txt_frequency{rig_endpoint.number}"].setText(str(frequency))
+            self.params[f"cbb_mode{rig_endpoint.number}"].setCurrentText(mode)
             logger.info("Got frequency %s mode %s from rig %d", frequency, mode, rig_endpoint.number)
-        except (OSError, TimeoutError, ValueError) as err:
-            if not silent:
-                QMessageBox.critical(self._parent(), "Error", f"Could not connect to rig.\n{err}")
+
+        self._run_rig_command(rig_endpoint.number, read, done)
 
     def cb_set_frequency(self, rig_endpoint: RigEndpoint, silent: bool = False) -> None:
         """Set the rig frequency and mode"""
@@ -237,19 +328,35 @@ class RigRemoteHandlersMixin:
         mode = self.params[cbb_mode].currentText()
 
         try:
-            self.rigctl[0].set_frequency(int(frequency))
-            self.rigctl[0].set_mode(mode)
-            logger.info("Set frequency %s mode %s on rig 1", frequency, mode)
-        except (OSError, TimeoutError, ValueError) as err:
+            frequency_hz = int(frequency)
+        except ValueError as err:
             if not silent and (frequency != "" or mode != ""):
                 QMessageBox.critical(self._parent(), "Error", f"Could not set frequency.\n{err}")
             if not silent and (frequency == "" or mode == ""):
                 QMessageBox.critical(self._parent(), "Error", "Please provide frequency and mode.")
+            return
+
+        rig = self.rigctl[0]
+
+        def tune() -> None:
+            rig.set_frequency(frequency_hz)
+            rig.set_mode(mode)
+
+        def done(future: Future[None]) -> None:
+            try:
+                future.result()
+            except (OSError, TimeoutError, ValueError) as err:
+                if not silent:
+                    QMessageBox.critical(self._parent(), "Error", f"Could not set frequency.\n{err}")
+                return
+            logger.info("Set frequency %s mode %s on rig 1", frequency, mode)
+
+        self._run_rig_command(1, tune, done)
 
     def cb_autofill_form(self, rig_number: int) -> None:
         """Auto-fill bookmark fields with selected entry"""
-        current_item = cast(QTreeWidgetItem | None, self.tree.currentItem())
-        if current_item is None:
+        row = self._selected_row()
+        if row < 0:
             return
 
         self._clear_form(rig_number)
@@ -258,9 +365,10 @@ class RigRemoteHandlersMixin:
         txt_frequency = f"txt_frequency{rig_number}"
         txt_description = f"txt_description{rig_number}"
 
-        self.params[cbb_mode].setCurrentText(current_item.text(1))
-        self.params[txt_frequency].setText(current_item.text(0))
-        self.params[txt_description].setText(current_item.text(2))
+        bookmark = self.bookmark_model.bookmark(row)
+        self.params[cbb_mode].setCurrentText(bookmark.channel.modulation)
+        self.params[txt_frequency].setText(str(bookmark.channel.frequency))
+        self.params[txt_description].setText(bookmark.description)
 
     def build_control_source(self, number: int, silent: bool = False) -> dict[str, Any] | None:
         """Build control source dictionary"""
@@ -317,13 +425,11 @@ class RigRemoteHandlersMixin:
 
     def cb_delete(self, source: int) -> None:
         """Delete frequency from tree"""
-        current_item = self.tree.currentItem()
-        if not current_item:
+        row = self._selected_row()
+        if row < 0:
             return
 
-        self.bookmarks.delete_bookmark(self._get_bookmark_from_item(current_item))
-        index = self.tree.indexOfTopLevelItem(current_item)
-        self.tree.takeTopLevelItem(index)
+        self.bookmarks.delete_bookmark(self.bookmark_model.remove_row(row))
 
         # Save bookmarks
         self.bookmarks.save(bookmarks_file=self.bookmarks_file)
@@ -386,22 +492,25 @@ class RigRemoteHandlersMixin:
         )
         translator = ModeTranslator(BackendType.HAMLIB)
         rig = HamlibRigCtl(endpoint=endpoint, mode_translator=translator)
-        try:
-            self.freq_scan_toggle.setEnabled(False)
-            self.book_scan_toggle.setEnabled(False)
-            self.sync_button.setEnabled(False)
-            rig.connect()
-        except OSError as exc:
-            logger.error("Hamlib connect failed for rig %d: %s", rig_number, exc)
-            QMessageBox.critical(self._parent(), "Connection Error", f"Could not connect to rig:\n{exc}")
-            return
-        finally:
-            self.freq_scan_toggle.setEnabled(True)
-            self.book_scan_toggle.setEnabled(True)
-            self.sync_button.setEnabled(True)
-
-        self.rigctl[rig_number - 1] = rig
-        logger.info("Rig %d connected via Hamlib (model=%d port=%s)", rig_number, rig_model, serial_port)
+        self._set_scan_buttons_enabled(False)
+
+        def done(future: Future[None]) -> None:
+            self._set_scan_buttons_enabled(True)
+            try:
+                future.result()
+            except OSError as exc:
+                logger.error("Hamlib connect failed for rig %d: %s", rig_number, exc)
+                QMessageBox.critical(self._parent(), "Connection Error", f"Could not connect to rig:\n{exc}")
+                return
+            self.rigctl[rig_number - 1] = rig
+            logger.info("Rig %d connected via Hamlib (model=%d port=%s)", rig_number, rig_model, serial_port)
+
+        self._run_rig_command(rig_number, rig.connect, done)
+
+    def _set_scan_buttons_enabled(self, enabled: bool) -> None:
+        self.freq_scan_toggle.setEnabled(enabled)
+        self.book_scan_toggle.setEnabled(enabled)
+        self.sync_button.setEnabled(enabled)
 
     # ------------------------------------------------------------------
     # Window close
@@ -433,6 +542,7 @@ class RigRemoteHandlersMixin:
                 if self.syncing is not None:
                     self.syncing.terminate()
                 self.sync_thread.join(timeout=2)  # Wait max 2 seconds
+            self.rig_executor.shutdown()
             event.accept()
         else:
             event.ignore()
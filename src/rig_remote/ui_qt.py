@@ -2,7 +2,7 @@
 Main window class for Rig Remote.
 
 RigRemote owns instance state, initialisation, configuration application,
-and the bookmark-tree helpers.  All user-interaction callbacks live in
+and the bookmark-table helpers.  All user-interaction callbacks live in
 RigRemoteHandlersMixin (ui_handlers.py); all widget-building methods live
 in RigRemoteUIBuilder (ui_renderer.py).
 """
@@ -11,56 +11,37 @@ import logging
 import threading
 from typing import Any
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QBrush, QColor
 from PySide6.QtWidgets import (
     QCheckBox,
     QLineEdit,
     QMainWindow,
     QMessageBox,
-    QTreeWidgetItem,
 )
 
 from rig_remote.app_config import AppConfig
-from rig_remote.bookmarksmanager import BookmarksManager, bookmark_factory
+from rig_remote.bookmark_activity import BookmarkActivity
+from rig_remote.bookmarksmanager import BookmarksManager
 from rig_remote.constants import RIG_COUNT
 from rig_remote.models.bookmark import Bookmark
 from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.models.scan_segment import ScanSegment
 from rig_remote.queue_comms import QueueComms
 from rig_remote.rig_backends.gqrx_rigctl import GQRXRigCtl
 from rig_remote.rig_backends.hamlib_rigctl import HamlibRigCtl
 from rig_remote.rig_backends.mode_translator import ModeTranslator
 from rig_remote.rig_backends.protocol import BackendType, RigBackend
+from rig_remote.rig_command_executor import RigCommandExecutor
+from rig_remote.scan_telemetry import ScanTelemetry
 from rig_remote.scanning import Scanning2
 from rig_remote.stmessenger import STMessenger
 from rig_remote.syncing import Syncing
-from rig_remote.ui_handlers import RigRemoteHandlersMixin
-from rig_remote.ui_renderer import RigRemoteUIBuilder
-from rig_remote.ui_scan_handlers import RigRemoteScanHandlersMixin
+from rig_remote.ui_handlers import RigCommandRelay, RigRemoteHandlersMixin
+from rig_remote.ui_renderer import HamlibModelRelay, RigRemoteUIBuilder
+from rig_remote.ui_scan_handlers import RigRemoteScanHandlersMixin, ScanTelemetryRelay
 
 logger = logging.getLogger(__name__)
 
 
-class _BookmarkTreeItem(QTreeWidgetItem):
-    """QTreeWidgetItem with column-aware sorting for the bookmarks table.
-
-    Column 0 (Frequency) is compared numerically; columns 1 and 2
-    (Mode, Description) are compared case-insensitively as strings.
-    """
-
-    _NUMERIC_COLUMNS = {0}
-
-    def __lt__(self, other: QTreeWidgetItem) -> bool:
-        tree = self.treeWidget()
-        col = tree.sortColumn() if tree is not None else 0
-        if col in self._NUMERIC_COLUMNS:
-            try:
-                return int(self.text(col)) < int(other.text(col))
-            except ValueError:
-                pass
-        return self.text(col).lower() < other.text(col).lower()
-
-
 class RigRemote(QMainWindow, RigRemoteHandlersMixin, RigRemoteScanHandlersMixin, RigRemoteUIBuilder):
     """Remote application that interacts with the rig using rigctl protocol.
     Gqrx partially implements rigctl since version 2.3.
@@ -81,11 +62,21 @@ class RigRemote(QMainWindow, RigRemoteHandlersMixin, RigRemoteScanHandlersMixin,
         self.sync_thread: threading.Thread | None = None
         self.scan_mode: str | None = None
         self.scanning: Scanning2 | None = None
+        self.scan_telemetry: ScanTelemetry | None = None
+        self.telemetry_relay = ScanTelemetryRelay(self)
+        self.telemetry_relay.sample_received.connect(self._on_scan_telemetry)
+        self.hamlib_model_relay = HamlibModelRelay(self)
+        self.hamlib_model_relay.models_loaded.connect(self._fill_hamlib_models)
+        self.rig_executor = RigCommandExecutor()
+        self.rig_command_relay = RigCommandRelay(self)
         self.syncing: Syncing | None = None
         self.selected_bookmark = None
         self.scan_queue = STMessenger(queue_comms=QueueComms())
         self.sync_queue = STMessenger(queue_comms=QueueComms())
         self.new_bookmarks_list: list[Bookmark] = []
+        self.band_plan: list[ScanSegment] = []
+        # kept across scans, so adaptive bookmark scans build on the history
+        self.bookmark_activity = BookmarkActivity()
         self.rigctl: list[RigBackend] = []
 
         self._build_ui()
@@ -171,10 +162,21 @@ class RigRemote(QMainWindow, RigRemoteHandlersMixin, RigRemoteScanHandlersMixin,
 
         # Test positive integer values
         keys = [f"port{r}" for r in range(1, RIG_COUNT + 1)]
-        keys.extend(["interval", "delay", "passes", "range_min", "range_max", "inner_band", "inner_interval"])
+        keys.extend(
+            [
+                "interval",
+                "delay",
+                "passes",
+                "range_min",
+                "range_max",
+                "inner_band",
+                "inner_interval",
+                "priority_interval",
+            ]
+        )
         for key in keys:
             ekey = f"txt_{key}"
-            config_key_val = str(ac.config[key] or "")
+            config_key_val = str(ac.config.get(key) or "")
             if str.isdigit(config_key_val.replace(",", "")):
                 self.params[ekey].setText(config_key_val)
             else:
@@ -200,6 +202,7 @@ class RigRemote(QMainWindow, RigRemoteHandlersMixin, RigRemoteScanHandlersMixin,
 
         # Set checkboxes
         self.params["ckb_auto_bookmark"].setChecked(str(ac.config.get("auto_bookmark") or "false").lower() == "true")
+        self.params["ckb_adaptive_scan"].setChecked(str(ac.config.get("adaptive_scan") or "false").lower() == "true")
         self.params["ckb_record"].setChecked(str(ac.config.get("record") or "false").lower() == "true")
         self.params["ckb_wait"].setChecked(str(ac.config.get("wait") or "false").lower() == "true")
         self.params["ckb_log"].setChecked(str(ac.config.get("log") or "false").lower() == "true")
@@ -226,23 +229,13 @@ class RigRemote(QMainWindow, RigRemoteHandlersMixin, RigRemoteScanHandlersMixin,
                 self.params_last_content[key] = str(widget.isChecked())
 
     # ------------------------------------------------------------------
-    # Bookmark tree helpers
+    # Bookmark table helpers
     # ------------------------------------------------------------------
 
     def _insert_bookmarks(self, bookmarks: list[Bookmark], silent: bool = False) -> None:
         """Insert bookmarks into tree view"""
         logger.info("adding %i bookmarks", len(bookmarks))
-        for entry in bookmarks:
-            item = _BookmarkTreeItem(self.tree)
-            item.setText(0, str(entry.channel.frequency))
-            item.setText(1, entry.channel.modulation)
-            item.setText(2, entry.description)
-            item.setData(0, Qt.ItemDataRole.UserRole, entry.lockout)
-
-            if entry.lockout == "L":
-                item.setBackground(0, QBrush(QColor("red")))
-                item.setBackground(1, QBrush(QColor("red")))
-                item.setBackground(2, QBrush(QColor("red")))
+        self.bookmark_model.append_bookmarks(bookmarks)
 
     def _add_new_bookmark(self, bookmark: Bookmark) -> None:
         """adds new bookmark to the tree, to the bookmark object and saves bookmarks
@@ -250,35 +243,24 @@ class RigRemote(QMainWindow, RigRemoteHandlersMixin, RigRemoteScanHandlersMixin,
         Args:
             bookmark (Bookmark): bookmark object to add
         """
-        item = _BookmarkTreeItem()
         if self.bookmarks.add_bookmark(bookmark):
-            item.setText(0, str(bookmark.channel.frequency))
-            item.setText(1, bookmark.channel.modulation)
-            item.setText(2, bookmark.description)
-            item.setData(0, Qt.ItemDataRole.UserRole, bookmark.lockout)
-            self.tree.addTopLevelItem(item)
-
-        self.tree.setCurrentItem(item)
-        self.tree.scrollToItem(item)
+            row = self.bookmark_model.insert_bookmark(bookmark)
+        else:
+            row = self.bookmark_model.row_of(bookmark)
+
+        if row >= 0:
+            index = self.bookmark_model.index(row, 0)
+            self.tree.setCurrentIndex(index)
+            self.tree.scrollTo(index)
         # Save bookmarks
         self.bookmarks.save(bookmarks_file=self.bookmarks_file)
         logger.info("Bookmark saved: %s at %s Hz", bookmark.description, bookmark.channel.frequency)
 
     def _extract_bookmarks(self) -> list[Bookmark]:
         """Extract bookmarks from tree"""
-        bookmark_list = []
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            if item is not None:
-                bookmark_list.append(self._get_bookmark_from_item(item))
-        return bookmark_list
-
-    @staticmethod
-    def _get_bookmark_from_item(item: QTreeWidgetItem) -> Bookmark:
-        """Get bookmark object from tree item"""
-        return bookmark_factory(
-            input_frequency=int(item.text(0)),
-            modulation=item.text(1),
-            description=item.text(2),
-            lockout=str(item.data(0, Qt.ItemDataRole.UserRole)),
-        )
+        return self.bookmark_model.bookmarks()
+
+    def _selected_row(self) -> int:
+        """Return the row of the selected bookmark, or -1 without selection"""
+        index = self.tree.currentIndex()
+        return index.row() if index.isValid() else -1
@@ -6,63 +6,45 @@ It is designed as a mixin class to be used with the main RigRemote class.
 """
 
 import logging
-import re
-import subprocess
 from typing import Any
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QObject, Qt, Signal
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QCheckBox,
     QComboBox,
     QGridLayout,
     QGroupBox,
+    QHeaderView,
     QLabel,
     QLineEdit,
     QPushButton,
-    QTreeWidget,
+    QTableView,
     QWidget,
 )
 
 from rig_remote.constants import RIG_COUNT
+from rig_remote.hamlib_models import HAMLIB_MODEL_FALLBACK, HamlibModelLoader
 from rig_remote.models.modulation_modes import ModulationModes
 from rig_remote.models.rig_endpoint import RigEndpoint
 from rig_remote.rig_backends.protocol import RigBackend
+from rig_remote.ui_bookmarks_model import BookmarksTableModel
 
 logger = logging.getLogger(__name__)
 
-_HAMLIB_MODEL_FALLBACK: list[str] = [
-    "1 (Hamlib Dummy)",
-    "122 (Yaesu FT-857)",
-    "209 (Kenwood TS-2000)",
-    "361 (Icom IC-7300)",
-]
 
+class HamlibModelRelay(QObject):
+    """Hands the models found by a HamlibModelLoader to the GUI thread."""
 
-def _load_hamlib_models() -> list[str]:
-    """Return all Hamlib rig models as combo-box strings by querying rigctl.
+    models_loaded = Signal(list)
 
-    Falls back to a short hardcoded list when rigctl is not on PATH.
-    Each entry has the format "<num> (<Mfg> <Model>)" so that
-    int(entry.split()[0]) always yields the model number.
-    """
-    try:
-        output = subprocess.check_output(["rigctl", "--list"], text=True, timeout=5)
-    except Exception:
-        logger.warning("rigctl not found on PATH; using fallback Hamlib model list")
-        return list(_HAMLIB_MODEL_FALLBACK)
-
-    entries: list[tuple[int, str]] = []
-    for line in output.splitlines():
-        parts = re.split(r"\s{2,}", line.strip())
-        if len(parts) >= 3 and parts[0].isdigit():
-            num = int(parts[0])
-            entries.append((num, f"{num} ({parts[1]} {parts[2]})"))
-
-    if not entries:
-        logger.warning("rigctl returned no parseable models; using fallback list")
-        return list(_HAMLIB_MODEL_FALLBACK)
-
-    return [label for _, label in sorted(entries)]
+    def deliver(self, models: list[str]) -> None:
+        """Emit *models*; called on the loader thread."""
+        try:
+            self.models_loaded.emit(models)
+        except RuntimeError:
+            # the window was closed before the models were loaded
+            logger.debug("Hamlib models loaded after the window was closed")
 
 
 class RigRemoteUIBuilder:
@@ -72,13 +54,16 @@ class RigRemoteUIBuilder:
     params: dict[str, Any]
     params_last_content: dict[str, str]
     rigctl: list[RigBackend]
-    tree: QTreeWidget
+    tree: QTableView
+    bookmark_model: BookmarksTableModel
+    hamlib_model_relay: HamlibModelRelay
     ckb_top: QCheckBox
     ckb_save_exit: QCheckBox
     sync_button: QPushButton
     freq_scan_toggle: QPushButton
     book_scan_toggle: QPushButton
     book_lockout: QPushButton
+    book_priority: QPushButton
 
     def setWindowTitle(self, title: str) -> None: ...
     def setMinimumSize(self, width: int, height: int) -> None: ...
@@ -95,6 +80,7 @@ class RigRemoteUIBuilder:
     def frequency_toggle(self) -> None: ...
     def bookmark_toggle(self) -> None: ...
     def bookmark_lockout(self) -> None: ...
+    def bookmark_priority(self) -> None: ...
     def sync_toggle(self) -> None: ...
     def toggle_cb_top(self, state: int) -> None: ...
     def add_bookmark_from_rig(self, rig_number: int) -> None: ...
@@ -106,6 +92,8 @@ class RigRemoteUIBuilder:
     def _import_bookmarks_dialog(self) -> None: ...
     def _export_gqrx(self) -> None: ...
     def _export_rig_remote(self) -> None: ...
+    def _load_band_plan_dialog(self) -> None: ...
+    def _clear_band_plan(self) -> None: ...
     def _on_backend_changed(self, rig_number: int) -> None: ...
     def cb_connect_rig(self, rig_number: int) -> None: ...
 
@@ -127,16 +115,41 @@ class RigRemoteUIBuilder:
         self._build_sync_menu(main_layout)
         self._build_control_menu(main_layout)
         self._build_menu()
+        self._load_hamlib_models()
+
+    def _load_hamlib_models(self) -> None:
+        """Fill the rig model combo boxes once rigctl has listed its models."""
+        HamlibModelLoader(self.hamlib_model_relay.deliver).start()
+
+    def _fill_hamlib_models(self, models: list[str]) -> None:
+        """Replace the rig models offered, keeping the selected model."""
+        for rig_number in range(1, RIG_COUNT + 1):
+            combo = self.params[f"cbb_rig_model{rig_number}"]
+            selected = combo.currentText().split(" ", 1)[0]
+            combo.clear()
+            combo.addItems(models)
+            for index, model in enumerate(models):
+                if model.split(" ", 1)[0] == selected:
+                    combo.setCurrentIndex(index)
+                    break
 
     def _build_tree_view(self, layout: QGridLayout) -> None:
-        """Build the bookmarks tree view"""
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(["Frequency", "Mode", "Description"])
+        """Build the bookmarks table view"""
+        self.tree = QTableView()
+        self.bookmark_model = BookmarksTableModel(self.tree)
+        self.tree.setModel(self.bookmark_model)
+        self.tree.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.tree.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.tree.setShowGrid(False)
+        # fixed row heights keep the view from measuring every row
+        self.tree.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.tree.verticalHeader().hide()
+        self.tree.horizontalHeader().setStretchLastSection(True)
         self.tree.setColumnWidth(0, 100)
         self.tree.setColumnWidth(1, 70)
         self.tree.setToolTip("Your bookmark list")
         self.tree.setSortingEnabled(True)
-        self.tree.header().setSectionsClickable(True)
+        self.tree.horizontalHeader().setSectionsClickable(True)
         self.tree.sortByColumn(0, Qt.SortOrder.AscendingOrder)
         layout.addWidget(self.tree, 0, 0, 6, 1)
 
@@ -178,7 +191,8 @@ class RigRemoteUIBuilder:
 
         cbb_rig_model = f"cbb_rig_model{rig_number}"
         self.params[cbb_rig_model] = QComboBox()
-        self.params[cbb_rig_model].addItems(_load_hamlib_models())
+        # replaced by the full catalogue once _load_hamlib_models() is done
+        self.params[cbb_rig_model].addItems(HAMLIB_MODEL_FALLBACK)
         self.params[cbb_rig_model].setToolTip("Hamlib rig model")
         self.params[cbb_rig_model].setVisible(False)
         grid.addWidget(self.params[cbb_rig_model], 3, 1)
@@ -392,6 +406,28 @@ class RigRemoteUIBuilder:
         self.book_lockout.clicked.connect(self.bookmark_lockout)
         grid.addWidget(self.book_lockout, 0, 3)
 
+        self.book_priority = QPushButton("Priority")
+        self.book_priority.setToolTip("Toggle checking selected bookmark every priority interval steps of any scan.")
+        self.book_priority.clicked.connect(self.bookmark_priority)
+        grid.addWidget(self.book_priority, 0, 2)
+
+        self.params["ckb_adaptive_scan"] = QCheckBox("adaptive")
+        self.params["ckb_adaptive_scan"].setToolTip(
+            "Visit the busiest bookmarks first and the long silent ones less often."
+        )
+        grid.addWidget(self.params["ckb_adaptive_scan"], 1, 1)
+
+        grid.addWidget(QLabel("Priority interval:"), 2, 0)
+        self.params["txt_priority_interval"] = QLineEdit()
+        self.params["txt_priority_interval"].setToolTip(
+            "Scan steps between two checks of the priority bookmarks. Set to 0 to disable."
+        )
+        self.params["txt_priority_interval"].editingFinished.connect(
+            lambda: self.process_entry_wrapper("txt_priority_interval")
+        )
+        grid.addWidget(self.params["txt_priority_interval"], 2, 1)
+        grid.addWidget(QLabel("steps"), 2, 2)
+
         group.setLayout(grid)
         layout.addWidget(group, 3, 4)
 
@@ -448,3 +484,10 @@ class RigRemoteUIBuilder:
         export_gqrx.triggered.connect(self._export_gqrx)
         export_rig = export_menu.addAction("Export rig-remote")
         export_rig.triggered.connect(self._export_rig_remote)
+
+        # Scanning menu
+        scanning_menu = menubar.addMenu("Scanning")
+        load_band_plan = scanning_menu.addAction("Load band plan")
+        load_band_plan.triggered.connect(self._load_band_plan_dialog)
+        clear_band_plan = scanning_menu.addAction("Clear band plan")
+        clear_band_plan.triggered.connect(self._clear_band_plan)
@@ -8,6 +8,10 @@ This module is a mixin (RigRemoteScanHandlersMixin).  Concrete instance
 attributes it references are declared as class-level annotations so mypy
 can verify types; the actual values are set by RigRemote.__init__.
 
+Scans report their progress through a ScanTelemetry; ScanTelemetryRelay
+re-emits its samples as a Qt signal, so they are handled on the GUI thread
+while the scan thread carries on.
+
 Qt static methods (QMessageBox) require a QWidget parent.  At runtime
 ``self`` is always a QMainWindow; use ``self._parent()`` at call sites.
 """
@@ -16,32 +20,38 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import Any, NamedTuple, cast
+from collections.abc import Callable
+from functools import partial
+from typing import Any, NamedTuple
 
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QBrush, QColor
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QMessageBox,
     QPushButton,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QStatusBar,
+    QTableView,
     QWidget,
 )
 
 from rig_remote.app_config import AppConfig
+from rig_remote.bookmark_activity import BookmarkActivity
 from rig_remote.exceptions import (
     UnsupportedScanningConfigError,
     UnsupportedSyncConfigError,
 )
 from rig_remote.models.bookmark import Bookmark
 from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.models.scan_segment import ScanSegment
 from rig_remote.models.scanning_task import ScanningTask
 from rig_remote.models.sync_task import SyncTask
 from rig_remote.rig_backends.hamlib_rigctl import HamlibRigCtl
 from rig_remote.rig_backends.protocol import RigBackend
+from rig_remote.rig_backends.resilient_rigctl import ResilientRigCtl
+from rig_remote.scan_telemetry import ScanTelemetry, TelemetrySample
 from rig_remote.scanning import Scanning2, create_scanner
 from rig_remote.stmessenger import STMessenger
 from rig_remote.syncing import Syncing
+from rig_remote.ui_bookmarks_model import BookmarksTableModel
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +63,21 @@ class _WidgetEvent(NamedTuple):
     widget_name: str
 
 
+class ScanTelemetryRelay(QObject):
+    """Re-emits the samples of ScanTelemetry instances as a Qt signal.
+
+    ScanTelemetry calls its subscribers on the scan thread; the signal queues
+    each sample to the slots of the GUI thread, with the telemetry it came
+    from so that samples of an earlier scan can be told apart.
+    """
+
+    sample_received = Signal(object, object)
+
+    def attach(self, telemetry: ScanTelemetry) -> Callable[[], None]:
+        """Relay the samples of *telemetry*; returns the unsubscribe function."""
+        return telemetry.subscribe(partial(self.sample_received.emit, telemetry))
+
+
 class RigRemoteScanHandlersMixin:
     """Mixin providing scan, sync, form-entry, and checkbox event handlers for RigRemote.
 
@@ -78,10 +103,15 @@ class RigRemoteScanHandlersMixin:
     sync_thread: threading.Thread | None
     scan_mode: str | None
     scanning: Scanning2 | None
+    scan_telemetry: ScanTelemetry | None
+    telemetry_relay: ScanTelemetryRelay
     syncing: Syncing | None
     new_bookmarks_list: list[Bookmark]
+    band_plan: list[ScanSegment]
+    bookmark_activity: BookmarkActivity
     rigctl: list[RigBackend]
-    tree: QTreeWidget
+    tree: QTableView
+    bookmark_model: BookmarksTableModel
     book_scan_toggle: QPushButton
     freq_scan_toggle: QPushButton
     sync_button: QPushButton
@@ -97,11 +127,14 @@ class RigRemoteScanHandlersMixin:
 
     def _add_new_bookmark(self, bookmark: Bookmark) -> None: ...
 
+    def _selected_row(self) -> int: ...  # type: ignore[empty-body]
+
     def _parent(self) -> QWidget: ...  # type: ignore[empty-body]
 
     def windowFlags(self) -> Qt.WindowType: ...  # type: ignore[empty-body]
     def setWindowFlags(self, flags: Qt.WindowType) -> None: ...
     def show(self) -> None: ...
+    def statusBar(self) -> QStatusBar: ...  # type: ignore[empty-body]
 
     # ------------------------------------------------------------------
     # Entry / form processing
@@ -291,8 +324,8 @@ class RigRemoteScanHandlersMixin:
             try:
                 task = SyncTask(
                     self.sync_queue,
-                    self.rigctl[1],
-                    self.rigctl[0],
+                    ResilientRigCtl(self.rigctl[1]),
+                    ResilientRigCtl(self.rigctl[0]),
                 )
             except UnsupportedSyncConfigError:
                 QMessageBox.critical(self._parent(), "Sync error", "Hostname/port of both rigs must be specified")
@@ -321,23 +354,25 @@ class RigRemoteScanHandlersMixin:
 
     def bookmark_lockout(self) -> None:
         """Toggle lockout of selected bookmark"""
-        current_item = cast(QTreeWidgetItem | None, self.tree.currentItem())
-        if current_item is None:
+        row = self._selected_row()
+        if row < 0:
             return
 
-        lockout = current_item.data(0, Qt.ItemDataRole.UserRole)
+        lockout = self.bookmark_model.bookmark(row).lockout
         new_lockout = "O" if lockout == "L" else "L"
-        current_item.setData(0, Qt.ItemDataRole.UserRole, new_lockout)
+        self.bookmark_model.set_lockout(row, new_lockout)
         logger.info("Bookmark lockout toggled: %s → %s", lockout, new_lockout)
 
-        if new_lockout == "L":
-            current_item.setBackground(0, QBrush(QColor("red")))
-            current_item.setBackground(1, QBrush(QColor("red")))
-            current_item.setBackground(2, QBrush(QColor("red")))
-        else:
-            current_item.setBackground(0, QBrush(QColor("white")))
-            current_item.setBackground(1, QBrush(QColor("white")))
-            current_item.setBackground(2, QBrush(QColor("white")))
+    def bookmark_priority(self) -> None:
+        """Toggle priority of selected bookmark"""
+        row = self._selected_row()
+        if row < 0:
+            return
+
+        lockout = self.bookmark_model.bookmark(row).lockout
+        new_lockout = "O" if lockout == "P" else "P"
+        self.bookmark_model.set_lockout(row, new_lockout)
+        logger.info("Bookmark priority toggled: %s → %s", lockout, new_lockout)
 
     def frequency_toggle(self) -> None:
         """Toggle frequency scan Start/Stop"""
@@ -354,19 +389,28 @@ class RigRemoteScanHandlersMixin:
             )
 
     # ------------------------------------------------------------------
-    # Scan thread monitor (timer callbacks)
+    # Scan progress and thread monitor
     # ------------------------------------------------------------------
 
-    def check_scan_thread(self) -> None:
-        """Check if scan thread has terminated"""
-        if self.scan_queue.check_end_of_scan():
-            if self.scan_mode == "frequency":
-                self.frequency_toggle()
-            else:
-                self.bookmark_toggle()
+    def _on_scan_telemetry(self, telemetry: ScanTelemetry, sample: TelemetrySample) -> None:
+        """Show the progress of the running scan and toggle it off when it ends."""
+        if telemetry is not self.scan_telemetry:
+            # sample of a scan already stopped from the UI
+            return
+        for new_bookmark in sample.new_bookmarks:
+            logger.info("Adding new bookmark: %s, ID: %s", new_bookmark.description, new_bookmark.id)
+            self._add_new_bookmark(bookmark=new_bookmark)
+        if not sample.done:
+            self.statusBar().showMessage(
+                f"Scanning {sample.frequency:,} Hz, level {sample.level}, {sample.hits} hits in {sample.steps} steps"
+            )
+            return
+        self.statusBar().showMessage(f"Scan ended, {sample.hits} hits in {sample.steps} steps")
+        self.scan_queue.check_end_of_scan()
+        if self.scan_mode == "frequency":
+            self.frequency_toggle()
         else:
-            if self.scan_thread is not None:
-                QTimer.singleShot(self._UI_TIMER_INTERVAL_MS, self.check_scan_thread)
+            self.bookmark_toggle()
 
     def check_sync_thread(self) -> None:
         """Check if sync thread has terminated"""
@@ -398,6 +442,7 @@ class RigRemoteScanHandlersMixin:
                 self.scanning.terminate()
             self.scan_thread.join()
             self.scan_thread = None
+            self.scan_telemetry = None
             if scan_mode.lower() == "frequency":
                 logger.info("adding %i collected bookmarks...", len(self.new_bookmarks_list))
                 for new_bookmark in self.new_bookmarks_list:
@@ -416,7 +461,7 @@ class RigRemoteScanHandlersMixin:
             return
 
         if action.lower() == "start" and self.scan_thread is None:
-            if self.tree.topLevelItemCount() == 0 and scan_mode == "bookmarks":
+            if self.bookmark_model.rowCount() == 0 and scan_mode == "bookmarks":
                 if not silent:
                     QMessageBox.critical(self._parent(), "Error", "No bookmarks to scan.")
                 self.bookmark_toggle()
@@ -439,13 +484,21 @@ class RigRemoteScanHandlersMixin:
                     bookmarks=self.new_bookmarks_list,
                     inner_band=int(self.params["txt_inner_band"].text().replace(",", "")),
                     inner_interval=int(self.params["txt_inner_interval"].text().replace(",", "")),
+                    segments=self.band_plan if scan_mode == "frequency" else None,
+                    bookmark_activity=self.bookmark_activity if self.params["ckb_adaptive_scan"].isChecked() else None,
+                    priority_bookmarks=[
+                        bookmark for bookmark in self.bookmark_model.bookmarks() if bookmark.lockout == "P"
+                    ],
+                    priority_interval=int(self.params["txt_priority_interval"].text().replace(",", "")),
                 )
+                self.scan_telemetry = ScanTelemetry()
+                self.telemetry_relay.attach(self.scan_telemetry)
                 self.scanning = create_scanner(
                     scan_mode=scan_mode,
                     scan_queue=self.scan_queue,
                     log_filename=self.log_file,
-                    rigctl=self.rigctl[0],  # all scanning activities are performed using rig 1
+                    rigctl=ResilientRigCtl(self.rigctl[0]),  # all scanning activities are performed using rig 1
+                    telemetry=self.scan_telemetry,
                 )
                 self.scan_thread = threading.Thread(target=self.scanning.scan, args=(task,))
                 self.scan_thread.start()
-                QTimer.singleShot(0, self.check_scan_thread)
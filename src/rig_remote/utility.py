@@ -14,6 +14,8 @@ TAS - Tim Sweeney - mainetim@gmail.com
 """
 
 import logging
+import os
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -28,3 +30,48 @@ def khertz_to_hertz(value: int) -> int:
         logger.error("khertz_to_hertz: value must be an integer, got %s", type(value))  # type: ignore[unreachable]
         raise TypeError("value must be an integer")
     return value * 1000
+
+
+def log_configuration(verbose: bool) -> logging.Logger:
+    """
+    Configure logging and return the root logger with an explicit level set.
+    Ensures time.tzset is called if available and that handlers use the same level.
+    """
+    level = logging.INFO if verbose else logging.WARNING
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+
+    # Call tzset if available (harmless)
+    try:
+        if hasattr(time, "tzset"):
+            time.tzset()
+    except OSError:
+        pass
+
+    # Ensure at least one handler exists and synchronize handler levels
+    if not root_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setLevel(level)
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        handler.setFormatter(formatter)
+        root_logger.addHandler(handler)
+    else:
+        for h in root_logger.handlers:
+            try:
+                h.setLevel(level)
+            except (AttributeError, ValueError):
+                pass
+
+    return root_logger
+
+
+def process_path(path: str) -> str:
+    """Handle tilde expansion in a path.
+
+    :param path: path to expand
+    """
+
+    working_path, working_name = os.path.split(path)
+    if working_path:
+        working_path = os.path.expanduser(working_path)
+    return os.path.join(working_path, working_name)
@@ -1,10 +1,10 @@
 import os
 from pathlib import Path
-from rig_remote.app_config import AppConfig
+from rig_remote.app_config import AppConfig, _section_to_endpoint
 import pytest
 import configparser
 from rig_remote.constants import RIG_COUNT, CONFIG_SECTIONS, MAX_ENDPOINTS, SELECTED_RIG_KEYS
-from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.models.rig_endpoint import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT, RigEndpoint
 from rig_remote.rig_backends.protocol import BackendType
 from unittest.mock import Mock, patch
 
@@ -280,6 +280,7 @@ def test_appconfig_get_conf_populates_from_window():
         "txt_passes": FakeWidget("5"),
         "txt_inner_band": FakeWidget("0"),
         "txt_inner_interval": FakeWidget("0"),
+        "txt_priority_interval": FakeWidget("0"),
         "txt_sgn_level": FakeWidget("-20"),
         "txt_range_min": FakeWidget("24000"),
         "txt_range_max": FakeWidget("1800000"),
@@ -287,6 +288,7 @@ def test_appconfig_get_conf_populates_from_window():
         "ckb_record": FakeWidget(True),
         "ckb_log": FakeWidget(False),
         "ckb_auto_bookmark": FakeWidget(True),
+        "ckb_adaptive_scan": FakeWidget(False),
     }
 
     window = type("W", (), {})()
@@ -386,6 +388,7 @@ def test_appconfig_store_conf_calls_get_conf_and_write_conf():
         "txt_passes": FakeWidget("5"),
         "txt_inner_band": FakeWidget("0"),
         "txt_inner_interval": FakeWidget("0"),
+        "txt_priority_interval": FakeWidget("0"),
         "txt_sgn_level": FakeWidget("-20"),
         "txt_range_min": FakeWidget("24000"),
         "txt_range_max": FakeWidget("1800000"),
@@ -393,6 +396,7 @@ def test_appconfig_store_conf_calls_get_conf_and_write_conf():
         "ckb_record": FakeWidget(True),
         "ckb_log": FakeWidget(False),
         "ckb_auto_bookmark": FakeWidget(True),
+        "ckb_adaptive_scan": FakeWidget(False),
     }
 
     window = type("W", (), {})()
@@ -617,6 +621,28 @@ def test_write_conf_writes_endpoint_sections(tmp_path):
     assert loaded.get("rigendpoint.1", "backend").upper() == "HAMLIB"
 
 
+def test_endpoint_timeouts_round_trip(tmp_path):
+    cfg_path = tmp_path / "timeouts.ini"
+    ac = AppConfig(config_file=str(cfg_path))
+    ac.config = {k: (v if v is not None else "") for k, v in AppConfig.DEFAULT_CONFIG.items()}
+    ac.rig_endpoints = [
+        RigEndpoint(hostname="127.0.0.1", port=7356, number=1, connect_timeout=1.5, read_timeout=0.25)
+    ]
+    ac._write_conf()
+
+    loaded = configparser.RawConfigParser()
+    loaded.read(str(cfg_path))
+    endpoint = _section_to_endpoint(dict(loaded.items("rigendpoint.0")))
+    assert endpoint.connect_timeout == 1.5
+    assert endpoint.read_timeout == 0.25
+
+
+def test_endpoint_section_without_timeouts_uses_defaults():
+    endpoint = _section_to_endpoint({"backend": "GQRX", "hostname": "127.0.0.1", "port": "7356"})
+    assert endpoint.connect_timeout == DEFAULT_CONNECT_TIMEOUT
+    assert endpoint.read_timeout == DEFAULT_READ_TIMEOUT
+
+
 def test_write_endpoints_evicts_oldest_when_over_max(tmp_path):
     cfg_path = tmp_path / "evict.ini"
     ac = AppConfig(config_file=str(cfg_path))
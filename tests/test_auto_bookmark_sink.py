@@ -0,0 +1,132 @@
+import pytest
+
+from rig_remote.auto_bookmark_sink import AUTO_BOOKMARK_DESCRIPTION, AutoBookmarkSink
+from rig_remote.bookmarksmanager import bookmark_factory
+from rig_remote.models.scanning_task import ScanningTask
+
+
+def _task(**kw) -> ScanningTask:
+    defaults = dict(
+        frequency_modulation="FM",
+        scan_mode="frequency",
+        new_bookmarks_list=[],
+        range_min=100_000_000,
+        range_max=100_500_000,
+        interval=100_000,
+        delay=0,
+        passes=1,
+        sgn_level=-40,
+        wait=False,
+        record=False,
+        auto_bookmark=True,
+        log=False,
+        bookmarks=[],
+    )
+    defaults.update(kw)
+    return ScanningTask(**defaults)
+
+
+def _bm(freq: int, modulation: str = "FM"):
+    return bookmark_factory(input_frequency=freq, modulation=modulation, description="test", lockout="")
+
+
+def _frequencies(bookmarks) -> list[int]:
+    return [bm.channel.frequency for bm in bookmarks]
+
+
+def test_auto_bookmark_sink_flush_appends_to_task():
+    task = _task()
+    sink = AutoBookmarkSink(task)
+    assert sink.add(100_000_000, "FM") is True
+    assert len(sink) == 1
+    assert task.new_bookmarks_list == []
+    [bm] = sink.flush()
+    assert task.new_bookmarks_list == [bm]
+    assert bm.channel.modulation == "FM"
+    assert bm.description == AUTO_BOOKMARK_DESCRIPTION
+    assert len(sink) == 0
+    assert sink.flush() == []
+
+
+def test_auto_bookmark_sink_without_bandwidth_merges_same_frequency_only():
+    task = _task()
+    sink = AutoBookmarkSink(task)
+    assert sink.add(100_000_000, "FM") is True
+    assert sink.add(100_000_000, "FM") is False
+    assert sink.add(100_000_001, "FM") is True
+    assert sink.add(100_000_000, "AM") is True
+    assert _frequencies(sink.flush()) == [100_000_000, 100_000_001, 100_000_000]
+
+
+def test_auto_bookmark_sink_skips_task_bookmarks():
+    task = _task(bookmarks=[_bm(100_000_000)], new_bookmarks_list=[_bm(101_000_000)])
+    sink = AutoBookmarkSink(task, merge_bandwidth=10_000)
+    assert sink.add(100_005_000, "FM") is False
+    assert sink.add(100_995_000, "FM") is False
+    assert sink.add(100_005_000, "AM") is True
+    assert len(sink) == 1
+
+
+def test_auto_bookmark_sink_merges_to_strongest_hit():
+    task = _task()
+    sink = AutoBookmarkSink(task, merge_bandwidth=10_000)
+    assert sink.add(100_000_000, "FM", -300) is True
+    assert sink.add(100_010_000, "FM", -100) is False
+    assert sink.add(100_020_000, "FM", -200) is False
+    # beyond the bandwidth of the cluster [100.00, 100.02] MHz
+    assert sink.add(100_030_001, "FM", -50) is True
+    assert _frequencies(sink.flush()) == [100_010_000, 100_030_001]
+
+
+def test_auto_bookmark_sink_merges_hits_below_cluster():
+    sink = AutoBookmarkSink(_task(), merge_bandwidth=10_000)
+    sink.add(100_020_000, "FM", -300)
+    assert sink.add(100_010_000, "FM", -100) is False
+    assert sink.add(100_000_000, "FM", -200) is False
+    assert _frequencies(sink.flush()) == [100_010_000]
+
+
+@pytest.mark.parametrize(
+    "levels,expected",
+    [
+        ((-100, -300, -200), 100_000_000),
+        ((-300, -100, -200), 100_040_000),
+        ((-300, -200, -100), 100_020_000),
+    ],
+)
+def test_auto_bookmark_sink_hit_bridging_two_clusters_merges_them(levels, expected):
+    sink = AutoBookmarkSink(_task(), merge_bandwidth=20_000)
+    low, high, bridge = levels
+    assert sink.add(100_000_000, "FM", low) is True
+    assert sink.add(100_040_000, "FM", high) is True
+    assert len(sink) == 2
+    assert sink.add(100_020_000, "FM", bridge) is False
+    assert len(sink) == 1
+    assert _frequencies(sink.flush()) == [expected]
+
+
+def test_auto_bookmark_sink_cluster_bridged_to_known_bookmark_is_dropped():
+    task = _task(bookmarks=[_bm(100_000_000)])
+    sink = AutoBookmarkSink(task, merge_bandwidth=20_000)
+    assert sink.add(100_040_000, "FM", -100) is True
+    assert sink.add(100_020_000, "FM", -50) is False
+    assert sink.flush() == []
+
+
+def test_auto_bookmark_sink_hits_near_flushed_bookmark_are_dropped():
+    task = _task()
+    sink = AutoBookmarkSink(task, merge_bandwidth=10_000)
+    sink.add(100_000_000, "FM", -300)
+    sink.flush()
+    assert sink.add(100_005_000, "FM", -100) is False
+    assert sink.flush() == []
+    assert _frequencies(task.new_bookmarks_list) == [100_000_000]
+
+
+def test_auto_bookmark_sink_hits_in_any_order_give_one_bookmark_per_signal():
+    sink = AutoBookmarkSink(_task(), merge_bandwidth=10_000)
+    first = [100_000_000 + step * 10_000 for step in range(5)]
+    second = [101_000_000 + step * 10_000 for step in range(5)]
+    for freq in (*first[::2], *second[::-1], *first[1::2]):
+        sink.add(freq, "FM", -100 if freq in (100_020_000, 101_030_000) else -300)
+    assert sorted(_frequencies(sink.flush())) == [100_020_000, 101_030_000]
@@ -0,0 +1,61 @@
+import pytest
+
+from rig_remote.band_plan import load_band_plan
+from rig_remote.exceptions import InvalidPathError
+from rig_remote.models.scan_segment import ScanSegment
+
+
+def _write(tmp_path, content: str) -> str:
+    path = tmp_path / "band_plan.csv"
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+def test_band_plan_load(tmp_path):
+    path = _write(
+        tmp_path,
+        "# airband\n"
+        "118000000,137000000,25000,AM,airband\n"
+        "\n"
+        "88000000,108000000,100000,WFM\n",
+    )
+    assert load_band_plan(path) == [
+        ScanSegment(range_min=88_000_000, range_max=108_000_000, interval=100_000, modulation="WFM"),
+        ScanSegment(
+            range_min=118_000_000, range_max=137_000_000, interval=25_000, modulation="AM", description="airband"
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        "118000000,137000000,25000",
+        "118000000,137000000,25000,AM,airband,extra",
+        "abc,137000000,25000,AM",
+        "118000000,137000000,25000,XYZ",
+        "137000000,118000000,25000,AM",
+    ],
+)
+def test_band_plan_invalid_rows_skipped(tmp_path, row):
+    path = _write(tmp_path, row + "\n144000000,146000000,12500,FM\n")
+    assert load_band_plan(path) == [
+        ScanSegment(range_min=144_000_000, range_max=146_000_000, interval=12_500, modulation="FM")
+    ]
+
+
+def test_band_plan_overlaps_merged(tmp_path):
+    path = _write(tmp_path, "144000000,145000000,12500,FM\n144500000,146000000,12500,FM\n")
+    assert load_band_plan(path) == [
+        ScanSegment(range_min=144_000_000, range_max=146_000_000, interval=12_500, modulation="FM")
+    ]
+
+
+def test_band_plan_custom_delimiter(tmp_path):
+    path = _write(tmp_path, "144000000;146000000;12500;FM\n")
+    assert len(load_band_plan(path, delimiter=";")) == 1
+
+
+def test_band_plan_missing_file(tmp_path):
+    with pytest.raises(InvalidPathError):
+        load_band_plan(str(tmp_path / "missing.csv"))
@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.harness import (
+    BenchmarkResult,
+    compare_results,
+    latency_summary,
+    load_results,
+    measure,
+    percentile,
+    write_results,
+)
+
+
+def _result(name="bench", ops_per_second=1000.0, p99=10.0) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name,
+        operations=10,
+        total_s=10 / ops_per_second,
+        ops_per_second=ops_per_second,
+        latency_us={"p50": 1.0, "p90": 5.0, "p99": p99, "max": p99},
+        allocated_blocks=0.0,
+        peak_kib=1.0,
+    )
+
+
+@pytest.mark.parametrize("pct, expected", [(50, 5), (90, 9), (99, 10), (100, 10), (1, 1)])
+def test_benchmarks_percentile(pct, expected):
+    assert percentile([float(i) for i in range(10, 0, -1)], pct) == expected
+
+
+def test_benchmarks_percentile_empty():
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+def test_benchmarks_latency_summary_in_microseconds():
+    assert latency_summary([0.001, 0.002]) == pytest.approx(
+        {"p50": 1000.0, "p90": 2000.0, "p99": 2000.0, "max": 2000.0}
+    )
+
+
+def test_benchmarks_measure_counts_calls():
+    calls = []
+    result = measure("append", lambda: calls.append(1), iterations=20, warmup=3)
+    assert result.name == "append"
+    assert result.operations == 20
+    assert len(calls) == 3 + 20 + 20
+    assert result.ops_per_second > 0
+    assert set(result.latency_us) == {"p50", "p90", "p99", "max"}
+
+
+def test_benchmarks_measure_counts_retained_allocations():
+    kept = []
+    result = measure("leak", lambda: kept.append(object()), iterations=50, warmup=0)
+    assert result.allocated_blocks >= 1
+
+
+def test_benchmarks_measure_invalid_iterations():
+    with pytest.raises(ValueError):
+        measure("noop", lambda: None, iterations=0)
+
+
+def test_benchmarks_results_roundtrip(tmp_path):
+    path = tmp_path / "results.json"
+    write_results(str(path), [_result("a"), _result("b")])
+    data = json.loads(path.read_text())
+    assert {"rig_remote", "python", "platform", "timestamp"} <= set(data)
+    assert load_results(str(path)) == {"a": _result("a"), "b": _result("b")}
+
+
+def test_benchmarks_load_results_wrong_version(tmp_path):
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps({"version": 0, "results": []}))
+    with pytest.raises(ValueError):
+        load_results(str(path))
+
+
+@pytest.mark.parametrize(
+    "current, expected",
+    [
+        (_result(), 0),
+        (_result(ops_per_second=950.0, p99=10.5), 0),
+        (_result(ops_per_second=800.0), 1),
+        (_result(p99=20.0), 1),
+        (_result(ops_per_second=800.0, p99=20.0), 2),
+        (_result(name="new", ops_per_second=1.0), 0),
+    ],
+)
+def test_benchmarks_compare_results(current, expected):
+    assert len(compare_results({"bench": _result()}, [current], tolerance=0.1)) == expected
+
+
+def test_benchmarks_main_writes_results(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    args = ["--output", str(output), "--steps", "5", "--iterations", "5", "--bookmarks", "5", "--profile", "ideal"]
+    assert main(args) == 0
+    names = set(load_results(str(output)))
+    assert {"scan_frequency_ideal", "scan_bookmarks_ideal", "channel_construction", "logfile_write"} <= names
+    assert {"bookmarks_save_5", "bookmarks_load_5"} <= names
+    assert "scan_frequency_ideal" in capsys.readouterr().out
+
+
+def test_benchmarks_main_reports_regressions(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    write_results(str(baseline), [_result("channel_construction", ops_per_second=1e12, p99=1e-6)])
+    args = ["--output", str(tmp_path / "results.json"), "--baseline", str(baseline)]
+    args += ["--steps", "5", "--iterations", "5", "--bookmarks", "5", "--profile", "ideal"]
+    assert main(args) == 1
+    assert "REGRESSION channel_construction" in capsys.readouterr().out
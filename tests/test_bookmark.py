@@ -10,6 +10,7 @@ import pytest
         (Channel(input_frequency=1, modulation="AM"), "test_descroption", "0"),
         (Channel(input_frequency=1, modulation="AM"), "test_descroption", ""),
         (Channel(input_frequency=1, modulation="AM"), "test_descroption", "O"),
+        (Channel(input_frequency=1, modulation="AM"), "test_descroption", "P"),
     ],
 )
 def test_bookmark_init(channel1, description1, lockout1):
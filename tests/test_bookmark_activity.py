@@ -0,0 +1,118 @@
+import pytest
+
+from rig_remote.bookmark_activity import BookmarkActivity, activity_key
+from rig_remote.bookmarksmanager import bookmark_factory
+from rig_remote.models.bookmark import Bookmark
+
+
+def _bm(freq: int, bookmark_id: str = "") -> Bookmark:
+    return bookmark_factory(
+        input_frequency=freq,
+        modulation="FM",
+        description="test",
+        lockout="",
+        bookmark_id=bookmark_id,
+    )
+
+
+def test_bookmark_activity_key_uses_id():
+    assert activity_key(_bm(145_500_000, bookmark_id="abc")) == "abc"
+
+
+def test_bookmark_activity_key_falls_back_to_channel():
+    assert activity_key(_bm(145_500_000)) == "145500000:FM"
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"decay": -0.1},
+        {"decay": 1.0},
+        {"cold_threshold": -1.0},
+        {"cold_revisit_passes": 0},
+    ],
+)
+def test_bookmark_activity_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        BookmarkActivity(**kwargs)
+
+
+def test_bookmark_activity_score_unknown_is_zero():
+    assert BookmarkActivity().score(_bm(145_500_000)) == 0.0
+
+
+@pytest.mark.parametrize(
+    "hits, expected",
+    [
+        ([True], 1.0),
+        ([True, True], 1.5),
+        ([True, False], 0.5),
+        ([False, False], 0.0),
+        ([True, False, False], 0.25),
+    ],
+)
+def test_bookmark_activity_record_decays(hits, expected):
+    activity = BookmarkActivity(decay=0.5)
+    bm = _bm(145_500_000, bookmark_id="a")
+    for hit in hits:
+        activity.record(bm, hit)
+    assert activity.score(bm) == pytest.approx(expected)
+
+
+def test_bookmark_activity_schedule_unknown_keeps_list_order():
+    bookmarks = [_bm(145_000_000 + i * 1000, bookmark_id=str(i)) for i in range(4)]
+    assert BookmarkActivity().schedule(bookmarks) == bookmarks
+
+
+def test_bookmark_activity_schedule_busiest_first():
+    quiet, busy, busier = (_bm(145_000_000 + i * 1000, bookmark_id=str(i)) for i in range(3))
+    activity = BookmarkActivity(cold_revisit_passes=1)
+    activity.record(quiet, False)
+    activity.record(busy, True)
+    activity.record(busier, True)
+    activity.record(busier, True)
+    assert activity.schedule([quiet, busy, busier]) == [busier, busy, quiet]
+
+
+@pytest.mark.parametrize("revisit_passes", [1, 2, 4])
+def test_bookmark_activity_schedule_cold_bookmark_revisited_periodically(revisit_passes):
+    cold = _bm(145_000_000, bookmark_id="cold")
+    busy = _bm(146_000_000, bookmark_id="busy")
+    activity = BookmarkActivity(cold_revisit_passes=revisit_passes)
+    activity.record(cold, False)
+    visits = 0
+    for _ in range(revisit_passes * 3):
+        activity.record(busy, True)
+        if cold in activity.schedule([cold, busy]):
+            visits += 1
+            activity.record(cold, False)
+    assert visits == 3
+
+
+def test_bookmark_activity_schedule_all_cold_keeps_most_overdue():
+    bookmarks = [_bm(145_000_000 + i * 1000, bookmark_id=str(i)) for i in range(3)]
+    activity = BookmarkActivity(cold_revisit_passes=4)
+    activity.record(bookmarks[0], False)
+    activity.record(bookmarks[2], False)
+    activity.schedule(bookmarks[1:])
+    activity.record(bookmarks[1], False)
+    # bookmark 2 was skipped once already, so it is the most overdue
+    assert activity.schedule(bookmarks) == [bookmarks[2]]
+    activity.record(bookmarks[2], False)
+    assert activity.schedule(bookmarks) == [bookmarks[0]]
+
+
+def test_bookmark_activity_schedule_positions_match_schedule():
+    bookmarks = [_bm(145_000_000 + i * 1000, bookmark_id=str(i)) for i in range(3)]
+    activity = BookmarkActivity(cold_revisit_passes=1)
+    activity.record(bookmarks[2], True)
+    assert activity.schedule_positions(bookmarks) == [2, 0, 1]
+
+
+def test_bookmark_activity_reset_forgets_history():
+    bm = _bm(145_000_000, bookmark_id="a")
+    activity = BookmarkActivity()
+    activity.record(bm, False)
+    activity.reset()
+    assert activity.score(bm) == 0.0
+    assert activity.schedule([bm]) == [bm]
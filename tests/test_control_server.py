@@ -0,0 +1,447 @@
+import json
+import os
+import socket
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from rig_remote import control_server, daemon
+from rig_remote.app_config import AppConfig
+from rig_remote.bookmarksmanager import BookmarksManager
+from rig_remote.control_server import ControlDaemon, ControlServer, ScanController
+from rig_remote.models.scan_segment import ScanSegment
+from rig_remote.rig_backends.instrumented_rigctl import InstrumentedRigCtl
+from rig_remote.rig_backends.simulated_rigctl import (
+    Carrier,
+    SimulatedRigCtl,
+    SimulatedSpectrum,
+    SimulationProfile,
+)
+
+_CONFIG = """[Scanning]
+range_min = 100,000
+range_max = 110,000
+interval = 1000
+delay = 0
+passes = 1
+sgn_level = -30
+wait = false
+record = false
+auto_bookmark = false
+aggr_scan = false
+inner_band = 0
+inner_interval = 0
+
+[Main]
+log = false
+bookmark_filename = {bookmarks}
+log_filename = {log}
+"""
+
+
+@pytest.fixture
+def app_config(tmp_path) -> AppConfig:
+    config_file = tmp_path / "rig-remote.conf"
+    config_file.write_text(_CONFIG.format(bookmarks=tmp_path / "bookmarks.csv", log=tmp_path / "activity.log"))
+    return daemon.load_app_config(daemon.input_arguments(["--config", str(config_file)]))
+
+
+def _rigs(latency: float = 0.0, *carriers: Carrier) -> list[SimulatedRigCtl]:
+    spectrum = SimulatedSpectrum(carriers=list(carriers))
+    return [SimulatedRigCtl(spectrum=spectrum, profile=SimulationProfile(latency=latency)) for _ in range(2)]
+
+
+@pytest.fixture
+def controller(app_config):
+    controller = ScanController(app_config, _rigs(latency=0.001), sleep_fn=lambda _: None)
+    yield controller
+    controller.shutdown()
+
+
+def _wait(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def _rpc(address, *requests, raw: bytes | None = None) -> list:
+    with socket.create_connection(address, timeout=5) as conn:
+        payload = raw if raw is not None else b"".join(json.dumps(r).encode() + b"\n" for r in requests)
+        conn.sendall(payload)
+        conn.shutdown(socket.SHUT_WR)
+        data = b""
+        while chunk := conn.recv(4096):
+            data += chunk
+    return [json.loads(line) for line in data.splitlines()]
+
+
+def _request(method: str, params=None, request_id=1) -> dict:
+    request = {"jsonrpc": "2.0", "method": method, "id": request_id}
+    if params is not None:
+        request["params"] = params
+    return request
+
+
+def test_control_scan_controller_status_idle(controller):
+    status = controller.status()
+    assert status["scan"]["running"] is False
+    assert status["scan"]["task"] is None
+    assert status["sync"]["running"] is False
+    assert status["bookmarks"] == 0
+
+
+def test_control_scan_controller_scan_completes(app_config):
+    rigs = _rigs()
+    controller = ScanController(app_config, rigs, sleep_fn=lambda _: None)
+    scan = controller.start_scan(mode="frequency", passes=1)
+    assert scan["mode"] == "frequency"
+    _wait(lambda: not controller.scanning)
+    status = controller.status()
+    assert status["scan"]["counters"]["steps"] == 10
+    assert status["scan"]["counters"]["scans"] == 1
+    assert status["scan"]["frequency"] == rigs[0].get_frequency()
+    assert controller.scan_telemetry.last_sample.done
+    assert rigs[0].commands["set_frequency"] == 10
+
+
+def test_control_scan_controller_scan_overrides(controller):
+    scan = controller.start_scan(mode="frequency", rig=2, modulation="AM", passes=1000, sgn_level=-50, record=True)
+    assert scan["rig"] == 2
+    assert scan["task"]["sgn_level"] == -50
+    assert scan["task"]["record"] is True
+    assert scan["task"]["passes"] == 1000
+    assert controller.stop_scan() is True
+    assert controller.stop_scan() is False
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"mode": "monitor"},
+        {"rig": 3},
+        {"mode": "bookmarks"},
+        {"range_max": 10, "range_min": 100},
+        {"colour": 1},
+        {"adaptive": "yes"},
+    ],
+)
+def test_control_scan_controller_start_scan_invalid(controller, kwargs):
+    with pytest.raises(ValueError):
+        controller.start_scan(**kwargs)
+    assert not controller.scanning
+
+
+def test_control_scan_controller_one_task_at_a_time(controller):
+    controller.start_scan(passes=1000)
+    with pytest.raises(RuntimeError):
+        controller.start_scan()
+    with pytest.raises(RuntimeError):
+        controller.start_sync()
+    controller.stop_scan()
+
+
+def test_control_scan_controller_update_scan(controller):
+    with pytest.raises(RuntimeError):
+        controller.update_scan("sgn_level", -10)
+    controller.start_scan(passes=1000)
+    with pytest.raises(ValueError):
+        controller.update_scan("auto_bookmark", True)
+    controller.update_scan("sgn_level", -10)
+    _wait(lambda: controller.status()["scan"]["task"]["sgn_level"] == -10)
+    controller.stop_scan()
+
+
+def test_control_scan_controller_sync(controller):
+    controller.backends[1].frequency = 145_500_000
+    controller.start_sync()
+    _wait(lambda: controller.backends[0].frequency == 145_500_000)
+    assert controller.status()["sync"]["running"] is True
+    assert controller.stop_sync() is True
+    assert controller.stop_sync() is False
+    assert controller.status()["sync"]["counters"]["syncs"] >= 1
+
+
+def test_control_scan_controller_bookmarks(controller, app_config):
+    added = controller.add_bookmark(frequency=145_500_000, modulation="FM", description="repeater")
+    assert added["id"]
+    assert controller.list_bookmarks() == [added]
+    with pytest.raises(ValueError):
+        controller.add_bookmark(frequency=145_500_000, modulation="FM", description="repeater")
+    with pytest.raises(ValueError):
+        controller.add_bookmark(frequency=145_500_000, modulation="XX", description="bad")
+    controller.save_bookmarks()
+    saved = BookmarksManager().load(app_config.config["bookmark_filename"])
+    assert [bookmark.id for bookmark in saved] == [added["id"]]
+    assert controller.delete_bookmark(added["id"]) is True
+    assert controller.delete_bookmark(added["id"]) is False
+    assert controller.list_bookmarks() == []
+
+
+def test_control_scan_controller_bookmark_scan(app_config):
+    rigs = _rigs()
+    controller = ScanController(app_config, rigs, sleep_fn=lambda _: None)
+    controller.add_bookmark(frequency=145_500_000, modulation="FM", description="repeater")
+    controller.add_bookmark(frequency=145_600_000, modulation="FM", description="repeater 2")
+    controller.start_scan(mode="bookmarks", passes=1)
+    _wait(lambda: not controller.scanning)
+    assert rigs[0].commands["set_frequency"] == 2
+
+
+@pytest.mark.parametrize(
+    "adaptive,adaptive_scan,expected",
+    [(None, "false", False), (None, "true", True), (True, "false", True), (False, "true", False)],
+)
+def test_control_scan_controller_adaptive_bookmark_scan(app_config, adaptive, adaptive_scan, expected):
+    app_config.config["adaptive_scan"] = adaptive_scan
+    controller = ScanController(app_config, _rigs(), sleep_fn=lambda _: None)
+    controller.add_bookmark(frequency=145_500_000, modulation="FM", description="repeater")
+    for _ in range(2):
+        controller.start_scan(mode="bookmarks", passes=1, adaptive=adaptive)
+        _wait(lambda: not controller.scanning)
+        # the same activity history carries over to every adaptive scan
+        assert (controller._scan_task.bookmark_activity is controller.bookmark_activity) is expected
+        assert (controller._scan_task.bookmark_activity is None) is not expected
+
+
+def test_control_scan_controller_priority_bookmarks(app_config):
+    rigs = _rigs()
+    controller = ScanController(app_config, rigs, sleep_fn=lambda _: None)
+    controller.add_bookmark(frequency=145_500_000, modulation="FM", description="repeater", lockout="P")
+    scan = controller.start_scan(passes=1, priority_interval=5)
+    assert scan["task"]["priority_interval"] == 5
+    _wait(lambda: not controller.scanning)
+    assert rigs[0].commands["set_frequency"] == 12
+
+
+def test_control_scan_controller_update_bookmark(controller):
+    added = controller.add_bookmark(frequency=145_500_000, modulation="FM", description="repeater")
+    other = controller.add_bookmark(frequency=145_600_000, modulation="FM", description="other")
+    updated = controller.update_bookmark(added["id"], description="club repeater", lockout="P")
+    assert updated == {**added, "description": "club repeater", "lockout": "P"}
+    assert controller.update_bookmark(added["id"], modulation="AM")["modulation"] == "AM"
+    assert controller.list_bookmarks() == [{**updated, "modulation": "AM"}, other]
+    with pytest.raises(ValueError):
+        controller.update_bookmark("missing", description="x")
+    with pytest.raises(ValueError):
+        controller.update_bookmark(added["id"], lockout="X")
+    with pytest.raises(ValueError):
+        controller.update_bookmark(other["id"], description="")
+    assert controller.list_bookmarks()[1] == other
+
+
+def test_control_scan_controller_update_bookmark_rejects_duplicates(controller):
+    first = controller.add_bookmark(frequency=145_500_000, modulation="FM", description="repeater")
+    second = controller.add_bookmark(frequency=145_500_000, modulation="AM", description="repeater")
+    with pytest.raises(ValueError):
+        controller.update_bookmark(second["id"], modulation="FM")
+    assert controller.list_bookmarks() == [first, second]
+
+
+def test_control_scan_controller_band_plan(app_config):
+    rigs = _rigs()
+    segment = ScanSegment(range_min=144_000_000, range_max=144_050_000, interval=10_000, modulation="FM")
+    controller = ScanController(app_config, rigs, sleep_fn=lambda _: None, segments=[segment])
+    scan = controller.start_scan(passes=1)
+    assert scan["task"]["range_min"] == 144_000_000
+    _wait(lambda: not controller.scanning)
+    assert 144_000_000 <= rigs[0].get_frequency() <= 144_050_000
+
+
+def test_control_scan_controller_keeps_new_bookmarks(app_config):
+    rigs = _rigs(0.0, Carrier(frequency=105_000, level=-10.0, bandwidth=1000))
+    controller = ScanController(app_config, rigs, sleep_fn=lambda _: None)
+    controller.start_scan(passes=1, auto_bookmark=True)
+    _wait(lambda: not controller.scanning)
+    bookmarks = controller.list_bookmarks()
+    assert bookmarks
+    assert all(bookmark["id"] for bookmark in bookmarks)
+
+
+def test_control_scan_controller_reports_scan_errors(app_config):
+    rigs = _rigs()
+    controller = ScanController(app_config, rigs, sleep_fn=lambda _: None)
+    rigs[0].set_frequency = Mock(side_effect=RuntimeError("rig exploded"))
+    controller.start_scan(passes=1)
+    _wait(lambda: not controller.scanning)
+    assert controller.status()["scan"]["error"] == "rig exploded"
+    del rigs[0].set_frequency
+    controller.start_scan(passes=1)
+    assert controller.status()["scan"]["error"] == ""
+
+
+def test_control_scan_controller_metrics(controller):
+    text = controller.metrics_collector().render()
+    assert "rig_remote_scans_total 0" in text
+    assert 'rig_remote_queue_depth{queue="scan",direction="child"}' in text
+
+
+@pytest.fixture
+def server(controller):
+    with ControlServer(controller, port=0) as running:
+        yield running
+
+
+def test_control_server_status(server):
+    [response] = _rpc(server.address, _request("status"))
+    assert response["jsonrpc"] == "2.0"
+    assert response["id"] == 1
+    assert response["result"]["scan"]["running"] is False
+
+
+def test_control_server_scan_lifecycle(server):
+    responses = _rpc(
+        server.address,
+        _request("scan.start", {"mode": "frequency", "passes": 1000}, 1),
+        _request("scan.update", {"parameter": "sgn_level", "value": -20}, 2),
+        _request("scan.stop", None, 3),
+    )
+    assert [response["id"] for response in responses] == [1, 2, 3]
+    assert responses[0]["result"]["running"] is True
+    assert responses[1]["result"] is None
+    assert responses[2]["result"] is True
+
+
+def test_control_server_bookmarks(server):
+    add, listing = _rpc(
+        server.address,
+        _request("bookmarks.add", [145_500_000, "FM", "repeater"], 1),
+        _request("bookmarks.list", None, 2),
+    )
+    assert listing["result"] == [add["result"]]
+    update, missing = _rpc(
+        server.address,
+        _request("bookmarks.update", {"id": add["result"]["id"], "description": "club"}, 3),
+        _request("bookmarks.update", {"id": "missing", "lockout": "L"}, 4),
+    )
+    assert update["result"] == {**add["result"], "description": "club"}
+    assert missing["error"]["code"] == control_server.INVALID_PARAMS
+
+
+def test_control_server_concurrent_clients(server):
+    first = socket.create_connection(server.address, timeout=5)
+    try:
+        [response] = _rpc(server.address, _request("status"))
+        assert "result" in response
+    finally:
+        first.close()
+
+
+@pytest.mark.parametrize(
+    "payload, code",
+    [
+        (b"{not json\n", control_server.PARSE_ERROR),
+        (b'{"method": "status", "id": 1}\n', control_server.INVALID_REQUEST),
+        (b'{"jsonrpc": "2.0", "method": "reboot", "id": 1}\n', control_server.METHOD_NOT_FOUND),
+        (b'{"jsonrpc": "2.0", "method": "status", "params": 1, "id": 1}\n', control_server.INVALID_PARAMS),
+        (b'{"jsonrpc": "2.0", "method": "scan.stop", "params": {"now": 1}, "id": 1}\n', control_server.INVALID_PARAMS),
+        (b'{"jsonrpc": "2.0", "method": "scan.start", "params": {"rig": 5}, "id": 1}\n', control_server.INVALID_PARAMS),
+        (
+            b'{"jsonrpc": "2.0", "method": "scan.update", "params": ["sgn_level", 1], "id": 1}\n',
+            control_server.SERVER_ERROR,
+        ),
+    ],
+)
+def test_control_server_errors(server, payload, code):
+    [response] = _rpc(server.address, raw=payload)
+    assert response["error"]["code"] == code
+    assert "result" not in response
+
+
+def test_control_server_batch_and_notifications(server):
+    batch = [_request("status", None, 1), {"jsonrpc": "2.0", "method": "status"}, _request("bookmarks.list", None, 2)]
+    [responses] = _rpc(server.address, raw=json.dumps(batch).encode() + b"\n")
+    assert [response["id"] for response in responses] == [1, 2]
+    assert _rpc(server.address, raw=b'{"jsonrpc": "2.0", "method": "status"}\n') == []
+
+
+def test_control_server_unix_socket(controller, tmp_path):
+    path = str(tmp_path / "control.sock")
+    with ControlServer(controller, socket_path=path) as running:
+        assert running.address == path
+        assert oct(os.stat(path).st_mode & 0o777) == oct(0o600)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(path)
+            conn.sendall(json.dumps(_request("status")).encode() + b"\n")
+            conn.shutdown(socket.SHUT_WR)
+            response = json.loads(conn.makefile().readline())
+    assert response["result"]["bookmarks"] == 0
+    assert not os.path.exists(path)
+
+
+def test_control_server_unix_socket_is_never_world_accessible(controller, tmp_path, monkeypatch):
+    path = str(tmp_path / "control.sock")
+    modes = []
+
+    class _Recording(control_server._UnixControlServer):
+        def server_bind(self):
+            super().server_bind()
+            modes.append(os.stat(path).st_mode & 0o777)
+
+    monkeypatch.setattr(control_server, "_UnixControlServer", _Recording)
+    umask = os.umask(0o022)
+    try:
+        with ControlServer(controller, socket_path=path):
+            assert os.umask(0o022) == 0o022
+    finally:
+        os.umask(umask)
+    assert modes == [0o600]
+
+
+def test_control_server_address_when_stopped(controller):
+    with pytest.raises(RuntimeError):
+        _ = ControlServer(controller).address
+
+
+def test_control_daemon_serves_until_stopped(app_config):
+    control = ControlDaemon(app_config, port=0, backends=_rigs(), instrument=True)
+    assert all(isinstance(backend, InstrumentedRigCtl) for backend in control.controller.backends)
+    assert "rig_remote_up 1" in control.metrics_collector().render()
+    control.stop()
+    assert control.run() == 0
+
+
+def test_control_daemon_cli_serve_mode(app_config, monkeypatch):
+    started = []
+
+    def fake_run(self):
+        started.append(self)
+        return 0
+
+    monkeypatch.setattr(ControlDaemon, "run", fake_run)
+    monkeypatch.setattr(daemon.signal, "signal", lambda *args: None)
+    with pytest.raises(SystemExit) as excinfo:
+        daemon.cli(["-c", app_config.config_file, "--mode", "serve", "--control-port", "0"])
+    assert excinfo.value.code == 0
+    assert len(started) == 1
+
+
+def test_control_daemon_cli_serve_mode_scan_options(app_config, tmp_path, monkeypatch):
+    band_plan = tmp_path / "band_plan.csv"
+    band_plan.write_text("144000000,146000000,12500,FM\n", encoding="utf-8")
+    started = []
+
+    def fake_run(self):
+        started.append(self)
+        return 0
+
+    monkeypatch.setattr(ControlDaemon, "run", fake_run)
+    monkeypatch.setattr(daemon.signal, "signal", lambda *args: None)
+    argv = ["-c", app_config.config_file, "--mode", "serve", "--control-port", "0", "--detector", "squelch"]
+    argv += ["--merge-bandwidth", "25000", "--band-plan", str(band_plan), "--adaptive"]
+    with pytest.raises(SystemExit):
+        daemon.cli(argv)
+    controller = started[0].controller
+    assert controller._config.detector == "squelch"
+    assert controller._config.merge_bandwidth == 25_000
+    assert controller._segments == [
+        ScanSegment(range_min=144_000_000, range_max=146_000_000, interval=12_500, modulation="FM")
+    ]
+    assert controller._adaptive is True
+
+
+@pytest.mark.parametrize("argv", [["--checkpoint", "scan.checkpoint"], ["--resume"]])
+def test_control_daemon_cli_serve_mode_rejects_single_scan_options(argv):
+    with pytest.raises(SystemExit):
+        daemon.input_arguments(["--mode", "serve", *argv])
@@ -0,0 +1,323 @@
+import os
+import signal
+import subprocess
+import sys
+
+import pytest
+
+from rig_remote import daemon
+from rig_remote.app_config import AppConfig
+from rig_remote.bookmark_activity import BookmarkActivity
+from rig_remote.bookmarksmanager import BookmarksManager, bookmark_factory
+from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.rig_backends.gqrx_rigctl import GQRXRigCtl
+from rig_remote.rig_backends.hamlib_rigctl import HamlibRigCtl
+from rig_remote.rig_backends.instrumented_rigctl import InstrumentedRigCtl
+from rig_remote.rig_backends.protocol import BackendType
+from rig_remote.rig_backends.simulated_rigctl import Carrier, SimulatedRigCtl, SimulatedSpectrum, SimulationProfile
+from rig_remote.scan_profiler import ScanProfiler
+
+_CONFIG = """[Scanning]
+range_min = 100,000
+range_max = 110,000
+interval = 1000
+delay = 0
+passes = 1
+sgn_level = -30
+wait = false
+record = false
+auto_bookmark = {auto_bookmark}
+aggr_scan = false
+inner_band = 0
+inner_interval = 0
+
+[Main]
+log = false
+always_on_top = false
+save_exit = false
+bookmark_filename = {bookmarks}
+log_filename = {log}
+
+[Rig URI]
+hostname1 = 127.0.0.1
+port1 = 7356
+hostname2 = 127.0.0.1
+port2 = 7357
+"""
+
+
+@pytest.fixture
+def app_config(tmp_path):
+    def _make(auto_bookmark: bool = False) -> AppConfig:
+        config_file = tmp_path / "rig-remote.conf"
+        config_file.write_text(
+            _CONFIG.format(
+                auto_bookmark=str(auto_bookmark).lower(),
+                bookmarks=tmp_path / "bookmarks.csv",
+                log=tmp_path / "activity.log",
+            )
+        )
+        args = daemon.input_arguments(["--config", str(config_file)])
+        return daemon.load_app_config(args)
+
+    return _make
+
+
+def _rigs(*carriers: Carrier) -> list[SimulatedRigCtl]:
+    spectrum = SimulatedSpectrum(carriers=list(carriers), noise_floor=-100.0)
+    return [SimulatedRigCtl(spectrum=spectrum, sleep_fn=lambda _: None) for _ in range(2)]
+
+
+def _daemon(config: AppConfig, rigs: list[SimulatedRigCtl], **kw) -> daemon.ScanDaemon:
+    return daemon.ScanDaemon(config, backends=rigs, sleep_fn=lambda _: None, **kw)
+
+
+def test_daemon_does_not_import_qt():
+    code = "import sys, rig_remote.daemon; print(any(m.startswith('PySide6') for m in sys.modules))"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+    assert result.stdout.strip() == "False"
+
+
+def test_daemon_input_arguments_defaults():
+    args = daemon.input_arguments([])
+    assert args.mode == "frequency"
+    assert args.rig == 1
+    assert args.modulation == "FM"
+    assert args.passes is None
+    assert args.metrics_port is None
+    assert args.metrics_textfile is None
+    assert args.detector == "level"
+    assert args.merge_bandwidth == 0
+    assert args.adaptive is False
+
+
+@pytest.mark.parametrize(
+    "argv", [["--mode", "monitor"], ["--rig", "3"], ["--modulation", "XX"], ["--detector", "dcd"]]
+)
+def test_daemon_input_arguments_rejects_invalid_values(argv):
+    with pytest.raises(SystemExit):
+        daemon.input_arguments(argv)
+
+
+def test_daemon_load_app_config_file_names(tmp_path):
+    args = daemon.input_arguments(["--prefix", str(tmp_path)])
+    config = daemon.load_app_config(args)
+    assert config.config_file == os.path.join(tmp_path, "rig-remote.conf")
+    assert config.config["bookmark_filename"] == os.path.join(tmp_path, "rig-remote-bookmarks.csv")
+    assert config.config["log_filename"] == os.path.join(tmp_path, "rig-remote-log.txt")
+    assert AppConfig.DEFAULT_CONFIG["bookmark_filename"] is None
+
+
+def test_daemon_load_app_config_overrides(tmp_path):
+    args = daemon.input_arguments(["-p", str(tmp_path), "-b", "/tmp/b.csv", "-l", "/tmp/a.log"])
+    config = daemon.load_app_config(args)
+    assert config.config["bookmark_filename"] == "/tmp/b.csv"
+    assert config.config["log_filename"] == "/tmp/a.log"
+
+
+def test_daemon_create_backend():
+    gqrx = daemon.create_backend(RigEndpoint(hostname="127.0.0.1", port=7356, number=1))
+    hamlib = daemon.create_backend(RigEndpoint(backend=BackendType.HAMLIB, number=1, rig_model=1))
+    assert isinstance(gqrx, GQRXRigCtl)
+    assert isinstance(hamlib, HamlibRigCtl)
+
+
+def test_daemon_build_scanning_task(app_config):
+    task = daemon.build_scanning_task(
+        app_config(auto_bookmark=True), "frequency", "AM", bookmarks=[], new_bookmarks_list=[], overrides={"passes": 3}
+    )
+    assert (task.range_min, task.range_max, task.interval) == (100_000, 110_000, 1000)
+    assert task.passes == 3
+    assert task.sgn_level == -30
+    assert task.auto_bookmark is True
+    assert task.record is False
+    assert task.frequency_modulation == "AM"
+    assert task.bookmark_activity is None
+    assert task.priority_interval == 0
+    assert task.priority_bookmarks == []
+
+
+def test_daemon_build_scanning_task_priority_bookmarks(app_config):
+    priority = bookmark_factory(input_frequency=145_500_000, modulation="FM", description="repeater", lockout="P")
+    other = bookmark_factory(input_frequency=145_600_000, modulation="FM", description="other", lockout="O")
+    task = daemon.build_scanning_task(
+        app_config(),
+        "frequency",
+        "FM",
+        bookmarks=[priority, other],
+        new_bookmarks_list=[],
+        overrides={"priority_interval": 5},
+    )
+    assert task.priority_bookmarks == [priority]
+    assert task.priority_interval == 5
+
+
+def test_daemon_build_scanning_task_with_bookmark_activity(app_config):
+    activity = BookmarkActivity()
+    task = daemon.build_scanning_task(
+        app_config(), "bookmarks", "FM", bookmarks=[], new_bookmarks_list=[], bookmark_activity=activity
+    )
+    assert task.bookmark_activity is activity
+
+
+@pytest.mark.parametrize(
+    "adaptive,adaptive_scan,expected", [(False, "false", False), (True, "false", True), (False, "true", True)]
+)
+def test_daemon_adaptive_from_flag_or_config(app_config, adaptive, adaptive_scan, expected):
+    config = app_config()
+    config.config["adaptive_scan"] = adaptive_scan
+    scan_daemon = _daemon(config, _rigs(), adaptive=adaptive)
+    assert (scan_daemon.bookmark_activity is not None) is expected
+
+
+def test_daemon_builds_backends_from_config(app_config):
+    scan_daemon = daemon.ScanDaemon(app_config())
+    assert [backend.endpoint.port for backend in scan_daemon.backends] == [7356, 7357]
+
+
+@pytest.mark.parametrize("kw", [{"mode": "monitor"}, {"rig_number": 0}, {"rig_number": 3}])
+def test_daemon_rejects_invalid_mode_or_rig(app_config, kw):
+    with pytest.raises(ValueError):
+        daemon.ScanDaemon(app_config(), backends=_rigs(), **kw)
+
+
+def test_daemon_frequency_scan(app_config):
+    rigs = _rigs()
+    scan_daemon = _daemon(app_config(), rigs)
+    assert scan_daemon.run() == 0
+    assert rigs[0].commands["set_frequency"] == 10
+    assert rigs[1].commands["set_frequency"] == 0
+    assert scan_daemon.scan_counters.steps == 10
+    assert scan_daemon.scan_counters.scans == 1
+
+
+def test_daemon_frequency_scan_squelch_detector(app_config):
+    spectrum = SimulatedSpectrum(noise_floor=-100.0)
+    profile = SimulationProfile(squelch=-50.0)
+    rigs = [SimulatedRigCtl(spectrum=spectrum, profile=profile, sleep_fn=lambda _: None) for _ in range(2)]
+    assert _daemon(app_config(), rigs, detector="squelch").run() == 0
+    assert rigs[0].commands["get_dcd"] == 10
+    assert rigs[0].commands["get_level"] == 0
+
+
+def test_daemon_merge_bandwidth_sets_scanning_config(app_config):
+    rigs = [SimulatedRigCtl(sleep_fn=lambda _: None) for _ in range(2)]
+    assert _daemon(app_config(), rigs, merge_bandwidth=25_000).config.merge_bandwidth == 25_000
+    with pytest.raises(ValueError):
+        _daemon(app_config(), rigs, merge_bandwidth=-1)
+
+
+def test_daemon_frequency_scan_checks_priority_bookmarks(app_config):
+    config = app_config()
+    config.config["priority_interval"] = "5"
+    manager = BookmarksManager()
+    manager.bookmarks = [
+        bookmark_factory(input_frequency=145_500_000, modulation="FM", description="repeater", lockout="P")
+    ]
+    manager.save(config.config["bookmark_filename"])
+    rigs = _rigs()
+    assert _daemon(config, rigs).run() == 0
+    # 10 steps, plus the priority bookmark every 5 steps
+    assert rigs[0].commands["set_frequency"] == 12
+
+
+def test_daemon_frequency_scan_on_rig_2(app_config):
+    rigs = _rigs()
+    assert _daemon(app_config(), rigs, rig_number=2).run() == 0
+    assert rigs[0].commands["set_frequency"] == 0
+    assert rigs[1].commands["set_frequency"] == 10
+
+
+def test_daemon_frequency_scan_saves_new_bookmarks(app_config):
+    config = app_config(auto_bookmark=True)
+    scan_daemon = _daemon(config, _rigs(Carrier(frequency=105_000, level=-10.0, bandwidth=1000)))
+    assert scan_daemon.run() == 0
+    assert scan_daemon.new_bookmarks
+    saved = BookmarksManager().load(config.config["bookmark_filename"])
+    assert [bookmark.channel.frequency for bookmark in saved] == [
+        bookmark.channel.frequency for bookmark in scan_daemon.new_bookmarks
+    ]
+
+
+def test_daemon_bookmark_scan(app_config, tmp_path):
+    manager = BookmarksManager()
+    manager.bookmarks = BookmarksManager().load("tests/test_files/test-rig_remote-bookmarks.csv")
+    manager.save(str(tmp_path / "bookmarks.csv"))
+    rigs = _rigs()
+    assert _daemon(app_config(), rigs, mode="bookmarks").run() == 0
+    assert rigs[0].commands["set_frequency"] == len(manager.bookmarks)
+
+
+def test_daemon_adaptive_bookmark_scan_records_activity(app_config, tmp_path):
+    manager = BookmarksManager()
+    manager.bookmarks = BookmarksManager().load("tests/test_files/test-rig_remote-bookmarks.csv")
+    manager.save(str(tmp_path / "bookmarks.csv"))
+    rigs = _rigs()
+    scan_daemon = _daemon(app_config(), rigs, mode="bookmarks", adaptive=True)
+    assert scan_daemon.run() == 0
+    assert rigs[0].commands["set_frequency"] == len(manager.bookmarks)
+    assert all(scan_daemon.bookmark_activity.score(bookmark) > 0 for bookmark in manager.bookmarks)
+
+
+def test_daemon_bookmark_scan_without_bookmarks(app_config):
+    rigs = _rigs()
+    assert _daemon(app_config(), rigs, mode="bookmarks").run() == 1
+    assert rigs[0].commands["set_frequency"] == 0
+
+
+def test_daemon_sync(app_config):
+    rigs = _rigs()
+    rigs[1].frequency = 145_500_000
+    rigs[1].mode = "AM"
+    scan_daemon = _daemon(app_config(), rigs, mode="sync")
+    scan_daemon.stop()
+    assert scan_daemon.run() == 0
+    assert scan_daemon.sync_counters.syncs == 0
+    assert rigs[0].frequency != 145_500_000
+
+
+def test_daemon_stop_before_run(app_config):
+    rigs = _rigs()
+    scan_daemon = _daemon(app_config(), rigs)
+    scan_daemon.stop()
+    assert scan_daemon.run() == 0
+    assert rigs[0].commands["set_frequency"] == 0
+
+
+def test_daemon_run_reports_rig_errors(app_config):
+    hamlib = daemon.create_backend(RigEndpoint(backend=BackendType.HAMLIB, number=1, rig_model=1))
+    hamlib.connect = lambda: (_ for _ in ()).throw(OSError("no rig"))
+    assert _daemon(app_config(), [hamlib, _rigs()[1]]).run() == 1
+
+
+def test_daemon_instrument_and_profile(app_config):
+    profiler = ScanProfiler()
+    scan_daemon = _daemon(app_config(), _rigs(), instrument=True, profiler=profiler)
+    assert all(isinstance(backend, InstrumentedRigCtl) for backend in scan_daemon.backends)
+    assert scan_daemon.run() == 0
+    assert profiler.steps == 10
+    text = scan_daemon.metrics_collector().render()
+    assert 'rig_remote_backend_command_seconds_count{backend="rig1",command="set_frequency"} 10' in text
+    assert "rig_remote_scan_steps_total 10" in text
+
+
+def test_daemon_cli_runs_scan_and_writes_metrics(app_config, tmp_path, monkeypatch):
+    config = app_config()
+    rigs = _rigs()
+    monkeypatch.setattr(daemon, "create_backend", lambda endpoint: rigs[endpoint.number - 1])
+    monkeypatch.setattr(signal, "signal", lambda *args: None)
+    metrics_file = tmp_path / "rig_remote.prom"
+    with pytest.raises(SystemExit) as excinfo:
+        daemon.cli(["-c", config.config_file, "--metrics-textfile", str(metrics_file)])
+    assert excinfo.value.code == 0
+    assert rigs[0].commands["set_frequency"] == 10
+    assert "rig_remote_scans_total 1" in metrics_file.read_text()
+
+
+def test_daemon_cli_band_plan_error(app_config, tmp_path, monkeypatch):
+    config = app_config()
+    monkeypatch.setattr(signal, "signal", lambda *args: None)
+    with pytest.raises(SystemExit) as excinfo:
+        daemon.cli(["-c", config.config_file, "--band-plan", str(tmp_path / "missing.csv")])
+    assert excinfo.value.code == 1
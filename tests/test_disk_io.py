@@ -189,3 +189,15 @@ def test_disk_io_close_error(log_file, tmp_path):
     # Restore real close so the file object can be properly finalized by GC
     handler.close = real_close
     real_close()
+
+
+def test_disk_io_write_entry(log_file, tmp_path):
+    log_path = tmp_path / "tests.log"
+    log_file.open(str(log_path))
+    log_file.write_entry(record_type="F", frequency=145500000, modulation="AM", signal=[])
+    log_file.close()
+
+    with open(log_path, "r", encoding="utf-8") as f:
+        content = f.read().strip()
+        assert content.startswith("F")
+        assert content.endswith("145500000 AM []")
@@ -1,5 +1,9 @@
+import socket
+import threading
+import time
+
 import pytest
-from unittest.mock import MagicMock, create_autospec
+from unittest.mock import MagicMock, call, create_autospec, patch
 
 from rig_remote.rig_backends.gqrx_rigctl import GQRXRigCtl
 from rig_remote.rig_backends.mode_translator import ModeTranslator
@@ -81,6 +85,39 @@ def test_get_level_non_string_raises():
         ctl.get_level()
 
 
+def test_get_status_reads_frequency_mode_and_level():
+    ctl = _make_ctl(mode_translator=ModeTranslator(BackendType.GQRX))
+    ctl._send_message.side_effect = ["145000000", "FM\n12500\n", "-42.5"]
+    status = ctl.get_status()
+    assert (status.frequency, status.mode, status.strength) == (145000000, "FM", -42)
+    assert status.raw_strength is status.squelch_open is status.rf_power is None
+
+
+@pytest.mark.parametrize("level, expected", [("-40.0", True), ("-60.0", False)])
+def test_get_dcd_compares_level_with_squelch(level, expected):
+    ctl = _make_ctl()
+    ctl._send_message.side_effect = ["-50.0", level, level]
+    assert ctl.get_dcd() is expected
+    assert ctl.get_dcd() is expected
+    assert ctl._send_message.call_args_list == [call("l SQL"), call("l"), call("l")]
+
+
+def test_get_dcd_rereads_squelch_after_ttl():
+    ctl = _make_ctl()
+    ctl._send_message.side_effect = ["-50.0", "-40.0", "-30.0", "-40.0"]
+    with patch("rig_remote.rig_backends.gqrx_rigctl.time.monotonic", side_effect=[0.0, 10.0]):
+        assert ctl.get_dcd() is True
+        assert ctl.get_dcd() is False
+    assert ctl._send_message.call_count == 4
+
+
+def test_get_dcd_squelch_off_not_implemented():
+    ctl = _make_ctl()
+    ctl._send_message.return_value = "-150.0"
+    with pytest.raises(NotImplementedError):
+        ctl.get_dcd()
+
+
 @pytest.mark.parametrize("mode", list(ModulationModes))
 def test_set_mode_sends_m_command_for_all_modes(mode: str) -> None:
     ctl = _make_ctl(mode_translator=ModeTranslator(BackendType.GQRX))
@@ -206,3 +243,123 @@ def test_set_frequency_with_passthrough_translator():
     ctl = _make_ctl(mode_translator=translator)
     ctl.set_frequency(100000000)
     ctl._send_message.assert_called_once_with(request="F 100000000")
+
+
+# ---------------------------------------------------------------------------
+# Socket I/O and reply framing
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def segmented_server():
+    """Local server answering one command with the given segments.
+
+    The connection is kept open after the answer, as gqrx does, so a reader
+    waiting for more data would only return on its read timeout.
+    """
+    listener = socket.create_server(("127.0.0.1", 0))
+    done = threading.Event()
+    requests = []
+
+    def serve(segments, delay):
+        conn, _ = listener.accept()
+        with conn:
+            requests.append(conn.recv(1024))
+            for segment in segments:
+                conn.sendall(segment)
+                time.sleep(delay)
+            done.wait(5)
+
+    def start(*segments, delay=0.05):
+        threading.Thread(target=serve, args=(segments, delay), daemon=True).start()
+        endpoint = RigEndpoint(hostname="127.0.0.1", port=listener.getsockname()[1], read_timeout=3.0)
+        return GQRXRigCtl(endpoint=endpoint), requests
+
+    yield start
+    done.set()
+    listener.close()
+
+
+def test_multi_line_reply_split_in_segments(segmented_server):
+    ctl, requests = segmented_server(b"FM", b"\n100", b"00\n")
+    started = time.monotonic()
+    assert ctl._send_message("m") == "FM\n10000\n"
+    assert time.monotonic() - started < 2
+    assert requests == [b"m\n"]
+
+
+def test_get_mode_does_not_wait_for_read_timeout(segmented_server):
+    ctl, _ = segmented_server(b"USB\n", b"2800\n")
+    started = time.monotonic()
+    assert ctl.get_mode() == "USB"
+    assert time.monotonic() - started < 2
+
+
+def test_error_reply_ends_multi_line_reply(segmented_server):
+    ctl, _ = segmented_server(b"RPRT 1\n")
+    started = time.monotonic()
+    assert ctl._send_message("m") == "RPRT 1\n"
+    assert time.monotonic() - started < 2
+
+
+def test_single_line_reply_split_in_segments(segmented_server):
+    ctl, _ = segmented_server(b"1450", b"00000\n")
+    assert ctl.get_frequency() == 145000000
+
+
+def test_reply_longer_than_buffer(segmented_server):
+    value = b"x" * 5000
+    ctl, _ = segmented_server(value, b"\n", delay=0)
+    assert ctl._send_message("v") == value.decode() + "\n"
+    # the grown buffer serves the next replies
+    assert len(ctl._buffer) >= 5001
+
+
+def test_reply_ends_when_connection_closes():
+    listener = socket.create_server(("127.0.0.1", 0))
+
+    def serve():
+        conn, _ = listener.accept()
+        conn.recv(1024)
+        conn.close()
+
+    threading.Thread(target=serve, daemon=True).start()
+    ctl = GQRXRigCtl(endpoint=RigEndpoint(hostname="127.0.0.1", port=listener.getsockname()[1]))
+    assert ctl._send_message("f") == ""
+    listener.close()
+
+
+def test_send_message_uses_endpoint_timeouts_and_nodelay():
+    endpoint = RigEndpoint(hostname="127.0.0.1", port=7356, connect_timeout=1.5, read_timeout=0.5)
+    ctl = GQRXRigCtl(endpoint=endpoint)
+    with patch("socket.socket") as mock_socket:
+        rig_socket = mock_socket.return_value
+        rig_socket.recv_into.side_effect = [7, 0]
+        ctl._send_message("F 145000000")
+    rig_socket.setsockopt.assert_called_once_with(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    assert rig_socket.settimeout.call_args_list == [call(1.5), call(0.5)]
+    rig_socket.connect.assert_called_once_with(("127.0.0.1", 7356))
+    rig_socket.sendall.assert_called_once_with(b"F 145000000\n")
+    rig_socket.close.assert_called_once()
+
+
+def test_send_message_closes_socket_on_error():
+    ctl = GQRXRigCtl(endpoint=RigEndpoint(hostname="127.0.0.1", port=7356))
+    with patch("socket.socket") as mock_socket:
+        mock_socket.return_value.recv_into.side_effect = TimeoutError()
+        with pytest.raises(TimeoutError):
+            ctl._send_message("f")
+    mock_socket.return_value.close.assert_called_once()
+
+
+def test_send_message_rejects_endless_reply():
+    ctl = GQRXRigCtl(endpoint=RigEndpoint(hostname="127.0.0.1", port=7356))
+
+    def fill(view):
+        view[:] = b"x" * len(view)
+        return len(view)
+
+    with patch("socket.socket") as mock_socket:
+        mock_socket.return_value.recv_into.side_effect = fill
+        with pytest.raises(OSError, match="Reply longer"):
+            ctl._send_message("v")
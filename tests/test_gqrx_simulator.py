@@ -0,0 +1,99 @@
+import socket
+
+import pytest
+
+from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.rig_backends.gqrx_rigctl import GQRXRigCtl
+from rig_remote.rig_backends.gqrx_simulator import GQRXSimulator
+from rig_remote.rig_backends.simulated_rigctl import (
+    Carrier,
+    SimulatedRigCtl,
+    SimulatedSpectrum,
+    SimulationProfile,
+)
+
+
+def _simulated(**kw) -> SimulatedRigCtl:
+    return SimulatedRigCtl(sleep_fn=lambda _: None, **kw)
+
+
+@pytest.fixture
+def simulator():
+    rig = _simulated(spectrum=SimulatedSpectrum(carriers=[Carrier(frequency=145_500_000, level=-20.5)]))
+    with GQRXSimulator(rig=rig) as running:
+        yield running
+
+
+def _client(simulator: GQRXSimulator) -> GQRXRigCtl:
+    host, port = simulator.address
+    return GQRXRigCtl(endpoint=RigEndpoint(hostname=host, port=port, number=1))
+
+
+def _session(simulator: GQRXSimulator, payload: bytes) -> bytes:
+    with socket.create_connection(simulator.address, timeout=5) as conn:
+        conn.sendall(payload)
+        conn.shutdown(socket.SHUT_WR)
+        chunks = []
+        while chunk := conn.recv(1024):
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def test_gqrx_simulator_address_requires_running():
+    with pytest.raises(RuntimeError):
+        _ = GQRXSimulator().address
+
+
+def test_gqrx_simulator_rigctl_roundtrip(simulator):
+    rigctl = _client(simulator)
+    rigctl.set_frequency(145_500_000)
+    rigctl.set_mode("USB")
+    assert rigctl.get_frequency() == 145_500_000
+    assert rigctl.get_mode() == "USB"
+    assert rigctl.get_level() == -20
+    rigctl.start_recording()
+    assert simulator.rig.recording is True
+    rigctl.stop_recording()
+    assert simulator.rig.recording is False
+
+
+def test_gqrx_simulator_rigctl_other_commands(simulator):
+    rigctl = _client(simulator)
+    rigctl.set_vfo("VFOB")
+    rigctl.set_rit(50)
+    rigctl.set_antenna(2)
+    rigctl.set_split_freq(145_600_000)
+    assert rigctl.get_vfo().strip() == "VFOB"
+    assert rigctl.get_rit().strip() == "50"
+    assert rigctl.get_antenna() == 2
+    assert rigctl.get_split_freq() == 145_600_000
+    assert rigctl.rig_reset("VFO_RESET").strip() == "RPRT 0"
+
+
+def test_gqrx_simulator_several_commands_per_connection(simulator):
+    answer = _session(simulator, b"F 145500000\nf\nm\nl\nq\n")
+    assert answer == b"RPRT 0\n145500000\nFM\n10000\n-20.5\n"
+
+
+@pytest.mark.parametrize("payload", [b"F abc\n", b"M XYZ\n", b"W 1\n", b"\n", b"F\n"])
+def test_gqrx_simulator_rejects_invalid_commands(simulator, payload):
+    assert _session(simulator, payload) == b"RPRT 1\n"
+
+
+def test_gqrx_simulator_failure_drops_connection():
+    rig = _simulated(profile=SimulationProfile(failure_rate=1.0, fail_commands=frozenset({"get_level"})))
+    with GQRXSimulator(rig=rig) as running:
+        assert _session(running, b"f\nl\nf\n") == b"100000000\n"
+        with pytest.raises(ValueError):
+            _client(running).get_level()
+
+
+def test_gqrx_simulator_start_stop_idempotent():
+    simulator = GQRXSimulator()
+    simulator.stop()
+    simulator.start()
+    address = simulator.address
+    simulator.start()
+    assert simulator.address == address
+    simulator.stop()
+    simulator.stop()
@@ -0,0 +1,220 @@
+import json
+import os
+import subprocess
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from rig_remote.hamlib_models import (
+    HAMLIB_MODEL_FALLBACK,
+    HamlibModelLoader,
+    load_hamlib_models,
+    parse_rigctl_list,
+    rigctl_fingerprint,
+)
+
+_RIGCTL_SAMPLE = (
+    "Rig #  Mfg                    Model                   Version         Status\n"
+    "     1  Hamlib                 Dummy                   20240709.0      Stable\n"
+    "  1001  Yaesu                  FT-847                  20230512.0      Stable\n"
+    "  1002  Yaesu                  FT-1000                 20231124.0      Beta\n"
+)
+
+
+@pytest.fixture
+def rigctl(tmp_path):
+    """Fake rigctl script printing a version and a model list."""
+    script = tmp_path / "bin" / "rigctl"
+    script.parent.mkdir()
+    script.write_text(
+        "#!/bin/sh\n"
+        f'echo "$1" >> {tmp_path / "calls"}\n'
+        'if [ "$1" = "--version" ]; then echo "rigctl Hamlib 4.6"; exit 0; fi\n'
+        f"cat <<'END'\n{_RIGCTL_SAMPLE}END\n"
+    )
+    script.chmod(0o755)
+    return script
+
+
+def _calls(tmp_path):
+    calls_file = tmp_path / "calls"
+    return calls_file.read_text().split() if calls_file.exists() else []
+
+
+# ---------------------------------------------------------------------------
+# parse_rigctl_list
+# ---------------------------------------------------------------------------
+
+
+def test_parse_rigctl_list_count():
+    assert len(parse_rigctl_list(_RIGCTL_SAMPLE)) == 3
+
+
+def test_parse_rigctl_list_sorted_by_model_number():
+    nums = [int(e.split()[0]) for e in parse_rigctl_list(_RIGCTL_SAMPLE)]
+    assert nums == sorted(nums)
+
+
+def test_parse_rigctl_list_no_models():
+    assert parse_rigctl_list("no digits here\n") == []
+
+
+@pytest.mark.parametrize(
+    "rigctl_line,expected_num,expected_label",
+    [
+        ("     1  Hamlib  Dummy  20240709.0  Stable  RIG_MODEL_DUMMY\n", 1, "1 (Hamlib Dummy)"),
+        ("  1001  Yaesu  FT-847  20230512.0  Stable  RIG_MODEL_FT847\n", 1001, "1001 (Yaesu FT-847)"),
+        ("  3001  Kenwood  TS-2000  20230101.0  Stable  RIG_MODEL_TS2000\n", 3001, "3001 (Kenwood TS-2000)"),
+    ],
+)
+def test_parse_rigctl_list_format(rigctl_line, expected_num, expected_label):
+    result = parse_rigctl_list(rigctl_line)
+    assert result == [expected_label]
+    assert int(result[0].split()[0]) == expected_num
+
+
+# ---------------------------------------------------------------------------
+# load_hamlib_models
+# ---------------------------------------------------------------------------
+
+
+def test_load_falls_back_when_rigctl_not_on_path(tmp_path):
+    with patch("rig_remote.hamlib_models.shutil.which", return_value=None):
+        result = load_hamlib_models(str(tmp_path / "cache.json"))
+    assert result == HAMLIB_MODEL_FALLBACK
+    assert not (tmp_path / "cache.json").exists()
+
+
+@pytest.mark.parametrize(
+    "error",
+    [FileNotFoundError, OSError, subprocess.TimeoutExpired("rigctl", 5), subprocess.CalledProcessError(1, "rigctl")],
+)
+def test_load_falls_back_when_rigctl_fails(tmp_path, rigctl, error):
+    with patch("rig_remote.hamlib_models.subprocess.check_output", side_effect=error):
+        result = load_hamlib_models(str(tmp_path / "cache.json"), str(rigctl))
+    assert result == HAMLIB_MODEL_FALLBACK
+
+
+def test_load_falls_back_on_empty_output(tmp_path, rigctl):
+    with patch("rig_remote.hamlib_models.subprocess.check_output", return_value="no digits here\n"):
+        result = load_hamlib_models(str(tmp_path / "cache.json"), str(rigctl))
+    assert result == HAMLIB_MODEL_FALLBACK
+    assert not (tmp_path / "cache.json").exists()
+
+
+def test_load_queries_rigctl_and_writes_cache(tmp_path, rigctl):
+    cache = tmp_path / "cache" / "models.json"
+    result = load_hamlib_models(str(cache), str(rigctl))
+    assert result == ["1 (Hamlib Dummy)", "1001 (Yaesu FT-847)", "1002 (Yaesu FT-1000)"]
+    data = json.loads(cache.read_text())
+    assert data["models"] == result
+    assert data["rigctl_version"] == "rigctl Hamlib 4.6"
+    assert _calls(tmp_path) == ["--version", "--list"]
+
+
+def test_load_reuses_cache_while_rigctl_unchanged(tmp_path, rigctl):
+    cache = str(tmp_path / "cache.json")
+    first = load_hamlib_models(cache, str(rigctl))
+    assert load_hamlib_models(cache, str(rigctl)) == first
+    # a cache hit does not run rigctl at all
+    assert _calls(tmp_path) == ["--version", "--list"]
+
+
+def test_load_requeries_when_rigctl_modified(tmp_path, rigctl):
+    cache = str(tmp_path / "cache.json")
+    load_hamlib_models(cache, str(rigctl))
+    stat = os.stat(rigctl)
+    os.utime(rigctl, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    load_hamlib_models(cache, str(rigctl))
+    assert _calls(tmp_path).count("--list") == 2
+
+
+def test_load_requeries_when_rigctl_size_changes(tmp_path, rigctl):
+    cache = str(tmp_path / "cache.json")
+    load_hamlib_models(cache, str(rigctl))
+    stat = os.stat(rigctl)
+    with open(rigctl, "a") as script:
+        script.write("# replaced\n")
+    os.utime(rigctl, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    load_hamlib_models(cache, str(rigctl))
+    assert _calls(tmp_path).count("--list") == 2
+
+
+def test_load_ignores_cache_of_previous_format(tmp_path, rigctl):
+    cache = tmp_path / "cache.json"
+    load_hamlib_models(str(cache), str(rigctl))
+    data = json.loads(cache.read_text())
+    data["version"] = 1
+    cache.write_text(json.dumps(data))
+    load_hamlib_models(str(cache), str(rigctl))
+    assert _calls(tmp_path).count("--list") == 2
+
+
+@pytest.mark.parametrize("content", ["not json", "[]", '{"version": 1}', '{"version": 1, "rigctl": null}'])
+def test_load_ignores_invalid_cache(tmp_path, rigctl, content):
+    cache = tmp_path / "cache.json"
+    cache.write_text(content)
+    result = load_hamlib_models(str(cache), str(rigctl))
+    assert len(result) == 3
+    assert json.loads(cache.read_text())["models"] == result
+
+
+def test_load_ignores_unwritable_cache(tmp_path, rigctl):
+    cache = tmp_path / "cache.json"
+    cache.mkdir()
+    assert len(load_hamlib_models(str(cache), str(rigctl))) == 3
+
+
+def test_rigctl_fingerprint(tmp_path, rigctl):
+    fingerprint = rigctl_fingerprint(str(rigctl))
+    assert fingerprint == {
+        "path": str(rigctl),
+        "mtime": os.stat(rigctl).st_mtime_ns,
+        "size": os.stat(rigctl).st_size,
+    }
+    assert _calls(tmp_path) == []
+
+
+def test_rigctl_fingerprint_not_on_path():
+    with patch("rig_remote.hamlib_models.shutil.which", return_value=None):
+        assert rigctl_fingerprint() is None
+
+
+# ---------------------------------------------------------------------------
+# HamlibModelLoader
+# ---------------------------------------------------------------------------
+
+
+def test_loader_delivers_models_on_background_thread(tmp_path, rigctl):
+    delivered = []
+    loader = HamlibModelLoader(
+        lambda models: delivered.append((models, threading.current_thread())),
+        str(tmp_path / "cache.json"),
+        str(rigctl),
+    )
+    loader.start()
+    loader.join(10)
+    [(models, thread)] = delivered
+    assert len(models) == 3
+    assert thread is not threading.main_thread()
+
+
+def test_loader_start_twice_raises(tmp_path):
+    with patch("rig_remote.hamlib_models.shutil.which", return_value=None):
+        loader = HamlibModelLoader(lambda models: None, str(tmp_path / "cache.json"))
+        loader.start()
+        with pytest.raises(RuntimeError):
+            loader.start()
+        loader.join(10)
+
+
+def test_loader_callback_errors_are_logged(tmp_path, caplog):
+    def callback(models):
+        raise ValueError("boom")
+
+    with patch("rig_remote.hamlib_models.shutil.which", return_value=None):
+        loader = HamlibModelLoader(callback, str(tmp_path / "cache.json"))
+        loader.start()
+        loader.join(10)
+    assert "Hamlib model callback failed" in caplog.text
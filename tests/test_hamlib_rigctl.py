@@ -1,5 +1,6 @@
 import sys
 import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -118,6 +119,33 @@ def test_connect_raises_oserror_on_open_failure():
         ctl.connect()
 
 
+def test_connect_resolves_hamlib_once():
+    ctl = HamlibRigCtl(endpoint=_make_endpoint(), mode_translator=ModeTranslator(BackendType.HAMLIB))
+    rig = MagicMock()
+    _hl.Rig.return_value = rig
+    with patch("rig_remote.rig_backends.hamlib_rigctl._hamlib", wraps=_hamlib) as hamlib:
+        ctl.connect()
+        ctl.get_level()
+        ctl.set_frequency(145000000)
+        ctl.set_vfo("A")
+        ctl.rig_reset("NONE")
+    hamlib.assert_called_once()
+    rig.get_level_i.assert_called_once_with(_hl.RIG_LEVEL_STRENGTH)
+    rig.reset.assert_called_once_with(_hl.RIG_RESET_NONE)
+
+
+def test_vfo_constant_is_memoised():
+    ctl, mock_rig = _make_ctl_with_mock_rig()
+    ctl.set_vfo("B")
+    expected = _hl.RIG_VFO_B
+    _hl.RIG_VFO_B = object()
+    try:
+        ctl.set_vfo("b")
+    finally:
+        _hl.RIG_VFO_B = expected
+    assert [call.args for call in mock_rig.set_vfo.call_args_list] == [(expected,), (expected,)]
+
+
 # ---------------------------------------------------------------------------
 # disconnect()
 # ---------------------------------------------------------------------------
@@ -283,6 +311,78 @@ def test_get_level_reraises_on_error():
         ctl.get_level()
 
 
+# ---------------------------------------------------------------------------
+# get_status
+# ---------------------------------------------------------------------------
+
+def _status_rig(mock_rig: MagicMock) -> None:
+    levels = {_hl.RIG_LEVEL_STRENGTH: 5, _hl.RIG_LEVEL_RAWSTR: 120, _hl.RIG_LEVEL_SQLSTAT: 1}
+    mock_rig.get_freq.return_value = 145000000.0
+    mock_rig.get_mode.return_value = (32, 12500)  # FM
+    mock_rig.get_level_i.side_effect = levels.__getitem__
+    mock_rig.get_level_f.return_value = 0.5
+
+
+def test_get_status_reads_all_values():
+    ctl, mock_rig = _make_ctl_with_mock_rig()
+    _status_rig(mock_rig)
+    status = ctl.get_status()
+    assert status.frequency == 145000000
+    assert status.mode == "FM"
+    assert status.strength == 50
+    assert status.raw_strength == 120
+    assert status.squelch_open is True
+    assert status.rf_power == 0.5
+    mock_rig.get_level_f.assert_called_once_with(_hl.RIG_LEVEL_RFPOWER)
+
+
+def test_get_status_is_a_single_worker_transaction():
+    ctl, mock_rig = _make_ctl_with_mock_rig()
+    _status_rig(mock_rig)
+    with patch.object(ctl._worker, "run", wraps=ctl._worker.run) as run:
+        ctl.get_status()
+    run.assert_called_once()
+
+
+def test_get_status_skips_unsupported_levels():
+    ctl, mock_rig = _make_ctl_with_mock_rig()
+    _status_rig(mock_rig)
+    mock_rig.get_level_f.side_effect = RuntimeError("not supported")
+    assert ctl.get_status().rf_power is None
+    assert ctl.get_status().rf_power is None
+    mock_rig.get_level_f.assert_called_once()
+
+
+def test_get_status_reraises_strength_error():
+    ctl, mock_rig = _make_ctl_with_mock_rig()
+    _status_rig(mock_rig)
+    mock_rig.get_level_i.side_effect = RuntimeError("hw error")
+    with pytest.raises(RuntimeError):
+        ctl.get_status()
+
+
+@pytest.mark.parametrize("dcd, expected", [(1, True), (0, False)])
+def test_get_dcd_reads_squelch_state(dcd, expected):
+    ctl, mock_rig = _make_ctl_with_mock_rig()
+    mock_rig.get_dcd.return_value = dcd
+    mock_rig.error_status = 0
+    assert ctl.get_dcd() is expected
+    mock_rig.get_dcd.assert_called_once_with(_hl.RIG_VFO_CURR)
+
+
+def test_get_dcd_unavailable_raises_not_implemented():
+    ctl, mock_rig = _make_ctl_with_mock_rig()
+    _hl.RIG_ENAVAIL = 11
+    try:
+        ctl._hl = None
+        mock_rig.get_dcd.return_value = 0
+        mock_rig.error_status = -11
+        with pytest.raises(NotImplementedError):
+            ctl.get_dcd()
+    finally:
+        del _hl.RIG_ENAVAIL
+
+
 # ---------------------------------------------------------------------------
 # recording stubs
 # ---------------------------------------------------------------------------
@@ -610,3 +710,31 @@ def test_thread_safety_concurrent_get_frequency():
     assert not errors
     assert len(results) == 2
     assert all(r == 145000000 for r in results)
+
+
+def test_concurrent_identical_reads_share_one_transaction():
+    ctl, mock_rig = _make_ctl_with_mock_rig()
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_set_freq(*_args):
+        started.set()
+        release.wait(5)
+
+    mock_rig.set_freq.side_effect = slow_set_freq
+    mock_rig.get_level_i.return_value = 4
+    writer = threading.Thread(target=ctl.set_frequency, args=(145000000,))
+    writer.start()
+    assert started.wait(5)
+    results: list[int] = []
+    readers = [threading.Thread(target=lambda: results.append(ctl.get_level())) for _ in range(3)]
+    for reader in readers:
+        reader.start()
+    deadline = time.monotonic() + 5
+    while ctl._worker.merged < 2 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in (writer, *readers):
+        thread.join(5)
+    assert results == [40, 40, 40]
+    mock_rig.get_level_i.assert_called_once_with(_hl.RIG_LEVEL_STRENGTH)
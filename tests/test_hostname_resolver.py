@@ -0,0 +1,107 @@
+import threading
+from socket import gaierror
+from unittest.mock import Mock
+
+import pytest
+
+from rig_remote.hostname_resolver import HostnameResolver, is_ip_address
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.mark.parametrize(
+    "hostname, expected",
+    [("127.0.0.1", True), ("::1", True), ("localhost", False), ("192.168.1.300", False), ("", False)],
+)
+def test_is_ip_address(hostname, expected):
+    assert is_ip_address(hostname) is expected
+
+
+def test_resolve_caches_address(clock):
+    lookup = Mock(return_value="10.0.0.7")
+    resolver = HostnameResolver(ttl=60, lookup=lookup, clock=clock)
+    assert resolver.resolve("rig.example", timeout=5) == "10.0.0.7"
+    assert resolver.resolve("rig.example", timeout=5) == "10.0.0.7"
+    lookup.assert_called_once_with("rig.example")
+
+
+def test_resolve_again_after_ttl(clock):
+    lookup = Mock(side_effect=["10.0.0.7", "10.0.0.8"])
+    resolver = HostnameResolver(ttl=60, lookup=lookup, clock=clock)
+    assert resolver.resolve("rig.example", timeout=5) == "10.0.0.7"
+    clock.now = 61
+    assert resolver.resolve("rig.example", timeout=5) == "10.0.0.8"
+
+
+def test_failed_lookup_cached_for_negative_ttl(clock):
+    lookup = Mock(side_effect=[gaierror("unknown host"), "10.0.0.7"])
+    resolver = HostnameResolver(negative_ttl=10, lookup=lookup, clock=clock)
+    for _ in range(2):
+        with pytest.raises(gaierror):
+            resolver.resolve("rig.example", timeout=5)
+    assert lookup.call_count == 1
+    clock.now = 11
+    assert resolver.resolve("rig.example", timeout=5) == "10.0.0.7"
+
+
+def test_unicode_error_reported_as_gaierror():
+    resolver = HostnameResolver(lookup=Mock(side_effect=UnicodeError("label too long")))
+    with pytest.raises(gaierror, match="label too long"):
+        resolver.resolve("rig.example", timeout=5)
+
+
+def test_prefetch_does_not_block_and_is_shared():
+    answer = threading.Event()
+    lookup = Mock(side_effect=lambda hostname: answer.wait(5) and "10.0.0.7")
+    resolver = HostnameResolver(lookup=lookup)
+    first = resolver.prefetch("rig.example")
+    second = resolver.prefetch("rig.example")
+    assert first is second
+    assert not first.done()
+    answer.set()
+    assert resolver.resolve("rig.example", timeout=5) == "10.0.0.7"
+    lookup.assert_called_once()
+
+
+def test_lookup_runs_off_the_caller_thread():
+    threads = []
+    resolver = HostnameResolver(lookup=lambda hostname: threads.append(threading.current_thread()) or "10.0.0.7")
+    resolver.resolve("rig.example", timeout=5)
+    assert threads[0] is not threading.current_thread()
+    assert threads[0].daemon
+
+
+def test_resolve_timeout():
+    answer = threading.Event()
+    resolver = HostnameResolver(lookup=lambda hostname: answer.wait(5) and "10.0.0.7")
+    with pytest.raises(TimeoutError):
+        resolver.resolve("rig.example", timeout=0.01)
+    answer.set()
+
+
+def test_ip_address_is_not_looked_up():
+    lookup = Mock()
+    resolver = HostnameResolver(lookup=lookup)
+    assert resolver.prefetch("127.0.0.1").result(timeout=0) == "127.0.0.1"
+    assert resolver.resolve("::1") == "::1"
+    lookup.assert_not_called()
+
+
+def test_invalidate(clock):
+    lookup = Mock(side_effect=["10.0.0.7", "10.0.0.8"])
+    resolver = HostnameResolver(lookup=lookup, clock=clock)
+    resolver.resolve("rig.example", timeout=5)
+    resolver.invalidate("rig.example")
+    assert resolver.resolve("rig.example", timeout=5) == "10.0.0.8"
+    resolver.invalidate("unknown.example")
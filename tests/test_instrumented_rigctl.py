@@ -0,0 +1,192 @@
+import json
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.rig_backends.gqrx_rigctl import GQRXRigCtl
+from rig_remote.rig_backends.gqrx_simulator import GQRXSimulator
+from rig_remote.rig_backends.instrumented_rigctl import InstrumentedRigCtl, LatencyHistogram
+from rig_remote.rig_backends.protocol import RigBackend
+from rig_remote.rig_backends.simulated_rigctl import SimulatedRigCtl, SimulationProfile
+
+
+class _Clock:
+    """Advances by `step` seconds at every call."""
+
+    def __init__(self, step: float) -> None:
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+def _instrumented(profile: SimulationProfile | None = None, **kw) -> InstrumentedRigCtl:
+    return InstrumentedRigCtl(SimulatedRigCtl(profile=profile, sleep_fn=lambda _: None), **kw)
+
+
+def test_latency_histogram_empty():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) == 0.0
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 0
+    assert snapshot["min_s"] == snapshot["mean_s"] == snapshot["p99_s"] == 0.0
+    assert snapshot["buckets"] == {}
+
+
+def test_latency_histogram_statistics():
+    histogram = LatencyHistogram()
+    for seconds in [0.001] * 90 + [0.1] * 10:
+        histogram.record(seconds)
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 100
+    assert snapshot["min_s"] == 0.001
+    assert snapshot["max_s"] == 0.1
+    assert snapshot["mean_s"] == pytest.approx(0.0109)
+    assert 0.001 <= snapshot["p50_s"] < 0.002
+    assert 0.001 <= snapshot["p90_s"] < 0.002
+    assert snapshot["p99_s"] == pytest.approx(0.1)
+    assert sum(snapshot["buckets"].values()) == 100
+
+
+def test_latency_histogram_overflow_bucket():
+    histogram = LatencyHistogram()
+    histogram.record(60.0)
+    assert histogram.percentile(99) == 60.0
+    assert histogram.snapshot()["buckets"] == {"inf": 1}
+
+
+def test_instrumented_rigctl_is_a_rig_backend():
+    assert isinstance(_instrumented(), RigBackend)
+
+
+def test_instrumented_rigctl_forwards_calls():
+    rig = _instrumented()
+    assert rig.get_status().frequency == 100_000_000
+    rig.backend.commands.clear()
+    rig.set_frequency(145_000_000)
+    rig.set_mode("USB")
+    assert rig.get_frequency() == 145_000_000
+    assert rig.get_mode() == "USB"
+    assert rig.set_vfo("VFOB") == "RPRT 0"
+    assert rig.backend.commands == {"set_frequency": 1, "set_mode": 1, "get_frequency": 1, "get_mode": 1, "set_vfo": 1}
+
+
+def test_instrumented_rigctl_endpoint_delegates():
+    backend = SimulatedRigCtl()
+    rig = InstrumentedRigCtl(backend)
+    endpoint = RigEndpoint(hostname="127.0.0.1", port=7356, number=1)
+    rig.endpoint = endpoint
+    assert backend.endpoint is endpoint
+    assert rig.endpoint is endpoint
+
+
+def test_instrumented_rigctl_records_latency():
+    rig = _instrumented(clock=_Clock(0.002))
+    rig.get_level()
+    rig.get_level()
+    commands = rig.snapshot()["commands"]
+    assert list(commands) == ["get_level"]
+    assert commands["get_level"]["count"] == 2
+    assert commands["get_level"]["errors"] == 0
+    assert commands["get_level"]["mean_s"] == pytest.approx(0.002)
+
+
+def test_instrumented_rigctl_counts_errors_and_reraises():
+    rig = _instrumented(SimulationProfile(failure_rate=1.0))
+    with pytest.raises(OSError):
+        rig.get_level()
+    with pytest.raises(ValueError):
+        rig.set_mode("XYZ")
+    commands = rig.snapshot()["commands"]
+    assert commands["get_level"]["errors"] == 1
+    assert commands["set_mode"]["errors"] == 1
+
+
+def test_instrumented_rigctl_disabled_records_nothing():
+    clock = Mock(return_value=0.0)
+    rig = _instrumented(enabled=False, clock=clock)
+    rig.set_frequency(145_000_000)
+    assert rig.get_frequency() == 145_000_000
+    clock.assert_not_called()
+    assert rig.snapshot() == {"commands": {}, "phases": {}}
+    rig.enabled = True
+    rig.get_frequency()
+    assert rig.snapshot()["commands"]["get_frequency"]["count"] == 1
+
+
+def test_instrumented_rigctl_reset():
+    rig = _instrumented()
+    rig.get_frequency()
+    rig.reset()
+    assert rig.snapshot() == {"commands": {}, "phases": {}}
+
+
+def test_instrumented_rigctl_thread_safe():
+    rig = _instrumented()
+
+    def _work():
+        for _ in range(200):
+            rig.get_level()
+
+    threads = [threading.Thread(target=_work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert rig.snapshot()["commands"]["get_level"]["count"] == 800
+
+
+def test_instrumented_rigctl_records_gqrx_phases():
+    with GQRXSimulator() as simulator:
+        host, port = simulator.address
+        backend = GQRXRigCtl(endpoint=RigEndpoint(hostname=host, port=port, number=1))
+        rig = InstrumentedRigCtl(backend)
+        rig.set_frequency(145_000_000)
+        rig.get_frequency()
+        phases = rig.snapshot()["phases"]
+        assert set(phases) == {"connect", "send", "recv"}
+        assert all(phase["count"] == 2 for phase in phases.values())
+        rig.enabled = False
+        assert backend.phase_observer is None
+        rig.get_frequency()
+        assert rig.snapshot()["phases"]["recv"]["count"] == 2
+
+
+def test_gqrx_rigctl_no_phase_observer_by_default():
+    assert GQRXRigCtl(endpoint=RigEndpoint(hostname="127.0.0.1", port=7356, number=1)).phase_observer is None
+
+
+def test_instrumented_rigctl_dump(tmp_path):
+    path = tmp_path / "stats.json"
+    rig = _instrumented()
+    rig.get_frequency()
+    rig.dump(str(path))
+    data = json.loads(path.read_text())
+    assert data["commands"]["get_frequency"]["count"] == 1
+    assert "timestamp" in data
+    assert not (tmp_path / "stats.json.tmp").exists()
+
+
+def test_instrumented_rigctl_dump_write_error_is_logged(tmp_path, caplog):
+    rig = _instrumented()
+    rig.dump(str(tmp_path / "missing" / "stats.json"))
+    assert "Could not write rig statistics" in caplog.text
+
+
+def test_instrumented_rigctl_periodic_dump(tmp_path):
+    path = tmp_path / "stats.json"
+    rig = _instrumented()
+    rig.start_dump(str(path), interval=0.01)
+    rig.get_level()
+    rig.stop_dump()
+    assert json.loads(path.read_text())["commands"]["get_level"]["count"] == 1
+    rig.stop_dump()
+
+
+def test_instrumented_rigctl_periodic_dump_invalid_interval(tmp_path):
+    with pytest.raises(ValueError):
+        _instrumented().start_dump(str(tmp_path / "stats.json"), interval=0)
@@ -0,0 +1,159 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+from rig_remote.metrics import CONTENT_TYPE, MetricsCollector, MetricsHTTPServer, TextfileExporter
+from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.models.run_counters import ScanCounters, SyncCounters
+from rig_remote.queue_comms import QueueComms
+from rig_remote.rig_backends.gqrx_rigctl import GQRXRigCtl
+from rig_remote.rig_backends.gqrx_simulator import GQRXSimulator
+from rig_remote.rig_backends.instrumented_rigctl import BUCKET_BOUNDS, InstrumentedRigCtl
+from rig_remote.rig_backends.simulated_rigctl import SimulatedRigCtl, SimulationProfile
+from rig_remote.stmessenger import STMessenger
+
+
+class _Clock:
+    def __init__(self, step: float) -> None:
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+def _samples(text: str) -> dict[str, str]:
+    """Sample lines keyed by metric name and labels."""
+    return dict(line.rsplit(" ", 1) for line in text.splitlines() if line and not line.startswith("#"))
+
+
+def test_metrics_collector_without_sources():
+    assert _samples(MetricsCollector().render()) == {"rig_remote_up": "1"}
+
+
+def test_metrics_collector_scan_counters():
+    counters = ScanCounters(steps=10, hits=2, bookmarks_created=1, tune_errors=3, scans=1, active=True)
+    counters.last_step_time = 1700000000.5
+    text = MetricsCollector(scan_counters=counters).render()
+    samples = _samples(text)
+    assert samples["rig_remote_scan_steps_total"] == "10"
+    assert samples["rig_remote_scan_hits_total"] == "2"
+    assert samples["rig_remote_scan_bookmarks_created_total"] == "1"
+    assert samples["rig_remote_scan_tune_errors_total"] == "3"
+    assert samples["rig_remote_scans_total"] == "1"
+    assert samples["rig_remote_scan_active"] == "1"
+    assert samples["rig_remote_scan_last_step_timestamp_seconds"] == "1700000000.5"
+    assert "# TYPE rig_remote_scan_steps_total counter" in text
+    assert "# TYPE rig_remote_scan_active gauge" in text
+
+
+def test_metrics_collector_sync_counters():
+    samples = _samples(MetricsCollector(sync_counters=SyncCounters(syncs=5, errors=1, last_lag=0.25)).render())
+    assert samples["rig_remote_syncs_total"] == "5"
+    assert samples["rig_remote_sync_errors_total"] == "1"
+    assert samples["rig_remote_sync_lag_seconds"] == "0.25"
+
+
+def test_metrics_collector_queue_depth():
+    messenger = STMessenger(QueueComms())
+    messenger.send_event_update(("txt_passes", "2"))
+    samples = _samples(MetricsCollector(queues={"scan": messenger}).render())
+    assert samples['rig_remote_queue_depth{queue="scan",direction="child"}'] == "1"
+    assert samples['rig_remote_queue_depth{queue="scan",direction="parent"}'] == "0"
+
+
+def test_metrics_collector_backend_histograms():
+    rig = InstrumentedRigCtl(
+        SimulatedRigCtl(profile=SimulationProfile(failure_rate=1.0, fail_commands=frozenset({"get_level"}))),
+        clock=_Clock(0.001),
+    )
+    rig.get_frequency()
+    with pytest.raises(OSError):
+        rig.get_level()
+    text = MetricsCollector(backends={"rig1": rig}).render()
+    samples = _samples(text)
+    labels = 'backend="rig1",command="get_frequency"'
+    assert samples[f"rig_remote_backend_command_seconds_count{{{labels}}}"] == "1"
+    assert float(samples[f"rig_remote_backend_command_seconds_sum{{{labels}}}"]) == pytest.approx(0.001)
+    assert samples[f'rig_remote_backend_command_seconds_bucket{{{labels},le="+Inf"}}'] == "1"
+    buckets = [
+        line for line in text.splitlines() if line.startswith(f"rig_remote_backend_command_seconds_bucket{{{labels}")
+    ]
+    assert len(buckets) == len(BUCKET_BOUNDS) + 1
+    counts = [int(line.rsplit(" ", 1)[1]) for line in buckets]
+    assert counts == sorted(counts)
+    assert samples['rig_remote_backend_command_errors_total{backend="rig1",command="get_level"}'] == "1"
+    assert samples[f"rig_remote_backend_command_errors_total{{{labels}}}"] == "0"
+    assert "# TYPE rig_remote_backend_command_seconds histogram" in text
+
+
+def test_metrics_collector_backend_phases():
+    with GQRXSimulator() as simulator:
+        host, port = simulator.address
+        rig = InstrumentedRigCtl(GQRXRigCtl(endpoint=RigEndpoint(hostname=host, port=port, number=1)))
+        rig.get_frequency()
+    samples = _samples(MetricsCollector(backends={"gqrx": rig}).render())
+    for phase in ("connect", "send", "recv"):
+        assert samples[f'rig_remote_backend_phase_seconds_count{{backend="gqrx",phase="{phase}"}}'] == "1"
+
+
+def test_metrics_collector_backend_connects():
+    backend = SimulatedRigCtl()
+    backend.connect_count = 3  # type: ignore[attr-defined]
+    collector = MetricsCollector(backends={"direct": backend, "wrapped": InstrumentedRigCtl(backend)})
+    samples = _samples(collector.render())
+    assert samples['rig_remote_backend_connects_total{backend="direct"}'] == "3"
+    assert samples['rig_remote_backend_connects_total{backend="wrapped"}'] == "3"
+
+
+def test_metrics_collector_plain_backend_exports_nothing():
+    assert _samples(MetricsCollector(backends={"rig1": SimulatedRigCtl()}).render()) == {"rig_remote_up": "1"}
+
+
+def test_metrics_collector_escapes_labels():
+    samples = _samples(MetricsCollector(queues={'a"b\\c': STMessenger(QueueComms())}).render())
+    assert 'rig_remote_queue_depth{queue="a\\"b\\\\c",direction="child"}' in samples
+
+
+def test_metrics_http_server_serves_metrics():
+    collector = MetricsCollector(scan_counters=ScanCounters(steps=4))
+    with MetricsHTTPServer(collector, port=0) as server:
+        host, port = server.address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            body = response.read().decode()
+        assert _samples(body)["rig_remote_scan_steps_total"] == "4"
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"http://{host}:{port}/other", timeout=5)
+        assert error.value.code == 404
+
+
+def test_metrics_http_server_address_requires_running():
+    server = MetricsHTTPServer(MetricsCollector(), port=0)
+    with pytest.raises(RuntimeError):
+        _ = server.address
+    server.stop()
+
+
+def test_metrics_textfile_exporter(tmp_path):
+    path = tmp_path / "rig_remote.prom"
+    counters = ScanCounters()
+    exporter = TextfileExporter(MetricsCollector(scan_counters=counters), str(path), interval=60)
+    exporter.start()
+    counters.steps = 7
+    exporter.stop()
+    assert _samples(path.read_text())["rig_remote_scan_steps_total"] == "7"
+    assert not (tmp_path / "rig_remote.prom.tmp").exists()
+    exporter.stop()
+
+
+def test_metrics_textfile_exporter_write_error_logged(tmp_path, caplog):
+    TextfileExporter(MetricsCollector(), str(tmp_path / "missing" / "rig_remote.prom")).write()
+    assert "Could not write metrics" in caplog.text
+
+
+def test_metrics_textfile_exporter_invalid_interval(tmp_path):
+    with pytest.raises(ValueError):
+        TextfileExporter(MetricsCollector(), str(tmp_path / "rig_remote.prom"), interval=0)
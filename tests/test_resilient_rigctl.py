@@ -0,0 +1,225 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from rig_remote.exceptions import RigUnavailableError
+from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.rig_backends.protocol import RigBackend
+from rig_remote.rig_backends.resilient_rigctl import (
+    CircuitBreaker,
+    CircuitState,
+    ResilientRigCtl,
+    breaker_for,
+)
+from rig_remote.rig_backends.simulated_rigctl import SimulatedRigCtl, SimulationProfile
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: _Clock, **kw) -> CircuitBreaker:
+    defaults = dict(failure_threshold=2, base_delay=1.0, max_delay=4.0, jitter=0.0, clock=clock)
+    defaults.update(kw)
+    return CircuitBreaker(**defaults)
+
+
+def _failing_backend() -> Mock:
+    backend = Mock(spec=SimulatedRigCtl)
+    backend.endpoint = RigEndpoint(hostname="127.0.0.1", port=7356, number=1)
+    backend.get_level.side_effect = OSError("down")
+    return backend
+
+
+@pytest.mark.parametrize(
+    "kw",
+    [
+        dict(failure_threshold=0),
+        dict(base_delay=-1.0),
+        dict(base_delay=2.0, max_delay=1.0),
+        dict(jitter=1.5),
+    ],
+)
+def test_circuit_breaker_rejects_invalid_parameters(kw):
+    with pytest.raises(ValueError):
+        CircuitBreaker(**kw)
+
+
+def test_circuit_breaker_opens_after_threshold():
+    clock = _Clock()
+    breaker = _breaker(clock)
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.retry_in() == 1.0
+    with pytest.raises(RigUnavailableError):
+        breaker.before_call()
+
+
+def test_circuit_breaker_success_resets_failures():
+    breaker = _breaker(_Clock())
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_circuit_breaker_half_open_lets_one_trial_through():
+    clock = _Clock()
+    breaker = _breaker(clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 1.0
+    breaker.before_call()
+    assert breaker.state is CircuitState.HALF_OPEN
+    with pytest.raises(RigUnavailableError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.retry_in() == 0.0
+
+
+def test_circuit_breaker_backoff_doubles_up_to_max_delay():
+    clock = _Clock()
+    breaker = _breaker(clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    delays = []
+    for _ in range(4):
+        delays.append(breaker.retry_in())
+        clock.now += breaker.retry_in()
+        breaker.before_call()
+        breaker.record_failure()
+    assert delays == [1.0, 2.0, 4.0, 4.0]
+
+
+def test_circuit_breaker_jitter_shortens_delay():
+    breaker = _breaker(_Clock(), failure_threshold=1, jitter=0.5, rand=lambda: 1.0)
+    breaker.record_failure()
+    assert breaker.retry_in() == 0.5
+
+
+def test_breaker_for_is_shared_per_endpoint():
+    endpoint = RigEndpoint(hostname="127.0.0.1", port=7356, number=1)
+    other = RigEndpoint(hostname="127.0.0.1", port=7356, number=2)
+    assert breaker_for(endpoint) is breaker_for(endpoint)
+    assert breaker_for(endpoint) is not breaker_for(other)
+
+
+def test_resilient_rigctl_is_a_rig_backend():
+    assert isinstance(ResilientRigCtl(SimulatedRigCtl()), RigBackend)
+
+
+def test_resilient_rigctl_forwards_calls():
+    rig = ResilientRigCtl(SimulatedRigCtl(sleep_fn=lambda _: None))
+    assert rig.get_status().frequency == 100_000_000
+    rig.backend.commands.clear()
+    rig.set_frequency(145_000_000)
+    rig.set_mode("USB")
+    assert rig.get_frequency() == 145_000_000
+    assert rig.get_mode() == "USB"
+    assert rig.set_vfo("VFOB") == "RPRT 0"
+    assert rig.backend.commands == {"set_frequency": 1, "set_mode": 1, "get_frequency": 1, "get_mode": 1, "set_vfo": 1}
+
+
+def test_resilient_rigctl_uses_endpoint_breaker():
+    backend = SimulatedRigCtl()
+    rig = ResilientRigCtl(backend)
+    assert rig.breaker is breaker_for(backend.endpoint)
+    endpoint = RigEndpoint(hostname="127.0.0.1", port=7356, number=1)
+    rig.endpoint = endpoint
+    assert backend.endpoint is endpoint
+    assert rig.endpoint is endpoint
+    assert rig.breaker is breaker_for(endpoint)
+
+
+def test_resilient_rigctl_fails_fast_while_open():
+    clock = _Clock()
+    backend = _failing_backend()
+    rig = ResilientRigCtl(backend, _breaker(clock))
+    for _ in range(2):
+        with pytest.raises(OSError):
+            rig.get_level()
+    with pytest.raises(RigUnavailableError):
+        rig.get_level()
+    assert backend.get_level.call_count == 2
+    assert rig.retry_in() == 1.0
+
+    clock.now = 1.0
+    backend.get_level.side_effect = None
+    backend.get_level.return_value = 42
+    assert rig.get_level() == 42
+    assert rig.breaker.state is CircuitState.CLOSED
+
+
+def test_resilient_rigctl_value_error_is_not_a_failure():
+    rig = ResilientRigCtl(SimulatedRigCtl(), _breaker(_Clock(), failure_threshold=1))
+    with pytest.raises(ValueError):
+        rig.set_mode("XYZ")
+    assert rig.breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.parametrize("error", [ValueError("bad mode"), NotImplementedError()])
+def test_resilient_rigctl_half_open_trial_other_error_releases_trial(error):
+    clock = _Clock()
+    backend = _failing_backend()
+    rig = ResilientRigCtl(backend, _breaker(clock))
+    for _ in range(2):
+        with pytest.raises(OSError):
+            rig.get_level()
+    clock.now = 1.0
+    backend.get_level.side_effect = error
+    with pytest.raises(type(error)):
+        rig.get_level()
+    assert rig.breaker.state is CircuitState.OPEN
+    assert rig.retry_in() == 0.0
+
+    backend.get_level.side_effect = None
+    backend.get_level.return_value = 42
+    assert rig.get_level() == 42
+    assert rig.breaker.state is CircuitState.CLOSED
+
+
+def test_circuit_breaker_end_trial_ignored_when_closed():
+    breaker = _breaker(_Clock())
+    breaker.end_trial()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_resilient_rigctl_counts_simulated_failures():
+    backend = SimulatedRigCtl(profile=SimulationProfile(failure_rate=1.0), sleep_fn=lambda _: None)
+    rig = ResilientRigCtl(backend, _breaker(_Clock(), failure_threshold=1))
+    with pytest.raises(OSError):
+        rig.get_level()
+    assert rig.breaker.state is CircuitState.OPEN
+
+
+def test_circuit_breaker_single_trial_across_threads():
+    clock = _Clock()
+    breaker = _breaker(clock, failure_threshold=1)
+    breaker.record_failure()
+    clock.now = 1.0
+    allowed = []
+    barrier = threading.Barrier(8)
+
+    def attempt():
+        barrier.wait()
+        try:
+            breaker.before_call()
+        except RigUnavailableError:
+            return
+        allowed.append(True)
+
+    threads = [threading.Thread(target=attempt) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert allowed == [True]
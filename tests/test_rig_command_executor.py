@@ -0,0 +1,75 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from rig_remote.rig_command_executor import RigCommandExecutor
+
+
+@pytest.fixture
+def executor():
+    executor = RigCommandExecutor()
+    yield executor
+    executor.shutdown(wait=True)
+
+
+def test_submit_returns_command_result(executor):
+    command = Mock(return_value=145500000)
+    assert executor.submit(1, command, 1, key="value").result(timeout=5) == 145500000
+    command.assert_called_once_with(1, key="value")
+
+
+def test_submit_propagates_command_error(executor):
+    future = executor.submit(1, Mock(side_effect=OSError("unreachable")))
+    with pytest.raises(OSError, match="unreachable"):
+        future.result(timeout=5)
+
+
+def test_commands_run_off_the_caller_thread(executor):
+    thread = executor.submit(1, threading.current_thread).result(timeout=5)
+    assert thread is not threading.current_thread()
+    assert thread.name.startswith("rig-1")
+
+
+def test_commands_to_a_rig_run_in_order_one_at_a_time(executor):
+    calls = []
+    running = threading.Lock()
+
+    def command(number):
+        assert running.acquire(blocking=False)
+        calls.append(number)
+        running.release()
+
+    futures = [executor.submit(1, command, number) for number in range(50)]
+    for future in futures:
+        future.result(timeout=5)
+    assert calls == list(range(50))
+
+
+def test_slow_rig_does_not_delay_other_rigs(executor):
+    release = threading.Event()
+    slow = executor.submit(1, release.wait, 5)
+    assert executor.submit(2, Mock(return_value="FM")).result(timeout=5) == "FM"
+    assert not slow.done()
+    release.set()
+    assert slow.result(timeout=5) is True
+
+
+def test_shutdown_cancels_queued_commands():
+    executor = RigCommandExecutor()
+    started = threading.Event()
+    release = threading.Event()
+    running = executor.submit(1, lambda: started.set() or release.wait(5))
+    assert started.wait(5)
+    queued = executor.submit(1, Mock())
+    executor.shutdown()
+    release.set()
+    assert queued.cancelled()
+    assert running.result(timeout=5) is True
+
+
+def test_submit_after_shutdown_raises():
+    executor = RigCommandExecutor()
+    executor.shutdown()
+    with pytest.raises(RuntimeError):
+        executor.submit(1, Mock())
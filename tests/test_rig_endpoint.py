@@ -1,3 +1,8 @@
+import threading
+from socket import gaierror
+from unittest.mock import Mock, call, patch
+
+from rig_remote.hostname_resolver import HostnameResolver
 from rig_remote.models.rig_endpoint import RigEndpoint
 from rig_remote.rig_backends.protocol import BackendType
 import pytest
@@ -120,9 +125,12 @@ def test_rig_endpoint_set_port_error(test_port):
 @pytest.mark.parametrize(
     "test_hostname",
     [
-        "tests",
         "192.168.1.10.1",
         "192.168.1.300",
+        "-tests",
+        "tests..local",
+        "rig host",
+        "a" * 64,
     ],
 )
 def test_rig_endpoint_set_hostname_error(test_hostname):
@@ -244,3 +252,75 @@ def test_rig_endpoint_hamlib_rig_model_parametric(rig_model):
     )
     assert ep.rig_model == rig_model
     assert ep.backend == BackendType.HAMLIB
+
+
+# ---------------------------------------------------------------------------
+# Hostname resolution
+# ---------------------------------------------------------------------------
+
+def _resolver(lookup):
+    return patch("rig_remote.hostname_resolver.default_resolver", HostnameResolver(lookup=lookup))
+
+
+def test_rig_endpoint_creation_does_not_wait_for_dns():
+    answer = threading.Event()
+    with _resolver(lambda hostname: answer.wait(5) and "10.0.0.7"):
+        ep = RigEndpoint(hostname="rig.example", port=7356, number=1)
+        assert ep.address == ""
+        answer.set()
+        assert ep.resolve(timeout=5) == "10.0.0.7"
+    assert ep.address == "10.0.0.7"
+
+
+def test_rig_endpoint_unresolvable_hostname_fails_on_resolve():
+    with _resolver(Mock(side_effect=gaierror("Name or service not known"))):
+        ep = RigEndpoint(hostname="localhost", port=8080, number=1)
+        ep.set_hostname(hostname="tests")
+        assert ep.hostname == "tests"
+        with pytest.raises(OSError):
+            ep.resolve(timeout=5)
+
+
+def test_rig_endpoint_resolves_hostname_once():
+    lookup = Mock(return_value="10.0.0.7")
+    with _resolver(lookup):
+        endpoints = [RigEndpoint(hostname="rig.example", port=7356, number=n) for n in range(20)]
+        assert {ep.resolve(timeout=5) for ep in endpoints} == {"10.0.0.7"}
+    lookup.assert_called_once_with("rig.example")
+
+
+def test_rig_endpoint_reuses_address_until_invalidated():
+    lookup = Mock(side_effect=["10.0.0.7", "10.0.0.8", "10.0.0.9"])
+    with _resolver(lookup):
+        ep = RigEndpoint(hostname="rig.example", port=7356, number=1)
+        assert [ep.resolve(timeout=5) for _ in range(3)] == ["10.0.0.7"] * 3
+        ep.invalidate_address()
+        assert ep.address == ""
+        assert ep.resolve(timeout=5) == "10.0.0.8"
+        ep.set_hostname(hostname="other.example")
+        assert ep.resolve(timeout=5) == "10.0.0.9"
+    assert lookup.call_args_list == [call("rig.example"), call("rig.example"), call("other.example")]
+
+
+def test_rig_endpoint_ip_address_needs_no_lookup():
+    lookup = Mock()
+    with _resolver(lookup):
+        assert RigEndpoint(hostname="127.0.0.1", port=7356).resolve() == "127.0.0.1"
+    lookup.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Socket timeouts
+# ---------------------------------------------------------------------------
+
+def test_rig_endpoint_default_timeouts():
+    ep = RigEndpoint(hostname="127.0.0.1", port=7356)
+    assert ep.connect_timeout == 5.0
+    assert ep.read_timeout == 5.0
+
+
+@pytest.mark.parametrize("field_name", ["connect_timeout", "read_timeout"])
+@pytest.mark.parametrize("timeout", [0, -1.0])
+def test_rig_endpoint_invalid_timeout_raises(field_name, timeout):
+    with pytest.raises(ValueError):
+        RigEndpoint(hostname="127.0.0.1", port=7356, **{field_name: timeout})
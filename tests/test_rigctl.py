@@ -1,5 +1,7 @@
 import pytest
-from mock import create_autospec, patch
+from socket import gethostbyname
+from mock import Mock, create_autospec, patch
+from rig_remote.hostname_resolver import HostnameResolver
 from rig_remote.rigctl import RigCtl
 from rig_remote.models.rig_endpoint import RigEndpoint
 
@@ -114,6 +116,20 @@ def test_rigctl_set_commands(command, parameter, message):
     rigctl._send_message.assert_called_once_with(request=message)
 
 
+def _segments(*segments):
+    """recv_into side effect delivering *segments*, then end of stream."""
+    pending = list(segments)
+
+    def recv_into(view):
+        if not pending:
+            return 0
+        segment = pending.pop(0)
+        view[: len(segment)] = segment
+        return len(segment)
+
+    return recv_into
+
+
 def test_rigctl_set_commands_socket_mock():
     hostname = "localhost"
     port = 8080
@@ -121,9 +137,12 @@ def test_rigctl_set_commands_socket_mock():
     rig_endpoint = RigEndpoint(hostname=hostname, port=port, number=number)
     rigctl = RigCtl(endpoint=rig_endpoint)
     with patch("socket.socket") as mock_socket:
+        mock_socket.return_value.recv_into.side_effect = _segments(b"RPRT 0\n")
         rigctl.set_frequency(frequency=1.1)
         assert mock_socket.call_count == 1
-        mock_socket().connect.assert_called_once_with(("localhost", 8080))
+        # connects to the address resolved by the endpoint
+        mock_socket().connect.assert_called_once_with((rig_endpoint.address, 8080))
+        assert rig_endpoint.address == gethostbyname("localhost")
         mock_socket().sendall.assert_called_once_with((bytearray(b"F 1\n")))
         mock_socket().close.assert_called_once()
 
@@ -139,8 +158,28 @@ def test_rigctl_set_commands_socket_mock_exception():
         with pytest.raises(TimeoutError):
             rigctl.set_frequency(frequency=1.1)
         assert mock_socket.call_count == 1
-        mock_socket().connect.assert_called_once_with(("localhost", 8080))
+        # connects to the address resolved by the endpoint
+        mock_socket().connect.assert_called_once_with((gethostbyname("localhost"), 8080))
         mock_socket().sendall.assert_called_once_with((bytearray(b"F 1\n")))
+        # forgotten after the error, looked up again by the next command
+        assert rig_endpoint.address == ""
+
+
+def test_rigctl_resolves_hostname_once_and_again_after_connection_error():
+    lookup = Mock(side_effect=["10.0.0.7", "10.0.0.8"])
+    with patch("rig_remote.hostname_resolver.default_resolver", HostnameResolver(lookup=lookup)):
+        rigctl = RigCtl(endpoint=RigEndpoint(hostname="rig.example", port=8080, number=1))
+        with patch("socket.socket") as mock_socket:
+            mock_socket.return_value.recv_into.side_effect = _segments(*[b"RPRT 0\n"] * 3)
+            rigctl.set_frequency(frequency=1.1)
+            rigctl.set_frequency(frequency=1.2)
+            mock_socket.return_value.connect.side_effect = [ConnectionRefusedError, None]
+            with pytest.raises(ConnectionRefusedError):
+                rigctl.set_frequency(frequency=1.3)
+            rigctl.set_frequency(frequency=1.4)
+        addresses = [args[0][0] for args, _ in mock_socket.return_value.connect.call_args_list]
+    assert addresses == ["10.0.0.7", "10.0.0.7", "10.0.0.7", "10.0.0.8"]
+    assert lookup.call_count == 2
 
 
 @pytest.mark.parametrize(
@@ -298,7 +337,7 @@ def test_rigctl_send_message_receive_error():
     rigctl = RigCtl(endpoint=rig_endpoint)
 
     with patch("socket.socket") as mock_socket:
-        mock_socket.return_value.recv.side_effect = OSError()
+        mock_socket.return_value.recv_into.side_effect = OSError()
         with pytest.raises(OSError):
             rigctl._send_message("tests")
 
@@ -308,6 +347,6 @@ def mock_socket():
     with patch("socket.socket") as mock:
         socket_instance = mock.return_value
         socket_instance.send.return_value = None
-        socket_instance.recv.return_value = b"OK\n"
+        socket_instance.recv_into.side_effect = _segments(b"OK\n")
         socket_instance.connect.return_value = None
         yield socket_instance
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from rig_remote.bookmarksmanager import bookmark_factory
+from rig_remote.models.scan_segment import ScanSegment
+from rig_remote.models.scanning_task import ScanningTask
+from rig_remote.scan_checkpoint import ScanCheckpoint, ScanCheckpointStore
+
+
+def _task(**kw) -> ScanningTask:
+    defaults = dict(
+        frequency_modulation="FM",
+        scan_mode="frequency",
+        new_bookmarks_list=[],
+        range_min=100_000_000,
+        range_max=100_500_000,
+        interval=100_000,
+        delay=0,
+        passes=3,
+        sgn_level=-40,
+        wait=False,
+        record=False,
+        auto_bookmark=False,
+        log=False,
+        bookmarks=[],
+    )
+    defaults.update(kw)
+    return ScanningTask(**defaults)
+
+
+def _bm(freq: int):
+    return bookmark_factory(
+        input_frequency=freq, modulation="FM", description="auto added by scan", lockout="", bookmark_id="id1"
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ScanCheckpointStore(str(tmp_path / "scan.checkpoint"), save_every=3)
+
+
+def test_scan_checkpoint_invalid_save_every(tmp_path):
+    with pytest.raises(ValueError):
+        ScanCheckpointStore(str(tmp_path / "scan.checkpoint"), save_every=0)
+
+
+def test_scan_checkpoint_roundtrip(store):
+    task = _task(new_bookmarks_list=[_bm(100_200_000)])
+    store.save(task, 100_300_000, 2)
+    assert store.load(_task()) == ScanCheckpoint(frequency=100_300_000, pass_count=2, new_bookmarks=[_bm(100_200_000)])
+
+
+def test_scan_checkpoint_load_missing_file(store):
+    assert store.load(_task()) is None
+
+
+@pytest.mark.parametrize("content", ["not json", "[]", '{"version": 1}', ""])
+def test_scan_checkpoint_load_invalid_file(store, content):
+    with open(store.path, "w", encoding="utf-8") as f:
+        f.write(content)
+    assert store.load(_task()) is None
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        dict(range_min=100_100_000),
+        dict(range_max=100_600_000),
+        dict(interval=200_000),
+        dict(frequency_modulation="AM"),
+        dict(segments=[ScanSegment(range_min=100_000_000, range_max=100_500_000, interval=100_000, modulation="FM")]),
+    ],
+)
+def test_scan_checkpoint_load_other_scan_ignored(store, other):
+    store.save(_task(), 100_300_000, 2)
+    assert store.load(_task(**other)) is None
+
+
+def test_scan_checkpoint_load_other_version_ignored(store):
+    store.save(_task(), 100_300_000, 2)
+    with open(store.path, encoding="utf-8") as f:
+        data = json.load(f)
+    data["version"] = 0
+    with open(store.path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    assert store.load(_task()) is None
+
+
+def test_scan_checkpoint_save_is_atomic(store, tmp_path):
+    store.save(_task(), 100_300_000, 2)
+    assert [p.name for p in tmp_path.iterdir()] == ["scan.checkpoint"]
+
+
+def test_scan_checkpoint_save_error_is_not_raised(tmp_path):
+    store = ScanCheckpointStore(str(tmp_path / "missing_dir" / "scan.checkpoint"))
+    store.save(_task(), 100_300_000, 2)  # logged, not raised
+    assert store.load(_task()) is None
+
+
+def test_scan_checkpoint_step_saves_every_n_steps(store):
+    task = _task()
+    for freq in (100_000_000, 100_100_000):
+        store.step(task, freq, 3)
+    assert store.load(task) is None
+    store.step(task, 100_200_000, 3)
+    assert store.load(task).frequency == 100_200_000
+    store.step(task, 100_300_000, 3)
+    assert store.load(task).frequency == 100_200_000
+
+
+def test_scan_checkpoint_clear(store):
+    store.save(_task(), 100_300_000, 2)
+    store.clear()
+    assert store.load(_task()) is None
+    store.clear()  # no file, no error
@@ -0,0 +1,139 @@
+import pytest
+
+from rig_remote.bookmarksmanager import bookmark_factory
+from rig_remote.constants import MAX_FREQUENCY_HZ
+from rig_remote.models.scan_segment import ScanSegment
+from rig_remote.models.scanning_task import ScanningTask
+from rig_remote.scan_plan import (
+    MODE_CODES,
+    ScanPlan,
+    compile_bookmark_plan,
+    compile_frequency_plan,
+    mode_code,
+)
+
+
+def _task(**kw) -> ScanningTask:
+    defaults = dict(
+        frequency_modulation="FM",
+        scan_mode="frequency",
+        new_bookmarks_list=[],
+        range_min=100_000_000,
+        range_max=100_500_000,
+        interval=100_000,
+        delay=0,
+        passes=1,
+        sgn_level=-40,
+        wait=False,
+        record=False,
+        auto_bookmark=False,
+        log=False,
+        bookmarks=[],
+    )
+    defaults.update(kw)
+    return ScanningTask(**defaults)
+
+
+def _bm(freq: int, modulation: str = "FM", lockout: str = ""):
+    return bookmark_factory(input_frequency=freq, modulation=modulation, description="test", lockout=lockout)
+
+
+@pytest.mark.parametrize("modulation", ["FM", "fm", "Usb", "WFM_ST"])
+def test_scan_plan_mode_code_roundtrip(modulation):
+    assert MODE_CODES[mode_code(modulation)] == modulation.upper()
+
+
+def test_scan_plan_mode_code_unsupported():
+    with pytest.raises(ValueError):
+        mode_code("XYZ")
+
+
+def test_scan_plan_empty():
+    plan = ScanPlan()
+    assert len(plan) == 0
+    assert plan.resume_index(100) == 0
+
+
+def test_scan_plan_frequency_steps_exclude_range_max():
+    plan = compile_frequency_plan(_task())
+    assert list(plan.frequencies) == [100_000_000, 100_100_000, 100_200_000, 100_300_000, 100_400_000]
+    assert {plan.mode(i) for i in range(len(plan))} == {"FM"}
+
+
+def test_scan_plan_frequency_modulation_normalised():
+    plan = compile_frequency_plan(_task(frequency_modulation="am"))
+    assert plan.mode(0) == "AM"
+
+
+def test_scan_plan_frequency_zero_first_step_empty_plan():
+    task = _task(range_min=0, range_max=3_000, interval=1_000)
+    assert len(compile_frequency_plan(task)) == 0
+
+
+def test_scan_plan_frequency_capped_at_max_frequency():
+    task = _task(range_min=MAX_FREQUENCY_HZ - 2_000, range_max=MAX_FREQUENCY_HZ)
+    task.range_max = MAX_FREQUENCY_HZ + 5_000  # as set by a queue event
+    task.interval = 1_000
+    assert compile_frequency_plan(task).frequencies[-1] == MAX_FREQUENCY_HZ
+
+
+@pytest.mark.parametrize("interval", [0, -5, 10])
+def test_scan_plan_frequency_interval_clamped(interval):
+    task = _task(range_min=100_000_000, range_max=100_003_000)
+    task.interval = interval  # as set by a queue event
+    assert list(compile_frequency_plan(task).frequencies) == [100_000_000, 100_001_000, 100_002_000]
+
+
+def test_scan_plan_frequency_empty_range():
+    task = _task()
+    task.range_min = task.range_max
+    assert len(compile_frequency_plan(task)) == 0
+
+
+def test_scan_plan_frequency_unsupported_modulation():
+    task = _task()
+    task.frequency_modulation = "XYZ"
+    with pytest.raises(ValueError):
+        compile_frequency_plan(task)
+
+
+@pytest.mark.parametrize("frequency,expected", [
+    (99_000_000, 0),
+    (100_000_000, 0),
+    (100_050_000, 1),
+    (100_400_000, 4),
+    (100_400_001, 5),
+])
+def test_scan_plan_resume_index(frequency, expected):
+    assert compile_frequency_plan(_task()).resume_index(frequency) == expected
+
+
+def test_scan_plan_frequency_segments_concatenated():
+    task = _task(
+        segments=[
+            ScanSegment(range_min=145_000_000, range_max=145_025_000, interval=12_500, modulation="FM"),
+            ScanSegment(range_min=118_000_000, range_max=118_050_000, interval=25_000, modulation="AM"),
+        ]
+    )
+    plan = compile_frequency_plan(task)
+    assert list(plan.frequencies) == [118_000_000, 118_025_000, 145_000_000, 145_012_500]
+    assert [plan.mode(i) for i in range(len(plan))] == ["AM", "AM", "FM", "FM"]
+    assert plan.resume_index(130_000_000) == 2
+
+
+def test_scan_plan_frequency_segments_ignore_task_range():
+    task = _task(segments=[ScanSegment(range_min=145_000_000, range_max=145_002_000, interval=1_000, modulation="FM")])
+    task.range_min, task.range_max, task.interval = 1_000, 5_000, 1_000  # as set by queue events
+    assert list(compile_frequency_plan(task).frequencies) == [145_000_000, 145_001_000]
+
+
+def test_scan_plan_bookmarks_drop_locked_entries():
+    first, locked, last = _bm(145_000_000), _bm(146_000_000, lockout="L"), _bm(147_000_000, modulation="USB")
+    plan = compile_bookmark_plan([first, locked, last])
+    assert plan.bookmarks == [first, last]
+    assert list(plan.frequencies) == [145_000_000, 147_000_000]
+    assert [plan.mode(i) for i in range(len(plan))] == ["FM", "USB"]
+
+
+def test_scan_plan_bookmarks_empty():
+    assert len(compile_bookmark_plan([_bm(145_000_000, lockout="L")])) == 0
@@ -0,0 +1,96 @@
+import pytest
+
+from rig_remote.scan_profiler import PHASES, ScanProfiler
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _profiler() -> tuple[ScanProfiler, _Clock]:
+    clock = _Clock()
+    return ScanProfiler(clock=clock), clock
+
+
+def test_scan_profiler_empty_summary():
+    profiler, _ = _profiler()
+    summary = profiler.summary()
+    assert summary["steps"] == 0
+    assert summary["wall_s"] == 0.0
+    assert set(summary["phases"]) == {*PHASES, "other"}
+    assert all(phase["share"] == 0.0 and phase["ms_per_step"] == 0.0 for phase in summary["phases"].values())
+
+
+def test_scan_profiler_attributes_phases():
+    profiler, clock = _profiler()
+    for _ in range(2):
+        profiler.step()
+        with profiler.phase("tune_io"):
+            clock.now += 0.1
+        with profiler.phase("settle_sleep"):
+            clock.now += 0.25
+        clock.now += 0.15
+    profiler.stop()
+    summary = profiler.summary()
+    assert summary["steps"] == 2
+    assert summary["wall_s"] == pytest.approx(1.0)
+    tune, settle, other = (summary["phases"][name] for name in ("tune_io", "settle_sleep", "other"))
+    assert tune["count"] == 2
+    assert tune["total_s"] == pytest.approx(0.2)
+    assert tune["share"] == pytest.approx(0.2)
+    assert tune["ms_per_step"] == pytest.approx(100.0)
+    assert settle["share"] == pytest.approx(0.5)
+    assert other["total_s"] == pytest.approx(0.3)
+
+
+def test_scan_profiler_phase_timed_on_exception():
+    profiler, clock = _profiler()
+    with pytest.raises(OSError):
+        with profiler.phase("tune_io"):
+            clock.now += 0.5
+            raise OSError
+    assert profiler.totals["tune_io"] == pytest.approx(0.5)
+    assert profiler.counts["tune_io"] == 1
+
+
+def test_scan_profiler_unknown_phase():
+    profiler, _ = _profiler()
+    with pytest.raises(KeyError):
+        with profiler.phase("coffee"):
+            pass
+
+
+def test_scan_profiler_running_summary_uses_clock():
+    profiler, clock = _profiler()
+    profiler.step()
+    clock.now = 2.0
+    assert profiler.summary()["wall_s"] == pytest.approx(2.0)
+
+
+def test_scan_profiler_reset():
+    profiler, clock = _profiler()
+    profiler.step()
+    with profiler.phase("queue"):
+        clock.now += 1.0
+    profiler.stop()
+    profiler.reset()
+    assert profiler.steps == 0
+    assert profiler.totals["queue"] == 0.0
+    assert profiler.summary()["wall_s"] == 0.0
+
+
+def test_scan_profiler_report_slowest_first():
+    profiler, clock = _profiler()
+    profiler.step()
+    with profiler.phase("sample_io"):
+        clock.now += 0.1
+    with profiler.phase("settle_sleep"):
+        clock.now += 0.5
+    profiler.stop()
+    lines = profiler.report().splitlines()
+    assert lines[0] == "Scan profile: 1 steps in 0.600 s"
+    assert [line.split()[0] for line in lines[1:]] == ["settle_sleep", "sample_io"]
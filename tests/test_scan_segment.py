@@ -0,0 +1,68 @@
+import pytest
+
+from rig_remote.constants import MAX_FREQUENCY_HZ
+from rig_remote.models.scan_segment import ScanSegment, merge_segments
+
+
+def _seg(range_min: int, range_max: int, interval: int = 1_000, modulation: str = "FM") -> ScanSegment:
+    return ScanSegment(range_min=range_min, range_max=range_max, interval=interval, modulation=modulation)
+
+
+def test_scan_segment_modulation_normalised():
+    assert _seg(1_000, 2_000, modulation="usb").modulation == "USB"
+
+
+@pytest.mark.parametrize(
+    "range_min, range_max, interval, modulation",
+    [
+        (0, 2_000, 1_000, "FM"),
+        (2_000, 2_000, 1_000, "FM"),
+        (3_000, 2_000, 1_000, "FM"),
+        (1_000, MAX_FREQUENCY_HZ + 2, 1_000, "FM"),
+        (1_000, 2_000, 0, "FM"),
+        (1_000, 2_000, 1_000, "XYZ"),
+    ],
+)
+def test_scan_segment_invalid(range_min, range_max, interval, modulation):
+    with pytest.raises(ValueError):
+        ScanSegment(range_min=range_min, range_max=range_max, interval=interval, modulation=modulation)
+
+
+def test_scan_segment_merge_sorts():
+    high, low = _seg(5_000, 6_000), _seg(1_000, 2_000)
+    assert merge_segments([high, low]) == [low, high]
+
+
+@pytest.mark.parametrize(
+    "segments, expected",
+    [
+        # overlapping, same parameters: joined
+        ([_seg(1_000, 3_000), _seg(2_000, 5_000)], [_seg(1_000, 5_000)]),
+        # adjacent, same parameters: joined
+        ([_seg(1_000, 3_000), _seg(3_000, 5_000)], [_seg(1_000, 5_000)]),
+        # contained, same parameters: absorbed
+        ([_seg(1_000, 5_000), _seg(2_000, 3_000)], [_seg(1_000, 5_000)]),
+        # overlapping, different mode: the second starts where the first ends
+        (
+            [_seg(1_000, 3_000), _seg(2_000, 5_000, modulation="AM")],
+            [_seg(1_000, 3_000), _seg(3_000, 5_000, modulation="AM")],
+        ),
+        # contained, different step: dropped
+        ([_seg(1_000, 5_000), _seg(2_000, 3_000, interval=500)], [_seg(1_000, 5_000)]),
+        # adjacent, different step: both kept
+        (
+            [_seg(1_000, 3_000), _seg(3_000, 5_000, interval=500)],
+            [_seg(1_000, 3_000), _seg(3_000, 5_000, interval=500)],
+        ),
+        ([], []),
+    ],
+)
+def test_scan_segment_merge(segments, expected):
+    assert merge_segments(segments) == expected
+
+
+def test_scan_segment_merge_does_not_mutate_input():
+    first, second = _seg(1_000, 3_000), _seg(2_000, 5_000)
+    merge_segments([first, second])
+    assert first == _seg(1_000, 3_000)
+    assert second == _seg(2_000, 5_000)
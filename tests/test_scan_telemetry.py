@@ -0,0 +1,143 @@
+import threading
+
+import pytest
+
+from rig_remote.bookmarksmanager import bookmark_factory
+from rig_remote.scan_telemetry import ScanTelemetry, TelemetrySample
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _bookmark(frequency=145_500_000):
+    return bookmark_factory(input_frequency=frequency, modulation="FM", description="auto added by scan", lockout="")
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def telemetry(clock):
+    return ScanTelemetry(interval=1.0, clock=clock)
+
+
+def test_scan_telemetry_first_signal_check_published(telemetry):
+    samples = []
+    telemetry.subscribe(samples.append)
+    telemetry.step()
+    telemetry.tuned(145_500_000)
+    telemetry.sampled(-250, hit=False)
+    assert len(samples) == 1
+    assert samples[0].frequency == 145_500_000
+    assert samples[0].level == -250
+    assert samples[0].steps == 1
+    assert samples[0].hits == 0
+    assert not samples[0].done
+    assert telemetry.last_sample is samples[0]
+
+
+def test_scan_telemetry_rate_limited(telemetry, clock):
+    samples = []
+    telemetry.subscribe(samples.append)
+    for step in range(10):
+        clock.now = step * 0.25
+        telemetry.sampled(step, hit=True)
+    assert [sample.level for sample in samples] == [0, 4, 8]
+    assert samples[-1].hits == 9
+
+
+def test_scan_telemetry_bookmarks_delivered_once(telemetry, clock):
+    samples = []
+    telemetry.subscribe(samples.append)
+    telemetry.sampled(0, hit=False)
+    first, second = _bookmark(), _bookmark(146_000_000)
+    telemetry.bookmark_created(first)
+    telemetry.sampled(0, hit=True)
+    clock.now = 1.0
+    telemetry.sampled(0, hit=True)
+    telemetry.bookmark_created(second)
+    telemetry.finish()
+    assert [sample.new_bookmarks for sample in samples] == [(), (first,), (second,)]
+    assert samples[-1].done
+
+
+def test_scan_telemetry_reset(telemetry):
+    telemetry.tuned(145_500_000)
+    telemetry.step()
+    telemetry.sampled(0, hit=True)
+    telemetry.bookmark_created(_bookmark())
+    telemetry.reset()
+    telemetry.finish()
+    assert telemetry.last_sample == TelemetrySample(
+        frequency=0, level=0, steps=0, hits=0, timestamp=telemetry.last_sample.timestamp, done=True
+    )
+
+
+def test_scan_telemetry_unsubscribe(telemetry):
+    samples = []
+    unsubscribe = telemetry.subscribe(samples.append)
+    unsubscribe()
+    unsubscribe()
+    telemetry.finish()
+    assert samples == []
+
+
+def test_scan_telemetry_failing_subscriber_isolated(telemetry, caplog):
+    samples = []
+
+    def failing(sample):
+        raise RuntimeError("slow consumer")
+
+    telemetry.subscribe(failing)
+    telemetry.subscribe(samples.append)
+    telemetry.finish()
+    assert len(samples) == 1
+    assert "slow consumer" in caplog.text
+
+
+def test_telemetry_stream_ends_with_scan(telemetry, clock):
+    stream = telemetry.stream()
+    telemetry.sampled(-100, hit=False)
+    clock.now = 2.0
+    telemetry.sampled(-50, hit=True)
+    telemetry.finish()
+    telemetry.finish()
+    samples = list(stream)
+    assert [sample.level for sample in samples] == [-100, -50, -50]
+    assert [sample.done for sample in samples] == [False, False, True]
+    assert telemetry._subscribers == ()
+
+
+def test_telemetry_stream_drops_oldest(telemetry, clock):
+    stream = telemetry.stream(maxsize=2)
+    for step in range(5):
+        clock.now = float(step)
+        telemetry.sampled(step, hit=False)
+    telemetry.finish()
+    assert [sample.level for sample in stream] == [4, 4]
+
+
+def test_telemetry_stream_get_timeout(telemetry):
+    with telemetry.stream() as stream:
+        assert stream.get(timeout=0.01) is None
+    assert telemetry._subscribers == ()
+    assert list(stream) == []
+
+
+def test_telemetry_stream_across_threads(telemetry):
+    stream = telemetry.stream()
+    received = []
+    consumer = threading.Thread(target=lambda: received.extend(stream))
+    consumer.start()
+    telemetry.sampled(-100, hit=True)
+    telemetry.finish()
+    consumer.join(timeout=5)
+    assert not consumer.is_alive()
+    assert [sample.done for sample in received] == [False, True]
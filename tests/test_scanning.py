@@ -19,9 +19,18 @@ from rig_remote.scanning import (
     Scanning2,
     create_scanner,
 )
+from rig_remote.bookmark_activity import BookmarkActivity
+from rig_remote.auto_bookmark_sink import AUTO_BOOKMARK_DESCRIPTION
+from rig_remote.scanning_config import DETECTOR_SQUELCH
+from rig_remote.models.run_counters import ScanCounters
+from rig_remote.models.scan_segment import ScanSegment
 from rig_remote.models.scanning_task import ScanningTask
+from rig_remote.scan_checkpoint import ScanCheckpointStore
+from rig_remote.scan_profiler import ScanProfiler
+from rig_remote.scan_telemetry import ScanTelemetry
 from rig_remote.models.channel import Channel
 from rig_remote.rigctl import RigCtl
+from rig_remote.rig_backends.resilient_rigctl import CircuitBreaker, ResilientRigCtl
 from rig_remote.stmessenger import STMessenger
 from rig_remote.disk_io import LogFile
 from rig_remote.bookmarksmanager import bookmark_factory
@@ -728,16 +737,16 @@ def test_scanning_bookmark_scanner_queue_sleep_called_when_active():
 
 
 def test_scanning_bookmark_scanner_queue_sleep_skipped_when_inactive_and_early_return():
-    """When channel_tune sets _scan_active=False (without exception), queue_sleep
+    """When tune sets _scan_active=False (without exception), queue_sleep
     is skipped and should_stop() triggers early return."""
     core = _core()
     sleep_calls = []
     core.queue_sleep = Mock(side_effect=lambda t: sleep_calls.append(t))
 
-    def terminating_tune(ch):
+    def terminating_tune(freq, mode):
         core._scan_active = False
 
-    core.channel_tune = Mock(side_effect=terminating_tune)
+    core.tune = Mock(side_effect=terminating_tune)
     scanner = BookmarkScannerStrategy(core)
     result = scanner.scan(_bm_task(bookmarks=[_bookmark()]), _log())
     # queue_sleep must NOT be called (active=False → guard skips it)
@@ -747,6 +756,374 @@ def test_scanning_bookmark_scanner_queue_sleep_skipped_when_inactive_and_early_r
     assert result is not None
 
 
+# ---------------------------------------------------------------------------
+# BookmarkScannerStrategy — scan: adaptive ordering
+# ---------------------------------------------------------------------------
+
+def test_scanning_bookmark_scanner_adaptive_visits_busiest_first():
+    rigctl = _rigctl(level=-600.0)
+    core = _core(rigctl=rigctl)
+    scanner = BookmarkScannerStrategy(core)
+    quiet = _bookmark(freq=145_000_000)
+    busy = _bookmark(freq=146_000_000)
+    activity = BookmarkActivity(cold_revisit_passes=1)
+    activity.record(busy, True)
+    scanner.scan(_bm_task(bookmarks=[quiet, busy], bookmark_activity=activity), _log())
+    assert rigctl.set_frequency.call_args_list == [call(146_000_000), call(145_000_000)]
+
+
+def test_scanning_bookmark_scanner_adaptive_records_signal_checks():
+    rigctl = _rigctl(level=-300.0)  # signal present
+    core = _core(rigctl=rigctl)
+    scanner = BookmarkScannerStrategy(core)
+    bm = _bookmark()
+    activity = BookmarkActivity()
+    scanner.scan(_bm_task(bookmarks=[bm], bookmark_activity=activity), _log())
+    assert activity.score(bm) == 1.0
+
+
+def test_scanning_bookmark_scanner_adaptive_skips_cold_bookmarks():
+    rigctl = _rigctl(level=-600.0)
+    core = _core(rigctl=rigctl)
+    scanner = BookmarkScannerStrategy(core)
+    cold = _bookmark(freq=145_000_000)
+    busy = _bookmark(freq=146_000_000)
+    activity = BookmarkActivity(cold_revisit_passes=3)
+    activity.record(cold, False)
+    activity.record(busy, True)
+    scanner.scan(_bm_task(bookmarks=[cold, busy], passes=3, bookmark_activity=activity), _log())
+    # skipped on passes 1 and 2, due again on pass 3
+    assert rigctl.set_frequency.call_args_list.count(call(145_000_000)) == 1
+    assert rigctl.set_frequency.call_args_list.count(call(146_000_000)) == 3
+
+
+def test_scanning_bookmark_scanner_adaptive_all_cold_still_tunes():
+    rigctl = _rigctl(level=-600.0)
+    core = _core(rigctl=rigctl)
+    scanner = BookmarkScannerStrategy(core)
+    bookmarks = [_bookmark(freq=145_000_000), _bookmark(freq=146_000_000)]
+    activity = BookmarkActivity(cold_revisit_passes=4)
+    for bookmark in bookmarks:
+        activity.record(bookmark, False)
+    scanner.scan(_bm_task(bookmarks=bookmarks, passes=1, bookmark_activity=activity), _log())
+    rigctl.set_frequency.assert_called_once_with(145_000_000)
+
+
+def test_scanning_bookmark_scanner_without_activity_keeps_list_order():
+    rigctl = _rigctl(level=-600.0)
+    core = _core(rigctl=rigctl)
+    scanner = BookmarkScannerStrategy(core)
+    bookmarks = [_bookmark(freq=145_000_000), _bookmark(freq=146_000_000)]
+    scanner.scan(_bm_task(bookmarks=bookmarks), _log())
+    assert rigctl.set_frequency.call_args_list == [call(145_000_000), call(146_000_000)]
+
+
+# ---------------------------------------------------------------------------
+# ScannerCore — tune / plan_stale
+# ---------------------------------------------------------------------------
+
+def test_scanning_core_tune_sets_frequency_and_mode():
+    rigctl = _rigctl()
+    core = _core(rigctl=rigctl)
+    core.tune(145_500_000, "USB")
+    rigctl.set_frequency.assert_called_once_with(145_500_000)
+    rigctl.set_mode.assert_called_once_with("USB")
+
+
+@pytest.mark.parametrize("event,stale", [
+    (("txt_range_min", "88000"), True),
+    (("txt_range_max", "108000"), True),
+    (("txt_interval", "200000"), True),
+    (("txt_delay", "2"), False),
+    (("ckb_wait", True), False),
+])
+def test_scanning_core_process_queue_marks_plan_stale(event, stale):
+    core = _core(queue=_queue([event]))
+    core.process_queue(_freq_task())
+    assert core.plan_stale is stale
+
+
+def test_scanning_freq_scanner_scan_recompiles_plan_on_interval_event():
+    """An interval event mid-pass recompiles the plan and resumes at the
+    current frequency on the new grid."""
+    rigctl = _rigctl(level=-600.0)
+    queue = Mock(spec=STMessenger)
+    # no event on the first step, then one interval update before the second
+    queue.update_queued.side_effect = [False, True, True] + [False] * 999
+    queue.get_event_update.side_effect = [("txt_interval", "200000")] + [None] * 999
+    core = _core(rigctl=rigctl, queue=queue)
+    task = _freq_task(range_min=100_000_000, range_max=100_600_000, interval=100_000)
+    FrequencyScannerStrategy(core).scan(task, _log())
+    assert [c.args[0] for c in rigctl.set_frequency.call_args_list] == [
+        100_000_000, 100_200_000, 100_400_000,
+    ]
+    assert core.plan_stale is False
+
+
+def test_scanning_freq_scanner_scan_unsupported_modulation_tunes_nothing():
+    rigctl = _rigctl()
+    core = _core(rigctl=rigctl)
+    task = _freq_task()
+    task.frequency_modulation = "XYZ"
+    FrequencyScannerStrategy(core).scan(task, _log())
+    rigctl.set_frequency.assert_not_called()
+    core.scan_queue.notify_end_of_scan.assert_called_once()
+
+
+def test_scanning_bookmark_scanner_recompiles_stale_plan_each_pass():
+    rigctl = _rigctl(level=-600.0)
+    core = _core(rigctl=rigctl)
+    bookmarks = [_bookmark(freq=145_000_000)]
+    task = _bm_task(bookmarks=bookmarks, passes=2)
+    scanner = BookmarkScannerStrategy(core)
+
+    def add_bookmark_after_first_pass(pass_count):
+        bookmarks.append(_bookmark(freq=146_000_000))
+        core.plan_stale = True
+        core.pass_count_update = ScannerCore.pass_count_update.__get__(core)
+        return core.pass_count_update(pass_count)
+
+    core.pass_count_update = Mock(side_effect=add_bookmark_after_first_pass)
+    scanner.scan(task, _log())
+    assert [c.args[0] for c in rigctl.set_frequency.call_args_list] == [
+        145_000_000, 145_000_000, 146_000_000,
+    ]
+
+
+def test_scanning_freq_scanner_scan_sweeps_all_segments_in_one_pass():
+    rigctl = _rigctl(level=-600.0)
+    core = _core(rigctl=rigctl)
+    task = _freq_task(
+        segments=[
+            _segment(145_000_000, 145_025_000, interval=12_500),
+            _segment(118_000_000, 118_050_000, interval=25_000, modulation="AM"),
+        ],
+    )
+    FrequencyScannerStrategy(core).scan(task, _log())
+    assert [c.args[0] for c in rigctl.set_frequency.call_args_list] == [
+        118_000_000, 118_025_000, 145_000_000, 145_012_500,
+    ]
+    assert [c.args[0] for c in rigctl.set_mode.call_args_list] == ["AM", "AM", "FM", "FM"]
+
+
+def test_scanning_freq_scanner_inner_scan_uses_segment_mode():
+    rigctl = _rigctl(level=-300.0)
+    core = _core(rigctl=rigctl)
+    task = _freq_task(
+        auto_bookmark=True, inner_band=2_000, inner_interval=1_000,
+        segments=[_segment(118_000_000, 118_025_000, interval=25_000, modulation="AM")],
+    )
+    FrequencyScannerStrategy(core).scan(task, _log())
+    assert {c.args[0] for c in rigctl.set_mode.call_args_list} == {"AM"}
+
+
+# ---------------------------------------------------------------------------
+# FrequencyScannerStrategy — scan: checkpoints
+# ---------------------------------------------------------------------------
+
+def _checkpoint_core(tmp_path, rigctl, resume=False, save_every=50):
+    store = ScanCheckpointStore(str(tmp_path / "scan.checkpoint"), save_every=save_every, resume=resume)
+    core = ScannerCore(
+        scan_queue=_queue(), rigctl=rigctl, config=_cfg(), sleep_fn=lambda _: None, checkpoint=store,
+    )
+    return core, store
+
+
+def _tuned(rigctl):
+    return [c.args[0] for c in rigctl.set_frequency.call_args_list]
+
+
+def test_scanning_freq_scanner_checkpoint_saved_on_tune_error(tmp_path):
+    rigctl = _rigctl(level=-600.0)
+    rigctl.set_frequency.side_effect = [None, None, OSError("comm")]
+    core, store = _checkpoint_core(tmp_path, rigctl)
+    task = _freq_task(range_min=100_000_000, range_max=100_500_000, interval=100_000, passes=2)
+    FrequencyScannerStrategy(core).scan(task, _log())
+    state = store.load(task)
+    assert (state.frequency, state.pass_count) == (100_200_000, 2)
+
+
+def test_scanning_freq_scanner_checkpoint_resume_skips_done_steps(tmp_path):
+    rigctl = _rigctl(level=-600.0)
+    core, store = _checkpoint_core(tmp_path, rigctl, resume=True)
+    task = _freq_task(range_min=100_000_000, range_max=100_500_000, interval=100_000, passes=2)
+    collected = bookmark_factory(
+        input_frequency=100_100_000, modulation="FM", description="auto added by scan", bookmark_id="a",
+    )
+    store.save(_freq_task(
+        range_min=100_000_000, range_max=100_500_000, interval=100_000, new_bookmarks_list=[collected],
+    ), 100_300_000, 1)
+    FrequencyScannerStrategy(core).scan(task, _log())
+    assert _tuned(rigctl) == [100_300_000, 100_400_000]
+    assert task.new_bookmarks_list == [collected]
+
+
+def test_scanning_freq_scanner_checkpoint_ignored_without_resume(tmp_path):
+    rigctl = _rigctl(level=-600.0)
+    core, store = _checkpoint_core(tmp_path, rigctl, resume=False)
+    task = _freq_task(range_min=100_000_000, range_max=100_300_000, interval=100_000)
+    store.save(task, 100_200_000, 1)
+    FrequencyScannerStrategy(core).scan(task, _log())
+    assert _tuned(rigctl) == [100_000_000, 100_100_000, 100_200_000]
+
+
+def test_scanning_freq_scanner_checkpoint_cleared_when_complete(tmp_path):
+    rigctl = _rigctl(level=-600.0)
+    core, store = _checkpoint_core(tmp_path, rigctl, save_every=1)
+    task = _freq_task(passes=2)
+    FrequencyScannerStrategy(core).scan(task, _log())
+    assert not (tmp_path / "scan.checkpoint").exists()
+
+
+def test_scanning_freq_scanner_checkpoint_saved_on_terminate(tmp_path):
+    rigctl = _rigctl(level=-600.0)
+    core, store = _checkpoint_core(tmp_path, rigctl)
+    task = _freq_task(range_min=100_000_000, range_max=100_300_000, interval=100_000, passes=2)
+
+    def terminating_tune(freq, mode):
+        core._scan_active = False
+
+    core.tune = Mock(side_effect=terminating_tune)
+    FrequencyScannerStrategy(core).scan(task, _log())
+    assert store.load(task).frequency == 100_100_000
+
+
+def test_scanning_freq_scanner_checkpoint_saved_at_pass_boundary(tmp_path):
+    rigctl = _rigctl(level=-600.0)
+    core, store = _checkpoint_core(tmp_path, rigctl)
+    task = _freq_task(passes=2)
+    saved = []
+    store.save = Mock(side_effect=lambda t, freq, passes: saved.append((freq, passes)))
+    FrequencyScannerStrategy(core).scan(task, _log())
+    assert saved == [(task.range_min, 1)]
+
+
+# ---------------------------------------------------------------------------
+# ScannerCore — priority_check
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("interval,priority", [
+    (0, True),    # disabled by interval
+    (1, False),   # disabled by empty list
+])
+def test_scanning_core_priority_check_disabled(interval, priority):
+    rigctl = _rigctl()
+    core = _core(rigctl=rigctl)
+    task = _freq_task(
+        priority_interval=interval,
+        priority_bookmarks=[_bookmark()] if priority else [],
+    )
+    assert core.priority_check(task, _log()) is False
+    rigctl.set_frequency.assert_not_called()
+
+
+@pytest.mark.parametrize("interval,steps,expected_visits", [
+    (1, 3, 3),
+    (2, 3, 1),
+    (2, 4, 2),
+    (5, 4, 0),
+])
+def test_scanning_core_priority_check_every_n_steps(interval, steps, expected_visits):
+    rigctl = _rigctl(level=-600.0)
+    core = _core(rigctl=rigctl)
+    task = _freq_task(priority_interval=interval, priority_bookmarks=[_bookmark(freq=145_500_000)])
+    visits = sum(core.priority_check(task, _log()) for _ in range(steps))
+    assert visits == expected_visits
+    assert rigctl.set_frequency.call_count == expected_visits
+
+
+def test_scanning_core_priority_check_skips_locked_bookmarks():
+    rigctl = _rigctl(level=-600.0)
+    core = _core(rigctl=rigctl)
+    task = _freq_task(
+        priority_interval=1,
+        priority_bookmarks=[_bookmark(freq=145_000_000, lockout="L"), _bookmark(freq=146_000_000)],
+    )
+    assert core.priority_check(task, _log()) is True
+    rigctl.set_frequency.assert_called_once_with(146_000_000)
+
+
+def test_scanning_core_priority_check_hit_logs_and_sleeps():
+    rigctl = _rigctl(level=-300.0)  # signal present
+    core = _core(rigctl=rigctl)
+    core.queue_sleep = Mock()
+    log = _log()
+    bm = _bookmark()
+    task = _freq_task(priority_interval=1, priority_bookmarks=[bm], log=True)
+    core.priority_check(task, log)
+    log.write.assert_called_once_with(record_type="B", record=bm, signal=[])
+    core.queue_sleep.assert_called_once_with(task)
+
+
+def test_scanning_core_priority_check_wait_holds_while_active():
+    rigctl = _rigctl()
+    # initial check hit, two more active checks while waiting, then quiet
+    rigctl.get_level.side_effect = [-300.0, -300.0, -300.0, -600.0]
+    core = _core(rigctl=rigctl)
+    core.queue_sleep = Mock()
+    task = _freq_task(priority_interval=1, priority_bookmarks=[_bookmark()], wait=True)
+    core.priority_check(task, _log())
+    assert rigctl.get_level.call_count == 4
+
+
+def test_scanning_core_priority_check_value_error_skips_channel():
+    rigctl = _rigctl(level=-600.0)
+    rigctl.set_frequency.side_effect = [ValueError("bad"), None]
+    core = _core(rigctl=rigctl)
+    task = _freq_task(
+        priority_interval=1,
+        priority_bookmarks=[_bookmark(freq=145_000_000), _bookmark(freq=146_000_000)],
+    )
+    assert core.priority_check(task, _log()) is True
+    assert rigctl.set_frequency.call_count == 2
+
+
+def test_scanning_core_priority_check_comms_error_propagates():
+    rigctl = _rigctl()
+    rigctl.set_frequency.side_effect = OSError("comm")
+    core = _core(rigctl=rigctl)
+    task = _freq_task(priority_interval=1, priority_bookmarks=[_bookmark()])
+    with pytest.raises(OSError):
+        core.priority_check(task, _log())
+
+
+def test_scanning_core_priority_check_stops_when_terminated():
+    rigctl = _rigctl(level=-600.0)
+    core = _core(rigctl=rigctl)
+    core.terminate()
+    task = _freq_task(priority_interval=1, priority_bookmarks=[_bookmark()])
+    assert core.priority_check(task, _log()) is True
+    rigctl.set_frequency.assert_not_called()
+
+
+def test_scanning_freq_scanner_scan_interleaves_priority_channel():
+    rigctl = _rigctl(level=-600.0)
+    core = _core(rigctl=rigctl)
+    scanner = FrequencyScannerStrategy(core)
+    task = _freq_task(
+        range_min=100_000_000, range_max=100_400_000, interval=100_000,
+        priority_interval=2, priority_bookmarks=[_bookmark(freq=145_500_000)],
+    )
+    scanner.scan(task, _log())
+    assert [c.args[0] for c in rigctl.set_frequency.call_args_list] == [
+        100_000_000, 145_500_000, 100_100_000, 100_200_000, 145_500_000, 100_300_000,
+    ]
+
+
+def test_scanning_bookmark_scanner_interleaves_priority_channel():
+    rigctl = _rigctl(level=-600.0)
+    core = _core(rigctl=rigctl)
+    scanner = BookmarkScannerStrategy(core)
+    task = _bm_task(
+        bookmarks=[_bookmark(freq=145_000_000), _bookmark(freq=146_000_000)],
+        priority_interval=1, priority_bookmarks=[_bookmark(freq=150_000_000)],
+    )
+    scanner.scan(task, _log())
+    assert [c.args[0] for c in rigctl.set_frequency.call_args_list] == [
+        150_000_000, 145_000_000, 150_000_000, 146_000_000,
+    ]
+
+
 # ---------------------------------------------------------------------------
 # FrequencyScannerStrategy — terminate
 # ---------------------------------------------------------------------------
@@ -762,13 +1139,40 @@ def test_scanning_freq_scanner_terminate():
 # FrequencyScannerStrategy — bookmark helpers
 # ---------------------------------------------------------------------------
 
-def test_scanning_freq_scanner_create_new_bookmark():
+def test_scanning_freq_scanner_add_hit():
     rigctl = _rigctl(mode="AM")
     core = _core(rigctl=rigctl)
     scanner = FrequencyScannerStrategy(core)
-    bm = scanner._create_new_bookmark(145_500_000)
+    task = _freq_task()
+    assert scanner._add_hit(145_500_000, "USB", task) is True
+    rigctl.get_mode.assert_not_called()
+    # queued until the sink is flushed
+    assert task.new_bookmarks_list == []
+    scanner._flush_bookmarks()
+    [bm] = task.new_bookmarks_list
     assert bm.channel.frequency == 145_500_000
-    assert bm.channel.modulation == "AM"
+    assert bm.channel.modulation == "USB"
+    assert bm.description == AUTO_BOOKMARK_DESCRIPTION
+
+
+def test_scanning_freq_scanner_add_hit_skips_known_channel():
+    scanner = FrequencyScannerStrategy(_core())
+    known = bookmark_factory(input_frequency=145_500_000, modulation="FM", description="known", lockout="")
+    task = _freq_task(bookmarks=[known])
+    assert scanner._add_hit(145_500_000, "FM", task) is False
+    assert scanner._add_hit(145_500_000, "AM", task) is True
+    assert scanner._add_hit(145_500_000, "AM", task) is False
+    scanner._flush_bookmarks()
+    assert [bm.channel.modulation for bm in task.new_bookmarks_list] == ["AM"]
+
+
+def test_scanning_freq_scanner_add_hit_uses_config_merge_bandwidth():
+    scanner = FrequencyScannerStrategy(_core(config=_cfg(merge_bandwidth=10_000)))
+    task = _freq_task()
+    assert scanner._add_hit(145_500_000, "FM", task, level=-300) is True
+    assert scanner._add_hit(145_510_000, "FM", task, level=-100) is False
+    scanner._flush_bookmarks()
+    assert [bm.channel.frequency for bm in task.new_bookmarks_list] == [145_510_000]
 
 
 def test_scanning_freq_scanner_store_prev_bookmark():
@@ -818,7 +1222,9 @@ def test_scanning_freq_scanner_autobookmark_level_comparison_parametric(
     # Seed prev_level so first call doesn't take the "prev_level=0" branch
     scanner._store_prev_bookmark(level=prev_level, freq=100_000_000)
     scanner._autobookmark(level=new_level, freq=100_100_000, task=task)
+    scanner._flush_bookmarks()
     assert (len(task.new_bookmarks_list) == 1) is expect_bookmark_added
+    rigctl.get_mode.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -897,7 +1303,7 @@ def test_scanning_freq_scanner_scan_range_min_gt_range_max_terminates():
 # ---------------------------------------------------------------------------
 
 def test_scanning_freq_scanner_scan_should_stop_early_return():
-    """channel_tune deactivates core (no exception); next inner-while iteration
+    """tune deactivates core (no exception); next inner-while iteration
     hits should_stop() → True → returns without notify_end_of_scan."""
     # range covers 3 steps so there is a 'next' iteration
     task = _freq_task(range_min=100_000_000, range_max=100_300_000, interval=100_000)
@@ -905,10 +1311,10 @@ def test_scanning_freq_scanner_scan_should_stop_early_return():
     queue = _queue()
     core = _core(rigctl=rigctl, queue=queue)
 
-    def terminating_tune(ch):
+    def terminating_tune(freq, mode):
         core._scan_active = False
 
-    core.channel_tune = Mock(side_effect=terminating_tune)
+    core.tune = Mock(side_effect=terminating_tune)
     scanner = FrequencyScannerStrategy(core)
     result = scanner.scan(task, _log())
     queue.notify_end_of_scan.assert_not_called()
@@ -963,7 +1369,10 @@ def test_scanning_freq_scanner_scan_log_parametric(do_log, expected_write_calls)
     scanner = FrequencyScannerStrategy(core)
     log = _log()
     scanner.scan(_freq_task(log=do_log), log)
-    assert log.write.call_count == expected_write_calls
+    assert log.write_entry.call_count == expected_write_calls
+    if do_log:
+        log.write_entry.assert_called_with(record_type="F", frequency=100_100_000, modulation="FM", signal=[])
+    rigctl.get_mode.assert_not_called()
 
 
 def test_scanning_freq_scanner_scan_queue_sleep_called_when_signal_and_active():
@@ -1013,11 +1422,56 @@ def test_scanning_freq_scanner_scan_hold_bookmark_adds_to_list():
     scanner.scan(task, _log())
 
     # After first freq auto_bookmark: _hold_bookmark=True, _prev_level=-40 (sgn_level)
-    # After second freq (no signal): elif self._hold_bookmark → _create_new_bookmark
+    # After second freq (no signal): elif self._hold_bookmark → _add_hit
     # new_bookmarks_list should have at least one entry
     assert len(task.new_bookmarks_list) >= 1
 
 
+@pytest.mark.parametrize("merge_bandwidth,expected", [
+    (0, [100_000_000, 100_100_000, 100_200_000]),
+    (100_000, [100_100_000]),
+])
+def test_scanning_freq_scanner_scan_merges_wide_signal(merge_bandwidth, expected):
+    """Three adjacent inner-scan peaks of one wide signal become one bookmark
+    at the strongest step once merge_bandwidth covers the step."""
+    task = _freq_task(
+        range_min=100_000_000, range_max=100_300_000, interval=100_000,
+        auto_bookmark=True, new_bookmarks_list=[],
+        inner_band=100_000, inner_interval=100_000,
+    )
+    rigctl = _rigctl(mode="FM")
+    # per step: outer check, then the single inner step
+    rigctl.get_level.side_effect = [-300.0, -300.0, -300.0, -100.0, -300.0, -300.0] + [-600.0] * 50
+    core = _core(rigctl=rigctl, config=_cfg(signal_checks=1, merge_bandwidth=merge_bandwidth))
+    scanner = FrequencyScannerStrategy(core)
+
+    scanner.scan(task, _log())
+
+    assert [bm.channel.frequency for bm in task.new_bookmarks_list] == expected
+    assert core.counters.bookmarks_created == len(expected)
+
+
+def test_scanning_freq_scanner_scan_bookmarks_flushed_once_per_pass():
+    """The held peak is bookmarked once, and reaches the core at the end of
+    the pass."""
+    task = _freq_task(
+        range_min=100_000_000, range_max=100_400_000, interval=100_000,
+        auto_bookmark=True, new_bookmarks_list=[],
+    )
+    rigctl = _rigctl(mode="FM")
+    rigctl.get_level.side_effect = [-300.0] + [-600.0] * 50
+    core = _core(rigctl=rigctl, config=_cfg(signal_checks=1))
+    created = []
+    core.bookmark_created = lambda bm: created.append((bm, rigctl.set_frequency.call_count))
+    scanner = FrequencyScannerStrategy(core)
+
+    scanner.scan(task, _log())
+
+    assert [bm.channel.frequency for bm in task.new_bookmarks_list] == [100_000_000]
+    assert [tunes for _, tunes in created] == [4]
+    rigctl.get_mode.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # ScanningTask — inner_band / inner_interval validation
 # ---------------------------------------------------------------------------
@@ -1075,6 +1529,54 @@ def test_scanning_task_inner_band_smaller_than_interval_allowed():
     assert task.inner_interval == 10_000
 
 
+# ---------------------------------------------------------------------------
+# ScanningTask — priority_bookmarks / priority_interval validation
+# ---------------------------------------------------------------------------
+
+def test_scanning_task_priority_disabled_by_default():
+    task = _freq_task()
+    assert task.priority_bookmarks == []
+    assert task.priority_interval == 0
+
+
+@pytest.mark.parametrize("interval,expected", [(-5, 0), (-1, 0), (0, 0), (3, 3)])
+def test_scanning_task_priority_interval_clamped(interval, expected):
+    assert _freq_task(priority_interval=interval).priority_interval == expected
+
+
+@pytest.mark.parametrize("count,expected", [(1, 1), (10, 10), (11, 10), (25, 10)])
+def test_scanning_task_priority_bookmarks_truncated(count, expected):
+    bookmarks = [_bookmark(freq=145_000_000 + i * 1000) for i in range(count)]
+    task = _freq_task(priority_bookmarks=bookmarks, priority_interval=1)
+    assert task.priority_bookmarks == bookmarks[:expected]
+
+
+# ---------------------------------------------------------------------------
+# ScanningTask — segments validation
+# ---------------------------------------------------------------------------
+
+def _segment(range_min, range_max, interval=100_000, modulation="FM"):
+    return ScanSegment(range_min=range_min, range_max=range_max, interval=interval, modulation=modulation)
+
+
+def test_scanning_task_segments_disabled_by_default():
+    assert _freq_task().segments == []
+
+
+def test_scanning_task_segments_merged_and_span_range():
+    task = _freq_task(
+        segments=[_segment(144_000_000, 146_000_000), _segment(118_000_000, 137_000_000, modulation="AM")],
+    )
+    assert task.segments == [_segment(118_000_000, 137_000_000, modulation="AM"), _segment(144_000_000, 146_000_000)]
+    assert (task.range_min, task.range_max) == (118_000_000, 146_000_000)
+
+
+@pytest.mark.parametrize("interval,expected", [(1, 1_000), (999, 1_000), (1_000, 1_000), (12_500, 12_500)])
+def test_scanning_task_segments_interval_clamped(interval, expected):
+    task = _freq_task(segments=[_segment(144_000_000, 146_000_000, interval=interval)])
+    assert task.segments[0].interval == expected
+
+
 # ---------------------------------------------------------------------------
 # FrequencyScannerStrategy — _inner_scan
 # ---------------------------------------------------------------------------
@@ -1369,6 +1871,34 @@ def test_scanning_factory_uses_custom_sleep_fn():
     assert slept == [0.5]
 
 
+@pytest.mark.parametrize("mode,has_checkpoint", [("frequency", True), ("bookmarks", False)])
+def test_scanning_factory_checkpoint_frequency_only(tmp_path, mode, has_checkpoint):
+    path = str(tmp_path / "scan.checkpoint")
+    facade = create_scanner(mode, _queue(), "/tmp/scan.log", _rigctl(), checkpoint_file=path, resume=True)
+    checkpoint = facade._scanner._core.checkpoint
+    assert (checkpoint is not None) is has_checkpoint
+    if has_checkpoint:
+        assert checkpoint.path == path
+        assert checkpoint.resume is True
+
+
+def test_scanning_factory_no_checkpoint_by_default():
+    facade = create_scanner("frequency", _queue(), "/tmp/scan.log", _rigctl())
+    assert facade._scanner._core.checkpoint is None
+
+
+def test_scanning_factory_profiler_shared_by_core_and_facade():
+    profiler = ScanProfiler()
+    facade = create_scanner("bookmarks", _queue(), "/tmp/scan.log", _rigctl(), profiler=profiler)
+    assert facade._scanner._core.profiler is profiler
+    assert facade._profiler is profiler
+
+
+def test_scanning_factory_no_profiler_by_default():
+    facade = create_scanner("frequency", _queue(), "/tmp/scan.log", _rigctl())
+    assert facade._scanner._core.profiler is None
+
+
 def test_scanning_factory_injects_rigctl_into_core():
     rigctl = _rigctl()
     facade = create_scanner("frequency", _queue(), "/tmp/scan.log", rigctl)
@@ -1399,3 +1929,303 @@ def test_scanning_core_process_queue_unknown_converter_key_returns_false():
     cfg.valid_scan_update_event_names = ["txt_unknown"]
     core = _core(queue=_queue(events=[("txt_unknown", "value")]), config=cfg)
     assert core.process_queue(_bm_task()) is False
+
+
+# ---------------------------------------------------------------------------
+# ScanProfiler integration
+# ---------------------------------------------------------------------------
+
+
+class _SleepClock:
+    """Clock advanced only by the injected sleep, so phases add up exactly."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _profiled_core(clock, rigctl=None, **cfg):
+    core = _core(rigctl=rigctl, config=_cfg(**cfg), sleep_fn=clock.sleep)
+    core.profiler = ScanProfiler(clock=clock)
+    return core
+
+
+def test_scanning_core_timed_without_profiler_is_shared_noop():
+    core = _core()
+    assert core.timed("tune_io") is core.timed("queue")
+    with core.timed("tune_io"):
+        pass
+    core.count_step()
+
+
+def test_scanning_frequency_profile_attributes_sleeps():
+    clock = _SleepClock()
+    core = _profiled_core(clock, time_wait_for_tune=0.25, no_signal_delay=0.1, signal_checks=2)
+    FrequencyScannerStrategy(core).scan(_freq_task(), _log())
+    summary = core.profiler.summary()
+    assert summary["steps"] == 2
+    assert summary["phases"]["settle_sleep"]["total_s"] == pytest.approx(2 * 2 * 0.25)
+    assert summary["phases"]["sample_sleep"]["total_s"] == pytest.approx(2 * 2 * 0.1)
+    assert summary["phases"]["tune_io"]["count"] == 4
+    assert summary["phases"]["sample_io"]["count"] == 4
+    assert summary["phases"]["queue"]["count"] == 2
+
+
+def test_scanning_frequency_profile_signal_phases():
+    clock = _SleepClock()
+    core = _profiled_core(clock, rigctl=_rigctl(level=0.0))
+    task = _freq_task(record=True, log=True, auto_bookmark=True, delay=2)
+    FrequencyScannerStrategy(core).scan(task, _log())
+    phases = core.profiler.summary()["phases"]
+    assert phases["recording"]["count"] == 4
+    assert phases["logging"]["count"] == 2
+    # one auto-bookmark; the log records no longer build a bookmark
+    assert phases["bookmark"]["count"] == 1
+    assert phases["hold"]["total_s"] == pytest.approx(2 * 2)
+
+
+def test_scanning_bookmark_profile_counts_steps():
+    clock = _SleepClock()
+    core = _profiled_core(clock, rigctl=_rigctl(level=0.0), time_wait_for_tune=0.5)
+    task = _bm_task(bookmarks=[_bookmark(145_000_000), _bookmark(146_000_000)], log=True, record=True)
+    BookmarkScannerStrategy(core).scan(task, _log())
+    summary = core.profiler.summary()
+    assert summary["steps"] == 2
+    assert summary["phases"]["settle_sleep"]["total_s"] == pytest.approx(2 * 2 * 0.5)
+    assert summary["phases"]["logging"]["count"] == 2
+    assert summary["phases"]["recording"]["count"] == 4
+
+
+def test_scanning_facade_logs_profile_report(caplog):
+    profiler = ScanProfiler()
+    facade = create_scanner(
+        "frequency", _queue(), "/tmp/scan.log", _rigctl(), config=_cfg(), sleep_fn=lambda _: None, profiler=profiler
+    )
+    with caplog.at_level("INFO", logger="rig_remote.scanning"):
+        facade.scan(_freq_task())
+    assert "Scan profile: 2 steps" in caplog.text
+    assert profiler.summary()["steps"] == 2
+    # a new scan starts from an empty profile; this core is already stopped
+    facade.scan(_freq_task())
+    assert profiler.summary()["steps"] == 0
+
+
+def test_scanning_facade_profile_stopped_on_error(caplog):
+    profiler = ScanProfiler()
+    strategy = Mock()
+    strategy.scan.side_effect = OSError
+    facade = Scanning2(scanner=strategy, log=_log(), log_filename="/tmp/scan.log", profiler=profiler)
+    with caplog.at_level("INFO", logger="rig_remote.scanning"), pytest.raises(OSError):
+        facade.scan(_freq_task())
+    assert "Scan profile: 0 steps" in caplog.text
+
+
+# ---------------------------------------------------------------------------
+# ScanCounters
+# ---------------------------------------------------------------------------
+
+
+def test_scanning_core_counters_default():
+    assert _core().counters == ScanCounters()
+
+
+def test_scanning_core_count_step():
+    core = _core()
+    core.count_step()
+    assert core.counters.steps == 1
+    assert core.counters.last_step_time > 0.0
+
+
+def test_scanning_core_signal_check_counts_hits():
+    core = _core(rigctl=_rigctl(level=0.0), config=_cfg(signal_checks=3))
+    assert core.signal_check(sgn_level=-40)
+    assert core.counters.hits == 1
+    core.rigctl.get_level.return_value = -500
+    assert not core.signal_check(sgn_level=-40)
+    assert core.counters.hits == 1
+
+
+def test_scanning_frequency_counters():
+    core = _core(rigctl=_rigctl(level=0.0))
+    FrequencyScannerStrategy(core).scan(_freq_task(auto_bookmark=True, inner_band=2000, inner_interval=1000), _log())
+    assert core.counters.steps == 2
+    assert core.counters.hits == 2
+    assert core.counters.bookmarks_created == 2
+    assert core.counters.tune_errors == 0
+
+
+def test_scanning_frequency_counters_tune_error():
+    rigctl = _rigctl()
+    rigctl.set_frequency.side_effect = OSError
+    core = _core(rigctl=rigctl)
+    FrequencyScannerStrategy(core).scan(_freq_task(), _log())
+    assert core.counters.tune_errors == 1
+
+
+def test_scanning_bookmark_counters_tune_error():
+    rigctl = _rigctl()
+    rigctl.set_frequency.side_effect = OSError
+    core = _core(rigctl=rigctl)
+    BookmarkScannerStrategy(core).scan(_bm_task(bookmarks=[_bookmark()]), _log())
+    assert core.counters.steps == 1
+    assert core.counters.tune_errors == 1
+
+
+def test_scanning_factory_counters_shared_across_scans():
+    counters = ScanCounters()
+    for _ in range(2):
+        facade = create_scanner("frequency", _queue(), "/tmp/scan.log", _rigctl(), config=_cfg(), counters=counters)
+        assert facade._scanner._core.counters is counters
+        facade.scan(_freq_task())
+    assert counters.scans == 2
+    assert counters.steps == 4
+    assert counters.active is False
+
+
+def test_scanning_facade_counters_active_during_scan():
+    counters = ScanCounters()
+    seen = []
+    strategy = Mock()
+    strategy.scan.side_effect = lambda task, log: seen.append(counters.active)
+    facade = Scanning2(scanner=strategy, log=_log(), log_filename="/tmp/scan.log", counters=counters)
+    facade.scan(_freq_task())
+    assert seen == [True]
+    assert counters.active is False
+    strategy.scan.side_effect = OSError
+    with pytest.raises(OSError):
+        facade.scan(_freq_task())
+    assert counters.active is False
+    assert counters.scans == 2
+
+
+# ---------------------------------------------------------------------------
+# ScanTelemetry
+# ---------------------------------------------------------------------------
+
+
+def test_scanning_core_telemetry_default_none():
+    assert _core().telemetry is None
+
+
+def test_scanning_frequency_telemetry():
+    telemetry = ScanTelemetry(interval=0)
+    samples = []
+    telemetry.subscribe(samples.append)
+    facade = create_scanner(
+        "frequency", _queue(), "/tmp/scan.log", _rigctl(level=0.0), config=_cfg(), telemetry=telemetry
+    )
+    facade.scan(_freq_task(auto_bookmark=True, inner_band=2000, inner_interval=1000))
+    assert samples[-1].done
+    assert samples[-1].steps == facade._scanner._core.counters.steps == 2
+    assert samples[-1].hits == facade._scanner._core.counters.hits
+    assert samples[-1].frequency > 0
+    new_bookmarks = [bm for sample in samples for bm in sample.new_bookmarks]
+    assert len(new_bookmarks) == 2
+    assert all(not sample.done for sample in samples[:-1])
+
+
+def test_scanning_facade_telemetry_reset_and_finished_on_error():
+    telemetry = ScanTelemetry()
+    telemetry.steps = 5
+    strategy = Mock()
+    strategy.scan.side_effect = OSError
+    facade = Scanning2(scanner=strategy, log=_log(), log_filename="/tmp/scan.log", telemetry=telemetry)
+    with pytest.raises(OSError):
+        facade.scan(_freq_task())
+    assert telemetry.last_sample is not None
+    assert telemetry.last_sample.done
+    assert telemetry.last_sample.steps == 0
+
+
+# ---------------------------------------------------------------------------
+# ScannerCore with a ResilientRigCtl
+# ---------------------------------------------------------------------------
+
+
+def _resilient(backend: Mock):
+    clock = Mock(return_value=0.0)
+    sleeps = []
+
+    def advance(seconds):
+        sleeps.append(seconds)
+        clock.return_value += seconds
+
+    rig = ResilientRigCtl(backend, CircuitBreaker(failure_threshold=1, base_delay=2.0, jitter=0.0, clock=clock))
+    return rig, advance, sleeps
+
+
+def test_scanner_core_pauses_and_retries_resilient_rig():
+    backend = _rigctl()
+    backend.set_frequency.side_effect = [OSError("down"), None]
+    rig, advance, sleeps = _resilient(backend)
+    core = _core(rigctl=rig, sleep_fn=advance)
+    core.tune(145_000_000, "FM")
+    assert backend.set_frequency.call_count == 2
+    assert core._scan_active is True
+    assert sum(sleeps) >= 2.0
+    assert max(sleeps) <= 0.5
+
+
+def test_scanner_core_resilient_signal_check_retries():
+    backend = _rigctl()
+    backend.get_level.side_effect = [OSError("down"), 500]
+    rig, advance, _ = _resilient(backend)
+    core = _core(rigctl=rig, sleep_fn=advance)
+    assert core.signal_check(sgn_level=10) is True
+    assert backend.get_level.call_count == 2
+
+
+def test_scanner_core_resilient_wait_ends_on_terminate():
+    backend = _rigctl()
+    backend.set_frequency.side_effect = OSError("down")
+    rig, advance, _ = _resilient(backend)
+    core = _core(rigctl=rig, sleep_fn=lambda seconds: core.terminate())
+    with pytest.raises(OSError):
+        core.tune(145_000_000, "FM")
+    assert backend.set_frequency.call_count == 1
+    assert core._scan_active is False
+
+
+# ---------------------------------------------------------------------------
+# Squelch detector
+# ---------------------------------------------------------------------------
+
+
+def test_scanning_config_merge_bandwidth():
+    assert ScanningConfig().merge_bandwidth == 0
+    assert ScanningConfig(merge_bandwidth=5_000) != ScanningConfig()
+    with pytest.raises(ValueError):
+        ScanningConfig(merge_bandwidth=-1)
+
+
+def test_scanning_config_rejects_unknown_detector():
+    with pytest.raises(ValueError):
+        ScanningConfig(detector="dcd")
+
+
+@pytest.mark.parametrize("squelch_open", [True, False])
+def test_signal_check_squelch_detector_reads_squelch_once(squelch_open):
+    rig = _rigctl(level=1000)
+    rig.get_dcd.return_value = squelch_open
+    core = _core(rigctl=rig, config=_cfg(detector=DETECTOR_SQUELCH, signal_checks=3))
+    assert core.signal_check(sgn_level=10) is squelch_open
+    rig.get_dcd.assert_called_once()
+    # the level is read once, only to record the level of a hit
+    assert rig.get_level.call_count == int(squelch_open)
+    assert core.last_level == (1000 if squelch_open else 0)
+    assert core.counters.hits == int(squelch_open)
+
+
+def test_signal_check_squelch_detector_falls_back_to_level():
+    rig = _rigctl(level=1000)
+    rig.get_dcd.side_effect = NotImplementedError
+    core = _core(rigctl=rig, config=_cfg(detector=DETECTOR_SQUELCH, signal_checks=2))
+    assert core.signal_check(sgn_level=10) is True
+    assert core.signal_check(sgn_level=10) is True
+    rig.get_dcd.assert_called_once()
+    assert rig.get_level.call_count == 4
@@ -0,0 +1,135 @@
+import threading
+import time
+
+import pytest
+
+from rig_remote.rig_backends.serial_worker import SerialWorker, background_priority
+
+
+def _blocked(worker: SerialWorker) -> threading.Event:
+    """Occupy the worker until the returned event is set."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    worker.submit(block)
+    assert started.wait(5)
+    return release
+
+
+def test_serial_worker_runs_commands_on_its_thread():
+    worker = SerialWorker("test")
+    assert worker.run(threading.current_thread) is not threading.current_thread()
+    assert worker.run(lambda a, b: a + b, 1, 2) == 3
+
+
+def test_serial_worker_propagates_exceptions():
+    worker = SerialWorker("test")
+
+    def fail():
+        raise OSError("serial")
+
+    with pytest.raises(OSError, match="serial"):
+        worker.run(fail)
+
+
+def test_serial_worker_foreground_runs_before_background():
+    worker = SerialWorker("test")
+    release = _blocked(worker)
+    order = []
+    with background_priority():
+        futures = [worker.submit(order.append, f"scan {i}") for i in range(3)]
+    futures.append(worker.submit(order.append, "ui"))
+    release.set()
+    for future in futures:
+        future.result(5)
+    assert order == ["ui", "scan 0", "scan 1", "scan 2"]
+
+
+def test_serial_worker_merges_identical_reads():
+    worker = SerialWorker("test")
+    release = _blocked(worker)
+    calls = []
+
+    def read():
+        calls.append(1)
+        return 42
+
+    first = worker.submit(read, key="level")
+    second = worker.submit(read, key="level")
+    other = worker.submit(read, key="frequency")
+    release.set()
+    assert first is second
+    assert first.result(5) == other.result(5) == 42
+    assert len(calls) == 2
+    assert worker.merged == 1
+
+
+def test_serial_worker_foreground_read_promotes_background_read():
+    worker = SerialWorker("test")
+    release = _blocked(worker)
+    order = []
+    with background_priority():
+        scan = worker.submit(order.append, "scan")
+        read = worker.submit(order.append, "read", key="frequency")
+    assert worker.submit(order.append, "ignored", key="frequency") is read
+    release.set()
+    scan.result(5)
+    assert order == ["read", "scan"]
+
+
+def test_serial_worker_reads_not_merged_once_started():
+    worker = SerialWorker("test")
+    started = threading.Event()
+    release = threading.Event()
+
+    def read():
+        started.set()
+        release.wait(5)
+        return "value"
+
+    first = worker.submit(read, key="level")
+    assert started.wait(5)
+    second = worker.submit(read, key="level")
+    release.set()
+    assert first is not second
+    assert second.result(5) == "value"
+
+
+def test_serial_worker_nested_run_is_inline():
+    worker = SerialWorker("test")
+    assert worker.run(lambda: worker.run(lambda: "nested")) == "nested"
+
+
+def test_serial_worker_thread_ends_when_idle():
+    worker = SerialWorker("test", idle_timeout=0.05)
+    thread = worker.run(threading.current_thread)
+    thread.join(5)
+    assert not thread.is_alive()
+    assert worker.run(lambda: "again") == "again"
+
+
+def test_background_priority_is_per_thread():
+    worker = SerialWorker("test")
+    release = _blocked(worker)
+    order = []
+    ready = threading.Event()
+
+    def scan():
+        with background_priority():
+            worker.submit(order.append, "scan")
+            ready.set()
+            time.sleep(0.01)
+
+    thread = threading.Thread(target=scan)
+    thread.start()
+    assert ready.wait(5)
+    ui = worker.submit(order.append, "ui")
+    release.set()
+    thread.join(5)
+    ui.result(5)
+    worker.run(lambda: None)
+    assert order == ["ui", "scan"]
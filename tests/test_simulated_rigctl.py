@@ -0,0 +1,232 @@
+import pytest
+
+from rig_remote.rig_backends.protocol import RigBackend
+from rig_remote.rig_backends.simulated_rigctl import (
+    Carrier,
+    SimulatedRigCtl,
+    SimulatedSpectrum,
+    SimulationProfile,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _rig(**kw) -> SimulatedRigCtl:
+    kw.setdefault("sleep_fn", lambda _: None)
+    return SimulatedRigCtl(**kw)
+
+
+def test_simulated_rigctl_is_a_rig_backend():
+    assert isinstance(_rig(), RigBackend)
+    assert _rig().endpoint.name == "simulated"
+
+
+@pytest.mark.parametrize("kwargs", [{"bandwidth": 0}, {"bandwidth": -5}])
+def test_simulated_carrier_invalid(kwargs):
+    with pytest.raises(ValueError):
+        Carrier(frequency=145_000_000, level=-20.0, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "frequency, expected",
+    [
+        (145_000_000, -20.0),
+        (145_002_500, -60.0),  # half way down the slope
+        (144_995_000, -100.0),  # edge of the carrier
+        (146_000_000, -100.0),
+        (150_000_000, -30.0),
+    ],
+)
+def test_simulated_spectrum_level_at(frequency, expected):
+    spectrum = SimulatedSpectrum(
+        carriers=[
+            Carrier(frequency=150_000_000, level=-30.0, bandwidth=1_000),
+            Carrier(frequency=145_000_000, level=-20.0, bandwidth=10_000),
+        ]
+    )
+    assert spectrum.level_at(frequency) == pytest.approx(expected)
+
+
+def test_simulated_spectrum_overlapping_carriers_keep_strongest():
+    spectrum = SimulatedSpectrum(
+        carriers=[
+            Carrier(frequency=145_000_000, level=-50.0, bandwidth=100_000),
+            Carrier(frequency=145_010_000, level=-10.0, bandwidth=10_000),
+        ]
+    )
+    assert spectrum.level_at(145_010_000) == pytest.approx(-10.0)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"latency": -1.0},
+        {"jitter": -0.1},
+        {"settle_time": -1.0},
+        {"level_noise": -1.0},
+        {"failure_rate": -0.1},
+        {"failure_rate": 1.5},
+    ],
+)
+def test_simulation_profile_invalid(kwargs):
+    with pytest.raises(ValueError):
+        SimulationProfile(**kwargs)
+
+
+def test_simulated_rigctl_roundtrip_state():
+    rig = _rig()
+    rig.set_frequency(145_500_000)
+    rig.set_mode("USB")
+    rig.set_vfo("VFOB")
+    rig.set_rit(100)
+    rig.set_xit(-100)
+    rig.set_split_freq(145_600_000)
+    rig.set_split_mode("LSB")
+    rig.set_func("NB")
+    rig.set_parm("BEEP")
+    rig.set_antenna(2)
+    assert rig.get_frequency() == 145_500_000
+    assert rig.get_mode() == "USB"
+    assert rig.get_vfo() == "VFOB"
+    assert (rig.get_rit(), rig.get_xit()) == ("100", "-100")
+    assert rig.get_split_freq() == 145_600_000
+    assert rig.get_split_mode() == "LSB"
+    assert (rig.get_func(), rig.get_parm()) == ("NB", "BEEP")
+    assert rig.get_antenna() == 2
+    assert rig.rig_reset("SOFTWARE_RESET") == "RPRT 0"
+
+
+def test_simulated_rigctl_recording():
+    rig = _rig()
+    rig.start_recording()
+    assert rig.recording is True
+    rig.stop_recording()
+    assert rig.recording is False
+
+
+@pytest.mark.parametrize(
+    "method, value",
+    [
+        ("set_frequency", "abc"),
+        ("set_mode", "XYZ"),
+        ("set_vfo", "VFOZ"),
+        ("set_split_mode", "XYZ"),
+        ("set_func", "XYZ"),
+        ("set_parm", "XYZ"),
+        ("rig_reset", "XYZ"),
+    ],
+)
+def test_simulated_rigctl_invalid_values(method, value):
+    with pytest.raises(ValueError):
+        getattr(_rig(), method)(value)
+
+
+def test_simulated_rigctl_level_follows_spectrum():
+    rig = _rig(spectrum=SimulatedSpectrum(carriers=[Carrier(frequency=145_000_000, level=-20.0)]))
+    rig.set_frequency(145_000_000)
+    assert rig.get_level() == -20
+    rig.set_frequency(146_000_000)
+    assert rig.get_level() == -100
+
+
+def test_simulated_rigctl_get_status_is_one_command():
+    rig = _rig(spectrum=SimulatedSpectrum(carriers=[Carrier(frequency=145_000_000, level=-20.0)]))
+    rig.set_frequency(145_000_000)
+    status = rig.get_status()
+    assert (status.frequency, status.mode, status.strength) == (145_000_000, "FM", -20)
+    assert rig.commands["get_status"] == 1
+    assert rig.commands["get_level"] == 0
+
+
+def test_simulated_rigctl_get_dcd():
+    spectrum = SimulatedSpectrum(carriers=[Carrier(frequency=145_000_000, level=-20.0)])
+    rig = _rig(spectrum=spectrum, profile=SimulationProfile(squelch=-50.0))
+    rig.set_frequency(145_000_000)
+    assert rig.get_dcd() is True
+    rig.set_frequency(146_000_000)
+    assert rig.get_dcd() is False
+    with pytest.raises(NotImplementedError):
+        _rig(spectrum=spectrum).get_dcd()
+
+
+def test_simulated_rigctl_settle_time_reports_noise_floor():
+    clock = _Clock()
+    rig = _rig(
+        spectrum=SimulatedSpectrum(carriers=[Carrier(frequency=145_000_000, level=-20.0)]),
+        profile=SimulationProfile(settle_time=0.5),
+        clock=clock,
+    )
+    rig.set_frequency(145_000_000)
+    clock.now = 0.4
+    assert rig.get_level() == -100
+    clock.now = 0.5
+    assert rig.get_level() == -20
+
+
+def test_simulated_rigctl_level_noise_bounded_and_seeded():
+    profile = SimulationProfile(level_noise=3.0, seed=7)
+    levels = [_rig(profile=profile).sample_level() for _ in range(2)]
+    assert levels[0] == levels[1]
+    rig = _rig(profile=profile)
+    assert all(-103.0 <= rig.sample_level() <= -97.0 for _ in range(50))
+
+
+def test_simulated_rigctl_latency_and_jitter():
+    slept = []
+    rig = SimulatedRigCtl(profile=SimulationProfile(latency=0.01, jitter=0.005, seed=1), sleep_fn=slept.append)
+    rig.get_frequency()
+    rig.get_mode()
+    assert len(slept) == 2
+    assert all(0.01 <= delay <= 0.015 for delay in slept)
+
+
+def test_simulated_rigctl_no_sleep_without_latency():
+    slept = []
+    SimulatedRigCtl(sleep_fn=slept.append).get_frequency()
+    assert slept == []
+
+
+def test_simulated_rigctl_failure_injection_all_commands():
+    rig = _rig(profile=SimulationProfile(failure_rate=1.0))
+    with pytest.raises(OSError):
+        rig.get_frequency()
+    with pytest.raises(OSError):
+        rig.set_frequency(145_000_000)
+    assert rig.frequency == 100_000_000
+
+
+def test_simulated_rigctl_failure_injection_selected_commands():
+    rig = _rig(profile=SimulationProfile(failure_rate=1.0, fail_commands=frozenset({"get_level"})))
+    rig.set_frequency(145_000_000)
+    with pytest.raises(OSError):
+        rig.get_level()
+
+
+def test_simulated_rigctl_failure_rate_is_seeded():
+    def failures(seed):
+        rig = _rig(profile=SimulationProfile(failure_rate=0.5, seed=seed))
+        outcome = []
+        for _ in range(20):
+            try:
+                rig.get_frequency()
+                outcome.append(False)
+            except OSError:
+                outcome.append(True)
+        return outcome
+
+    assert failures(3) == failures(3)
+    assert 0 < sum(failures(3)) < 20
+
+
+def test_simulated_rigctl_counts_commands():
+    rig = _rig()
+    rig.set_frequency(145_000_000)
+    rig.get_level()
+    rig.get_level()
+    assert rig.commands == {"set_frequency": 1, "get_level": 2}
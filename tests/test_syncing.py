@@ -1,9 +1,14 @@
+import pytest
+
 from rig_remote.syncing import Syncing
+from rig_remote.models.run_counters import SyncCounters
 from rig_remote.models.sync_task import SyncTask
 from rig_remote.stmessenger import STMessenger
 from rig_remote.rigctl import RigCtl
 from rig_remote.queue_comms import QueueComms
-from unittest.mock import create_autospec
+from unittest.mock import Mock, create_autospec
+
+from rig_remote.rig_backends.resilient_rigctl import CircuitBreaker, ResilientRigCtl
 
 
 def test_syncing_terminate():
@@ -29,3 +34,79 @@ def test_sycing_sync():
     sync_task.dst_rig.set_frequency.assert_called_once()
     sync_task.dst_rig.set_mode.assert_called_once()
     not syncing.sync_active
+
+
+def _sync_task():
+    return SyncTask(
+        syncq=STMessenger(queue_comms=QueueComms()),
+        src_rig=create_autospec(RigCtl),
+        dst_rig=create_autospec(RigCtl),
+        error="",
+    )
+
+
+def test_syncing_counts_copies():
+    counters = SyncCounters()
+    syncing = Syncing(counters=counters)
+    syncing.sync(task=_sync_task(), once=True)
+    assert counters.syncs == 1
+    assert counters.errors == 0
+    assert counters.last_lag >= 0.0
+    assert counters.last_sync_time > 0.0
+
+
+def test_syncing_counts_errors():
+    syncing = Syncing()
+    task = _sync_task()
+    task.src_rig.get_frequency.side_effect = OSError
+    with pytest.raises(OSError):
+        syncing.sync(task=task, once=True)
+    assert syncing.counters.errors == 1
+    assert syncing.counters.syncs == 0
+
+
+def test_syncing_waits_for_resilient_rigs(monkeypatch):
+    clock = Mock(return_value=0.0)
+    sleeps = []
+
+    def advance(seconds):
+        sleeps.append(seconds)
+        clock.return_value += seconds
+
+    monkeypatch.setattr("rig_remote.syncing.time.sleep", advance)
+    task = _sync_task()
+    task.src_rig.get_frequency.side_effect = [OSError("down"), 145_000_000]
+    breaker = CircuitBreaker(failure_threshold=1, base_delay=1.0, jitter=0.0, clock=clock)
+    task.src_rig = ResilientRigCtl(task.src_rig, breaker)
+    syncing = Syncing()
+    syncing.sync(task=task, once=True)
+    assert syncing.counters.errors == 1
+    assert syncing.counters.syncs == 1
+    assert task.dst_rig.set_frequency.call_args.args == (145_000_000,)
+    assert sum(sleeps[:-1]) == pytest.approx(1.0)
+
+
+def test_syncing_plain_rig_error_ends_sync_with_a_resilient_rig(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("rig_remote.syncing.time.sleep", sleeps.append)
+    task = _sync_task()
+    task.src_rig = ResilientRigCtl(task.src_rig, CircuitBreaker(failure_threshold=1, jitter=0.0))
+    task.dst_rig.set_frequency.side_effect = OSError("down")
+    syncing = Syncing()
+    with pytest.raises(OSError):
+        syncing.sync(task=task)
+    assert syncing.counters.errors == 1
+    assert sleeps == []
+
+
+def test_syncing_resilient_rig_error_waits_while_breaker_closed(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("rig_remote.syncing.time.sleep", sleeps.append)
+    task = _sync_task()
+    task.src_rig.get_frequency.side_effect = [OSError("down"), 145_000_000]
+    task.src_rig = ResilientRigCtl(task.src_rig, CircuitBreaker(failure_threshold=3, jitter=0.0))
+    syncing = Syncing()
+    syncing.sync(task=task, once=True)
+    assert syncing.counters.errors == 1
+    assert syncing.counters.syncs == 1
+    assert sleeps == [Syncing._SYNC_INTERVAL, Syncing._SYNC_INTERVAL]
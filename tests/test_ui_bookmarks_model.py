@@ -0,0 +1,141 @@
+import pytest
+from PySide6.QtCore import QModelIndex, QPersistentModelIndex, Qt
+from PySide6.QtWidgets import QApplication
+
+from rig_remote.bookmarksmanager import bookmark_factory
+from rig_remote.ui_bookmarks_model import COLUMNS, BookmarksTableModel
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def model(qapp):
+    return BookmarksTableModel()
+
+
+def _bookmark(frequency, modulation="FM", description="Test", lockout="O"):
+    return bookmark_factory(
+        input_frequency=frequency, modulation=modulation, description=description, lockout=lockout
+    )
+
+
+def _frequencies(model):
+    return [bookmark.channel.frequency for bookmark in model.bookmarks()]
+
+
+def test_bookmarks_model_empty(model):
+    assert model.rowCount() == 0
+    assert model.columnCount() == len(COLUMNS)
+    assert model.data(QModelIndex()) is None
+
+
+def test_bookmarks_model_rows_have_no_children(model):
+    model.append_bookmarks([_bookmark(145_500_000)])
+    assert model.rowCount(model.index(0, 0)) == 0
+    assert model.columnCount(model.index(0, 0)) == 0
+
+
+def test_bookmarks_model_header(model):
+    headers = [model.headerData(column, Qt.Orientation.Horizontal) for column in range(model.columnCount())]
+    assert headers == ["Frequency", "Mode", "Description"]
+    assert model.headerData(0, Qt.Orientation.Vertical) is None
+    assert model.headerData(0, Qt.Orientation.Horizontal, Qt.ItemDataRole.ToolTipRole) is None
+
+
+def test_bookmarks_model_data(model):
+    model.append_bookmarks([_bookmark(145_500_000, "AM", "Tower", lockout="L"), _bookmark(100_000_000)])
+    cells = [model.data(model.index(0, column)) for column in range(3)]
+    assert cells == ["145500000", "AM", "Tower"]
+    assert model.data(model.index(0, 0), Qt.ItemDataRole.BackgroundRole).color().name() == "#ff0000"
+    assert model.data(model.index(1, 0), Qt.ItemDataRole.BackgroundRole) is None
+    assert model.data(model.index(0, 0), Qt.ItemDataRole.ToolTipRole) is None
+
+
+def test_bookmarks_model_priority_background(model):
+    model.append_bookmarks([_bookmark(145_500_000, lockout="P")])
+    assert model.data(model.index(0, 0), Qt.ItemDataRole.BackgroundRole).color().name() == "#ffff00"
+
+
+@pytest.mark.parametrize(
+    "column, order, expected",
+    [
+        (0, Qt.SortOrder.AscendingOrder, [9_000_000, 10_000_000, 145_000_000]),
+        (0, Qt.SortOrder.DescendingOrder, [145_000_000, 10_000_000, 9_000_000]),
+        (1, Qt.SortOrder.AscendingOrder, [10_000_000, 145_000_000, 9_000_000]),
+        (2, Qt.SortOrder.AscendingOrder, [145_000_000, 9_000_000, 10_000_000]),
+        (-1, Qt.SortOrder.AscendingOrder, [10_000_000, 9_000_000, 145_000_000]),
+    ],
+)
+def test_bookmarks_model_sort(model, column, order, expected):
+    model.append_bookmarks(
+        [
+            _bookmark(10_000_000, "am", "charlie"),
+            _bookmark(9_000_000, "WFM", "Bravo"),
+            _bookmark(145_000_000, "FM", "alpha"),
+        ]
+    )
+    model.sort(column, order)
+    assert _frequencies(model) == expected
+
+
+def test_bookmarks_model_sort_keeps_persistent_indexes(model):
+    first, second = _bookmark(200_000_000), _bookmark(100_000_000)
+    model.append_bookmarks([first, second])
+    selected = QPersistentModelIndex(model.index(0, 2))
+    model.sort(0)
+    assert model.bookmark(selected.row()) is first
+    assert selected.column() == 2
+
+
+@pytest.mark.parametrize("order", [Qt.SortOrder.AscendingOrder, Qt.SortOrder.DescendingOrder])
+def test_bookmarks_model_insert_sorted(model, order):
+    model.sort(0, order)
+    for frequency in (300, 100, 200, 100):
+        model.insert_bookmark(_bookmark(frequency, description=str(frequency)))
+    expected = sorted([300, 100, 200, 100], reverse=order == Qt.SortOrder.DescendingOrder)
+    assert _frequencies(model) == expected
+
+
+def test_bookmarks_model_insert_unsorted_appends(model):
+    model.append_bookmarks([_bookmark(300), _bookmark(100)])
+    assert model.insert_bookmark(_bookmark(200)) == 2
+
+
+def test_bookmarks_model_append_restores_sort(model):
+    model.sort(0)
+    model.append_bookmarks([_bookmark(300), _bookmark(100)])
+    model.append_bookmarks([])
+    model.append_bookmarks([_bookmark(200)])
+    assert _frequencies(model) == [100, 200, 300]
+
+
+def test_bookmarks_model_row_of_remove_and_lockout(model):
+    bookmark = _bookmark(145_500_000)
+    model.append_bookmarks([_bookmark(100_000_000), bookmark])
+    changed = []
+    model.dataChanged.connect(lambda top, bottom: changed.append((top.row(), bottom.column())))
+    model.set_lockout(1, "L")
+    assert bookmark.lockout == "L"
+    assert changed == [(1, 2)]
+    assert model.row_of(bookmark) == 1
+    assert model.remove_row(1) is bookmark
+    assert model.row_of(bookmark) == -1
+    model.clear()
+    assert model.rowCount() == 0
+
+
+def test_bookmarks_model_large_list(model):
+    bookmarks = [_bookmark(frequency * 7919 % 100_003 + 1, description=str(frequency)) for frequency in range(100_000)]
+    model.sort(0)
+    model.append_bookmarks(bookmarks)
+    assert model.rowCount() == 100_000
+    frequencies = _frequencies(model)
+    assert frequencies == sorted(frequencies)
+    model.sort(0, Qt.SortOrder.DescendingOrder)
+    assert model.bookmark(0).channel.frequency == frequencies[-1]
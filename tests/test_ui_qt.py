@@ -1,19 +1,23 @@
+import threading
+
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
-from PySide6.QtWidgets import QApplication, QLineEdit, QTreeWidget, QTreeWidgetItem, QMessageBox
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QLineEdit, QMessageBox
+from PySide6.QtCore import QModelIndex, Qt
 
-from rig_remote.ui_qt import RigRemote, _BookmarkTreeItem
+from rig_remote.ui_qt import RigRemote
 from rig_remote.ui_handlers import RigRemoteHandlersMixin
 from rig_remote.app_config import AppConfig
 from rig_remote.models.bookmark import Bookmark
 from rig_remote.models.rig_endpoint import RigEndpoint
+from rig_remote.models.scan_segment import ScanSegment
 from rig_remote.bookmarksmanager import bookmark_factory
-from rig_remote.exceptions import UnsupportedScanningConfigError, UnsupportedSyncConfigError
+from rig_remote.exceptions import InvalidPathError, UnsupportedScanningConfigError, UnsupportedSyncConfigError
 from rig_remote.rig_backends.hamlib_rigctl import HamlibRigCtl
 from rig_remote.rig_backends.mode_translator import ModeTranslator
 from rig_remote.rig_backends.protocol import BackendType
+from rig_remote.scan_telemetry import ScanTelemetry, TelemetrySample
 
 
 # ---------------------------------------------------------------------------
@@ -30,6 +34,7 @@ _VALID_CONFIG = {
     "passes": "0",
     "inner_band": "0",
     "inner_interval": "0",
+    "priority_interval": "0",
     "range_min": "88000",
     "range_max": "108000",
     "sgn_level": "-40",
@@ -103,6 +108,10 @@ def _make_config(overrides=None):
     return cfg
 
 
+def _sample(frequency=0, new_bookmarks=(), done=False):
+    return TelemetrySample(frequency=frequency, level=-300, steps=3, hits=1, new_bookmarks=new_bookmarks, done=done)
+
+
 # ---------------------------------------------------------------------------
 # Initialization
 # ---------------------------------------------------------------------------
@@ -186,6 +195,42 @@ def test_import_bookmarks_with_entries(rig_remote_app, mock_bookmark):
     rig_remote_app.bookmarks.add_bookmark.assert_called_once_with(mock_bookmark)
 
 
+# ---------------------------------------------------------------------------
+# band plan
+# ---------------------------------------------------------------------------
+
+def test_load_band_plan_dialog_no_filename(rig_remote_app):
+    with patch("rig_remote.ui_handlers.QFileDialog.getOpenFileName", return_value=("", "")):
+        with patch.object(rig_remote_app, "_load_band_plan") as mock_load:
+            rig_remote_app._load_band_plan_dialog()
+    mock_load.assert_not_called()
+
+
+def test_load_band_plan_dialog_with_filename(rig_remote_app):
+    with patch("rig_remote.ui_handlers.QFileDialog.getOpenFileName", return_value=("/tmp/plan.csv", "")):
+        with patch.object(rig_remote_app, "_load_band_plan") as mock_load:
+            rig_remote_app._load_band_plan_dialog()
+    mock_load.assert_called_once_with(Path("/tmp/plan.csv"))
+
+
+def test_load_band_plan_success(rig_remote_app):
+    segments = [ScanSegment(range_min=144_000_000, range_max=146_000_000, interval=12_500, modulation="FM")]
+    with patch("rig_remote.ui_handlers.load_band_plan", return_value=segments):
+        rig_remote_app._load_band_plan(Path("/tmp/plan.csv"))
+    assert rig_remote_app.band_plan == segments
+    rig_remote_app._clear_band_plan()
+    assert rig_remote_app.band_plan == []
+
+
+@pytest.mark.parametrize("outcome", [{"side_effect": InvalidPathError}, {"return_value": []}])
+def test_load_band_plan_error_keeps_previous_plan(rig_remote_app, outcome):
+    with patch("rig_remote.ui_handlers.load_band_plan", **outcome):
+        with patch("rig_remote.ui_handlers.QMessageBox.critical") as mock_critical:
+            rig_remote_app._load_band_plan(Path("/tmp/plan.csv"))
+    mock_critical.assert_called_once()
+    assert rig_remote_app.band_plan == []
+
+
 # ---------------------------------------------------------------------------
 # _export_rig_remote
 # ---------------------------------------------------------------------------
@@ -621,34 +666,66 @@ def test_frequency_toggle_skips_when_wrong_scan_mode(rig_remote_app):
 
 
 # ---------------------------------------------------------------------------
-# check_scan_thread / check_sync_thread
+# _on_scan_telemetry / check_sync_thread
 # ---------------------------------------------------------------------------
 
-def test_check_scan_thread_done_frequency_mode(rig_remote_app):
+def test_scan_telemetry_done_frequency_mode(rig_remote_app):
     rig_remote_app.scan_mode = "frequency"
-    with patch.object(rig_remote_app.scan_queue, "check_end_of_scan", return_value=True):
+    rig_remote_app.scan_telemetry = ScanTelemetry()
+    with patch.object(rig_remote_app.scan_queue, "check_end_of_scan") as mock_check:
         with patch.object(rig_remote_app, "frequency_toggle") as mock_toggle:
-            rig_remote_app.check_scan_thread()
+            rig_remote_app._on_scan_telemetry(rig_remote_app.scan_telemetry, _sample(done=True))
+    mock_check.assert_called_once()
     mock_toggle.assert_called_once()
     rig_remote_app.scan_mode = None
+    rig_remote_app.scan_telemetry = None
 
 
-def test_check_scan_thread_done_bookmark_mode(rig_remote_app):
+def test_scan_telemetry_done_bookmark_mode(rig_remote_app):
     rig_remote_app.scan_mode = "bookmarks"
-    with patch.object(rig_remote_app.scan_queue, "check_end_of_scan", return_value=True):
-        with patch.object(rig_remote_app, "bookmark_toggle") as mock_toggle:
-            rig_remote_app.check_scan_thread()
+    rig_remote_app.scan_telemetry = ScanTelemetry()
+    with patch.object(rig_remote_app, "bookmark_toggle") as mock_toggle:
+        rig_remote_app._on_scan_telemetry(rig_remote_app.scan_telemetry, _sample(done=True))
     mock_toggle.assert_called_once()
     rig_remote_app.scan_mode = None
+    rig_remote_app.scan_telemetry = None
 
 
-def test_check_scan_thread_still_running(rig_remote_app):
-    rig_remote_app.scan_thread = Mock()
-    with patch.object(rig_remote_app.scan_queue, "check_end_of_scan", return_value=False):
-        with patch("rig_remote.ui_scan_handlers.QTimer.singleShot") as mock_timer:
-            rig_remote_app.check_scan_thread()
-    mock_timer.assert_called_once()
-    rig_remote_app.scan_thread = None
+def test_scan_telemetry_progress_shown_and_bookmarks_added(rig_remote_app):
+    rig_remote_app.scan_mode = "frequency"
+    rig_remote_app.scan_telemetry = ScanTelemetry()
+    new_bookmark = bookmark_factory(
+        input_frequency=145_500_000, modulation="FM", description="auto added by scan", lockout=""
+    )
+    sample = _sample(frequency=145_500_000, new_bookmarks=(new_bookmark,))
+    with patch.object(rig_remote_app, "_add_new_bookmark") as mock_add:
+        with patch.object(rig_remote_app, "frequency_toggle") as mock_toggle:
+            rig_remote_app._on_scan_telemetry(rig_remote_app.scan_telemetry, sample)
+    mock_add.assert_called_once_with(bookmark=new_bookmark)
+    mock_toggle.assert_not_called()
+    assert "145,500,000 Hz" in rig_remote_app.statusBar().currentMessage()
+    rig_remote_app.scan_mode = None
+    rig_remote_app.scan_telemetry = None
+
+
+def test_scan_telemetry_of_stopped_scan_ignored(rig_remote_app):
+    rig_remote_app.scan_mode = "frequency"
+    rig_remote_app.scan_telemetry = None
+    with patch.object(rig_remote_app, "frequency_toggle") as mock_toggle:
+        rig_remote_app._on_scan_telemetry(ScanTelemetry(), _sample(done=True))
+    mock_toggle.assert_not_called()
+    rig_remote_app.scan_mode = None
+
+
+def test_scan_telemetry_relayed_as_signal(rig_remote_app, qapp):
+    telemetry = ScanTelemetry()
+    received = []
+    rig_remote_app.telemetry_relay.sample_received.connect(lambda t, s: received.append((t, s)))
+    unsubscribe = rig_remote_app.telemetry_relay.attach(telemetry)
+    telemetry.finish()
+    unsubscribe()
+    qapp.processEvents()
+    assert received == [(telemetry, telemetry.last_sample)]
 
 
 def test_check_sync_thread_still_running(rig_remote_app):
@@ -727,7 +804,7 @@ def test_scan_stop_when_no_thread(rig_remote_app):
 
 
 def test_scan_start_bookmarks_empty_tree(rig_remote_app):
-    rig_remote_app.tree.clear()
+    rig_remote_app.bookmark_model.clear()
     rig_remote_app.scan_thread = None
     with patch("rig_remote.ui_handlers.QMessageBox.critical"):
         with patch.object(rig_remote_app, "bookmark_toggle"):
@@ -735,7 +812,7 @@ def test_scan_start_bookmarks_empty_tree(rig_remote_app):
 
 
 def test_scan_start_bookmarks_with_entries(rig_remote_app, mock_bookmark):
-    rig_remote_app.tree.clear()
+    rig_remote_app.bookmark_model.clear()
     rig_remote_app._insert_bookmarks([mock_bookmark])
     rig_remote_app.scan_thread = None
     with patch("rig_remote.ui_scan_handlers.create_scanner"):
@@ -744,7 +821,27 @@ def test_scan_start_bookmarks_with_entries(rig_remote_app, mock_bookmark):
                 rig_remote_app._scan("bookmarks", "start", "FM")
     assert rig_remote_app.scan_thread is not None
     rig_remote_app.scan_thread = None
-    rig_remote_app.tree.clear()
+    rig_remote_app.bookmark_model.clear()
+
+
+@pytest.mark.parametrize("adaptive", [False, True])
+def test_scan_start_bookmarks_adaptive_checkbox(rig_remote_app, mock_bookmark, adaptive):
+    rig_remote_app.bookmark_model.clear()
+    rig_remote_app._insert_bookmarks([mock_bookmark])
+    rig_remote_app.params["ckb_adaptive_scan"].setChecked(adaptive)
+    tasks = []
+    for _ in range(2):
+        rig_remote_app.scan_thread = None
+        with patch("rig_remote.ui_scan_handlers.create_scanner"):
+            with patch("rig_remote.ui_scan_handlers.threading.Thread") as mock_thread_cls:
+                with patch("rig_remote.ui_scan_handlers.QTimer.singleShot"):
+                    rig_remote_app._scan("bookmarks", "start", "FM")
+        tasks.append(mock_thread_cls.call_args.kwargs["args"][0])
+    expected = rig_remote_app.bookmark_activity if adaptive else None
+    assert all(task.bookmark_activity is expected for task in tasks)
+    rig_remote_app.params["ckb_adaptive_scan"].setChecked(False)
+    rig_remote_app.scan_thread = None
+    rig_remote_app.bookmark_model.clear()
 
 
 def test_scan_start_frequency_mode(rig_remote_app):
@@ -756,6 +853,49 @@ def test_scan_start_frequency_mode(rig_remote_app):
     rig_remote_app.scan_thread = None
 
 
+def test_scan_start_passes_telemetry(rig_remote_app):
+    rig_remote_app.scan_thread = None
+    with patch("rig_remote.ui_scan_handlers.create_scanner") as mock_create:
+        with patch("rig_remote.ui_scan_handlers.threading.Thread"):
+            rig_remote_app._scan("frequency", "start", "FM")
+    assert isinstance(rig_remote_app.scan_telemetry, ScanTelemetry)
+    assert mock_create.call_args.kwargs["telemetry"] is rig_remote_app.scan_telemetry
+    rig_remote_app.scan_thread = None
+    rig_remote_app.scan_telemetry = None
+
+
+def test_scan_start_frequency_mode_uses_band_plan(rig_remote_app):
+    rig_remote_app.scan_thread = None
+    segment = ScanSegment(range_min=144_000_000, range_max=146_000_000, interval=12_500, modulation="FM")
+    rig_remote_app.band_plan = [segment]
+    with patch("rig_remote.ui_scan_handlers.create_scanner"):
+        with patch("rig_remote.ui_scan_handlers.threading.Thread") as mock_thread_cls:
+            with patch("rig_remote.ui_scan_handlers.QTimer.singleShot"):
+                rig_remote_app._scan("frequency", "start", "FM")
+    task = mock_thread_cls.call_args.kwargs["args"][0]
+    assert task.segments == [segment]
+    rig_remote_app.band_plan = []
+    rig_remote_app.scan_thread = None
+
+
+def test_scan_start_frequency_mode_checks_priority_bookmarks(rig_remote_app, mock_bookmark):
+    rig_remote_app.bookmark_model.clear()
+    mock_bookmark.lockout = "P"
+    rig_remote_app._insert_bookmarks([mock_bookmark])
+    rig_remote_app.params["txt_priority_interval"].setText("5")
+    rig_remote_app.scan_thread = None
+    with patch("rig_remote.ui_scan_handlers.create_scanner"):
+        with patch("rig_remote.ui_scan_handlers.threading.Thread") as mock_thread_cls:
+            with patch("rig_remote.ui_scan_handlers.QTimer.singleShot"):
+                rig_remote_app._scan("frequency", "start", "FM")
+    task = mock_thread_cls.call_args.kwargs["args"][0]
+    assert task.priority_bookmarks == [mock_bookmark]
+    assert task.priority_interval == 5
+    rig_remote_app.params["txt_priority_interval"].setText("0")
+    rig_remote_app.scan_thread = None
+    rig_remote_app.bookmark_model.clear()
+
+
 # ---------------------------------------------------------------------------
 # build_control_source
 # ---------------------------------------------------------------------------
@@ -819,7 +959,7 @@ def test_add_bookmark_from_rig_empty_description_not_silent(rig_remote_app):
 
 def test_add_new_bookmark_sorted_by_frequency(rig_remote_app):
     """Tree keeps bookmarks sorted by frequency ascending regardless of insertion order."""
-    rig_remote_app.tree.clear()
+    rig_remote_app.bookmark_model.clear()
     high = bookmark_factory(input_frequency=200000000, modulation="FM",
                             description="High", lockout="O")
     rig_remote_app.bookmarks.add_bookmark = Mock(return_value=True)
@@ -832,34 +972,37 @@ def test_add_new_bookmark_sorted_by_frequency(rig_remote_app):
         rig_remote_app._add_new_bookmark(low)
 
     # Low-freq bookmark inserted at index 0
-    assert int(rig_remote_app.tree.topLevelItem(0).text(0)) < int(
-        rig_remote_app.tree.topLevelItem(1).text(0)
-    )
-    rig_remote_app.tree.clear()
+    assert rig_remote_app.bookmark_model.bookmarks() == [low, high]
+    assert rig_remote_app.tree.currentIndex().row() == 0
+    rig_remote_app.bookmark_model.clear()
 
 
 def test_add_new_bookmark_not_added_when_manager_returns_false(rig_remote_app):
     """When BookmarksManager.add_bookmark returns False, item not inserted in tree."""
-    rig_remote_app.tree.clear()
+    rig_remote_app.bookmark_model.clear()
     bm = bookmark_factory(input_frequency=145500000, modulation="FM",
                           description="Test", lockout="O")
     rig_remote_app.bookmarks.add_bookmark = Mock(return_value=False)
-    with patch.object(rig_remote_app.bookmarks, "save"):
+    with patch.object(rig_remote_app.bookmarks, "save") as mock_save:
         rig_remote_app._add_new_bookmark(bm)
+    assert rig_remote_app.bookmark_model.rowCount() == 0
+    mock_save.assert_called_once()
 
 
-def test_add_new_bookmark_item_none_branch(rig_remote_app):
-    """topLevelItem returning None is skipped in insertion sort (line 701)."""
-    rig_remote_app.tree.clear()
+def test_add_new_bookmark_existing_selected(rig_remote_app):
+    """A bookmark the manager already has is selected instead of added again."""
+    rig_remote_app.bookmark_model.clear()
     bm = bookmark_factory(input_frequency=145500000, modulation="FM",
                           description="Test", lockout="O")
-    rig_remote_app.bookmarks.add_bookmark = Mock(return_value=True)
-    # Fake one existing item that topLevelItem returns as None
-    with patch.object(rig_remote_app.tree, "topLevelItemCount", return_value=1):
-        with patch.object(rig_remote_app.tree, "topLevelItem", return_value=None):
-            with patch.object(rig_remote_app.tree, "insertTopLevelItem"):
-                with patch.object(rig_remote_app.bookmarks, "save"):
-                    rig_remote_app._add_new_bookmark(bm)
+    other = bookmark_factory(input_frequency=100000000, modulation="FM",
+                             description="Other", lockout="O")
+    rig_remote_app._insert_bookmarks([bm, other])
+    rig_remote_app.bookmarks.add_bookmark = Mock(return_value=False)
+    with patch.object(rig_remote_app.bookmarks, "save"):
+        rig_remote_app._add_new_bookmark(bm)
+    assert rig_remote_app.bookmark_model.rowCount() == 2
+    assert rig_remote_app.tree.currentIndex().row() == rig_remote_app.bookmark_model.row_of(bm)
+    rig_remote_app.bookmark_model.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -867,14 +1010,14 @@ def test_add_new_bookmark_item_none_branch(rig_remote_app):
 # ---------------------------------------------------------------------------
 
 def test_insert_bookmarks_single(rig_remote_app, mock_bookmark):
-    rig_remote_app.tree.clear()
+    rig_remote_app.bookmark_model.clear()
     rig_remote_app._insert_bookmarks([mock_bookmark])
-    assert rig_remote_app.tree.topLevelItemCount() == 1
-    rig_remote_app.tree.clear()
+    assert rig_remote_app.bookmark_model.rowCount() == 1
+    rig_remote_app.bookmark_model.clear()
 
 
 def test_insert_bookmarks_with_lockout(rig_remote_app):
-    rig_remote_app.tree.clear()
+    rig_remote_app.bookmark_model.clear()
     bm = Mock(spec=Bookmark)
     ch = Mock()
     ch.frequency = "145500000"
@@ -883,15 +1026,17 @@ def test_insert_bookmarks_with_lockout(rig_remote_app):
     bm.description = "Locked"
     bm.lockout = "L"
     rig_remote_app._insert_bookmarks([bm])
-    item = rig_remote_app.tree.topLevelItem(0)
-    assert item.background(0).color().name() == "#ff0000"
-    rig_remote_app.tree.clear()
+    model = rig_remote_app.bookmark_model
+    for column in range(model.columnCount()):
+        background = model.data(model.index(0, column), Qt.ItemDataRole.BackgroundRole)
+        assert background.color().name() == "#ff0000"
+    rig_remote_app.bookmark_model.clear()
 
 
 def test_insert_bookmarks_empty(rig_remote_app):
-    rig_remote_app.tree.clear()
+    rig_remote_app.bookmark_model.clear()
     rig_remote_app._insert_bookmarks([])
-    assert rig_remote_app.tree.topLevelItemCount() == 0
+    assert rig_remote_app.bookmark_model.rowCount() == 0
 
 
 # ---------------------------------------------------------------------------
@@ -899,15 +1044,15 @@ def test_insert_bookmarks_empty(rig_remote_app):
 # ---------------------------------------------------------------------------
 
 def test_extract_bookmarks_round_trip(rig_remote_app, mock_bookmark):
-    rig_remote_app.tree.clear()
+    rig_remote_app.bookmark_model.clear()
     rig_remote_app._insert_bookmarks([mock_bookmark])
     bookmarks = rig_remote_app._extract_bookmarks()
     assert len(bookmarks) == 1
-    rig_remote_app.tree.clear()
+    rig_remote_app.bookmark_model.clear()
 
 
 def test_extract_bookmarks_empty(rig_remote_app):
-    rig_remote_app.tree.clear()
+    rig_remote_app.bookmark_model.clear()
     assert rig_remote_app._extract_bookmarks() == []
 
 
@@ -915,29 +1060,29 @@ def test_extract_bookmarks_empty(rig_remote_app):
 # cb_autofill_form
 # ---------------------------------------------------------------------------
 
+def _select_new_bookmark(app):
+    app.bookmark_model.clear()
+    app._insert_bookmarks(
+        [bookmark_factory(input_frequency=145500000, modulation="FM", description="Test", lockout="O")]
+    )
+    app.tree.setCurrentIndex(app.bookmark_model.index(0, 0))
+
+
 @pytest.mark.parametrize("rig_number", [1, 2])
 def test_autofill_form_with_selection(rig_remote_app, rig_number):
-    item = QTreeWidgetItem(rig_remote_app.tree)
-    item.setText(0, "145500000")
-    item.setText(1, "FM")
-    item.setText(2, "Test")
-    rig_remote_app.tree.setCurrentItem(item)
+    _select_new_bookmark(rig_remote_app)
     rig_remote_app.cb_autofill_form(rig_number)
     assert rig_remote_app.params[f"txt_frequency{rig_number}"].text() == "145500000"
     assert rig_remote_app.params[f"txt_description{rig_number}"].text() == "Test"
 
 
 def test_autofill_form_no_selection(rig_remote_app):
-    rig_remote_app.tree.clearSelection()
+    rig_remote_app.tree.setCurrentIndex(QModelIndex())
     rig_remote_app.cb_autofill_form(1)  # no-op
 
 
 def test_autofill_form_invalid_rig_raises(rig_remote_app):
-    item = QTreeWidgetItem(rig_remote_app.tree)
-    item.setText(0, "145500000")
-    item.setText(1, "FM")
-    item.setText(2, "Test")
-    rig_remote_app.tree.setCurrentItem(item)
+    _select_new_bookmark(rig_remote_app)
     with pytest.raises(NotImplementedError):
         rig_remote_app.cb_autofill_form(99)
 
@@ -946,12 +1091,19 @@ def test_autofill_form_invalid_rig_raises(rig_remote_app):
 # cb_get_frequency / cb_set_frequency
 # ---------------------------------------------------------------------------
 
+def _deliver_rig_commands(app, rig_number=1):
+    """Wait for the commands sent to the rig and run their GUI callbacks."""
+    app.rig_executor.submit(rig_number, lambda: None).result(timeout=5)
+    QApplication.processEvents()
+
+
 def test_get_frequency_success(rig_remote_app):
     with patch.object(rig_remote_app, "rigctl", [Mock() for _ in range(4)]):
         rig_remote_app.rigctl[0].get_frequency = Mock(return_value="145500000")
         rig_remote_app.rigctl[0].get_mode = Mock(return_value="FM")
         ep = RigEndpoint(hostname="localhost", port=4532, number=1, name="rig_1")
         rig_remote_app.cb_get_frequency(ep, silent=True)
+        _deliver_rig_commands(rig_remote_app)
     assert rig_remote_app.params["txt_frequency1"].text() == "145500000"
 
 
@@ -961,6 +1113,7 @@ def test_get_frequency_error(rig_remote_app):
         ep = RigEndpoint(hostname="localhost", port=4532, number=1, name="rig_1")
         with patch("rig_remote.ui_handlers.QMessageBox.critical"):
             rig_remote_app.cb_get_frequency(ep, silent=False)
+            _deliver_rig_commands(rig_remote_app)
 
 
 @pytest.mark.parametrize("frequency,mode", [("145500000", "FM"), ("146000000", "LSB")])
@@ -970,6 +1123,7 @@ def test_set_frequency_success(rig_remote_app, frequency, mode):
     with patch.object(rig_remote_app, "rigctl", [Mock() for _ in range(4)]) as mock_rigctl:
         ep = RigEndpoint(hostname="localhost", port=4532, number=1, name="rig_1")
         rig_remote_app.cb_set_frequency(ep, silent=True)
+        _deliver_rig_commands(rig_remote_app)
         mock_rigctl[0].set_frequency.assert_called_with(int(frequency))
 
 
@@ -981,6 +1135,7 @@ def test_set_frequency_error(rig_remote_app):
         ep = RigEndpoint(hostname="localhost", port=4532, number=1, name="rig_1")
         with patch("rig_remote.ui_handlers.QMessageBox.critical"):
             rig_remote_app.cb_set_frequency(ep, silent=False)
+            _deliver_rig_commands(rig_remote_app)
 
 
 def test_set_frequency_empty_fields(rig_remote_app):
@@ -991,6 +1146,60 @@ def test_set_frequency_empty_fields(rig_remote_app):
         ep = RigEndpoint(hostname="localhost", port=4532, number=1, name="rig_1")
         with patch("rig_remote.ui_handlers.QMessageBox.critical"):
             rig_remote_app.cb_set_frequency(ep, silent=False)
+            _deliver_rig_commands(rig_remote_app)
+
+
+def test_get_frequency_does_not_block_gui_thread(rig_remote_app):
+    answer = threading.Event()
+    rig = Mock()
+    rig.get_frequency = Mock(side_effect=lambda: answer.wait(5) and 145500000)
+    rig.get_mode = Mock(return_value="FM")
+    with patch.object(rig_remote_app, "rigctl", [rig, Mock(), Mock(), Mock()]):
+        ep = RigEndpoint(hostname="localhost", port=4532, number=1, name="rig_1")
+        rig_remote_app.cb_get_frequency(ep, silent=True)
+        QApplication.processEvents()
+        assert rig_remote_app.params["txt_frequency1"].text() == ""
+        answer.set()
+        _deliver_rig_commands(rig_remote_app)
+    assert rig_remote_app.params["txt_frequency1"].text() == "145500000"
+    assert rig_remote_app.params["cbb_mode1"].currentText() == "FM"
+
+
+def test_rig_commands_run_on_worker_thread(rig_remote_app):
+    threads = []
+    rig = Mock()
+    rig.set_frequency = Mock(side_effect=lambda frequency: threads.append(threading.current_thread()))
+    rig_remote_app.params["txt_frequency1"].setText("145500000")
+    rig_remote_app.params["cbb_mode1"].setCurrentText("FM")
+    with patch.object(rig_remote_app, "rigctl", [rig, Mock(), Mock(), Mock()]):
+        ep = RigEndpoint(hostname="localhost", port=4532, number=1, name="rig_1")
+        rig_remote_app.cb_set_frequency(ep, silent=True)
+        _deliver_rig_commands(rig_remote_app)
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_set_frequency_invalid_frequency_sends_nothing(rig_remote_app):
+    rig_remote_app.params["txt_frequency1"].setText("145.5")
+    rig_remote_app.params["cbb_mode1"].setCurrentText("FM")
+    with patch.object(rig_remote_app, "rigctl", [Mock() for _ in range(4)]) as mock_rigctl:
+        ep = RigEndpoint(hostname="localhost", port=4532, number=1, name="rig_1")
+        with patch("rig_remote.ui_handlers.QMessageBox.critical") as mock_crit:
+            rig_remote_app.cb_set_frequency(ep, silent=False)
+            _deliver_rig_commands(rig_remote_app)
+    mock_crit.assert_called_once()
+    mock_rigctl[0].set_frequency.assert_not_called()
+
+
+def test_set_frequency_rig_error_shows_error(rig_remote_app):
+    rig_remote_app.params["txt_frequency1"].setText("145500000")
+    rig_remote_app.params["cbb_mode1"].setCurrentText("FM")
+    with patch.object(rig_remote_app, "rigctl", [Mock() for _ in range(4)]):
+        rig_remote_app.rigctl[0].set_mode = Mock(side_effect=TimeoutError("no answer"))
+        ep = RigEndpoint(hostname="localhost", port=4532, number=1, name="rig_1")
+        with patch("rig_remote.ui_handlers.QMessageBox.critical") as mock_crit:
+            rig_remote_app.cb_set_frequency(ep, silent=False)
+            _deliver_rig_commands(rig_remote_app)
+    mock_crit.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -998,17 +1207,16 @@ def test_set_frequency_empty_fields(rig_remote_app):
 # ---------------------------------------------------------------------------
 
 def test_bookmark_lockout_open_to_locked(rig_remote_app, mock_bookmark):
-    rig_remote_app.tree.clear()
+    rig_remote_app.bookmark_model.clear()
     rig_remote_app._insert_bookmarks([mock_bookmark])
-    item = rig_remote_app.tree.topLevelItem(0)
-    rig_remote_app.tree.setCurrentItem(item)
+    rig_remote_app.tree.setCurrentIndex(rig_remote_app.bookmark_model.index(0, 0))
     rig_remote_app.bookmark_lockout()
-    assert item.data(0, Qt.ItemDataRole.UserRole) == "L"
-    rig_remote_app.tree.clear()
+    assert mock_bookmark.lockout == "L"
+    rig_remote_app.bookmark_model.clear()
 
 
 def test_bookmark_lockout_locked_to_open(rig_remote_app):
-    rig_remote_app.tree.clear()
+    rig_remote_app.bookmark_model.clear()
     bm = Mock(spec=Bookmark)
     ch = Mock()
     ch.frequency = "145500000"
@@ -1017,18 +1225,33 @@ def test_bookmark_lockout_locked_to_open(rig_remote_app):
     bm.description = "Test"
     bm.lockout = "L"
     rig_remote_app._insert_bookmarks([bm])
-    item = rig_remote_app.tree.topLevelItem(0)
-    rig_remote_app.tree.setCurrentItem(item)
+    rig_remote_app.tree.setCurrentIndex(rig_remote_app.bookmark_model.index(0, 0))
     rig_remote_app.bookmark_lockout()
-    assert item.data(0, Qt.ItemDataRole.UserRole) == "O"
-    rig_remote_app.tree.clear()
+    assert bm.lockout == "O"
+    rig_remote_app.bookmark_model.clear()
 
 
 def test_bookmark_lockout_no_selection(rig_remote_app):
-    rig_remote_app.tree.clearSelection()
+    rig_remote_app.tree.setCurrentIndex(QModelIndex())
     rig_remote_app.bookmark_lockout()  # no-op
 
 
+@pytest.mark.parametrize("lockout,expected", [("O", "P"), ("L", "P"), ("P", "O")])
+def test_bookmark_priority_toggle(rig_remote_app, mock_bookmark, lockout, expected):
+    rig_remote_app.bookmark_model.clear()
+    mock_bookmark.lockout = lockout
+    rig_remote_app._insert_bookmarks([mock_bookmark])
+    rig_remote_app.tree.setCurrentIndex(rig_remote_app.bookmark_model.index(0, 0))
+    rig_remote_app.bookmark_priority()
+    assert mock_bookmark.lockout == expected
+    rig_remote_app.bookmark_model.clear()
+
+
+def test_bookmark_priority_no_selection(rig_remote_app):
+    rig_remote_app.tree.setCurrentIndex(QModelIndex())
+    rig_remote_app.bookmark_priority()  # no-op
+
+
 # ---------------------------------------------------------------------------
 # _clear_form / cb_delete
 # ---------------------------------------------------------------------------
@@ -1050,19 +1273,19 @@ def test_clear_form_invalid_rig_raises(rig_remote_app, invalid):
 
 def test_cb_delete_no_current_item_returns_early(rig_remote_app):
     """No selection → early return (line 735)."""
-    rig_remote_app.tree.clear()
-    rig_remote_app.tree.clearSelection()
+    rig_remote_app.bookmark_model.clear()
+    rig_remote_app.tree.setCurrentIndex(QModelIndex())
     rig_remote_app.cb_delete(1)  # should not raise
 
 
 def test_cb_delete_with_item(rig_remote_app, mock_bookmark):
-    rig_remote_app.tree.clear()
+    rig_remote_app.bookmark_model.clear()
     rig_remote_app._insert_bookmarks([mock_bookmark])
-    item = rig_remote_app.tree.topLevelItem(0)
-    rig_remote_app.tree.setCurrentItem(item)
+    rig_remote_app.tree.setCurrentIndex(rig_remote_app.bookmark_model.index(0, 0))
     with patch.object(rig_remote_app.bookmarks, "save"):
         rig_remote_app.cb_delete(1)
-    assert rig_remote_app.tree.topLevelItemCount() == 0
+    rig_remote_app.bookmarks.delete_bookmark.assert_called_with(mock_bookmark)
+    assert rig_remote_app.bookmark_model.rowCount() == 0
 
 
 # ---------------------------------------------------------------------------
@@ -1084,6 +1307,8 @@ def test_close_event_yes_without_save_accepts(rig_remote_app):
                return_value=QMessageBox.StandardButton.Yes):
         RigRemoteHandlersMixin.closeEvent(rig_remote_app, event)
     event.accept.assert_called_once()
+    with pytest.raises(RuntimeError):
+        rig_remote_app.rig_executor.submit(1, Mock())
 
 
 def test_close_event_yes_with_save_exit(rig_remote_app):
@@ -1116,46 +1341,6 @@ def test_close_event_yes_with_active_threads(rig_remote_app):
     rig_remote_app.sync_thread = None
 
 
-# ---------------------------------------------------------------------------
-# _BookmarkTreeItem — sort comparison
-# ---------------------------------------------------------------------------
-
-def test_bookmark_tree_item_sort_text_column_alphabetical(qapp):
-    """Sorting on a non-numeric column goes directly to the string-compare path (line 62)."""
-    tree = QTreeWidget()
-    tree.setColumnCount(3)
-    tree.setSortingEnabled(True)
-    tree.sortByColumn(1, Qt.SortOrder.AscendingOrder)
-
-    alpha = _BookmarkTreeItem(tree)
-    alpha.setText(0, "100000000")
-    alpha.setText(1, "AM")
-    alpha.setText(2, "Alpha")
-
-    beta = _BookmarkTreeItem(tree)
-    beta.setText(0, "200000000")
-    beta.setText(1, "FM")
-    beta.setText(2, "Beta")
-
-    # col 1 is not numeric → goes to line 62 (string compare)
-    assert alpha.__lt__(beta)   # "am" < "fm"
-    assert not beta.__lt__(alpha)
-
-
-def test_bookmark_tree_item_sort_numeric_column_non_numeric_fallback(qapp):
-    """Non-numeric text in col 0 triggers ValueError (lines 60-61) then falls back to string compare (line 62)."""
-    # Items not added to a tree → treeWidget() is None → col defaults to 0
-    item_a = _BookmarkTreeItem()
-    item_a.setText(0, "abc")
-
-    item_b = _BookmarkTreeItem()
-    item_b.setText(0, "xyz")
-
-    # int("abc") raises ValueError → caught and ignored → string fallback
-    assert item_a.__lt__(item_b)   # "abc" < "xyz"
-    assert not item_b.__lt__(item_a)
-
-
 # ---------------------------------------------------------------------------
 # process_record — lines 331-337: Hamlib backend blocks recording
 # ---------------------------------------------------------------------------
@@ -1275,6 +1460,7 @@ def test_cb_connect_rig_gqrx_backend_returns_early(rig_remote_app):
     rig_remote_app.params["cbb_backend1"].setCurrentText("GQRX")
     original = rig_remote_app.rigctl[0]
     rig_remote_app.cb_connect_rig(1)
+    _deliver_rig_commands(rig_remote_app)
     assert rig_remote_app.rigctl[0] is original
 
 
@@ -1286,6 +1472,7 @@ def test_cb_connect_rig_invalid_model_shows_error(rig_remote_app):
     rig_remote_app.params["cbb_rig_model1"].setCurrentIndex(0)
     with patch("rig_remote.ui_handlers.QMessageBox.critical") as mock_crit:
         rig_remote_app.cb_connect_rig(1)
+        _deliver_rig_commands(rig_remote_app)
     mock_crit.assert_called_once()
 
 
@@ -1297,6 +1484,7 @@ def test_cb_connect_rig_empty_model_shows_error(rig_remote_app):
     rig_remote_app.params["cbb_rig_model1"].setCurrentIndex(0)
     with patch("rig_remote.ui_handlers.QMessageBox.critical") as mock_crit:
         rig_remote_app.cb_connect_rig(1)
+        _deliver_rig_commands(rig_remote_app)
     mock_crit.assert_called_once()
 
 
@@ -1305,6 +1493,7 @@ def test_cb_connect_rig_invalid_baud_rate_shows_error(rig_remote_app):
     _set_hamlib_widgets(rig_remote_app, 1, baud_rate="not_a_number")
     with patch("rig_remote.ui_handlers.QMessageBox.critical") as mock_crit:
         rig_remote_app.cb_connect_rig(1)
+        _deliver_rig_commands(rig_remote_app)
     mock_crit.assert_called_once()
 
 
@@ -1314,6 +1503,7 @@ def test_cb_connect_rig_success_updates_rigctl(rig_remote_app):
     mock_rig = Mock()
     with patch("rig_remote.ui_handlers.HamlibRigCtl", return_value=mock_rig):
         rig_remote_app.cb_connect_rig(1)
+        _deliver_rig_commands(rig_remote_app)
     mock_rig.connect.assert_called_once()
     assert rig_remote_app.rigctl[0] is mock_rig
 
@@ -1323,11 +1513,28 @@ def test_cb_connect_rig_success_reenables_buttons(rig_remote_app):
     _set_hamlib_widgets(rig_remote_app, 1)
     with patch("rig_remote.ui_handlers.HamlibRigCtl", return_value=Mock()):
         rig_remote_app.cb_connect_rig(1)
+        _deliver_rig_commands(rig_remote_app)
     assert rig_remote_app.freq_scan_toggle.isEnabled()
     assert rig_remote_app.book_scan_toggle.isEnabled()
     assert rig_remote_app.sync_button.isEnabled()
 
 
+def test_cb_connect_rig_disables_buttons_while_connecting(rig_remote_app):
+    _set_hamlib_widgets(rig_remote_app, 1)
+    connected = threading.Event()
+    mock_rig = Mock()
+    mock_rig.connect.side_effect = lambda: connected.wait(5)
+    with patch("rig_remote.ui_handlers.HamlibRigCtl", return_value=mock_rig):
+        rig_remote_app.cb_connect_rig(1)
+        QApplication.processEvents()
+        assert not rig_remote_app.freq_scan_toggle.isEnabled()
+        assert rig_remote_app.rigctl[0] is not mock_rig
+        connected.set()
+        _deliver_rig_commands(rig_remote_app)
+    assert rig_remote_app.freq_scan_toggle.isEnabled()
+    assert rig_remote_app.rigctl[0] is mock_rig
+
+
 def test_cb_connect_rig_oserror_shows_error(rig_remote_app):
     """OSError from rig.connect() shows a critical dialog (lines 753-756)."""
     _set_hamlib_widgets(rig_remote_app, 1)
@@ -1336,6 +1543,7 @@ def test_cb_connect_rig_oserror_shows_error(rig_remote_app):
     with patch("rig_remote.ui_handlers.HamlibRigCtl", return_value=mock_rig):
         with patch("rig_remote.ui_handlers.QMessageBox.critical") as mock_crit:
             rig_remote_app.cb_connect_rig(1)
+            _deliver_rig_commands(rig_remote_app)
     mock_crit.assert_called_once()
 
 
@@ -1348,6 +1556,7 @@ def test_cb_connect_rig_oserror_does_not_update_rigctl(rig_remote_app):
     with patch("rig_remote.ui_handlers.HamlibRigCtl", return_value=mock_rig):
         with patch("rig_remote.ui_handlers.QMessageBox.critical"):
             rig_remote_app.cb_connect_rig(1)
+            _deliver_rig_commands(rig_remote_app)
     assert rig_remote_app.rigctl[0] is original
 
 
@@ -1359,6 +1568,7 @@ def test_cb_connect_rig_oserror_reenables_buttons(rig_remote_app):
     with patch("rig_remote.ui_handlers.HamlibRigCtl", return_value=mock_rig):
         with patch("rig_remote.ui_handlers.QMessageBox.critical"):
             rig_remote_app.cb_connect_rig(1)
+            _deliver_rig_commands(rig_remote_app)
     assert rig_remote_app.freq_scan_toggle.isEnabled()
     assert rig_remote_app.book_scan_toggle.isEnabled()
     assert rig_remote_app.sync_button.isEnabled()
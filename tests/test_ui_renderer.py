@@ -1,10 +1,12 @@
-import subprocess
+import threading
 
 import pytest
 from unittest.mock import MagicMock, Mock, patch
 from PySide6.QtWidgets import QApplication, QLineEdit, QComboBox
+from PySide6.QtCore import Qt
 
-from rig_remote.ui_renderer import RigRemoteUIBuilder, _load_hamlib_models, _HAMLIB_MODEL_FALLBACK
+from rig_remote.hamlib_models import HAMLIB_MODEL_FALLBACK
+from rig_remote.ui_renderer import HamlibModelRelay, RigRemoteUIBuilder
 from rig_remote.ui_qt import RigRemote
 from rig_remote.app_config import AppConfig
 from rig_remote.models.rig_endpoint import RigEndpoint
@@ -77,6 +79,7 @@ def mock_app_config():
         "passes": "0",
         "inner_band": "0",
         "inner_interval": "0",
+        "priority_interval": "0",
         "range_min": "88000",
         "range_max": "108000",
         "sgn_level": "-40",
@@ -150,8 +153,8 @@ def test_ui_renderer_tree_widget_created(rig_remote_app):
 def test_ui_renderer_tree_widget_headers(rig_remote_app):
     """_build_tree_view sets the correct column headers."""
     headers = [
-        rig_remote_app.tree.headerItem().text(i)
-        for i in range(rig_remote_app.tree.columnCount())
+        rig_remote_app.tree.model().headerData(i, Qt.Orientation.Horizontal)
+        for i in range(rig_remote_app.tree.model().columnCount())
     ]
     assert "Frequency" in headers
     assert "Mode" in headers
@@ -161,8 +164,8 @@ def test_ui_renderer_tree_widget_headers(rig_remote_app):
 def test_ui_renderer_tree_widget_headers_no_invalid(rig_remote_app):
     """_build_tree_view does not introduce unexpected headers."""
     headers = [
-        rig_remote_app.tree.headerItem().text(i)
-        for i in range(rig_remote_app.tree.columnCount())
+        rig_remote_app.tree.model().headerData(i, Qt.Orientation.Horizontal)
+        for i in range(rig_remote_app.tree.model().columnCount())
     ]
     assert "InvalidHeader" not in headers
 
@@ -269,60 +272,53 @@ def test_ui_renderer_description_widget_absent_for_invalid_rig(rig_remote_app, i
 # ---------------------------------------------------------------------------
 
 # ---------------------------------------------------------------------------
-# Tests for _load_hamlib_models
+# Tests for the Hamlib model combo boxes
 # ---------------------------------------------------------------------------
 
-_RIGCTL_SAMPLE = (
-    "Rig #  Mfg                    Model                   Version         Status\n"
-    "     1  Hamlib                 Dummy                   20240709.0      Stable\n"
-    "  1001  Yaesu                  FT-847                  20230512.0      Stable\n"
-    "  1002  Yaesu                  FT-1000                 20231124.0      Beta\n"
-)
-
-
-@pytest.mark.parametrize(
-    "error",
-    [FileNotFoundError, OSError, subprocess.TimeoutExpired("rigctl", 5)],
-)
-def test_load_hamlib_models_falls_back_when_rigctl_unavailable(error):
-    with patch("rig_remote.ui_renderer.subprocess.check_output", side_effect=error):
-        result = _load_hamlib_models()
-    assert result == _HAMLIB_MODEL_FALLBACK
-
-
-def test_load_hamlib_models_falls_back_on_empty_output():
-    with patch("rig_remote.ui_renderer.subprocess.check_output", return_value="no digits here\n"):
-        result = _load_hamlib_models()
-    assert result == _HAMLIB_MODEL_FALLBACK
-
 
-def test_load_hamlib_models_parses_count():
-    with patch("rig_remote.ui_renderer.subprocess.check_output", return_value=_RIGCTL_SAMPLE):
-        result = _load_hamlib_models()
-    assert len(result) == 3
-
-
-def test_load_hamlib_models_sorted_by_model_number():
-    with patch("rig_remote.ui_renderer.subprocess.check_output", return_value=_RIGCTL_SAMPLE):
-        result = _load_hamlib_models()
-    nums = [int(e.split()[0]) for e in result]
-    assert nums == sorted(nums)
-
-
-@pytest.mark.parametrize(
-    "rigctl_line,expected_num,expected_label",
-    [
-        ("     1  Hamlib  Dummy  20240709.0  Stable  RIG_MODEL_DUMMY\n", 1, "1 (Hamlib Dummy)"),
-        ("  1001  Yaesu  FT-847  20230512.0  Stable  RIG_MODEL_FT847\n", 1001, "1001 (Yaesu FT-847)"),
-        ("  3001  Kenwood  TS-2000  20230101.0  Stable  RIG_MODEL_TS2000\n", 3001, "3001 (Kenwood TS-2000)"),
-    ],
-)
-def test_load_hamlib_models_format(rigctl_line, expected_num, expected_label):
-    with patch("rig_remote.ui_renderer.subprocess.check_output", return_value=rigctl_line):
-        result = _load_hamlib_models()
-    assert len(result) == 1
-    assert result[0] == expected_label
-    assert int(result[0].split()[0]) == expected_num
+def test_rig_model_combo_prefilled_with_fallback(qapp, mock_app_config):
+    """The combo boxes are usable before rigctl has listed its models."""
+    with patch("rig_remote.ui_renderer.HamlibModelLoader") as loader:
+        with patch("rig_remote.ui_qt.BookmarksManager"), patch("rig_remote.ui_qt.GQRXRigCtl"):
+            app = RigRemote(mock_app_config)
+    loader.return_value.start.assert_called_once_with()
+    combo = app.params["cbb_rig_model1"]
+    assert [combo.itemText(i) for i in range(combo.count())] == HAMLIB_MODEL_FALLBACK
+    app.closeEvent = Mock()
+    app.close()
+
+
+def test_fill_hamlib_models_keeps_selected_model(rig_remote_app):
+    combo = rig_remote_app.params["cbb_rig_model1"]
+    combo.setCurrentIndex(combo.findText("209 (Kenwood TS-2000)"))
+    rig_remote_app._fill_hamlib_models(["1 (Hamlib Dummy)", "209 (Kenwood TS-2000)", "2014 (Kenwood TS-2000)"])
+    assert combo.count() == 3
+    assert combo.currentText() == "209 (Kenwood TS-2000)"
+    assert rig_remote_app.params["cbb_rig_model2"].count() == 3
+
+
+def test_fill_hamlib_models_selects_first_when_model_gone(rig_remote_app):
+    combo = rig_remote_app.params["cbb_rig_model1"]
+    combo.setCurrentIndex(combo.findText("361 (Icom IC-7300)"))
+    rig_remote_app._fill_hamlib_models(["1 (Hamlib Dummy)", "2 (Hamlib NET rigctl)"])
+    assert combo.currentText() == "1 (Hamlib Dummy)"
+
+
+def test_hamlib_model_relay_fills_combo_on_gui_thread(rig_remote_app, qapp):
+    models = ["1 (Hamlib Dummy)", "2 (Hamlib NET rigctl)"]
+    thread = threading.Thread(target=rig_remote_app.hamlib_model_relay.deliver, args=(models,))
+    thread.start()
+    thread.join()
+    qapp.processEvents()
+    combo = rig_remote_app.params["cbb_rig_model1"]
+    assert [combo.itemText(i) for i in range(combo.count())] == models
+
+
+def test_hamlib_model_relay_deliver_after_close_is_ignored(qapp):
+    relay = HamlibModelRelay()
+    shiboken = pytest.importorskip("shiboken6")
+    shiboken.delete(relay)
+    relay.deliver(["1 (Hamlib Dummy)"])
 
 
 def test_ui_renderer_scanning_options_widgets_present(rig_remote_app):